@@ -8,6 +8,10 @@ The Agent Council implements a multi-agent coordination system that:
 4. Coordinates execution with consensus mechanisms
 5. Routes outputs through evaluation gates
 
+Execution is dependency-aware: phases whose dependencies are satisfied run
+concurrently, and the workers inside a phase are fanned out in parallel,
+bounded by max_concurrency and (optionally) per-tenant budget reservations.
+
 Architecture:
 - AgentRegistry: Discovers and indexes all agents
 - AgentCouncil: Assigns teams and coordinates execution
@@ -24,9 +28,11 @@ Usage:
 
 import os
 import re
+import time
 import yaml
 import json
 import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple, Callable
 from dataclasses import dataclass, field, asdict
@@ -34,6 +40,11 @@ from enum import Enum
 from datetime import datetime, timezone
 import uuid
 
+try:
+    from lib.catalog import Catalog, get_catalog
+except ImportError:
+    from catalog import Catalog, get_catalog
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -202,12 +213,13 @@ class AgentRegistry:
     """
     Registry that discovers and indexes all agents from the agents/ directory.
 
-    Scans:
+    Reads the agent catalog (lib.catalog), which indexes:
     - agents/orchestrators/*.md
     - agents/workers/*.md (and subdirectories)
     - agents/evaluators/*.md
 
-    Parses YAML frontmatter to extract agent metadata.
+    Builds agents from the catalog's parsed YAML frontmatter, so files are
+    only re-read when they change.
     """
 
     def __init__(self, agents_dir: str = None):
@@ -222,50 +234,40 @@ class AgentRegistry:
         self._loaded = False
 
     def _load_agents(self) -> Dict[str, List[Agent]]:
-        """Load all agents from the agents/ directory."""
+        """Load all agents from the agent catalog."""
         if self._loaded:
             return self._agents
 
-        # Scan each role directory
-        role_dirs = {
-            AgentRole.ORCHESTRATOR: self.agents_dir / "orchestrators",
-            AgentRole.WORKER: self.agents_dir / "workers",
-            AgentRole.EVALUATOR: self.agents_dir / "evaluators"
-        }
-
-        for role, role_dir in role_dirs.items():
-            if not role_dir.exists():
-                logger.warning(f"Agent directory not found: {role_dir}")
-                continue
-
-            # Find all .md files recursively
-            for md_file in role_dir.rglob("*.md"):
-                # Skip template files
-                if "TEMPLATE" in md_file.name or md_file.name.startswith("_"):
-                    continue
-
-                try:
-                    agent = self._parse_agent_file(md_file, role)
-                    if agent:
-                        self._agents[role.value].append(agent)
-                        self._by_name[agent.name] = agent
-
-                        # Index by capability
-                        for cap in agent.capabilities:
-                            if cap not in self._by_capability:
-                                self._by_capability[cap] = []
-                            self._by_capability[cap].append(agent)
-
-                        # Also index by skills
-                        for skill in agent.skills:
-                            if skill not in self._by_capability:
-                                self._by_capability[skill] = []
-                            self._by_capability[skill].append(agent)
-
-                        logger.debug(f"Loaded agent: {agent.name} ({role.value})")
-
-                except Exception as e:
-                    logger.warning(f"Failed to parse agent file {md_file}: {e}")
+        if self.agents_dir == AGENTS_DIR:
+            catalog = get_catalog()
+        else:
+            catalog = Catalog(path=None, skill_roots=(), agent_roots=(self.agents_dir,))
+            catalog.refresh()
+
+        for entry in catalog.agents:
+            try:
+                role = AgentRole(entry["role"])
+                agent = self._agent_from_frontmatter(entry["frontmatter"], Path(entry["path"]), role)
+                if agent:
+                    self._agents[role.value].append(agent)
+                    self._by_name[agent.name] = agent
+
+                    # Index by capability
+                    for cap in agent.capabilities:
+                        if cap not in self._by_capability:
+                            self._by_capability[cap] = []
+                        self._by_capability[cap].append(agent)
+
+                    # Also index by skills
+                    for skill in agent.skills:
+                        if skill not in self._by_capability:
+                            self._by_capability[skill] = []
+                        self._by_capability[skill].append(agent)
+
+                    logger.debug(f"Loaded agent: {agent.name} ({role.value})")
+
+            except Exception as e:
+                logger.warning(f"Failed to load agent {entry.get('path')}: {e}")
 
         self._loaded = True
         logger.info(f"Loaded {sum(len(v) for v in self._agents.values())} agents")
@@ -279,6 +281,15 @@ class AgentRegistry:
         # Extract YAML frontmatter
         frontmatter = self._extract_frontmatter(content)
 
+        return self._agent_from_frontmatter(frontmatter, file_path, role)
+
+    def _agent_from_frontmatter(
+        self,
+        frontmatter: Dict[str, Any],
+        file_path: Path,
+        role: AgentRole
+    ) -> Optional[Agent]:
+        """Build an Agent from parsed frontmatter."""
         # Get agent name (prefer frontmatter, fallback to filename)
         name = frontmatter.get("name") or file_path.stem
 
@@ -522,15 +533,24 @@ class AgentCouncil:
     # Default evaluators (always included)
     DEFAULT_EVALUATORS = ["fact-check-agent", "linkedin-qa-reviewer"]
 
-    def __init__(self, registry: AgentRegistry = None):
+    # Max concurrent executor (LLM) calls during execute_with_council
+    DEFAULT_MAX_CONCURRENCY = 4
+
+    # Budget reservation settings for phase execution
+    ESTIMATED_COST_PER_1K_TOKENS = 0.015  # Conservative: Sonnet output rate
+    BUDGET_RESERVATION_TTL = 600  # seconds
+
+    def __init__(self, registry: AgentRegistry = None, max_concurrency: int = None):
         """
         Initialize the Agent Council.
 
         Args:
             registry: Optional AgentRegistry instance. If not provided, creates one.
+            max_concurrency: Max concurrent executor calls (default DEFAULT_MAX_CONCURRENCY)
         """
         self.registry = registry or AgentRegistry()
         self.consensus = ConsensusEngine()
+        self.max_concurrency = max_concurrency or self.DEFAULT_MAX_CONCURRENCY
         self._current_assignment: Optional[CouncilAssignment] = None
 
     def assign_council(
@@ -766,20 +786,38 @@ class AgentCouncil:
         self,
         assignment: CouncilAssignment,
         plan: ExecutionPlan,
-        executor: Callable[[str, Dict], Dict] = None
+        executor: Callable[[str, Dict], Dict] = None,
+        max_concurrency: Optional[int] = None,
+        budget_manager: Any = None,
+        tenant_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Execute plan with orchestrator coordinating workers.
         Route outputs through evaluators.
 
+        Phases are scheduled as a DAG from plan.dependencies: every phase whose
+        dependencies have completed is started immediately, and the workers of
+        a phase are called in parallel. At most max_concurrency executor calls
+        are in flight at once.
+
+        If a budget_manager and tenant_id are given, each phase reserves its
+        estimated cost with BudgetManager.reserve_budget before starting and
+        releases it when done. A phase whose reservation is refused waits for
+        running phases to release theirs; if nothing is running, the run fails.
+
         Args:
             assignment: The council assignment
             plan: The execution plan
             executor: Optional function to execute agent tasks
                      Signature: executor(agent_name, task_context) -> result
+                     Must be thread-safe when max_concurrency > 1.
+            max_concurrency: Max concurrent executor calls (default: council setting)
+            budget_manager: Optional BudgetManager for per-tenant reservations
+            tenant_id: Tenant to reserve budget for
 
         Returns:
-            Execution result with outputs, evaluations, and metadata
+            Execution result with outputs, evaluations, timing and metadata.
+            results["timing"] includes the critical path through the phase DAG.
         """
         start_time = datetime.now(timezone.utc)
         results = {
@@ -793,62 +831,52 @@ class AgentCouncil:
             "started_at": start_time.isoformat()
         }
 
-        phase_outputs = {}
+        phase_order = {phase["phase_id"]: i for i, phase in enumerate(plan.phases)}
+        completed: Dict[str, Dict[str, Any]] = {}
+        timings: Dict[str, Dict[str, float]] = {}
 
-        try:
-            # Execute each phase in order (respecting dependencies)
-            for phase in plan.phases:
-                phase_id = phase["phase_id"]
-
-                # Check dependencies
-                deps = plan.dependencies.get(phase_id, [])
-                for dep in deps:
-                    if dep not in phase_outputs:
-                        raise RuntimeError(f"Dependency {dep} not completed for {phase_id}")
-
-                # Get dependency outputs
-                dep_context = {dep: phase_outputs[dep] for dep in deps}
-
-                # Execute phase
-                phase_result = self._execute_phase(
-                    phase=phase,
-                    assignment=assignment,
-                    context={
-                        "task_description": plan.task_description,
-                        "phase_id": phase_id,
-                        "dependencies": dep_context
-                    },
-                    executor=executor
-                )
-
-                phase_outputs[phase_id] = phase_result
-                results["phases"].append({
+        def on_phase_complete(phase: Dict[str, Any], phase_result: Dict[str, Any]):
+            phase_id = phase["phase_id"]
+            record = {
+                "phase": {
                     "phase_id": phase_id,
                     "name": phase["name"],
                     "status": "completed",
                     "output": phase_result
-                })
+                }
+            }
 
-                # Handle consensus for this phase
-                if phase_id in plan.consensus_required:
-                    consensus_result = self._run_consensus(
-                        phase_id=phase_id,
-                        phase_output=phase_result,
-                        assignment=assignment
-                    )
-                    results["consensus_log"].append(consensus_result)
+            # Handle consensus for this phase
+            if phase_id in plan.consensus_required:
+                record["consensus"] = self._run_consensus(
+                    phase_id=phase_id,
+                    phase_output=phase_result,
+                    assignment=assignment
+                )
 
-                # Run evaluation for non-eval phases
-                if phase_id != "phase-eval":
-                    eval_result = self._run_evaluation(
+            # Run evaluation for non-eval phases
+            if phase_id != "phase-eval":
+                record["evaluation"] = {
+                    "phase_id": phase_id,
+                    "evaluation": self._run_evaluation(
                         phase_output=phase_result,
                         evaluators=assignment.evaluators
                     )
-                    results["evaluations"].append({
-                        "phase_id": phase_id,
-                        "evaluation": eval_result
-                    })
+                }
+
+            completed[phase_id] = record
 
+        try:
+            self._run_phase_dag(
+                assignment=assignment,
+                plan=plan,
+                executor=executor,
+                max_concurrency=max_concurrency or self.max_concurrency,
+                budget_manager=budget_manager,
+                tenant_id=tenant_id,
+                on_phase_complete=on_phase_complete,
+                timings=timings
+            )
             results["status"] = "completed"
 
         except Exception as e:
@@ -856,49 +884,270 @@ class AgentCouncil:
             results["error"] = str(e)
             logger.error(f"Council execution failed: {e}")
 
+        # Report in plan order regardless of completion order
+        for phase_id in sorted(completed, key=phase_order.get):
+            record = completed[phase_id]
+            results["phases"].append(record["phase"])
+            if "consensus" in record:
+                results["consensus_log"].append(record["consensus"])
+            if "evaluation" in record:
+                results["evaluations"].append(record["evaluation"])
+
         results["completed_at"] = datetime.now(timezone.utc).isoformat()
         results["duration_seconds"] = (
             datetime.now(timezone.utc) - start_time
         ).total_seconds()
+        results["timing"] = self._summarize_timing(
+            timings, plan.dependencies, results["duration_seconds"]
+        )
 
         return results
 
-    def _execute_phase(
+    def _validate_dependencies(self, plan: ExecutionPlan) -> Dict[str, List[str]]:
+        """
+        Check that plan.dependencies forms a DAG over the plan's phases.
+
+        Returns:
+            Map of phase_id to its dependency phase_ids
+
+        Raises:
+            RuntimeError: If a dependency is unknown or the graph has a cycle
+        """
+        phase_ids = [phase["phase_id"] for phase in plan.phases]
+        deps = {phase_id: list(plan.dependencies.get(phase_id, [])) for phase_id in phase_ids}
+
+        for phase_id, phase_deps in deps.items():
+            for dep in phase_deps:
+                if dep not in deps:
+                    raise RuntimeError(f"Unknown phase id {dep!r} in dependencies of {phase_id}")
+
+        # Kahn's algorithm: anything left unvisited is part of a cycle
+        remaining = {phase_id: len(phase_deps) for phase_id, phase_deps in deps.items()}
+        ready = [phase_id for phase_id, count in remaining.items() if count == 0]
+        visited = 0
+        while ready:
+            current = ready.pop()
+            visited += 1
+            for phase_id, phase_deps in deps.items():
+                if current in phase_deps:
+                    remaining[phase_id] -= 1
+                    if remaining[phase_id] == 0:
+                        ready.append(phase_id)
+
+        if visited != len(deps):
+            cyclic = sorted(phase_id for phase_id, count in remaining.items() if count > 0)
+            raise RuntimeError(f"Dependency cycle between phases: {cyclic}")
+
+        return deps
+
+    def _estimate_phase_cost(self, phase: Dict[str, Any]) -> float:
+        """Estimated USD cost of a phase, for budget reservations."""
+        if "estimated_cost_usd" in phase:
+            return float(phase["estimated_cost_usd"])
+        tokens = phase.get("estimated_tokens", 5000)
+        return tokens / 1000 * self.ESTIMATED_COST_PER_1K_TOKENS
+
+    def _submit_phase(
         self,
+        pool: ThreadPoolExecutor,
         phase: Dict[str, Any],
         assignment: CouncilAssignment,
         context: Dict[str, Any],
-        executor: Callable = None
-    ) -> Dict[str, Any]:
-        """Execute a single phase of the plan."""
-        if executor:
-            # Use provided executor
-            workers = phase.get("workers", [])
-            outputs = []
-            for worker_name in workers:
-                result = executor(worker_name, {
-                    **context,
-                    "phase": phase,
-                    "worker": worker_name
-                })
-                outputs.append({
-                    "worker": worker_name,
-                    "result": result
-                })
-            return {
-                "phase_id": phase["phase_id"],
-                "outputs": outputs,
-                "completed_at": datetime.now(timezone.utc).isoformat()
+        executor: Optional[Callable]
+    ) -> List[Future]:
+        """Submit a phase's work to the pool, one future per worker call."""
+        if not executor:
+            return [pool.submit(self._execute_phase, phase, assignment, context)]
+
+        return [
+            pool.submit(executor, worker_name, {
+                **context,
+                "phase": phase,
+                "worker": worker_name
+            })
+            for worker_name in phase.get("workers", [])
+        ]
+
+    def _run_phase_dag(
+        self,
+        assignment: CouncilAssignment,
+        plan: ExecutionPlan,
+        executor: Optional[Callable],
+        max_concurrency: int,
+        budget_manager: Any,
+        tenant_id: Optional[str],
+        on_phase_complete: Callable[[Dict[str, Any], Dict[str, Any]], None],
+        timings: Dict[str, Dict[str, float]]
+    ):
+        """
+        Run plan phases as a DAG on a bounded thread pool.
+
+        Scheduling, consensus and evaluation run on the calling thread; only
+        executor calls run on the pool, so phases never block pool workers
+        waiting on each other.
+
+        Raises:
+            RuntimeError: On invalid dependencies or refused budget
+            Exception: The first error raised by a worker call
+        """
+        deps = self._validate_dependencies(plan)
+        phases = {phase["phase_id"]: phase for phase in plan.phases}
+        pending = [phase["phase_id"] for phase in plan.phases]
+        phase_outputs: Dict[str, Dict[str, Any]] = {}
+        running: Dict[str, Dict[str, Any]] = {}
+        clock_start = time.monotonic()
+        error: Optional[BaseException] = None
+
+        def finish(phase_id: str):
+            state = running.pop(phase_id)
+            if state["reservation_id"]:
+                budget_manager.release_reservation(state["reservation_id"])
+
+            phase = phases[phase_id]
+            timings[phase_id] = {
+                "start": state["start"],
+                "end": time.monotonic() - clock_start,
             }
-        else:
-            # Placeholder execution - return structured stub
-            return {
-                "phase_id": phase["phase_id"],
-                "status": "simulated",
-                "workers_assigned": phase.get("workers", []),
-                "message": "Executor not provided - phase simulated",
-                "completed_at": datetime.now(timezone.utc).isoformat()
+
+            failures = [f.exception() for f in state["futures"] if f.exception() is not None]
+            if failures:
+                raise failures[0]
+
+            if executor:
+                phase_result = {
+                    "phase_id": phase_id,
+                    "outputs": [
+                        {"worker": worker_name, "result": future.result()}
+                        for worker_name, future in zip(phase.get("workers", []), state["futures"])
+                    ],
+                    "completed_at": datetime.now(timezone.utc).isoformat()
+                }
+            else:
+                phase_result = state["futures"][0].result()
+
+            phase_outputs[phase_id] = phase_result
+            on_phase_complete(phase, phase_result)
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, max_concurrency),
+            thread_name_prefix="council"
+        ) as pool:
+            while pending or running:
+                # Start every phase whose dependencies are complete
+                if error is None:
+                    ready = [
+                        phase_id for phase_id in pending
+                        if all(dep in phase_outputs for dep in deps[phase_id])
+                    ]
+                    for phase_id in ready:
+                        reservation_id = None
+                        if budget_manager is not None and tenant_id:
+                            cost = self._estimate_phase_cost(phases[phase_id])
+                            reservation_id = budget_manager.reserve_budget(
+                                tenant_id, cost, ttl_seconds=self.BUDGET_RESERVATION_TTL
+                            )
+                            if reservation_id is None:
+                                if running:
+                                    break  # Retry once a running phase releases budget
+                                error = RuntimeError(
+                                    f"Budget exceeded for tenant {tenant_id}: "
+                                    f"could not reserve ${cost:.2f} for {phase_id}"
+                                )
+                                break
+
+                        pending.remove(phase_id)
+                        context = {
+                            "task_description": plan.task_description,
+                            "phase_id": phase_id,
+                            "dependencies": {dep: phase_outputs[dep] for dep in deps[phase_id]}
+                        }
+                        running[phase_id] = {
+                            "futures": self._submit_phase(
+                                pool, phases[phase_id], assignment, context, executor
+                            ),
+                            "start": time.monotonic() - clock_start,
+                            "reservation_id": reservation_id,
+                        }
+
+                if not running:
+                    break
+
+                # Complete phases with no outstanding work (e.g. no workers)
+                in_flight = [f for state in running.values() for f in state["futures"] if not f.done()]
+                if in_flight:
+                    wait(in_flight, return_when=FIRST_COMPLETED)
+
+                for phase_id in [
+                    phase_id for phase_id, state in running.items()
+                    if all(f.done() for f in state["futures"])
+                ]:
+                    try:
+                        finish(phase_id)
+                    except Exception as e:
+                        if error is None:
+                            error = e
+
+        if error is not None:
+            raise error
+
+    def _summarize_timing(
+        self,
+        timings: Dict[str, Dict[str, float]],
+        dependencies: Dict[str, List[str]],
+        wall_seconds: float
+    ) -> Dict[str, Any]:
+        """
+        Summarize phase timings and the critical path of a run.
+
+        The critical path is traced back from the last phase to finish,
+        following at each step the dependency that finished last.
+        """
+        critical_path: List[str] = []
+        if timings:
+            current = max(timings, key=lambda phase_id: timings[phase_id]["end"])
+            critical_path.append(current)
+            while True:
+                finished_deps = [dep for dep in dependencies.get(current, []) if dep in timings]
+                if not finished_deps:
+                    break
+                current = max(finished_deps, key=lambda phase_id: timings[phase_id]["end"])
+                critical_path.append(current)
+            critical_path.reverse()
+
+        durations = {
+            phase_id: t["end"] - t["start"] for phase_id, t in timings.items()
+        }
+        serial_seconds = sum(durations.values())
+
+        return {
+            "critical_path": critical_path,
+            "critical_path_seconds": sum(durations[phase_id] for phase_id in critical_path),
+            "serial_seconds": serial_seconds,
+            "wall_seconds": wall_seconds,
+            "parallel_speedup": serial_seconds / wall_seconds if wall_seconds > 0 else 1.0,
+            "phases": {
+                phase_id: {
+                    "start_offset_seconds": t["start"],
+                    "duration_seconds": durations[phase_id],
+                }
+                for phase_id, t in timings.items()
             }
+        }
+
+    def _execute_phase(
+        self,
+        phase: Dict[str, Any],
+        assignment: CouncilAssignment,
+        context: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Simulate a phase when no executor is provided (executor phases are assembled in _run_phase_dag)."""
+        return {
+            "phase_id": phase["phase_id"],
+            "status": "simulated",
+            "workers_assigned": phase.get("workers", []),
+            "message": "Executor not provided - phase simulated",
+            "completed_at": datetime.now(timezone.utc).isoformat()
+        }
 
     def _run_consensus(
         self,
@@ -1028,10 +1277,11 @@ def generate_execution_plan(
 def execute_council_plan(
     assignment: CouncilAssignment,
     plan: ExecutionPlan,
-    executor: Callable = None
+    executor: Callable = None,
+    **kwargs
 ) -> Dict[str, Any]:
     """Execute a council plan. See AgentCouncil.execute_with_council for details."""
-    return get_agent_council().execute_with_council(assignment, plan, executor)
+    return get_agent_council().execute_with_council(assignment, plan, executor, **kwargs)
 
 
 def find_agent(name: str) -> Optional[Agent]:
@@ -1139,6 +1389,7 @@ if __name__ == "__main__":
 
     print(f"\nExecution Status: {result['status']}")
     print(f"Duration: {result.get('duration_seconds', 0):.2f}s")
+    print(f"Critical path: {result['timing']['critical_path']}")
     print(f"Phases completed: {len(result['phases'])}")
     print(f"Evaluations: {len(result['evaluations'])}")
 
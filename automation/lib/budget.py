@@ -8,22 +8,46 @@ NOT a full budget enforcement system. Just:
 
 Designed for 100+ clients with simple per-tenant limits.
 Thread-safe with SQLite WAL mode for 20+ concurrent agents.
+
+Budget tables live in the same database as telemetry runs. Spend is read
+from per-tenant daily/monthly rollups that telemetry maintains as runs are
+written, and active reservations from an in-memory ledger, so a budget
+check is a few keyed lookups regardless of run history.
 """
 
 from dataclasses import dataclass
 from typing import Optional, Dict
 from datetime import datetime, timedelta
 import threading
-import sqlite3
-import queue
+import time
+import uuid
 from pathlib import Path
 from contextlib import contextmanager
 
+# Skills import this module both as lib.budget and as top-level budget
+try:
+    from lib.storage_engine import (
+        ConnectionPool,
+        Migration,
+        STORAGE_DB_PATH,
+        copy_legacy_tables,
+        get_storage_engine,
+    )
+except ImportError:
+    from storage_engine import (
+        ConnectionPool,
+        Migration,
+        STORAGE_DB_PATH,
+        copy_legacy_tables,
+        get_storage_engine,
+    )
+
 
-# Database path for budget-specific data (separate from telemetry)
+# Budget data shares one database with telemetry (see lib.storage_engine)
 SYSTEM_ROOT = Path(__file__).parent.parent
 BUDGET_DIR = SYSTEM_ROOT / "telemetry"
-BUDGET_DB_PATH = BUDGET_DIR / "budget.db"
+BUDGET_DB_PATH = STORAGE_DB_PATH
+LEGACY_BUDGET_DB_PATH = BUDGET_DIR / "budget.db"
 
 # Ensure directory exists
 BUDGET_DIR.mkdir(parents=True, exist_ok=True)
@@ -56,187 +80,150 @@ class BudgetStatus:
     message: str
 
 
-class BudgetConnectionPool:
-    """
-    Thread-safe SQLite connection pool for budget operations.
-    
-    Uses WAL mode for better concurrent read/write performance with 20+ agents.
-    """
-    
-    def __init__(self, db_path: Path, pool_size: int = 20, timeout: float = 30.0):
+# Kept for backwards compatibility; all components share one pool type now
+BudgetConnectionPool = ConnectionPool
+
+
+# Schema migrations for the budget tables in the shared storage engine
+BUDGET_MIGRATIONS = [
+    Migration(1, "Create budget_configs and budget_reservations", statements=[
+        # Table for storing budget configs (persistent)
         """
-        Initialize connection pool.
-        
-        Args:
-            db_path: Path to SQLite database
-            pool_size: Maximum number of pooled connections (default 20 for 20 agents)
-            timeout: Timeout in seconds waiting for a connection
+        CREATE TABLE IF NOT EXISTS budget_configs (
+            tenant_id TEXT PRIMARY KEY,
+            daily_limit_usd REAL DEFAULT 100.0,
+            monthly_limit_usd REAL DEFAULT 2000.0,
+            per_run_limit_usd REAL DEFAULT 10.0,
+            warn_at_percent REAL DEFAULT 0.8,
+            block_on_exceed INTEGER DEFAULT 0,
+            updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        # Table for budget reservations (for concurrent budget checking)
         """
-        self.db_path = str(db_path)
-        self.pool_size = pool_size
-        self.timeout = timeout
-        self._pool = queue.Queue(maxsize=pool_size)
-        self._lock = threading.Lock()
-        self._created_count = 0
-    
-    def _create_connection(self) -> sqlite3.Connection:
-        """Create a new database connection with WAL mode."""
-        conn = sqlite3.connect(
-            self.db_path,
-            timeout=self.timeout,
-            check_same_thread=False,  # Allow connection sharing with proper locking
-            isolation_level=None  # Autocommit mode for better concurrency
+        CREATE TABLE IF NOT EXISTS budget_reservations (
+            reservation_id TEXT PRIMARY KEY,
+            tenant_id TEXT NOT NULL,
+            amount_usd REAL NOT NULL,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            expires_at TEXT NOT NULL,
+            status TEXT DEFAULT 'active'
         )
-        conn.row_factory = sqlite3.Row
-        
-        # Enable WAL mode for better concurrent access
-        conn.execute("PRAGMA journal_mode=WAL")
-        # Increase cache size for better performance
-        conn.execute("PRAGMA cache_size=-32000")  # 32MB cache
-        # Enable foreign keys
-        conn.execute("PRAGMA foreign_keys=ON")
-        # Synchronous mode for durability with good performance
-        conn.execute("PRAGMA synchronous=NORMAL")
-        # Increase busy timeout for concurrent writes (30 seconds)
-        conn.execute("PRAGMA busy_timeout=30000")
-        
-        return conn
-    
-    def get_connection(self) -> sqlite3.Connection:
-        """Get a connection from the pool or create a new one."""
-        try:
-            # Try to get from pool (non-blocking)
-            return self._pool.get_nowait()
-        except queue.Empty:
-            # Pool is empty, create new connection if under limit
-            with self._lock:
-                if self._created_count < self.pool_size:
-                    self._created_count += 1
-                    return self._create_connection()
-            
-            # At limit, wait for a connection to be returned
-            try:
-                return self._pool.get(timeout=self.timeout)
-            except queue.Empty:
-                raise TimeoutError(f"Could not get database connection within {self.timeout}s")
-    
-    def return_connection(self, conn: sqlite3.Connection):
-        """Return a connection to the pool."""
-        try:
-            self._pool.put_nowait(conn)
-        except queue.Full:
-            # Pool is full, close the connection
-            conn.close()
-            with self._lock:
-                self._created_count -= 1
-    
-    def close_all(self):
-        """Close all pooled connections."""
-        while True:
-            try:
-                conn = self._pool.get_nowait()
-                conn.close()
-            except queue.Empty:
-                break
-        with self._lock:
-            self._created_count = 0
-
-
-# Global connection pool for budget operations
-_budget_pool: Optional[BudgetConnectionPool] = None
-_budget_pool_lock = threading.Lock()
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_reservations_tenant
+        ON budget_reservations(tenant_id, status)
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_reservations_expires
+        ON budget_reservations(expires_at)
+        """,
+    ]),
+    Migration(
+        2,
+        "Import configs and reservations from legacy budget.db",
+        apply=lambda conn: copy_legacy_tables(
+            conn, LEGACY_BUDGET_DB_PATH, ["budget_configs", "budget_reservations"]
+        )
+    ),
+]
 
 
-def _get_budget_pool() -> BudgetConnectionPool:
-    """Get or create the global budget connection pool."""
-    global _budget_pool
-    if _budget_pool is None:
-        with _budget_pool_lock:
-            if _budget_pool is None:
-                _budget_pool = BudgetConnectionPool(BUDGET_DB_PATH, pool_size=20)
-    return _budget_pool
+def init_budget_db():
+    """Initialize budget tables in the shared storage engine. Thread-safe."""
+    get_storage_engine().migrate("budget", BUDGET_MIGRATIONS)
 
 
 @contextmanager
 def get_budget_db():
-    """Thread-safe context manager for budget database connections."""
-    pool = _get_budget_pool()
-    conn = pool.get_connection()
-    try:
+    """Thread-safe context manager for a pooled read connection."""
+    init_budget_db()
+    with get_storage_engine().read() as conn:
         yield conn
-    finally:
-        pool.return_connection(conn)
-
 
-# Thread-safe initialization
-_budget_db_initialized = False
-_budget_init_lock = threading.Lock()
 
-
-def init_budget_db():
-    """Initialize budget database with WAL mode. Thread-safe."""
-    global _budget_db_initialized
+class ReservationLedger:
+    """
+    In-memory ledger of active budget reservations, shared per process.
     
-    if _budget_db_initialized:
-        return
+    Entries expire lazily: expired reservations are dropped when a tenant's
+    total is read. The budget_reservations table remains the durable record
+    and is used to (re)load a tenant's entries.
     
-    with _budget_init_lock:
-        if _budget_db_initialized:
-            return
+    Thread Safety:
+        All methods are synchronized; hold `lock` to make a check-and-add
+        atomic.
+    """
+    
+    def __init__(self):
+        self.lock = threading.RLock()
+        self._entries: Dict[str, Dict[str, tuple[float, float]]] = {}  # tenant -> id -> (amount, expires_at)
+        self._tenant_of: Dict[str, str] = {}
+        self._loaded_at: Dict[str, float] = {}
+    
+    def needs_refresh(self, tenant_id: str, max_age_seconds: float) -> bool:
+        """True if the tenant was never loaded or was loaded too long ago."""
+        loaded_at = self._loaded_at.get(tenant_id)
+        return loaded_at is None or time.monotonic() - loaded_at > max_age_seconds
+    
+    def load(self, tenant_id: str, rows: list):
+        """
+        Replace a tenant's entries with rows from the database.
         
-        with get_budget_db() as conn:
-            cursor = conn.cursor()
-            cursor.execute("BEGIN IMMEDIATE")
-            
-            try:
-                # Table for storing budget configs (persistent)
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS budget_configs (
-                        tenant_id TEXT PRIMARY KEY,
-                        daily_limit_usd REAL DEFAULT 100.0,
-                        monthly_limit_usd REAL DEFAULT 2000.0,
-                        per_run_limit_usd REAL DEFAULT 10.0,
-                        warn_at_percent REAL DEFAULT 0.8,
-                        block_on_exceed INTEGER DEFAULT 0,
-                        updated_at TEXT DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                
-                # Table for budget reservations (for concurrent budget checking)
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS budget_reservations (
-                        reservation_id TEXT PRIMARY KEY,
-                        tenant_id TEXT NOT NULL,
-                        amount_usd REAL NOT NULL,
-                        created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                        expires_at TEXT NOT NULL,
-                        status TEXT DEFAULT 'active'
-                    )
-                """)
-                
-                cursor.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_reservations_tenant 
-                    ON budget_reservations(tenant_id, status)
-                """)
-                
-                cursor.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_reservations_expires 
-                    ON budget_reservations(expires_at)
-                """)
-                
-                cursor.execute("COMMIT")
-                _budget_db_initialized = True
-                
-            except Exception:
-                cursor.execute("ROLLBACK")
-                raise
+        Args:
+            tenant_id: Tenant identifier
+            rows: (reservation_id, amount_usd, expires_at_epoch) tuples
+        """
+        with self.lock:
+            for reservation_id in self._entries.pop(tenant_id, {}):
+                self._tenant_of.pop(reservation_id, None)
+            self._entries[tenant_id] = {
+                reservation_id: (amount, expires_at)
+                for reservation_id, amount, expires_at in rows
+            }
+            for reservation_id, _, _ in rows:
+                self._tenant_of[reservation_id] = tenant_id
+            self._loaded_at[tenant_id] = time.monotonic()
+    
+    def add(self, tenant_id: str, reservation_id: str, amount_usd: float, expires_at: float):
+        """Record a reservation expiring at the given epoch time."""
+        with self.lock:
+            self._entries.setdefault(tenant_id, {})[reservation_id] = (amount_usd, expires_at)
+            self._tenant_of[reservation_id] = tenant_id
+    
+    def release(self, reservation_id: str) -> bool:
+        """Drop a reservation. Returns False if it was not in the ledger."""
+        with self.lock:
+            tenant_id = self._tenant_of.pop(reservation_id, None)
+            if tenant_id is None:
+                return False
+            self._entries.get(tenant_id, {}).pop(reservation_id, None)
+            return True
+    
+    def total(self, tenant_id: str) -> float:
+        """Sum of a tenant's unexpired reservations, pruning expired ones."""
+        now = time.time()
+        with self.lock:
+            entries = self._entries.get(tenant_id)
+            if not entries:
+                return 0.0
+            expired = [rid for rid, (_, expires_at) in entries.items() if expires_at <= now]
+            for reservation_id in expired:
+                del entries[reservation_id]
+                self._tenant_of.pop(reservation_id, None)
+            return sum(amount for amount, _ in entries.values())
+
+
+# Process-wide ledger shared by all BudgetManager instances
+_reservation_ledger = ReservationLedger()
 
 
 class BudgetManager:
     """
     Thread-safe budget tracking and enforcement for 20+ concurrent agents.
     
-    Uses SQLite WAL mode and connection pooling for concurrent access.
+    Uses the shared storage engine: reads from pooled connections, writes
+    through its single writer thread.
     Supports budget reservations to prevent race conditions during concurrent runs.
     
     Usage:
@@ -265,6 +252,11 @@ class BudgetManager:
     # Thread-safe config cache
     _config_lock = threading.RLock()
     
+    # Reservation ledger refresh and database cleanup intervals
+    LEDGER_REFRESH_SECONDS = 60
+    CLEANUP_INTERVAL_SECONDS = 300
+    _last_cleanup = float("-inf")
+    
     def __init__(self, telemetry_collector=None):
         """
         Initialize with optional telemetry collector for cost data.
@@ -276,10 +268,16 @@ class BudgetManager:
             from lib.telemetry import TelemetryCollector
             telemetry_collector = TelemetryCollector()
         self.telemetry = telemetry_collector
+        self.engine = get_storage_engine()
         self._configs: Dict[str, BudgetConfig] = {}  # In-memory cache
         self._local = threading.local()  # Thread-local storage
         init_budget_db()
     
+    @property
+    def _shares_telemetry_db(self) -> bool:
+        """True if telemetry runs live in the same database as budget tables."""
+        return getattr(self.telemetry, "engine", None) is self.engine
+    
     def get_config(self, tenant_id: str) -> BudgetConfig:
         """
         Get budget config for tenant, or default. Thread-safe.
@@ -321,65 +319,107 @@ class BudgetManager:
         
         Persists to database and updates in-memory cache.
         """
-        with get_budget_db() as conn:
-            cursor = conn.cursor()
-            cursor.execute("BEGIN IMMEDIATE")
-            try:
-                cursor.execute("""
-                    INSERT OR REPLACE INTO budget_configs 
-                    (tenant_id, daily_limit_usd, monthly_limit_usd, per_run_limit_usd,
-                     warn_at_percent, block_on_exceed, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, datetime('now'))
-                """, (
-                    config.tenant_id,
-                    config.daily_limit_usd,
-                    config.monthly_limit_usd,
-                    config.per_run_limit_usd,
-                    config.warn_at_percent,
-                    1 if config.block_on_exceed else 0
-                ))
-                cursor.execute("COMMIT")
-            except Exception:
-                cursor.execute("ROLLBACK")
-                raise
+        self.engine.execute("""
+            INSERT OR REPLACE INTO budget_configs 
+            (tenant_id, daily_limit_usd, monthly_limit_usd, per_run_limit_usd,
+             warn_at_percent, block_on_exceed, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, datetime('now'))
+        """, (
+            config.tenant_id,
+            config.daily_limit_usd,
+            config.monthly_limit_usd,
+            config.per_run_limit_usd,
+            config.warn_at_percent,
+            1 if config.block_on_exceed else 0
+        ))
         
         with self._config_lock:
             self._configs[config.tenant_id] = config
     
     def _get_active_reservations(self, tenant_id: str) -> float:
         """Get total amount of active (non-expired) reservations for a tenant."""
-        with get_budget_db() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT COALESCE(SUM(amount_usd), 0.0) 
-                FROM budget_reservations 
-                WHERE tenant_id = ? 
-                  AND status = 'active' 
-                  AND expires_at > datetime('now')
-            """, (tenant_id,))
-            return cursor.fetchone()[0]
+        self._ensure_ledger_loaded(tenant_id)
+        return _reservation_ledger.total(tenant_id)
+    
+    def _ensure_ledger_loaded(self, tenant_id: str):
+        """
+        Load a tenant's active reservations from the database into the ledger.
+        
+        Runs on first use per process, then every LEDGER_REFRESH_SECONDS so
+        reservations made by other processes are picked up.
+        """
+        if not _reservation_ledger.needs_refresh(tenant_id, self.LEDGER_REFRESH_SECONDS):
+            return
+        
+        with _reservation_ledger.lock:
+            if not _reservation_ledger.needs_refresh(tenant_id, self.LEDGER_REFRESH_SECONDS):
+                return
+            # Our own reservation writes are queued; make them visible first
+            self.engine.flush()
+            with get_budget_db() as conn:
+                rows = conn.execute("""
+                    SELECT reservation_id, amount_usd,
+                           CAST(strftime('%s', expires_at) AS REAL)
+                    FROM budget_reservations 
+                    WHERE tenant_id = ? 
+                      AND status = 'active' 
+                      AND expires_at > datetime('now')
+                """, (tenant_id,)).fetchall()
+            _reservation_ledger.load(tenant_id, [tuple(row) for row in rows])
     
     def _cleanup_expired_reservations(self):
-        """Clean up expired reservations. Thread-safe."""
-        with get_budget_db() as conn:
-            cursor = conn.cursor()
-            cursor.execute("BEGIN IMMEDIATE")
-            try:
-                cursor.execute("""
-                    UPDATE budget_reservations 
-                    SET status = 'expired'
-                    WHERE status = 'active' AND expires_at <= datetime('now')
-                """)
-                cursor.execute("COMMIT")
-            except Exception:
-                cursor.execute("ROLLBACK")
+        """
+        Mark expired reservations in the database. Thread-safe, rate-limited.
+        
+        The ledger already ignores expired entries, so this is housekeeping
+        only: it runs at most every CLEANUP_INTERVAL_SECONDS and does not wait
+        for the write.
+        """
+        now = time.monotonic()
+        with self._config_lock:
+            if now - BudgetManager._last_cleanup < self.CLEANUP_INTERVAL_SECONDS:
+                return
+            BudgetManager._last_cleanup = now
+        
+        self.engine.execute("""
+            UPDATE budget_reservations 
+            SET status = 'expired'
+            WHERE status = 'active' AND expires_at <= datetime('now')
+        """, wait=False)
+    
+    def _flush_telemetry(self):
+        """Make runs still in the telemetry write-behind queue visible to reads."""
+        if hasattr(self.telemetry, "flush"):
+            self.telemetry.flush()
+    
+    def _get_spend(self, tenant_id: str) -> tuple[float, float]:
+        """
+        Get a tenant's daily and monthly spend.
+        
+        Both are rolling 1- and 30-day sums. When telemetry shares the
+        storage engine they are read from the daily spend rollups; otherwise
+        from the collector's get_tenant_costs.
+        
+        Returns:
+            (daily_spent, monthly_spent)
+        """
+        if self._shares_telemetry_db and hasattr(self.telemetry, "get_tenant_spend"):
+            spend = self.telemetry.get_tenant_spend(tenant_id)
+            return spend["daily_cost_usd"], spend["monthly_cost_usd"]
+        
+        self._flush_telemetry()
+        daily_spent = self.telemetry.get_tenant_costs(tenant_id, days=1)["total_cost_usd"]
+        monthly_spent = self.telemetry.get_tenant_costs(tenant_id, days=30)["total_cost_usd"]
+        return daily_spent, monthly_spent
     
     def reserve_budget(self, tenant_id: str, amount_usd: float, ttl_seconds: int = 300) -> Optional[str]:
         """
         Reserve budget for an upcoming run. Thread-safe.
         
         Prevents race conditions where multiple concurrent agents might
-        all pass budget checks but collectively exceed the budget.
+        all pass budget checks but collectively exceed the budget: the check
+        and the ledger entry are made under one lock. The database row is
+        written behind, but queued under that lock.
         
         Args:
             tenant_id: Tenant identifier
@@ -389,31 +429,30 @@ class BudgetManager:
         Returns:
             reservation_id if successful, None if budget would be exceeded
         """
-        import uuid
+        config = self.get_config(tenant_id)
+        daily_spent, monthly_spent = self._get_spend(tenant_id)
+        self._ensure_ledger_loaded(tenant_id)
         
-        # First check if this would exceed budget
-        status = self.check_budget(tenant_id, amount_usd)
-        if status.status == "exceeded":
-            config = self.get_config(tenant_id)
+        with _reservation_ledger.lock:
             if config.block_on_exceed:
-                return None
-        
-        reservation_id = str(uuid.uuid4())
-        
-        with get_budget_db() as conn:
-            cursor = conn.cursor()
-            cursor.execute("BEGIN IMMEDIATE")
-            try:
-                cursor.execute("""
-                    INSERT INTO budget_reservations 
-                    (reservation_id, tenant_id, amount_usd, expires_at, status)
-                    VALUES (?, ?, ?, datetime('now', '+' || ? || ' seconds'), 'active')
-                """, (reservation_id, tenant_id, amount_usd, ttl_seconds))
-                cursor.execute("COMMIT")
-                return reservation_id
-            except Exception:
-                cursor.execute("ROLLBACK")
-                raise
+                status = self._build_status(
+                    tenant_id, config, daily_spent, monthly_spent,
+                    _reservation_ledger.total(tenant_id), amount_usd
+                )
+                if status.status == "exceeded":
+                    return None
+            
+            reservation_id = str(uuid.uuid4())
+            expires_at = time.time() + ttl_seconds
+            _reservation_ledger.add(tenant_id, reservation_id, amount_usd, expires_at)
+            # Queue the row before releasing the lock, so a ledger reload
+            # (which flushes first) cannot miss it
+            self.engine.execute("""
+                INSERT INTO budget_reservations 
+                (reservation_id, tenant_id, amount_usd, expires_at, status)
+                VALUES (?, ?, ?, datetime(?, 'unixepoch'), 'active')
+            """, (reservation_id, tenant_id, amount_usd, int(expires_at)), wait=False)
+        return reservation_id
     
     def release_reservation(self, reservation_id: str):
         """
@@ -422,24 +461,23 @@ class BudgetManager:
         Args:
             reservation_id: The reservation to release
         """
-        with get_budget_db() as conn:
-            cursor = conn.cursor()
-            cursor.execute("BEGIN IMMEDIATE")
-            try:
-                cursor.execute("""
-                    UPDATE budget_reservations 
-                    SET status = 'released'
-                    WHERE reservation_id = ?
-                """, (reservation_id,))
-                cursor.execute("COMMIT")
-            except Exception:
-                cursor.execute("ROLLBACK")
+        # Same ordering as reserve_budget: the update is queued under the
+        # ledger lock so a reload cannot bring the reservation back
+        with _reservation_ledger.lock:
+            _reservation_ledger.release(reservation_id)
+            self.engine.execute("""
+                UPDATE budget_reservations 
+                SET status = 'released'
+                WHERE reservation_id = ?
+            """, (reservation_id,), wait=False)
     
     def check_budget(self, tenant_id: str, estimated_cost: float = 0) -> BudgetStatus:
         """
         Check current budget status for a tenant. Thread-safe.
         
         Includes active reservations from concurrent runs in calculations.
+        Spend comes from the per-tenant rollups and reservations from the
+        in-memory ledger, so the cost does not grow with run history.
         
         Args:
             tenant_id: Tenant identifier
@@ -452,17 +490,23 @@ class BudgetManager:
         self._cleanup_expired_reservations()
         
         config = self.get_config(tenant_id)
-        
-        # Get current spend from telemetry
-        daily_costs = self.telemetry.get_tenant_costs(tenant_id, days=1)
-        monthly_costs = self.telemetry.get_tenant_costs(tenant_id, days=30)
-        
-        daily_spent = daily_costs["total_cost_usd"]
-        monthly_spent = monthly_costs["total_cost_usd"]
-        
-        # Include active reservations (pending concurrent runs)
+        daily_spent, monthly_spent = self._get_spend(tenant_id)
         active_reservations = self._get_active_reservations(tenant_id)
         
+        return self._build_status(
+            tenant_id, config, daily_spent, monthly_spent, active_reservations, estimated_cost
+        )
+    
+    def _build_status(
+        self,
+        tenant_id: str,
+        config: BudgetConfig,
+        daily_spent: float,
+        monthly_spent: float,
+        active_reservations: float,
+        estimated_cost: float
+    ) -> BudgetStatus:
+        """Compute a BudgetStatus from spend, reservations and an estimate."""
         # Calculate with estimated cost AND active reservations
         daily_projected = daily_spent + active_reservations + estimated_cost
         monthly_projected = monthly_spent + active_reservations + estimated_cost
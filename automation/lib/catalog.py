@@ -0,0 +1,465 @@
+"""
+MH1 Skill & Agent Catalog
+Single on-disk index of every SKILL.md and agent definition.
+
+Skill and agent discovery used to rescan the skills/ and agents/ trees and
+re-parse YAML frontmatter in every consumer (the mh1 CLI, SkillRegistry,
+ContextOrchestrator and AgentRegistry). The catalog compiles that metadata
+once into a versioned JSON file and keeps it current incrementally:
+
+- Directory mtimes detect added or removed skills and agents
+- Per-file (mtime, size) signatures detect edits
+- Only new or changed files are re-parsed; everything else is reused
+
+Usage:
+    from lib.catalog import get_catalog
+
+    catalog = get_catalog()
+    for skill in catalog.skills:
+        print(skill["name"], skill["category"], skill["description"])
+
+    agent = catalog.get_agent("lifecycle-auditor")
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+SYSTEM_ROOT = Path(__file__).parent.parent
+PROJECT_ROOT = SYSTEM_ROOT.parent
+CATALOG_PATH = Path(os.environ.get("MH1_CATALOG_PATH", SYSTEM_ROOT / ".mh1" / "catalog.json"))
+
+# Bump when the entry format changes; older files are rebuilt from scratch
+CATALOG_VERSION = 1
+
+DEFAULT_SKILL_ROOTS = (PROJECT_ROOT / ".skills", PROJECT_ROOT / "skills")
+DEFAULT_AGENT_ROOTS = (PROJECT_ROOT / ".agents", PROJECT_ROOT / "agents")
+AGENT_ROLE_DIRS = ("orchestrators", "workers", "evaluators")
+_ROLE_ORDER = {d.rstrip("s"): i for i, d in enumerate(AGENT_ROLE_DIRS)}
+
+FRONTMATTER_PATTERN = re.compile(r'^---\s*\n(.*?)\n---', re.DOTALL)
+
+
+def _signature(path: Path) -> Optional[List[int]]:
+    """(mtime_ns, size) for a file or directory, or None if missing."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def parse_frontmatter(content: str) -> Dict[str, Any]:
+    """
+    Parse YAML frontmatter from markdown content.
+
+    Values are normalized to JSON types (dates become strings) so parsed
+    and reloaded entries compare equal.
+    """
+    match = FRONTMATTER_PATTERN.match(content)
+    if not match:
+        return {}
+    try:
+        frontmatter = yaml.safe_load(match.group(1))
+    except yaml.YAMLError as e:
+        logger.warning(f"Failed to parse YAML frontmatter: {e}")
+        return {}
+    if not isinstance(frontmatter, dict):
+        return {}
+    return json.loads(json.dumps(frontmatter, default=str))
+
+
+def _skippable(path: Path) -> bool:
+    return path.name.startswith("_") or path.name.startswith(".") or "TEMPLATE" in path.name
+
+
+def _first_text_line(content: str) -> str:
+    """First non-empty line that is not a heading or frontmatter fence."""
+    for line in content.split("\n"):
+        if line.strip() and not line.startswith("#") and not line.startswith("---"):
+            return line.strip()
+    return ""
+
+
+def _load_json(path: Path) -> Dict[str, Any]:
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def build_skill_entry(skill_dir: Path, category_dir: Optional[Path]) -> Dict[str, Any]:
+    """Compile one skill directory into a catalog entry."""
+    skill_md = skill_dir / "SKILL.md"
+    content = skill_md.read_text()
+    frontmatter = parse_frontmatter(content)
+    meta = frontmatter.get("metadata") if isinstance(frontmatter.get("metadata"), dict) else {}
+
+    version = frontmatter.get("version") or meta.get("version")
+    if not version:
+        for line in content.split("\n"):
+            if line.strip().startswith("Version:"):
+                version = line.split(":", 1)[1].strip()
+                break
+
+    description = frontmatter.get("description") or ""
+    if not isinstance(description, str):
+        description = str(description)
+
+    category = category_dir.name.replace("-skills", "") if category_dir else ""
+
+    return {
+        "name": frontmatter.get("name") or skill_dir.name,
+        "dir_name": skill_dir.name,
+        "category": category,
+        "path": str(skill_dir),
+        "description": description,
+        "version": str(version) if version else "unknown",
+        "status": meta.get("status", "active"),
+        "tags": meta.get("tags", []),
+        "deprecated": "status: deprecated" in content.lower(),
+        "inputs": _load_json(skill_dir / "schemas" / "input.json"),
+        "outputs": _load_json(skill_dir / "schemas" / "output.json"),
+        "frontmatter": frontmatter,
+    }
+
+
+def build_agent_entry(agent_file: Path, role_dir: Path) -> Dict[str, Any]:
+    """Compile one agent markdown file into a catalog entry."""
+    content = agent_file.read_text()
+    frontmatter = parse_frontmatter(content)
+    return {
+        "name": frontmatter.get("name") or agent_file.stem,
+        "stem": agent_file.stem,
+        "role": role_dir.name.rstrip("s"),
+        "path": str(agent_file),
+        "nested": agent_file.parent != role_dir,
+        "first_line": _first_text_line(content),
+        "frontmatter": frontmatter,
+    }
+
+
+class Catalog:
+    """
+    Incrementally maintained index of skills and agents.
+
+    Thread-safe. With a path, the index is persisted as JSON and reused by
+    later processes; without one it lives in memory only.
+    """
+
+    # Minimum seconds between filesystem checks from get_catalog()
+    REFRESH_INTERVAL_SECONDS = 2.0
+
+    def __init__(
+        self,
+        path: Optional[Path] = CATALOG_PATH,
+        skill_roots: Iterable[Path] = DEFAULT_SKILL_ROOTS,
+        agent_roots: Iterable[Path] = DEFAULT_AGENT_ROOTS
+    ):
+        """
+        Initialize Catalog.
+
+        Args:
+            path: Catalog file (None keeps the catalog in memory only)
+            skill_roots: Directories holding <category>/<skill>/SKILL.md
+                         (or <skill>/SKILL.md) trees
+            agent_roots: Directories holding orchestrators/, workers/ and
+                         evaluators/ agent markdown
+        """
+        self.path = Path(path) if path else None
+        self.skill_roots = [Path(p) for p in skill_roots]
+        self.agent_roots = [Path(p) for p in agent_roots]
+
+        self._lock = threading.RLock()
+        self._skills: Dict[str, Dict[str, Any]] = {}   # SKILL.md path -> entry
+        self._agents: Dict[str, Dict[str, Any]] = {}   # agent file path -> entry
+        self._files: Dict[str, Any] = {}               # file path -> {signatures, entry}
+        self._dirs: Dict[str, Any] = {}                # scanned dir -> [signature, children]
+        self._previous_files: Dict[str, Any] = {}
+        self._previous_dirs: Dict[str, Any] = {}
+        self._last_refresh = 0.0
+        self._generation = 0
+        self._stats = {"parsed": 0, "reused": 0, "refreshes": 0, "loaded_from_disk": False}
+
+        self._read()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    @property
+    def skills(self) -> List[Dict[str, Any]]:
+        """All skill entries, ordered by category then directory name."""
+        with self._lock:
+            return sorted(self._skills.values(), key=lambda s: (s["category"], s["dir_name"], s["path"]))
+
+    @property
+    def agents(self) -> List[Dict[str, Any]]:
+        """All agent entries, ordered by role (as in AGENT_ROLE_DIRS) then path."""
+        with self._lock:
+            return sorted(
+                self._agents.values(),
+                key=lambda a: (_ROLE_ORDER.get(a["role"], len(_ROLE_ORDER)), a["path"])
+            )
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped whenever a refresh changes the catalog."""
+        return self._generation
+
+    def get_skill(self, name: str) -> Optional[Dict[str, Any]]:
+        """Find a skill by frontmatter name or directory name."""
+        for skill in self.skills:
+            if skill["name"] == name or skill["dir_name"] == name:
+                return skill
+        return None
+
+    def get_agent(self, name: str) -> Optional[Dict[str, Any]]:
+        """Find an agent by frontmatter name or file stem."""
+        for agent in self.agents:
+            if agent["name"] == name or agent["stem"] == name:
+                return agent
+        return None
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Bring the catalog up to date with the filesystem.
+
+        Args:
+            force: Re-parse every file instead of reusing unchanged entries
+
+        Returns:
+            True if any entry was added, changed or removed
+        """
+        with self._lock:
+            self._previous_files = {} if force else self._files
+            self._previous_dirs = {} if force else self._dirs
+
+            dirs: Dict[str, Any] = {}
+            skills, skill_files = self._scan_skills(dirs)
+            agents, agent_files = self._scan_agents(dirs)
+
+            changed = (
+                force
+                or skills.keys() != self._skills.keys()
+                or agents.keys() != self._agents.keys()
+                or any(skills[k] is not self._skills.get(k) for k in skills)
+                or any(agents[k] is not self._agents.get(k) for k in agents)
+            )
+
+            self._skills, self._agents, self._dirs = skills, agents, dirs
+            self._files = {**skill_files, **agent_files}
+            self._last_refresh = time.monotonic()
+            self._stats["refreshes"] += 1
+
+            if changed:
+                self._generation += 1
+                self._write()
+            return changed
+
+    def refresh_if_due(self) -> bool:
+        """refresh() at most once per REFRESH_INTERVAL_SECONDS."""
+        if time.monotonic() - self._last_refresh < self.REFRESH_INTERVAL_SECONDS:
+            return False
+        return self.refresh()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get catalog size and parse/reuse counters."""
+        with self._lock:
+            return {
+                **self._stats,
+                "skills": len(self._skills),
+                "agents": len(self._agents),
+                "path": str(self.path) if self.path else None,
+            }
+
+    # ------------------------------------------------------------------
+    # Scanning
+    # ------------------------------------------------------------------
+
+    def _list_dir(self, directory: Path, dirs: Dict[str, Any]) -> List[Path]:
+        """List a directory, reusing the previous listing if its mtime is unchanged."""
+        key = str(directory)
+        signature = _signature(directory)
+        previous = self._previous_dirs.get(key)
+        if previous and previous[0] == signature:
+            children = previous[1]
+        else:
+            children = sorted(p.name for p in directory.iterdir()) if signature else []
+        dirs[key] = [signature, children]
+        return [directory / name for name in children]
+
+    def _reuse(self, path: Path, deps: List[Path]) -> Tuple[Optional[Dict], Dict[str, Any]]:
+        """Return the previous entry for path if none of its files changed."""
+        signatures = {str(p): _signature(p) for p in deps}
+        previous = self._previous_files.get(str(path))
+        if previous is not None and previous.get("signatures") == signatures:
+            self._stats["reused"] += 1
+            return previous["entry"], signatures
+        return None, signatures
+
+    def _scan_skills(self, dirs: Dict[str, Any]) -> Tuple[Dict[str, Dict], Dict[str, Any]]:
+        skills: Dict[str, Dict[str, Any]] = {}
+        files: Dict[str, Any] = {}
+
+        def add(skill_dir: Path, category_dir: Optional[Path]):
+            skill_md = skill_dir / "SKILL.md"
+            deps = [skill_md, skill_dir / "schemas" / "input.json", skill_dir / "schemas" / "output.json"]
+            entry, signatures = self._reuse(skill_md, deps)
+            if entry is None:
+                try:
+                    entry = build_skill_entry(skill_dir, category_dir)
+                    self._stats["parsed"] += 1
+                except Exception as e:
+                    logger.warning(f"Failed to catalog skill {skill_dir}: {e}")
+                    return
+            skills[str(skill_md)] = entry
+            files[str(skill_md)] = {"signatures": signatures, "entry": entry}
+
+        for root in self.skill_roots:
+            for child in self._list_dir(root, dirs):
+                if _skippable(child) or not child.is_dir():
+                    continue
+                if (child / "SKILL.md").exists():
+                    add(child, None)
+                    continue
+                for skill_dir in self._list_dir(child, dirs):
+                    if _skippable(skill_dir) or not (skill_dir / "SKILL.md").exists():
+                        continue
+                    add(skill_dir, child)
+
+        return skills, files
+
+    def _scan_agents(self, dirs: Dict[str, Any]) -> Tuple[Dict[str, Dict], Dict[str, Any]]:
+        agents: Dict[str, Dict[str, Any]] = {}
+        files: Dict[str, Any] = {}
+
+        def walk(directory: Path, role_dir: Path):
+            for child in self._list_dir(directory, dirs):
+                if child.name.startswith("_") or "TEMPLATE" in child.name:
+                    continue
+                if child.is_dir():
+                    walk(child, role_dir)
+                    continue
+                if child.suffix != ".md":
+                    continue
+                entry, signatures = self._reuse(child, [child])
+                if entry is None:
+                    try:
+                        entry = build_agent_entry(child, role_dir)
+                        self._stats["parsed"] += 1
+                    except Exception as e:
+                        logger.warning(f"Failed to catalog agent {child}: {e}")
+                        continue
+                agents[str(child)] = entry
+                files[str(child)] = {"signatures": signatures, "entry": entry}
+
+        for root in self.agent_roots:
+            for role in AGENT_ROLE_DIRS:
+                role_dir = root / role
+                if role_dir.is_dir():
+                    walk(role_dir, role_dir)
+
+        return agents, files
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _roots_key(self) -> Dict[str, List[str]]:
+        return {
+            "skills": [str(p) for p in self.skill_roots],
+            "agents": [str(p) for p in self.agent_roots],
+        }
+
+    def _read(self):
+        """Load a previously written catalog, if compatible."""
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable catalog {self.path}: {e}")
+            return
+        if data.get("version") != CATALOG_VERSION or data.get("roots") != self._roots_key():
+            return
+
+        self._files = data.get("files", {})
+        self._dirs = data.get("dirs", {})
+        skill_paths = set(data.get("skills", []))
+        agent_paths = set(data.get("agents", []))
+        self._skills = {k: v["entry"] for k, v in self._files.items() if k in skill_paths}
+        self._agents = {k: v["entry"] for k, v in self._files.items() if k in agent_paths}
+        self._stats["loaded_from_disk"] = True
+
+    def _write(self):
+        """Persist the catalog atomically."""
+        if self.path is None:
+            return
+        data = {
+            "version": CATALOG_VERSION,
+            "built_at": datetime.now(timezone.utc).isoformat(),
+            "roots": self._roots_key(),
+            "skills": sorted(self._skills),
+            "agents": sorted(self._agents),
+            "dirs": self._dirs,
+            "files": self._files,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(data, separators=(",", ":"), default=str))
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write catalog {self.path}: {e}")
+
+
+# Process-wide catalog
+_catalog: Optional[Catalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog(refresh: bool = True) -> Catalog:
+    """
+    Get the shared catalog, checking the filesystem for changes.
+
+    Args:
+        refresh: Check for changes (at most every REFRESH_INTERVAL_SECONDS)
+
+    Returns:
+        The process-wide Catalog
+    """
+    global _catalog
+
+    with _catalog_lock:
+        if _catalog is None:
+            _catalog = Catalog()
+            _catalog.refresh()
+            return _catalog
+
+    if refresh:
+        _catalog.refresh_if_due()
+    return _catalog
+
+
+__all__ = [
+    "CATALOG_PATH",
+    "CATALOG_VERSION",
+    "Catalog",
+    "build_agent_entry",
+    "build_skill_entry",
+    "get_catalog",
+    "parse_frontmatter",
+]
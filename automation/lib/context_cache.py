@@ -0,0 +1,356 @@
+"""
+Context Cache - Bounded cache layer for the Context Orchestrator.
+
+Replaces the orchestrator's unbounded dict + fixed TTL with:
+- A size bound in estimated tokens (and entry count), evicting least
+  recently used entries first
+- File-backed entries validated against their source files' mtime/size,
+  so edits to SKILL.md or agent files are picked up on the next read
+- Stale-while-revalidate for remote (Firebase) entries: a stale value is
+  served immediately while one background refresh reloads it
+- Hit/miss/eviction/invalidation statistics
+
+The cache is pluggable: ContextOrchestrator accepts any object with the
+same get/set/get_or_load/invalidate/get_stats interface.
+
+Usage:
+    from lib.context_cache import ContextCache
+
+    cache = ContextCache(max_tokens=2_000_000)
+
+    # File-backed: valid until a source file changes
+    cache.set("skill_metadata:lifecycle-audit", metadata, sources=[skill_md_path])
+
+    # Remote-backed: fresh for 5 minutes, then served stale while refreshing
+    profile = cache.get_or_load(
+        "client_profile:abc123",
+        loader=lambda: firebase.get_document("clients", "abc123"),
+        ttl=300,
+        stale_ttl=3600,
+    )
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Source file signature: (mtime_ns, size), or None if the file is missing
+FileSignature = Optional[Tuple[int, int]]
+
+
+def file_signature(path: Path) -> FileSignature:
+    """Cheap change signature for a file or directory."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def estimate_tokens(value: Any) -> int:
+    """Rough token estimate (4 characters per token) used for the size bound."""
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        text = value
+    else:
+        try:
+            text = json.dumps(value, default=str)
+        except (TypeError, ValueError):
+            text = str(value)
+    return len(text) // 4
+
+
+@dataclass
+class CacheEntry:
+    """A cached value with its validation metadata."""
+    value: Any
+    size: int                                          # Estimated tokens
+    stored_at: float                                   # time.monotonic()
+    ttl: Optional[float] = None                        # Fresh for ttl seconds (None = no expiry)
+    stale_ttl: float = 0.0                             # Served stale for this long after ttl
+    sources: Optional[Dict[str, FileSignature]] = None # File-backed validation
+    refreshing: bool = False
+
+    def age(self, now: float) -> float:
+        return now - self.stored_at
+
+    def is_fresh(self, now: float) -> bool:
+        return self.ttl is None or self.age(now) <= self.ttl
+
+    def is_servable_stale(self, now: float) -> bool:
+        return self.ttl is not None and self.age(now) <= self.ttl + self.stale_ttl
+
+    def sources_changed(self) -> bool:
+        if not self.sources:
+            return False
+        return any(file_signature(Path(path)) != sig for path, sig in self.sources.items())
+
+
+class ContextCache:
+    """
+    Thread-safe LRU cache bounded by estimated tokens.
+
+    Entries are one of:
+    - File-backed (sources given): valid until any source file's mtime/size
+      changes (a missing source that appears also invalidates). An optional
+      ttl still applies.
+    - TTL-backed: valid for ttl seconds.
+    - Stale-while-revalidate (get_or_load with stale_ttl): after ttl the
+      stale value is returned and reloaded in the background until
+      ttl + stale_ttl, after which the load is synchronous again.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int = 2_000_000,
+        max_entries: int = 10_000,
+        default_ttl: Optional[float] = 300.0,
+        sizeof: Callable[[Any], int] = estimate_tokens,
+        refresh_workers: int = 2
+    ):
+        """
+        Initialize ContextCache.
+
+        Args:
+            max_tokens: Bound on the total estimated tokens of cached values
+            max_entries: Bound on the number of entries
+            default_ttl: TTL for entries stored without sources or ttl
+            sizeof: Size estimate for a value, in tokens
+            refresh_workers: Threads for stale-while-revalidate refreshes
+        """
+        self.max_tokens = max_tokens
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.sizeof = sizeof
+        self.refresh_workers = refresh_workers
+
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._total_size = 0
+        self._lock = threading.RLock()
+        self._refresh_pool: Optional[ThreadPoolExecutor] = None
+
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "stale_hits": 0,
+            "evictions": 0,
+            "invalidations": 0,
+            "expirations": 0,
+            "refreshes": 0,
+            "refresh_failures": 0,
+            "rejected": 0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ------------------------------------------------------------------
+    # Core operations
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a value if present and still valid.
+
+        Stale-while-revalidate entries past their ttl count as misses here;
+        use get_or_load() to serve them stale.
+        """
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None or not entry.is_fresh(time.monotonic()):
+                self._stats["misses"] += 1
+                return None
+            self._stats["hits"] += 1
+            return entry.value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        sources: Optional[Iterable[Path]] = None,
+        ttl: Optional[float] = ...,
+        stale_ttl: float = 0.0
+    ):
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            sources: Files the value was built from. The entry is dropped
+                     when any of them changes, appears or disappears.
+            ttl: Fresh lifetime in seconds. Defaults to no expiry for
+                 file-backed entries and default_ttl otherwise; pass None
+                 for no expiry.
+            stale_ttl: Extra seconds get_or_load() may serve the value stale
+        """
+        if ttl is ...:
+            ttl = None if sources is not None else self.default_ttl
+
+        signatures = None
+        if sources is not None:
+            signatures = {str(path): file_signature(Path(path)) for path in sources}
+
+        size = self.sizeof(value)
+        entry = CacheEntry(
+            value=value,
+            size=size,
+            stored_at=time.monotonic(),
+            ttl=ttl,
+            stale_ttl=stale_ttl,
+            sources=signatures,
+        )
+
+        with self._lock:
+            self._remove(key)
+            if size > self.max_tokens:
+                self._stats["rejected"] += 1
+                return
+            self._entries[key] = entry
+            self._total_size += size
+            self._evict()
+
+    def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        ttl: Optional[float] = ...,
+        stale_ttl: float = 0.0,
+        sources: Optional[Iterable[Path]] = None
+    ) -> Any:
+        """
+        Get a value, loading it on a miss.
+
+        With stale_ttl > 0, a value older than ttl (but within ttl +
+        stale_ttl) is returned immediately and one background refresh
+        reloads it.
+
+        Args:
+            key: Cache key
+            loader: Zero-argument callable producing the value
+            ttl: Fresh lifetime (see set())
+            stale_ttl: Seconds past ttl during which stale values are served
+            sources: Files the value is built from (see set())
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        with self._lock:
+            entry = self._lookup(key)
+            now = time.monotonic()
+            if entry is not None:
+                if entry.is_fresh(now):
+                    self._stats["hits"] += 1
+                    return entry.value
+                if entry.is_servable_stale(now):
+                    self._stats["stale_hits"] += 1
+                    if not entry.refreshing:
+                        entry.refreshing = True
+                        self._schedule_refresh(key, loader, ttl, stale_ttl, sources)
+                    return entry.value
+                self._remove(key)
+                self._stats["expirations"] += 1
+            self._stats["misses"] += 1
+
+        value = loader()
+        self.set(key, value, sources=sources, ttl=ttl, stale_ttl=stale_ttl)
+        return value
+
+    def invalidate(self, key: str = None):
+        """Drop one key, or every entry if key is None."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self._total_size = 0
+            else:
+                self._remove(key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss/eviction statistics and current size."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+            stats["size_tokens"] = self._total_size
+            stats["max_tokens"] = self.max_tokens
+        lookups = stats["hits"] + stats["stale_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["hits"] + stats["stale_hits"]) / lookups if lookups else 0.0
+        return stats
+
+    # ------------------------------------------------------------------
+    # Internals (call with the lock held)
+    # ------------------------------------------------------------------
+
+    def _lookup(self, key: str) -> Optional[CacheEntry]:
+        """Find an entry, dropping it if expired or its sources changed."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if entry.sources_changed():
+            self._remove(key)
+            self._stats["invalidations"] += 1
+            return None
+
+        now = time.monotonic()
+        if not entry.is_fresh(now) and not entry.is_servable_stale(now):
+            self._remove(key)
+            self._stats["expirations"] += 1
+            return None
+
+        self._entries.move_to_end(key)
+        return entry
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_size -= entry.size
+
+    def _evict(self):
+        """Evict least recently used entries until within bounds."""
+        while self._entries and (
+            self._total_size > self.max_tokens or len(self._entries) > self.max_entries
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._total_size -= entry.size
+            self._stats["evictions"] += 1
+
+    def _schedule_refresh(self, key, loader, ttl, stale_ttl, sources):
+        if self._refresh_pool is None:
+            self._refresh_pool = ThreadPoolExecutor(
+                max_workers=self.refresh_workers,
+                thread_name_prefix="context-cache-refresh"
+            )
+
+        def refresh():
+            try:
+                value = loader()
+            except Exception as e:
+                logger.warning(f"Background refresh failed for {key}: {e}")
+                with self._lock:
+                    self._stats["refresh_failures"] += 1
+                    entry = self._entries.get(key)
+                    if entry is not None:
+                        entry.refreshing = False
+                return
+            self.set(key, value, sources=sources, ttl=ttl, stale_ttl=stale_ttl)
+            with self._lock:
+                self._stats["refreshes"] += 1
+
+        self._refresh_pool.submit(refresh)
+
+
+__all__ = [
+    "CacheEntry",
+    "ContextCache",
+    "estimate_tokens",
+    "file_signature",
+]
@@ -9,6 +9,12 @@ Loads context in 3 levels:
 This implements efficient context management to minimize token usage while
 ensuring all necessary context is available for execution.
 
+Independent sources (Firebase reads, platform configs, Level 3 files) are
+fetched concurrently, each with its own timeout; a source that fails or
+times out is left empty and listed in LoadedContext.degraded_sources. With
+speculative=True, load_for_planning also prefetches Level 3 for the
+top-ranked skill in the background.
+
 Usage:
     from lib.context_orchestrator import ContextOrchestrator, ContextBudget
 
@@ -25,12 +31,23 @@ import json
 import logging
 import re
 import threading
+import time
 import yaml
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Set, Tuple
+from typing import Callable, Dict, List, Any, Optional, Set, Tuple
 from datetime import datetime, timezone
 
+try:
+    from lib.catalog import get_catalog
+    from lib.context_cache import ContextCache
+    from lib.skill_retrieval import SkillRetriever
+except ImportError:
+    from catalog import get_catalog
+    from context_cache import ContextCache
+    from skill_retrieval import SkillRetriever
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -125,6 +142,7 @@ class LoadedContext:
     client_id: str = ""
     loaded_at: str = ""
     levels_loaded: List[int] = field(default_factory=list)
+    degraded_sources: List[str] = field(default_factory=list)  # Failed or timed out (left empty)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -140,7 +158,8 @@ class LoadedContext:
             "budget": self.budget.to_dict(),
             "client_id": self.client_id,
             "loaded_at": self.loaded_at,
-            "levels_loaded": self.levels_loaded
+            "levels_loaded": self.levels_loaded,
+            "degraded_sources": self.degraded_sources
         }
 
     def has_level(self, level: int) -> bool:
@@ -170,7 +189,9 @@ class ContextOrchestrator:
     - Level 3 (Execution): Full skill content, historical patterns
 
     Features:
-    - Caching to avoid redundant Firebase/file reads
+    - Bounded caching to avoid redundant Firebase/file reads (file-backed
+      entries refresh when the file changes; Firebase-backed entries are
+      served stale while revalidating)
     - Token budget management
     - Graceful handling of missing data
     - YAML frontmatter parsing for skills and agents
@@ -234,22 +255,65 @@ class ContextOrchestrator:
         "research-founder": ["thought-leader-analyst"],
     }
 
-    def __init__(self, firebase_client=None, intelligence_bridge=None):
+    # Skills whose metadata is loaded per intent (best-ranked first)
+    MAX_MATCHED_SKILLS = 5
+
+    # Cache lifetimes (seconds)
+    CACHE_TTL_SECONDS = 300          # TTL-backed entries (patterns, platform config)
+    REMOTE_STALE_TTL_SECONDS = 3600  # Firebase entries served stale while refreshing
+
+    # Concurrent loading
+    LOADER_WORKERS = 8
+    SOURCE_TIMEOUT_SECONDS = 10.0    # Per source; a slow source degrades to empty
+
+    def __init__(
+        self,
+        firebase_client=None,
+        intelligence_bridge=None,
+        cache=None,
+        speculative: bool = False,
+        source_timeout: float = None
+    ):
         """
         Initialize the Context Orchestrator.
 
         Args:
             firebase_client: Optional FirebaseClient instance for data loading
             intelligence_bridge: Optional IntelligenceBridge for pattern retrieval
+            cache: Optional cache layer (default: ContextCache bounded by
+                   estimated tokens)
+            speculative: Prefetch Level 3 for the top-ranked skill during
+                         load_for_planning
+            source_timeout: Seconds to wait for each concurrently loaded
+                            source (default: SOURCE_TIMEOUT_SECONDS)
         """
         self.firebase = firebase_client
         self.bridge = intelligence_bridge
+        self.speculative = speculative
+        self.source_timeout = source_timeout or self.SOURCE_TIMEOUT_SECONDS
+
+        # Concurrent loading: shared pool + in-flight loads by cache key, so
+        # a load already running (e.g. a speculative prefetch) is joined
+        # rather than repeated
+        self._loader_pool: Optional[ThreadPoolExecutor] = None
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self._loader_stats = {
+            "sources_loaded": 0,
+            "sources_joined": 0,
+            "timeouts": 0,
+            "failures": 0,
+            "prefetches": 0,
+        }
 
         # Caching
-        self._cache: Dict[str, Any] = {}
-        self._cache_timestamps: Dict[str, datetime] = {}
-        self._cache_lock = threading.RLock()
-        self._cache_ttl_seconds = 300  # 5 minute cache TTL
+        self._cache = cache or ContextCache(
+            default_ttl=self.CACHE_TTL_SECONDS,
+            sizeof=self._estimate_tokens
+        )
+
+        # Ranked skill retrieval (BM25 over the catalog + trigger phrases)
+        self._retriever = SkillRetriever(triggers=self.SKILL_TRIGGERS)
 
         # Track loaded state
         self._current_context: Optional[LoadedContext] = None
@@ -293,37 +357,192 @@ class ContextOrchestrator:
     # ============================================================
 
     def _get_cached(self, cache_key: str) -> Optional[Any]:
-        """Get item from cache if not expired."""
-        with self._cache_lock:
-            if cache_key not in self._cache:
-                return None
-
-            timestamp = self._cache_timestamps.get(cache_key)
-            if timestamp:
-                age = (datetime.now(timezone.utc) - timestamp).total_seconds()
-                if age > self._cache_ttl_seconds:
-                    # Expired - remove and return None
-                    del self._cache[cache_key]
-                    del self._cache_timestamps[cache_key]
-                    return None
-
-            return self._cache[cache_key]
-
-    def _set_cached(self, cache_key: str, value: Any):
-        """Set item in cache with timestamp."""
-        with self._cache_lock:
-            self._cache[cache_key] = value
-            self._cache_timestamps[cache_key] = datetime.now(timezone.utc)
+        """Get item from cache if still valid."""
+        return self._cache.get(cache_key)
+
+    def _set_cached(self, cache_key: str, value: Any, sources: List[Path] = None):
+        """
+        Set item in cache.
+
+        Args:
+            cache_key: Cache key
+            value: Value to cache
+            sources: Files the value was read from. If given, the entry stays
+                     valid until one of them changes instead of expiring.
+        """
+        self._cache.set(cache_key, value, sources=sources)
 
     def clear_cache(self, cache_key: str = None):
         """Clear cache (specific key or all)."""
-        with self._cache_lock:
-            if cache_key:
-                self._cache.pop(cache_key, None)
-                self._cache_timestamps.pop(cache_key, None)
-            else:
-                self._cache.clear()
-                self._cache_timestamps.clear()
+        self._cache.invalidate(cache_key)
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss/eviction statistics."""
+        return self._cache.get_stats()
+
+    # ============================================================
+    # CONCURRENT LOADING
+    # ============================================================
+
+    def _submit(self, key: str, loader: Callable[[], Any]) -> Future:
+        """
+        Run a loader on the loader pool, joining an in-flight load of the same key.
+
+        Args:
+            key: Cache key the loader populates
+            loader: Zero-argument loader (reads through the cache)
+
+        Returns:
+            Future for the loader's result
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                self._loader_stats["sources_joined"] += 1
+                return future
+
+            if self._loader_pool is None:
+                self._loader_pool = ThreadPoolExecutor(
+                    max_workers=self.LOADER_WORKERS,
+                    thread_name_prefix="context-loader"
+                )
+            future = self._loader_pool.submit(loader)
+            self._inflight[key] = future
+            self._loader_stats["sources_loaded"] += 1
+
+        def forget(done: Future):
+            with self._inflight_lock:
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+
+        future.add_done_callback(forget)
+        return future
+
+    def _load_concurrently(
+        self,
+        sources: Dict[str, Tuple[str, Callable[[], Any], Any]]
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Load independent sources in parallel with per-source timeouts.
+
+        A source that raises or exceeds source_timeout gets its default
+        value instead; a timed-out load keeps running and fills the cache
+        for the next call.
+
+        Args:
+            sources: Result name -> (cache key, loader, default)
+
+        Returns:
+            Tuple of (results by name, names of degraded sources)
+        """
+        started = time.monotonic()
+        futures = {
+            name: self._submit(key, loader)
+            for name, (key, loader, _) in sources.items()
+        }
+
+        results: Dict[str, Any] = {}
+        degraded: List[str] = []
+        for name, future in futures.items():
+            # Every source was submitted at `started`, so each one's
+            # deadline is started + source_timeout
+            remaining = max(0.0, started + self.source_timeout - time.monotonic())
+            try:
+                results[name] = future.result(timeout=remaining)
+            except FutureTimeoutError:
+                logger.warning(f"Context source '{name}' timed out after {self.source_timeout}s")
+                with self._inflight_lock:
+                    self._loader_stats["timeouts"] += 1
+                results[name] = sources[name][2]
+                degraded.append(name)
+            except Exception as e:
+                logger.warning(f"Context source '{name}' failed: {e}")
+                with self._inflight_lock:
+                    self._loader_stats["failures"] += 1
+                results[name] = sources[name][2]
+                degraded.append(name)
+
+        return results, degraded
+
+    def _level_1_sources(self, client_id: str) -> Dict[str, Tuple[str, Callable[[], Any], Any]]:
+        return {
+            "client": (f"client_profile:{client_id}", lambda: self._load_client_profile(client_id), {}),
+            "voice_contract": (f"voice_contract:{client_id}", lambda: self._load_voice_contract(client_id), {}),
+        }
+
+    def _platform_sources(self, client_id: str, platforms: Set[str]) -> Dict[str, Tuple[str, Callable[[], Any], Any]]:
+        return {
+            f"platform:{platform}": (
+                f"platform_config:{client_id}:{platform}",
+                lambda platform=platform: self._load_platform_config(client_id, platform),
+                {}
+            )
+            for platform in sorted(platforms)
+        }
+
+    def _level_3_sources(self, client_id: str, skill_name: str) -> Dict[str, Tuple[str, Callable[[], Any], Any]]:
+        return {
+            "full_skill": (f"full_skill:{skill_name}", lambda: self._load_full_skill(skill_name), {}),
+            "patterns": (
+                f"patterns:{skill_name}:{client_id}",
+                lambda: self._load_historical_patterns(skill_name, client_id),
+                []
+            ),
+            "skill_specific_data": (
+                f"skill_client_data:{skill_name}:{client_id}",
+                lambda: self._load_skill_specific_client_data(skill_name, client_id),
+                {}
+            ),
+        }
+
+    @staticmethod
+    def _collect_platform_config(results: Dict[str, Any]) -> Dict:
+        return {
+            name.split(":", 1)[1]: config
+            for name, config in results.items()
+            if name.startswith("platform:") and config
+        }
+
+    def prefetch_level_3(self, client_id: str, skill_name: str):
+        """
+        Start loading Level 3 context for a skill in the background.
+
+        A later load_for_execution for the same skill joins the in-flight
+        loads or is served from cache.
+
+        Args:
+            client_id: Client identifier
+            skill_name: Skill expected to be executed next
+        """
+        with self._inflight_lock:
+            self._loader_stats["prefetches"] += 1
+        for key, loader, _ in self._level_3_sources(client_id, skill_name).values():
+            self._submit(key, loader)
+
+    def close(self):
+        """
+        Shut down the loader pool without waiting for running loads.
+
+        Loads still running finish in the background; the orchestrator
+        starts a new pool if it is used again.
+        """
+        with self._inflight_lock:
+            pool, self._loader_pool = self._loader_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+    def __enter__(self) -> "ContextOrchestrator":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def get_loader_stats(self) -> Dict[str, Any]:
+        """Get concurrent loading statistics (loads, joins, timeouts, failures)."""
+        with self._inflight_lock:
+            stats = dict(self._loader_stats)
+            stats["in_flight"] = len(self._inflight)
+        return stats
 
     # ============================================================
     # YAML FRONTMATTER PARSING
@@ -373,11 +592,15 @@ class ContextOrchestrator:
         Returns:
             Client profile dict (empty dict if not found)
         """
-        cache_key = f"client_profile:{client_id}"
-        cached = self._get_cached(cache_key)
-        if cached is not None:
-            return cached
+        return self._cache.get_or_load(
+            f"client_profile:{client_id}",
+            lambda: self._fetch_client_profile(client_id),
+            ttl=self.CACHE_TTL_SECONDS,
+            stale_ttl=self.REMOTE_STALE_TTL_SECONDS
+        )
 
+    def _fetch_client_profile(self, client_id: str) -> Dict:
+        """Read a client profile from Firebase, falling back to local config."""
         profile = {}
 
         # Try Firebase first
@@ -400,7 +623,6 @@ class ContextOrchestrator:
                 except Exception as e:
                     logger.warning(f"Failed to load client config: {e}")
 
-        self._set_cached(cache_key, profile)
         return profile
 
     def _load_voice_contract(self, client_id: str) -> Dict:
@@ -415,11 +637,15 @@ class ContextOrchestrator:
         Returns:
             Voice contract dict (empty dict if not found)
         """
-        cache_key = f"voice_contract:{client_id}"
-        cached = self._get_cached(cache_key)
-        if cached is not None:
-            return cached
+        return self._cache.get_or_load(
+            f"voice_contract:{client_id}",
+            lambda: self._fetch_voice_contract(client_id),
+            ttl=self.CACHE_TTL_SECONDS,
+            stale_ttl=self.REMOTE_STALE_TTL_SECONDS
+        )
 
+    def _fetch_voice_contract(self, client_id: str) -> Dict:
+        """Read founder voice contracts from Firebase, falling back to local files."""
         voice_contract = {}
 
         # Try Firebase - look for founder voice contracts
@@ -455,24 +681,32 @@ class ContextOrchestrator:
                 except Exception as e:
                     logger.warning(f"Failed to load local voice contract: {e}")
 
-        self._set_cached(cache_key, voice_contract)
         return voice_contract
 
     # ============================================================
     # LEVEL 2 LOADERS: Skill & Agent Metadata
     # ============================================================
 
-    def _match_skills_to_intent(self, intent: Dict) -> List[str]:
+    def _match_skills_to_intent(self, intent: Dict, top_k: Optional[int] = None) -> List[str]:
         """
-        Match skills to user intent based on keywords and context.
+        Match skills to user intent, best match first.
+
+        Skills are ranked by SkillRetriever: BM25 over skill names, tags,
+        descriptions and inputs, plus a boost for each SKILL_TRIGGERS phrase
+        found in the intent text.
 
         Args:
             intent: Intent dict with keys like "type", "keywords", "description"
+            top_k: Maximum skills to return (default: MAX_MATCHED_SKILLS)
 
         Returns:
-            List of relevant skill names
+            List of relevant skill names, best first
         """
-        matched_skills: Set[str] = set()
+        return [name for name, _ in self._rank_skills_for_intent(intent, top_k)]
+
+    def _rank_skills_for_intent(self, intent: Dict, top_k: Optional[int] = None) -> List[Tuple[str, float]]:
+        """Ranked (skill name, score) pairs for an intent."""
+        top_k = top_k or self.MAX_MATCHED_SKILLS
 
         # Extract searchable text from intent
         search_text = " ".join([
@@ -482,20 +716,21 @@ class ContextOrchestrator:
             str(intent.get("query", ""))
         ]).lower()
 
-        # Match against trigger keywords
-        for trigger, skills in self.SKILL_TRIGGERS.items():
-            if trigger in search_text:
-                matched_skills.update(skills)
+        ranked = self._retriever.search(search_text, top_k=top_k)
 
-        # If explicit skill requested, add it
+        # If explicit skill requested, it always comes first; its score stays
+        # finite (one above the best match) so rankings serialize as JSON
         if intent.get("skill"):
-            matched_skills.add(intent["skill"])
+            explicit = intent["skill"]
+            others = [r for r in ranked if r[0] != explicit][:top_k - 1]
+            top_score = max((score for _, score in others), default=0.0)
+            ranked = [(explicit, top_score + 1.0)] + others
 
         # If no matches found, return empty list (let caller handle)
-        if not matched_skills:
+        if not ranked:
             logger.debug(f"No skills matched for intent: {intent}")
 
-        return list(matched_skills)
+        return ranked
 
     def _load_skill_metadata(self, skill_name: str) -> Dict:
         """
@@ -551,7 +786,7 @@ class ContextOrchestrator:
         else:
             logger.debug(f"Skill not found: {skill_name}")
 
-        self._set_cached(cache_key, metadata)
+        self._set_cached(cache_key, metadata, sources=[skill_path])
         return metadata
 
     def _match_agents_to_skills(self, skill_names: List[str]) -> List[Dict]:
@@ -634,7 +869,8 @@ class ContextOrchestrator:
                 except Exception as e:
                     logger.warning(f"Failed to load agent metadata for {agent_name}: {e}")
 
-        self._set_cached(cache_key, metadata)
+        # Watch every candidate path so a newly added agent file is found
+        self._set_cached(cache_key, metadata, sources=search_paths)
         return metadata
 
     def _load_platform_config(self, client_id: str, platform: str) -> Dict:
@@ -709,7 +945,7 @@ class ContextOrchestrator:
             except Exception as e:
                 logger.warning(f"Failed to load platform registry: {e}")
 
-        self._set_cached(cache_key, registry)
+        self._set_cached(cache_key, registry, sources=[registry_path])
         return registry
 
     def _find_platform_in_registry(self, registry: Dict, platform: str) -> Optional[Dict]:
@@ -752,6 +988,14 @@ class ContextOrchestrator:
         if not skill_dir.exists():
             return skill
 
+        # Directories are watched too, so added or removed files invalidate
+        sources = [
+            skill_dir / "SKILL.md",
+            skill_dir / "schemas",
+            skill_dir / "stages",
+            skill_dir / "config" / "defaults.yaml",
+        ]
+
         # Load full SKILL.md content
         skill_md = skill_dir / "SKILL.md"
         if skill_md.exists():
@@ -767,6 +1011,7 @@ class ContextOrchestrator:
         if schemas_dir.exists():
             skill["schemas"] = {}
             for schema_file in schemas_dir.glob("*.json"):
+                sources.append(schema_file)
                 try:
                     skill["schemas"][schema_file.stem] = json.loads(schema_file.read_text())
                 except Exception as e:
@@ -777,6 +1022,7 @@ class ContextOrchestrator:
         if stages_dir.exists():
             skill["stage_files"] = {}
             for stage_file in stages_dir.glob("*.md"):
+                sources.append(stage_file)
                 try:
                     skill["stage_files"][stage_file.stem] = stage_file.read_text()
                 except Exception as e:
@@ -790,7 +1036,7 @@ class ContextOrchestrator:
             except Exception as e:
                 logger.warning(f"Failed to load skill config: {e}")
 
-        self._set_cached(cache_key, skill)
+        self._set_cached(cache_key, skill, sources=sources)
         return skill
 
     def _load_historical_patterns(self, skill_name: str, client_id: str) -> List[Dict]:
@@ -931,13 +1177,8 @@ class ContextOrchestrator:
         Returns:
             Dict with "client" and "voice_contract" keys
         """
-        client = self._load_client_profile(client_id)
-        voice_contract = self._load_voice_contract(client_id)
-
-        return {
-            "client": client,
-            "voice_contract": voice_contract
-        }
+        level_1, _ = self._load_concurrently(self._level_1_sources(client_id))
+        return level_1
 
     def load_level_2(self, client_id: str, intent: Dict) -> Dict:
         """
@@ -950,8 +1191,9 @@ class ContextOrchestrator:
         Returns:
             Dict with "skills", "agents", "platform_config" keys
         """
-        # Match skills to intent
-        skill_names = self._match_skills_to_intent(intent)
+        # Match skills to intent (only the best-ranked few are loaded)
+        ranked = self._rank_skills_for_intent(intent)
+        skill_names = [name for name, _ in ranked]
 
         # Load skill metadata
         skills = []
@@ -972,17 +1214,15 @@ class ContextOrchestrator:
             platforms_needed.update(requires_mcp)
 
         # Load platform configs
-        platform_config = {}
-        for platform in platforms_needed:
-            config = self._load_platform_config(client_id, platform)
-            if config:
-                platform_config[platform] = config
+        results, _ = self._load_concurrently(self._platform_sources(client_id, platforms_needed))
+        platform_config = self._collect_platform_config(results)
 
         return {
             "skills": skills,
             "agents": agents,
             "platform_config": platform_config,
-            "matched_skill_names": skill_names
+            "matched_skill_names": skill_names,
+            "skill_scores": dict(ranked)
         }
 
     def load_level_3(self, client_id: str, skill_name: str) -> Dict:
@@ -996,17 +1236,10 @@ class ContextOrchestrator:
         Returns:
             Dict with "full_skill", "patterns", "skill_specific_data" keys
         """
-        full_skill = self._load_full_skill(skill_name)
-        patterns = self._load_historical_patterns(skill_name, client_id)
-        skill_specific_data = self._load_skill_specific_client_data(skill_name, client_id)
-
-        return {
-            "full_skill": full_skill,
-            "patterns": patterns,
-            "skill_specific_data": skill_specific_data
-        }
+        level_3, _ = self._load_concurrently(self._level_3_sources(client_id, skill_name))
+        return level_3
 
-    def load_for_planning(self, client_id: str, intent: Dict) -> LoadedContext:
+    def load_for_planning(self, client_id: str, intent: Dict, speculative: bool = None) -> LoadedContext:
         """
         Load context for the planning phase (Levels 1 & 2).
 
@@ -1015,21 +1248,31 @@ class ContextOrchestrator:
         Args:
             client_id: Client identifier
             intent: Intent dict describing user request
+            speculative: Prefetch Level 3 for the top-ranked skill in the
+                         background (default: the orchestrator's setting)
 
         Returns:
             LoadedContext with levels 1 and 2 populated
         """
         budget = ContextBudget()
 
-        # Level 1
-        level_1 = self.load_level_1(client_id)
+        # Level 1 loads in the background while Level 2 is matched
+        level_1_sources = self._level_1_sources(client_id)
+        for key, loader, _ in level_1_sources.values():
+            self._submit(key, loader)
+
+        # Level 2
+        level_2 = self.load_level_2(client_id, intent)
+
+        if speculative if speculative is not None else self.speculative:
+            if level_2["matched_skill_names"]:
+                self.prefetch_level_3(client_id, level_2["matched_skill_names"][0])
+
+        level_1, degraded = self._load_concurrently(level_1_sources)
         budget.level_1_used = (
             self._estimate_tokens(level_1["client"]) +
             self._estimate_tokens(level_1["voice_contract"])
         )
-
-        # Level 2
-        level_2 = self.load_level_2(client_id, intent)
         budget.level_2_used = (
             self._estimate_tokens(level_2["skills"]) +
             self._estimate_tokens(level_2["agents"]) +
@@ -1045,7 +1288,8 @@ class ContextOrchestrator:
             budget=budget,
             client_id=client_id,
             loaded_at=datetime.now(timezone.utc).isoformat(),
-            levels_loaded=[1, 2]
+            levels_loaded=[1, 2],
+            degraded_sources=degraded
         )
 
         self._current_context = context
@@ -1073,26 +1317,29 @@ class ContextOrchestrator:
         """
         budget = ContextBudget()
 
+        # Skill metadata (local file) decides which platform configs are needed
+        skill_metadata = self._load_skill_metadata(skill_name)
+        platforms_needed: Set[str] = set()
+        platforms_needed.update(skill_metadata.get("compatibility", []))
+        platforms_needed.update(skill_metadata.get("requires_mcp", []))
+
+        # Every remaining source is independent: load them all at once
+        sources = {}
+        sources.update(self._level_1_sources(client_id))
+        sources.update(self._platform_sources(client_id, platforms_needed))
+        sources.update(self._level_3_sources(client_id, skill_name))
+        results, degraded = self._load_concurrently(sources)
+
         # Level 1
-        level_1 = self.load_level_1(client_id)
+        level_1 = results
         budget.level_1_used = (
             self._estimate_tokens(level_1["client"]) +
             self._estimate_tokens(level_1["voice_contract"])
         )
 
         # Level 2 (focused on single skill)
-        skill_metadata = self._load_skill_metadata(skill_name)
         agents = self._match_agents_to_skills([skill_name])
-
-        platforms_needed: Set[str] = set()
-        platforms_needed.update(skill_metadata.get("compatibility", []))
-        platforms_needed.update(skill_metadata.get("requires_mcp", []))
-
-        platform_config = {}
-        for platform in platforms_needed:
-            config = self._load_platform_config(client_id, platform)
-            if config:
-                platform_config[platform] = config
+        platform_config = self._collect_platform_config(results)
 
         budget.level_2_used = (
             self._estimate_tokens(skill_metadata) +
@@ -1101,7 +1348,7 @@ class ContextOrchestrator:
         )
 
         # Level 3
-        level_3 = self.load_level_3(client_id, skill_name)
+        level_3 = results
         budget.level_3_used = (
             self._estimate_tokens(level_3["full_skill"]) +
             self._estimate_tokens(level_3["patterns"]) +
@@ -1127,7 +1374,8 @@ class ContextOrchestrator:
             budget=budget,
             client_id=client_id,
             loaded_at=datetime.now(timezone.utc).isoformat(),
-            levels_loaded=[1, 2, 3]
+            levels_loaded=[1, 2, 3],
+            degraded_sources=degraded
         )
 
         self._current_context = context
@@ -1148,44 +1396,39 @@ class ContextOrchestrator:
         """
         Get list of all available skills with basic metadata.
 
-        Useful for discovery and planning.
+        Useful for discovery and planning. Served from the skill catalog
+        rather than a directory walk.
 
         Returns:
             List of skill metadata dicts
         """
-        skills = []
-
-        if SKILLS_DIR.exists():
-            for skill_dir in SKILLS_DIR.iterdir():
-                if skill_dir.is_dir() and not skill_dir.name.startswith("_"):
-                    metadata = self._load_skill_metadata(skill_dir.name)
-                    if metadata:
-                        skills.append({
-                            "name": metadata.get("name"),
-                            "description": metadata.get("description", ""),
-                            "category": metadata.get("category", ""),
-                            "status": metadata.get("status", "active"),
-                            "tags": metadata.get("tags", [])
-                        })
-
-        return skills
+        return [
+            {
+                "name": skill["name"],
+                "description": skill["description"],
+                "category": skill["category"],
+                "status": skill["status"],
+                "tags": skill["tags"]
+            }
+            for skill in get_catalog().skills
+        ]
 
-    def find_skills_for_query(self, query: str) -> List[Dict]:
+    def find_skills_for_query(self, query: str, top_k: Optional[int] = None) -> List[Dict]:
         """
         Find skills matching a natural language query.
 
         Args:
             query: Natural language query
+            top_k: Maximum skills to return (default: MAX_MATCHED_SKILLS)
 
         Returns:
-            List of matching skill metadata dicts
+            List of matching skill metadata dicts, best match first
         """
         intent = {
-            "query": query,
-            "description": query
+            "query": query
         }
 
-        skill_names = self._match_skills_to_intent(intent)
+        skill_names = self._match_skills_to_intent(intent, top_k)
 
         skills = []
         for name in skill_names:
@@ -1206,7 +1449,8 @@ _orchestrator_lock = threading.Lock()
 
 def get_context_orchestrator(
     firebase_client=None,
-    intelligence_bridge=None
+    intelligence_bridge=None,
+    speculative: bool = False
 ) -> ContextOrchestrator:
     """
     Get or create the context orchestrator.
@@ -1214,6 +1458,7 @@ def get_context_orchestrator(
     Args:
         firebase_client: Optional FirebaseClient instance
         intelligence_bridge: Optional IntelligenceBridge instance
+        speculative: Prefetch Level 3 during planning (first call only)
 
     Returns:
         ContextOrchestrator instance
@@ -1224,7 +1469,8 @@ def get_context_orchestrator(
         if _orchestrator is None:
             _orchestrator = ContextOrchestrator(
                 firebase_client=firebase_client,
-                intelligence_bridge=intelligence_bridge
+                intelligence_bridge=intelligence_bridge,
+                speculative=speculative
             )
         return _orchestrator
 
@@ -3,19 +3,29 @@ MH1 Firebase Client
 Thread-safe Firebase client with connection pooling for concurrent agent access.
 
 Features:
-- Connection pooling for efficient concurrent access
+- Connection pooling: one shared, thread-safe Firestore client per project
+  (configurable channel count) leased by all threads
 - Thread-safe operations using locks
 - Retry logic with exponential backoff
 - Comprehensive error handling
 - Support for batch operations
+- Optional read-through document/query cache with write-through and
+  snapshot-listener invalidation (ReadCacheConfig)
+- Streaming, paginated iterators (iter_collection/iter_query) for large
+  collections
+- Parallel, auto-chunking bulk writes (BulkWriter)
 """
 
+import copy
+import itertools
 import json
 import os
 import time
 import threading
-from typing import Any, Dict, List, Optional, Callable
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterator, List, Optional, Callable, Set, Tuple
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from contextlib import contextmanager
 from functools import wraps
@@ -61,9 +71,23 @@ class RetryConfig:
 @dataclass
 class PoolConfig:
     """Configuration for connection pooling."""
-    max_connections: int = 10
+    max_connections: int = 10  # Concurrent leases across all projects
     connection_timeout: float = 30.0  # seconds
     idle_timeout: float = 300.0  # seconds
+    channels_per_project: int = 1  # Shared Firestore clients (gRPC channels) per project
+
+
+@dataclass
+class ReadCacheConfig:
+    """Configuration for the read-through document/query cache."""
+    default_ttl: float = 60.0  # seconds
+    # Collection path prefix -> TTL (longest matching prefix wins; 0 disables caching)
+    # e.g. {"clients": 300, "clients/*/context": 600, "telemetry_runs": 0}
+    ttl_by_prefix: Dict[str, float] = field(default_factory=dict)
+    max_entries: int = 5000
+    cache_queries: bool = True  # Also cache get_collection()/query() results
+    # Collections to watch with snapshot listeners (changes invalidate entries)
+    watch_collections: List[str] = field(default_factory=list)
 
 
 class FirebaseError(Exception):
@@ -88,6 +112,37 @@ class BatchWriteError(FirebaseError):
         self.failed_operations = failed_operations or []
 
 
+def _transient_exceptions() -> tuple:
+    """Errors worth retrying a write for: timeouts, throttling, unavailability."""
+    transient = [ConnectionError, TimeoutError]
+    try:
+        from google.api_core import exceptions as api_exceptions
+        transient.extend([
+            api_exceptions.Aborted,
+            api_exceptions.DeadlineExceeded,
+            api_exceptions.InternalServerError,
+            api_exceptions.ServiceUnavailable,
+            api_exceptions.TooManyRequests,
+            api_exceptions.GatewayTimeout,
+        ])
+    except ImportError:
+        pass
+    return tuple(transient)
+
+
+def transient_retry_config(retry_config: RetryConfig) -> RetryConfig:
+    """
+    Narrow a catch-all RetryConfig to transient errors.
+
+    Configs that name specific exceptions are returned unchanged. The
+    default config retries every Exception, which for writes would repeat
+    permission, validation and not-found errors that can never succeed.
+    """
+    if not any(issubclass(Exception, exc) for exc in retry_config.retryable_exceptions):
+        return retry_config
+    return replace(retry_config, retryable_exceptions=_transient_exceptions())
+
+
 def retry_operation(retry_config: RetryConfig = None):
     """
     Decorator for retrying operations with exponential backoff.
@@ -130,128 +185,411 @@ def retry_operation(retry_config: RetryConfig = None):
     return decorator
 
 
+# Unique firebase_admin app names across pools
+_app_ids = itertools.count(1)
+
+
+@dataclass
+class _Channel:
+    """One firebase_admin app + Firestore client shared by many leases."""
+    project_id: str
+    app_name: str
+    app: Any
+    client: Any
+    leases: int = 0
+    watchers: int = 0  # Snapshot listeners on this channel; exempt from idle teardown
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class PooledConnection:
+    """A lease on a shared Firestore client; return it with release()."""
+
+    def __init__(self, pool: "ConnectionPool", channel: _Channel):
+        self._pool = pool
+        self._channel = channel
+        self.client = channel.client
+        self.released = False
+
+    def release(self):
+        if not self.released:
+            self.released = True
+            self._pool.release(self)
+
+    def __enter__(self):
+        return self.client
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+
 class ConnectionPool:
     """
-    Thread-safe connection pool for Firebase clients.
+    Thread-safe pool of shared Firestore clients.
     
-    Manages multiple Firebase app instances for concurrent access.
+    Firestore clients are thread-safe, so each project gets a small set of
+    channels (firebase_admin app + client, default one) that every thread
+    leases from, instead of an app per thread. max_connections bounds
+    concurrent leases; idle channels are torn down (their apps deleted)
+    after idle_timeout.
     """
     
     def __init__(self, config: PoolConfig = None):
         self.config = config or PoolConfig()
         self._lock = threading.RLock()
-        self._connections: Dict[str, Any] = {}
-        self._connection_times: Dict[str, datetime] = {}
-        self._in_use: Dict[str, bool] = {}
         self._condition = threading.Condition(self._lock)
+        self._channels: Dict[str, List[_Channel]] = {}
+        self._thread_leases = threading.local()
+        self._last_cleanup = time.monotonic()
+        self._stats = {
+            "leases": 0,
+            "releases": 0,
+            "waits": 0,
+            "wait_seconds": 0.0,
+            "timeouts": 0,
+            "creations": 0,
+            "teardowns": 0,
+        }
     
-    def get_connection(self, project_id: str, credentials_path: str = None) -> Any:
+    def acquire(self, project_id: str, credentials_path: str = None) -> PooledConnection:
         """
-        Get a Firebase client from the pool.
+        Lease a Firestore client for a project.
         
-        Thread-safe: Will wait if all connections are in use.
+        Thread-safe: waits (up to connection_timeout) if max_connections
+        leases are outstanding.
+        
+        Returns:
+            PooledConnection; use as a context manager or call release()
         """
         with self._condition:
-            # Wait for an available connection if pool is full
-            while self._count_in_use() >= self.config.max_connections:
-                logger.debug(f"Connection pool full, waiting...")
-                notified = self._condition.wait(timeout=self.config.connection_timeout)
-                if not notified:
-                    raise FirebaseConnectionError(
-                        f"Timeout waiting for connection after {self.config.connection_timeout}s"
-                    )
-            
-            # Find or create a connection
-            conn_key = f"{project_id}_{threading.current_thread().ident}"
-            
-            if conn_key in self._connections and not self._in_use.get(conn_key, False):
-                # Reuse existing idle connection
-                self._in_use[conn_key] = True
-                self._connection_times[conn_key] = datetime.now(timezone.utc)
-                return self._connections[conn_key]
-            
-            # Create new connection
-            client = self._create_connection(project_id, credentials_path)
-            self._connections[conn_key] = client
-            self._in_use[conn_key] = True
-            self._connection_times[conn_key] = datetime.now(timezone.utc)
-            
-            return client
+            if self._active_leases() >= self.config.max_connections:
+                self._stats["waits"] += 1
+                logger.debug("Connection pool full, waiting...")
+                started = time.monotonic()
+                deadline = started + self.config.connection_timeout
+                while self._active_leases() >= self.config.max_connections:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats["timeouts"] += 1
+                        raise FirebaseConnectionError(
+                            f"Timeout waiting for connection after {self.config.connection_timeout}s"
+                        )
+                    self._condition.wait(timeout=remaining)
+                self._stats["wait_seconds"] += time.monotonic() - started
+            
+            channels = self._channels.setdefault(project_id, [])
+            channel = min(channels, key=lambda c: c.leases, default=None)
+            
+            # Open another channel only while every existing one is busy
+            if channel is None or (channel.leases > 0 and len(channels) < self.config.channels_per_project):
+                channel = self._create_channel(project_id, credentials_path)
+                channels.append(channel)
+            
+            channel.leases += 1
+            channel.last_used = time.monotonic()
+            self._stats["leases"] += 1
+            return PooledConnection(self, channel)
     
-    def release_connection(self, project_id: str):
-        """Release a connection back to the pool."""
+    def release(self, lease: PooledConnection):
+        """Return a lease to the pool."""
         with self._condition:
-            conn_key = f"{project_id}_{threading.current_thread().ident}"
-            if conn_key in self._in_use:
-                self._in_use[conn_key] = False
-            self._condition.notify_all()
+            channel = lease._channel
+            channel.leases = max(0, channel.leases - 1)
+            channel.last_used = time.monotonic()
+            self._stats["releases"] += 1
+            self._condition.notify()
+            
+            # Opportunistic idle teardown
+            if time.monotonic() - self._last_cleanup > min(60.0, self.config.idle_timeout):
+                self.cleanup_idle()
+    
+    @contextmanager
+    def lease(self, project_id: str, credentials_path: str = None):
+        """Context manager yielding a leased Firestore client."""
+        with self.acquire(project_id, credentials_path) as client:
+            yield client
     
-    def _count_in_use(self) -> int:
-        """Count connections currently in use."""
-        return sum(1 for in_use in self._in_use.values() if in_use)
+    def get_connection(self, project_id: str, credentials_path: str = None) -> Any:
+        """
+        Get a Firestore client from the pool.
+        
+        Compatibility API: pair each call with release_connection() on the
+        same thread. Prefer lease()/acquire().
+        """
+        lease = self.acquire(project_id, credentials_path)
+        stack = getattr(self._thread_leases, "stack", None)
+        if stack is None:
+            stack = self._thread_leases.stack = []
+        stack.append(lease)
+        return lease.client
     
-    def _create_connection(self, project_id: str, credentials_path: str = None) -> Any:
-        """Create a new Firebase connection."""
+    def release_connection(self, project_id: str):
+        """Release this thread's most recent get_connection() lease for a project."""
+        stack = getattr(self._thread_leases, "stack", [])
+        for i in range(len(stack) - 1, -1, -1):
+            if stack[i]._channel.project_id == project_id:
+                stack.pop(i).release()
+                return
+    
+    def pin(self, lease: PooledConnection) -> _Channel:
+        """
+        Keep a lease's channel open past idle cleanup until unpin().
+
+        For snapshot listeners, which stream over the channel long after
+        the lease that opened them is released.
+        """
+        with self._lock:
+            channel = lease._channel
+            channel.watchers += 1
+            return channel
+    
+    def unpin(self, channel: _Channel):
+        """Undo pin(); the channel becomes eligible for idle cleanup again."""
+        with self._lock:
+            channel.watchers = max(0, channel.watchers - 1)
+            channel.last_used = time.monotonic()
+    
+    def _active_leases(self) -> int:
+        """Count leases currently outstanding."""
+        return sum(c.leases for channels in self._channels.values() for c in channels)
+    
+    def _create_channel(self, project_id: str, credentials_path: str = None) -> _Channel:
+        """Create a firebase_admin app and Firestore client (lock held)."""
         firebase_admin, firestore = _ensure_firebase()
         
-        # Check if app already exists
-        app_name = f"mh1_{project_id}_{threading.current_thread().ident}"
+        app_name = f"mh1_{project_id}_{next(_app_ids)}"
         
-        try:
-            app = firebase_admin.get_app(app_name)
-        except ValueError:
-            # App doesn't exist, create it
-            if credentials_path:
-                cred = firebase_admin.credentials.Certificate(credentials_path)
+        if credentials_path:
+            cred = firebase_admin.credentials.Certificate(credentials_path)
+        else:
+            # Try to use default credentials or environment variable
+            cred_path = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS")
+            if cred_path:
+                cred = firebase_admin.credentials.Certificate(cred_path)
             else:
-                # Try to use default credentials or environment variable
-                cred_path = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS")
-                if cred_path:
-                    cred = firebase_admin.credentials.Certificate(cred_path)
-                else:
-                    # Use application default credentials
-                    cred = firebase_admin.credentials.ApplicationDefault()
-            
-            app = firebase_admin.initialize_app(cred, {
-                "projectId": project_id
-            }, name=app_name)
+                # Use application default credentials
+                cred = firebase_admin.credentials.ApplicationDefault()
         
-        return firestore.client(app)
+        app = firebase_admin.initialize_app(cred, {
+            "projectId": project_id
+        }, name=app_name)
+        
+        self._stats["creations"] += 1
+        logger.debug(f"Created Firestore channel: {app_name}")
+        return _Channel(project_id=project_id, app_name=app_name, app=app, client=firestore.client(app))
+    
+    def _teardown(self, channel: _Channel):
+        """Delete a channel's firebase_admin app (closes its gRPC channel)."""
+        try:
+            firebase_admin, _ = _ensure_firebase()
+            firebase_admin.delete_app(channel.app)
+        except Exception as e:
+            logger.warning(f"Error closing connection {channel.app_name}: {e}")
+        self._stats["teardowns"] += 1
     
     def cleanup_idle(self):
-        """Remove idle connections that have exceeded the timeout."""
+        """Tear down unpinned channels with no leases that have exceeded the idle timeout."""
         with self._lock:
-            now = datetime.now(timezone.utc)
-            keys_to_remove = []
+            now = time.monotonic()
+            self._last_cleanup = now
             
-            for conn_key, last_used in self._connection_times.items():
-                if not self._in_use.get(conn_key, False):
-                    idle_time = (now - last_used).total_seconds()
-                    if idle_time > self.config.idle_timeout:
-                        keys_to_remove.append(conn_key)
-            
-            for key in keys_to_remove:
-                del self._connections[key]
-                del self._connection_times[key]
-                self._in_use.pop(key, None)
-                logger.debug(f"Removed idle connection: {key}")
+            for project_id, channels in list(self._channels.items()):
+                for channel in list(channels):
+                    if (
+                        channel.leases == 0
+                        and channel.watchers == 0
+                        and now - channel.last_used > self.config.idle_timeout
+                    ):
+                        channels.remove(channel)
+                        self._teardown(channel)
+                        logger.debug(f"Removed idle connection: {channel.app_name}")
+                if not channels:
+                    del self._channels[project_id]
     
     def close_all(self):
         """Close all connections in the pool."""
         with self._lock:
-            firebase_admin, _ = _ensure_firebase()
-            
-            for conn_key in list(self._connections.keys()):
-                try:
-                    app_name = f"mh1_{conn_key.split('_')[0]}_{conn_key.split('_')[1]}"
-                    app = firebase_admin.get_app(app_name)
-                    firebase_admin.delete_app(app)
-                except Exception as e:
-                    logger.warning(f"Error closing connection {conn_key}: {e}")
-            
-            self._connections.clear()
-            self._connection_times.clear()
-            self._in_use.clear()
+            for channels in self._channels.values():
+                for channel in channels:
+                    self._teardown(channel)
+            self._channels.clear()
+            self._condition.notify_all()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool metrics (leases, waits, creations, teardowns, open channels)."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["active_leases"] = self._active_leases()
+            stats["channels"] = {
+                project_id: len(channels) for project_id, channels in self._channels.items()
+            }
+        stats["avg_wait_seconds"] = stats["wait_seconds"] / stats["waits"] if stats["waits"] else 0.0
+        return stats
+
+
+class FirestoreReadCache:
+    """
+    Thread-safe read-through cache for Firestore reads.
+
+    Documents are keyed by path ("clients/abc"), collection reads and
+    queries by their collection path plus the normalized query. Writes
+    invalidate the written document and every cached query on its
+    collection; a read that raced with an invalidation is not stored.
+    """
+
+    def __init__(self, config: ReadCacheConfig = None):
+        self.config = config or ReadCacheConfig()
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, Any, int]]" = OrderedDict()
+        self._keys_by_collection: Dict[str, Set[str]] = {}
+        self._versions: Dict[str, int] = {}
+        self._epoch = 0  # Bumped by clear()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "reads_saved": 0,       # Firestore document reads avoided
+            "invalidations": 0,
+            "evictions": 0,
+        }
+
+    @staticmethod
+    def doc_path(collection: str, doc_id: str, subcollection: str = None, subdoc_id: str = None) -> str:
+        if subcollection and subdoc_id:
+            return f"{collection}/{doc_id}/{subcollection}/{subdoc_id}"
+        return f"{collection}/{doc_id}"
+
+    @staticmethod
+    def collection_path(collection: str, parent_collection: str = None, parent_doc: str = None) -> str:
+        if parent_collection and parent_doc:
+            return f"{parent_collection}/{parent_doc}/{collection}"
+        return collection
+
+    @staticmethod
+    def query_key(collection_path: str, **query) -> str:
+        """Normalized key for a collection read or query."""
+        normalized = dict(query)
+        filters = normalized.pop("filters", None) or []
+        # Filters are ANDed, so their order does not matter
+        normalized["filters"] = sorted(json.dumps(list(f), default=str) for f in filters)
+        if normalized.get("order_direction"):
+            normalized["order_direction"] = normalized["order_direction"].upper()
+        return f"query:{collection_path}:{json.dumps(normalized, sort_keys=True, default=str)}"
+
+    def ttl_for(self, collection_path: str) -> float:
+        """TTL for a collection path (longest matching prefix; "*" matches one segment)."""
+        segments = collection_path.split("/")
+        best_len, ttl = -1, self.config.default_ttl
+        for prefix, prefix_ttl in self.config.ttl_by_prefix.items():
+            prefix_segments = prefix.strip("/").split("/")
+            if len(prefix_segments) > len(segments) or len(prefix_segments) <= best_len:
+                continue
+            if all(p == "*" or p == s for p, s in zip(prefix_segments, segments)):
+                best_len, ttl = len(prefix_segments), prefix_ttl
+        return ttl
+
+    def version(self, collection_path: str) -> Tuple[int, int]:
+        """Invalidation counter for a collection (capture before a read)."""
+        with self._lock:
+            return self._epoch, self._versions.get(collection_path, 0)
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        Look up a key.
+
+        Returns:
+            Tuple of (hit, value); value is a copy the caller may mutate
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] < time.monotonic():
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self._stats["misses"] += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            self._stats["reads_saved"] += entry[2]
+            value = entry[1]
+        return True, copy.deepcopy(value)
+
+    def put(self, key: str, collection_path: str, value: Any, version: Tuple[int, int]):
+        """
+        Store a read result.
+
+        Args:
+            key: Document path or query key
+            collection_path: Collection the result came from
+            value: Document dict (or None), or list of documents
+            version: version(collection_path) captured before the read
+        """
+        ttl = self.ttl_for(collection_path)
+        if ttl <= 0:
+            return
+        # A query costs one read per document (and at least one)
+        reads = max(1, len(value)) if isinstance(value, list) else 1
+        value = copy.deepcopy(value)
+
+        with self._lock:
+            if (self._epoch, self._versions.get(collection_path, 0)) != version:
+                return  # Invalidated while the read was in flight
+            self._drop(key)
+            self._entries[key] = (time.monotonic() + ttl, value, reads)
+            self._keys_by_collection.setdefault(collection_path, set()).add(key)
+            while len(self._entries) > self.config.max_entries:
+                oldest, _ = self._entries.popitem(last=False)
+                self._unindex(oldest)
+                self._stats["evictions"] += 1
+
+    def invalidate_document(self, path: str):
+        """Drop a document and every cached query on its collection."""
+        collection_path = path.rsplit("/", 1)[0]
+        with self._lock:
+            self._bump(collection_path)
+            self._drop(path)
+            for key in list(self._keys_by_collection.get(collection_path, ())):
+                self._drop(key)
+
+    def invalidate_collection(self, collection_path: str):
+        """Drop every cached document and query under a collection."""
+        with self._lock:
+            self._bump(collection_path)
+            for key in list(self._keys_by_collection.get(collection_path, ())):
+                self._drop(key)
+
+    def clear(self):
+        """Drop everything."""
+        with self._lock:
+            self._epoch += 1
+            self._stats["invalidations"] += 1
+            self._entries.clear()
+            self._keys_by_collection.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    # Internals (call with the lock held)
+
+    def _bump(self, collection_path: str):
+        self._versions[collection_path] = self._versions.get(collection_path, 0) + 1
+        self._stats["invalidations"] += 1
+
+    def _drop(self, key: str):
+        if self._entries.pop(key, None) is not None:
+            self._unindex(key)
+
+    def _unindex(self, key: str):
+        collection_path = key.split(":", 2)[1] if key.startswith("query:") else key.rsplit("/", 1)[0]
+        keys = self._keys_by_collection.get(collection_path)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_collection[collection_path]
 
 
 # Global connection pool
@@ -295,7 +633,9 @@ class FirebaseClient:
         project_id: str,
         credentials_path: str = None,
         retry_config: RetryConfig = None,
-        pool_config: PoolConfig = None
+        pool_config: PoolConfig = None,
+        cache_config: ReadCacheConfig = None,
+        firestore_client: Any = None
     ):
         """
         Initialize Firebase client.
@@ -305,28 +645,41 @@ class FirebaseClient:
             credentials_path: Path to service account JSON file (optional)
             retry_config: Configuration for retry behavior
             pool_config: Configuration for connection pooling
+            cache_config: Enables the read-through cache (None = no caching)
+            firestore_client: Pre-built Firestore client used instead of the
+                pool (e.g. an emulator client or an in-memory fake)
         """
         self.project_id = project_id
         self.credentials_path = credentials_path
         self.retry_config = retry_config or RetryConfig()
+        self._firestore_client = firestore_client
+        self.cache = FirestoreReadCache(cache_config) if cache_config else None
+        self._watches: List[Tuple[Any, Optional[_Channel]]] = []  # (listener, pinned channel)
         
         # Initialize pool with custom config if provided
         if pool_config:
             global _connection_pool
             with _pool_lock:
-                _connection_pool = ConnectionPool(pool_config)
+                if _connection_pool is None:
+                    _connection_pool = ConnectionPool(pool_config)
+                else:
+                    # Reconfigure in place: existing channels stay shared
+                    _connection_pool.config = pool_config
         
         self._local = threading.local()
+
+        if self.cache and self.cache.config.watch_collections:
+            self.watch_collections(self.cache.config.watch_collections)
     
     @contextmanager
     def _get_client(self):
         """Context manager for getting a pooled client."""
-        pool = get_connection_pool()
-        client = pool.get_connection(self.project_id, self.credentials_path)
-        try:
+        if self._firestore_client is not None:
+            yield self._firestore_client
+            return
+
+        with get_connection_pool().lease(self.project_id, self.credentials_path) as client:
             yield client
-        finally:
-            pool.release_connection(self.project_id)
     
     @retry_operation()
     def get_document(
@@ -348,6 +701,14 @@ class FirebaseClient:
         Returns:
             Document data as dict, or None if not found
         """
+        if self.cache:
+            path = FirestoreReadCache.doc_path(collection, doc_id, subcollection, subdoc_id)
+            hit, data = self.cache.get(path)
+            if hit:
+                return data
+            collection_path = path.rsplit("/", 1)[0]
+            version = self.cache.version(collection_path)
+
         with self._get_client() as client:
             ref = client.collection(collection).document(doc_id)
             
@@ -356,13 +717,15 @@ class FirebaseClient:
             
             doc = ref.get()
             
+            data = None
             if doc.exists:
                 data = doc.to_dict()
                 data["_id"] = doc.id
                 data["_path"] = doc.reference.path
-                return data
-            
-            return None
+
+        if self.cache:
+            self.cache.put(path, collection_path, data, version)
+        return data
     
     @retry_operation()
     def get_collection(
@@ -388,6 +751,17 @@ class FirebaseClient:
         Returns:
             List of document data dicts
         """
+        cache_key = None
+        if self.cache and self.cache.config.cache_queries:
+            collection_path = FirestoreReadCache.collection_path(collection, parent_collection, parent_doc)
+            cache_key = FirestoreReadCache.query_key(
+                collection_path, limit=limit, order_by=order_by, order_direction=order_direction
+            )
+            hit, results = self.cache.get(cache_key)
+            if hit:
+                return results
+            version = self.cache.version(collection_path)
+
         with self._get_client() as client:
             if parent_collection and parent_doc:
                 ref = client.collection(parent_collection).document(parent_doc).collection(collection)
@@ -416,8 +790,10 @@ class FirebaseClient:
                 data["_id"] = doc.id
                 data["_path"] = doc.reference.path
                 results.append(data)
-            
-            return results
+
+        if cache_key:
+            self.cache.put(cache_key, collection_path, results, version)
+        return results
     
     @retry_operation()
     def set_document(
@@ -462,6 +838,7 @@ class FirebaseClient:
                 )
             
             ref.set(data_with_meta, merge=merge)
+            self._invalidate_document(ref.path)
             
             logger.debug(f"Set document: {ref.path}")
             return doc_id
@@ -501,6 +878,7 @@ class FirebaseClient:
             }
             
             _, doc_ref = ref.add(data_with_meta)
+            self._invalidate_document(doc_ref.path)
             
             logger.debug(f"Added document: {doc_ref.path}")
             return doc_ref.id
@@ -549,6 +927,7 @@ class FirebaseClient:
             }
             
             ref.update(data_with_meta)
+            self._invalidate_document(ref.path)
             
             logger.debug(f"Updated document: {ref.path}")
             return doc_id
@@ -580,6 +959,7 @@ class FirebaseClient:
                 ref = ref.collection(subcollection).document(subdoc_id)
             
             ref.delete()
+            self._invalidate_document(ref.path)
             
             logger.debug(f"Deleted document: {ref.path}")
             return True
@@ -611,6 +991,18 @@ class FirebaseClient:
         Returns:
             List of matching document data dicts
         """
+        cache_key = None
+        if self.cache and self.cache.config.cache_queries:
+            collection_path = FirestoreReadCache.collection_path(collection, parent_collection, parent_doc)
+            cache_key = FirestoreReadCache.query_key(
+                collection_path, filters=filters, limit=limit,
+                order_by=order_by, order_direction=order_direction
+            )
+            hit, results = self.cache.get(cache_key)
+            if hit:
+                return results
+            version = self.cache.version(collection_path)
+
         with self._get_client() as client:
             if parent_collection and parent_doc:
                 ref = client.collection(parent_collection).document(parent_doc).collection(collection)
@@ -646,106 +1038,171 @@ class FirebaseClient:
                 data["_id"] = doc.id
                 data["_path"] = doc.reference.path
                 results.append(data)
-            
-            return results
+
+        if cache_key:
+            self.cache.put(cache_key, collection_path, results, version)
+        return results
     
+    @retry_operation()
+    def _fetch_page(self, build_query: Callable, cursor: Any, page_size: int) -> List[Any]:
+        """Fetch one page of snapshots (the pooled connection is held only for the page)."""
+        with self._get_client() as client:
+            query = build_query(client)
+            if cursor is not None:
+                query = query.start_after(cursor)
+            return list(query.limit(page_size).stream())
+
+    def iter_query(
+        self,
+        collection: str,
+        filters: List[tuple] = None,
+        order_by: str = None,
+        order_direction: str = "ASCENDING",
+        limit: int = None,
+        page_size: int = 500,
+        start_after: Any = None,
+        select: List[str] = None,
+        parent_doc: str = None,
+        parent_collection: str = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream documents matching a query, one page at a time.
+
+        Filters, ordering, limit and projection run server-side; only one
+        page is held in memory, and stopping iteration early stops further
+        page fetches. Results are not cached.
+
+        Args:
+            collection: Collection name
+            filters: List of filter tuples (field, operator, value)
+            order_by: Field to order by (documents missing it are excluded,
+                as in Firestore)
+            order_direction: "ASCENDING" or "DESCENDING"
+            limit: Maximum documents to yield in total
+            page_size: Documents fetched per round trip
+            start_after: Cursor to resume after: a DocumentSnapshot, or a
+                dict of order_by field values
+            select: Field paths to return (projection); None for all fields
+            parent_doc: Parent document ID (for subcollections)
+            parent_collection: Parent collection name (for subcollections)
+
+        Yields:
+            Document data dicts (with "_id" and "_path")
+        """
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+
+        def build_query(client):
+            if parent_collection and parent_doc:
+                query = client.collection(parent_collection).document(parent_doc).collection(collection)
+            else:
+                query = client.collection(collection)
+
+            for field_path, operator, value in filters or []:
+                query = query.where(field_path, operator, value)
+
+            if order_by:
+                _, firestore = _ensure_firebase()
+                direction = (
+                    firestore.Query.DESCENDING
+                    if order_direction.upper() == "DESCENDING"
+                    else firestore.Query.ASCENDING
+                )
+                query = query.order_by(order_by, direction=direction)
+
+            if select:
+                query = query.select(select)
+
+            return query
+
+        cursor = start_after
+        remaining = limit
+
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            page = self._fetch_page(build_query, cursor, size)
+
+            for doc in page:
+                data = doc.to_dict() or {}
+                data["_id"] = doc.id
+                data["_path"] = doc.reference.path
+                yield data
+
+            if remaining is not None:
+                remaining -= len(page)
+            if len(page) < size:
+                break
+            cursor = page[-1]
+
+    def iter_collection(
+        self,
+        collection: str,
+        parent_doc: str = None,
+        parent_collection: str = None,
+        order_by: str = None,
+        order_direction: str = "ASCENDING",
+        limit: int = None,
+        page_size: int = 500,
+        start_after: Any = None,
+        select: List[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream every document in a collection, one page at a time.
+
+        Streaming counterpart of get_collection(); see iter_query() for the
+        paging, cursor and projection arguments.
+
+        Yields:
+            Document data dicts (with "_id" and "_path")
+        """
+        return self.iter_query(
+            collection,
+            order_by=order_by,
+            order_direction=order_direction,
+            limit=limit,
+            page_size=page_size,
+            start_after=start_after,
+            select=select,
+            parent_doc=parent_doc,
+            parent_collection=parent_collection
+        )
+
     def batch_write(
         self,
         operations: List[Dict[str, Any]],
-        atomic: bool = True
+        atomic: bool = True,
+        max_workers: int = None
     ) -> Dict[str, Any]:
         """
-        Execute multiple write operations in a batch.
+        Execute multiple write operations in batches.
+
+        Operations are split into Firestore batches of at most 500 and
+        committed concurrently by a BulkWriter; each batch is retried with
+        backoff. Atomicity holds per batch: with more than 500 operations,
+        batches other than the failed one may already be committed.
         
         Args:
             operations: List of operation dicts with keys:
                 - type: "set", "update", or "delete"
-                - collection: Collection name
-                - doc_id: Document ID (optional for "add" type)
+                - collection: Collection name or path (e.g. "clients/abc/signals")
+                - doc_id: Document ID (optional for "set"; auto-generated)
                 - data: Document data (for set/update)
                 - merge: Boolean (for set operations)
-            atomic: If True, all operations succeed or fail together
+            atomic: If True, raise BatchWriteError on the first failed batch
+            max_workers: Batches committed concurrently (default: BulkWriter.DEFAULT_WORKERS)
         
         Returns:
             Dict with:
                 - success: bool
                 - operations_count: int
                 - failed_operations: List of failed ops (if not atomic)
+                - written, batches, elapsed_seconds, docs_per_second
         
         Raises:
-            BatchWriteError: If atomic batch fails
+            BatchWriteError: If atomic and an operation or batch fails
         """
-        if not operations:
-            return {"success": True, "operations_count": 0, "failed_operations": []}
-        
-        with self._get_client() as client:
-            batch = client.batch()
-            failed_operations = []
-            
-            for i, op in enumerate(operations):
-                try:
-                    op_type = op.get("type", "set")
-                    collection = op["collection"]
-                    doc_id = op.get("doc_id")
-                    data = op.get("data", {})
-                    merge = op.get("merge", False)
-                    
-                    if doc_id:
-                        ref = client.collection(collection).document(doc_id)
-                    else:
-                        ref = client.collection(collection).document()
-                    
-                    if op_type == "set":
-                        now = datetime.now(timezone.utc).isoformat()
-                        data_with_meta = {
-                            **data,
-                            "_updated_at": now,
-                        }
-                        if not merge:
-                            data_with_meta["_created_at"] = data.get("_created_at", now)
-                        batch.set(ref, data_with_meta, merge=merge)
-                    
-                    elif op_type == "update":
-                        data_with_meta = {
-                            **data,
-                            "_updated_at": datetime.now(timezone.utc).isoformat(),
-                        }
-                        batch.update(ref, data_with_meta)
-                    
-                    elif op_type == "delete":
-                        batch.delete(ref)
-                    
-                    else:
-                        raise ValueError(f"Unknown operation type: {op_type}")
-                
-                except Exception as e:
-                    if atomic:
-                        raise BatchWriteError(
-                            f"Batch operation {i} failed: {e}",
-                            failed_operations=[{**op, "error": str(e)}]
-                        )
-                    else:
-                        failed_operations.append({**op, "error": str(e), "index": i})
-            
-            # Commit the batch
-            try:
-                batch.commit()
-                logger.info(f"Batch write completed: {len(operations)} operations")
-            except Exception as e:
-                if atomic:
-                    raise BatchWriteError(f"Batch commit failed: {e}")
-                else:
-                    # Mark all operations as failed
-                    failed_operations = [
-                        {**op, "error": str(e), "index": i}
-                        for i, op in enumerate(operations)
-                    ]
-            
-            return {
-                "success": len(failed_operations) == 0,
-                "operations_count": len(operations),
-                "failed_operations": failed_operations
-            }
+        writer = BulkWriter(self, max_workers=max_workers, retry_config=self.retry_config)
+        return writer.write(operations, atomic=atomic)
     
     def transaction(self, callback: Callable) -> Any:
         """
@@ -777,14 +1234,301 @@ class FirebaseClient:
                 return callback(transaction, client)
 
             transaction_ref = client.transaction()
-            return run_transaction(transaction_ref)
+            try:
+                return run_transaction(transaction_ref)
+            finally:
+                # The callback may write anywhere
+                if self.cache:
+                    self.cache.clear()
+
+    # ============================================================
+    # READ CACHE
+    # ============================================================
+
+    def _invalidate_document(self, path: str):
+        """Write-through invalidation for a written document path."""
+        if self.cache:
+            self.cache.invalidate_document(path)
+
+    def watch_collections(self, collections: List[str]):
+        """
+        Invalidate cached reads from Firestore snapshot listeners.
+
+        Each change reported for a watched collection (including writes
+        made by other processes) drops the changed document and the
+        collection's cached queries. The pooled channel a listener streams
+        over is pinned until close(), so idle cleanup cannot delete it.
+
+        Args:
+            collections: Collection paths to watch (e.g. ["clients"])
+        """
+        if not self.cache:
+            return
+
+        def on_snapshot(docs, changes, read_time):
+            for change in changes:
+                self.cache.invalidate_document(change.document.reference.path)
+
+        for collection_path in collections:
+            if self._firestore_client is not None:
+                lease, channel, client = None, None, self._firestore_client
+            else:
+                pool = get_connection_pool()
+                lease = pool.acquire(self.project_id, self.credentials_path)
+                channel, client = pool.pin(lease), lease.client
+            try:
+                segments = collection_path.strip("/").split("/")
+                ref = client.collection(segments[0])
+                for doc_id, sub in zip(segments[1::2], segments[2::2]):
+                    ref = ref.document(doc_id).collection(sub)
+                watch = ref.on_snapshot(on_snapshot)
+            except Exception:
+                if channel is not None:
+                    get_connection_pool().unpin(channel)
+                raise
+            finally:
+                if lease is not None:
+                    lease.release()
+            self._watches.append((watch, channel))
+            logger.debug(f"Watching {collection_path} for cache invalidation")
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Get connection pool metrics (leases, waits, creations)."""
+        return get_connection_pool().get_stats()
+
+    def get_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Get read-cache statistics (hits, misses, reads_saved), or None if disabled."""
+        return self.cache.get_stats() if self.cache else None
+
+    def clear_cache(self):
+        """Drop every cached read."""
+        if self.cache:
+            self.cache.clear()
     
     def close(self):
         """Close all connections in the pool."""
+        for watch, channel in self._watches:
+            try:
+                watch.unsubscribe()
+            except Exception as e:
+                logger.warning(f"Error stopping snapshot listener: {e}")
+            if channel is not None:
+                get_connection_pool().unpin(channel)
+        self._watches.clear()
+
+        if self._firestore_client is not None:
+            return
         pool = get_connection_pool()
         pool.close_all()
 
 
+class BulkWriter:
+    """
+    Parallel, auto-chunking writer for large write sets.
+
+    Splits operations into Firestore batches (at most 500 writes each),
+    commits up to max_workers batches concurrently, and retries failed
+    commits with exponential backoff (retry_operation). In non-atomic mode
+    a batch that still fails is replayed one operation at a time, so
+    failures are reported per operation.
+
+    Usage:
+        writer = BulkWriter(client, max_workers=4)
+        result = writer.write([
+            {"type": "set", "collection": "clients/abc/signals", "doc_id": "s1", "data": {...}},
+            ...
+        ], atomic=False)
+        print(result["docs_per_second"], result["failed_operations"])
+    """
+
+    MAX_BATCH_SIZE = 500  # Firestore limit on writes per batch
+    DEFAULT_WORKERS = 4
+
+    def __init__(
+        self,
+        client: "FirebaseClient",
+        batch_size: int = MAX_BATCH_SIZE,
+        max_workers: int = None,
+        retry_config: RetryConfig = None,
+        add_metadata: bool = True
+    ):
+        """
+        Initialize BulkWriter.
+
+        Args:
+            client: FirebaseClient used for connections and cache invalidation
+            batch_size: Operations per batch (capped at 500)
+            max_workers: Batches committed concurrently
+            retry_config: Retry behavior for batch commits (a catch-all
+                config only retries transient errors, see transient_retry_config)
+            add_metadata: Add _created_at/_updated_at like set_document();
+                False writes data exactly as given
+        """
+        self.client = client
+        self.add_metadata = add_metadata
+        self.batch_size = max(1, min(batch_size, self.MAX_BATCH_SIZE))
+        self.max_workers = max(1, max_workers or self.DEFAULT_WORKERS)
+        self.retry_config = retry_config or RetryConfig()
+        self._commit = retry_operation(transient_retry_config(self.retry_config))(self._commit_batch)
+
+    def _apply(self, firestore_client, batch, op: Dict[str, Any]) -> str:
+        """Add one operation to a batch; returns the document path."""
+        op_type = op.get("type", "set")
+        data = op.get("data", {})
+        ref = firestore_client.collection(op["collection"]).document(op["doc_id"])
+
+        if not self.add_metadata:
+            if op_type == "set":
+                batch.set(ref, data, merge=op.get("merge", False))
+            elif op_type == "update":
+                batch.update(ref, data)
+            elif op_type == "delete":
+                batch.delete(ref)
+            else:
+                raise ValueError(f"Unknown operation type: {op_type}")
+
+        elif op_type == "set":
+            now = datetime.now(timezone.utc).isoformat()
+            data_with_meta = {
+                **data,
+                "_updated_at": now,
+            }
+            if not op.get("merge", False):
+                data_with_meta["_created_at"] = data.get("_created_at", now)
+            batch.set(ref, data_with_meta, merge=op.get("merge", False))
+
+        elif op_type == "update":
+            data_with_meta = {
+                **data,
+                "_updated_at": datetime.now(timezone.utc).isoformat(),
+            }
+            batch.update(ref, data_with_meta)
+
+        elif op_type == "delete":
+            batch.delete(ref)
+
+        else:
+            raise ValueError(f"Unknown operation type: {op_type}")
+
+        return ref.path
+
+    def _commit_batch(self, chunk: List[Tuple[int, Dict[str, Any]]]):
+        """Build and commit one batch (rebuilt on every retry attempt)."""
+        with self.client._get_client() as firestore_client:
+            batch = firestore_client.batch()
+            paths = [self._apply(firestore_client, batch, op) for _, op in chunk]
+            try:
+                batch.commit()
+            finally:
+                # Failed commits leave unknown state; invalidate either way
+                for path in paths:
+                    self.client._invalidate_document(path)
+
+    def _prepare(self, operations: List[Dict[str, Any]], atomic: bool):
+        """Validate operations and assign auto IDs; returns (ready, failed)."""
+        ready: List[Tuple[int, Dict[str, Any]]] = []
+        failed: List[Dict[str, Any]] = []
+
+        with self.client._get_client() as firestore_client:
+            for i, op in enumerate(operations):
+                try:
+                    if op.get("type", "set") not in ("set", "update", "delete"):
+                        raise ValueError(f"Unknown operation type: {op.get('type')}")
+                    if not op.get("collection"):
+                        raise ValueError("Operation is missing 'collection'")
+                    if not op.get("doc_id"):
+                        if op.get("type", "set") != "set":
+                            raise ValueError(f"{op.get('type')} requires a doc_id")
+                        # Fix the ID once so a retried batch rewrites the same document
+                        op = {**op, "doc_id": firestore_client.collection(op["collection"]).document().id}
+                    ready.append((i, op))
+                except Exception as e:
+                    if atomic:
+                        raise BatchWriteError(
+                            f"Batch operation {i} failed: {e}",
+                            failed_operations=[{**op, "error": str(e)}]
+                        )
+                    failed.append({**op, "error": str(e), "index": i})
+
+        return ready, failed
+
+    def _replay_individually(self, chunk: List[Tuple[int, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Commit a failed batch's operations one by one to isolate failures."""
+        failed = []
+        for i, op in chunk:
+            try:
+                self._commit_batch([(i, op)])
+            except Exception as e:
+                failed.append({**op, "error": str(e), "index": i})
+        return failed
+
+    def write(self, operations: List[Dict[str, Any]], atomic: bool = False) -> Dict[str, Any]:
+        """
+        Write operations in concurrent, retried batches.
+
+        Args:
+            operations: Operation dicts (see FirebaseClient.batch_write)
+            atomic: If True, raise BatchWriteError on the first failure
+                (already committed batches stay committed; pending ones
+                are cancelled)
+
+        Returns:
+            Dict with success, operations_count, written, failed_operations,
+            batches, elapsed_seconds and docs_per_second
+
+        Raises:
+            BatchWriteError: If atomic and any operation or batch fails
+        """
+        started = time.monotonic()
+        if not operations:
+            return {
+                "success": True, "operations_count": 0, "written": 0,
+                "failed_operations": [], "batches": 0,
+                "elapsed_seconds": 0.0, "docs_per_second": 0.0,
+            }
+
+        ready, failed_operations = self._prepare(operations, atomic)
+        chunks = [ready[i:i + self.batch_size] for i in range(0, len(ready), self.batch_size)]
+
+        written = 0
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chunks) or 1)) as pool:
+            futures = {pool.submit(self._commit, chunk): chunk for chunk in chunks}
+            for future in as_completed(futures):
+                chunk = futures[future]
+                try:
+                    future.result()
+                    written += len(chunk)
+                except Exception as e:
+                    if atomic:
+                        for pending in futures:
+                            pending.cancel()
+                        raise BatchWriteError(
+                            f"Batch commit failed: {e}",
+                            failed_operations=[{**op, "error": str(e), "index": i} for i, op in chunk]
+                        )
+                    logger.warning(f"Batch of {len(chunk)} failed ({e}); replaying operations individually")
+                    chunk_failures = self._replay_individually(chunk)
+                    written += len(chunk) - len(chunk_failures)
+                    failed_operations.extend(chunk_failures)
+
+        elapsed = time.monotonic() - started
+        failed_operations.sort(key=lambda op: op["index"])
+        logger.info(
+            f"Bulk write completed: {written}/{len(operations)} operations in "
+            f"{len(chunks)} batches, {elapsed:.2f}s"
+        )
+
+        return {
+            "success": len(failed_operations) == 0,
+            "operations_count": len(operations),
+            "written": written,
+            "failed_operations": failed_operations,
+            "batches": len(chunks),
+            "elapsed_seconds": round(elapsed, 3),
+            "docs_per_second": round(written / elapsed, 1) if elapsed > 0 else float(written),
+        }
+
+
 # Singleton client accessor
 _default_client: Optional[FirebaseClient] = None
 _client_lock = threading.Lock()
@@ -792,7 +1536,8 @@ _client_lock = threading.Lock()
 
 def get_firebase_client(
     project_id: str = None,
-    credentials_path: str = None
+    credentials_path: str = None,
+    cache_config: ReadCacheConfig = None
 ) -> FirebaseClient:
     """
     Get or create a Firebase client.
@@ -800,10 +1545,14 @@ def get_firebase_client(
     Uses environment variables if project_id not provided:
     - FIREBASE_PROJECT_ID or GCP_PROJECT_ID
     - GOOGLE_APPLICATION_CREDENTIALS for credentials
+    - MH1_FIREBASE_CACHE_TTL enables the read cache with that default TTL
+      (seconds) when no cache_config is given
     
     Args:
         project_id: Firebase/GCP project ID
         credentials_path: Path to service account JSON
+        cache_config: Read-through cache settings (used when the client
+            is created)
     
     Returns:
         FirebaseClient instance
@@ -822,9 +1571,12 @@ def get_firebase_client(
             "project_id required. Set FIREBASE_PROJECT_ID or GCP_PROJECT_ID environment variable."
         )
     
+    if cache_config is None and os.environ.get("MH1_FIREBASE_CACHE_TTL"):
+        cache_config = ReadCacheConfig(default_ttl=float(os.environ["MH1_FIREBASE_CACHE_TTL"]))
+    
     with _client_lock:
         if _default_client is None or _default_client.project_id != project_id:
-            _default_client = FirebaseClient(project_id, credentials_path)
+            _default_client = FirebaseClient(project_id, credentials_path, cache_config=cache_config)
         return _default_client
 
 
@@ -840,3 +1592,4 @@ if __name__ == "__main__":
     print("\nEnvironment variables:")
     print("  FIREBASE_PROJECT_ID - Firebase project ID")
     print("  GOOGLE_APPLICATION_CREDENTIALS - Path to service account JSON")
+    print("  MH1_FIREBASE_CACHE_TTL - Enable the read-through cache (default TTL, seconds)")
@@ -5,8 +5,10 @@ Provides:
 1. IdempotencyManager - Cache execution results to prevent duplicate work
 2. RetryPolicy - Configurable retry behavior per error class
 3. RetryExecutor - Execute functions with automatic retry and idempotency
+4. AdaptiveConcurrencyLimiter - AIMD in-flight limit for the async path
 
 Thread-safe with SQLite WAL mode for 20+ concurrent agents.
+Cache entries live in the shared database served by lib.storage_engine.
 
 Usage:
     from lib.idempotency import RetryExecutor, IdempotencyManager, RetryPolicy
@@ -26,18 +28,28 @@ Usage:
         print(f"Output: {result.output}")
     else:
         print(f"Failed: {result.error_class} - {result.error_message}")
+
+    # Async path: hundreds of I/O-bound calls in flight, AIMD-limited
+    results = await executor.execute_batch_async(
+        items=contacts,
+        item_func=enrich_contact,  # sync or async def (item, index)
+        client_id="acme",
+        module_id="lifecycle-audit",
+        skill_name="enrichment"
+    )
 """
 
+import asyncio
 import hashlib
+import inspect
 import json
 import os
 import random
 import re
-import sqlite3
 import threading
 import time
-import queue
 import uuid
+from collections import deque
 from contextlib import contextmanager
 from dataclasses import dataclass, asdict, field
 from datetime import datetime, timezone, timedelta
@@ -47,16 +59,38 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import yaml
 
+try:
+    from lib.storage_engine import (
+        ConnectionPool,
+        Migration,
+        STORAGE_DB_PATH,
+        copy_legacy_tables,
+        get_storage_engine,
+    )
+except ImportError:
+    from storage_engine import (
+        ConnectionPool,
+        Migration,
+        STORAGE_DB_PATH,
+        copy_legacy_tables,
+        get_storage_engine,
+    )
+
 
 # Base paths
 SYSTEM_ROOT = Path(__file__).parent.parent
 CONFIG_DIR = SYSTEM_ROOT / "config"
 CACHE_DIR = SYSTEM_ROOT / ".mh1" / "idempotency_cache"
-CACHE_DB_PATH = CACHE_DIR / "idempotency.db"
+CACHE_DB_PATH = STORAGE_DB_PATH
+LEGACY_CACHE_DB_PATH = CACHE_DIR / "idempotency.db"
 
 # Ensure directories exist
 CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
+# Serializer for key hashing; same output as json.dumps(sort_keys=True,
+# default=str) without building an encoder per call
+_KEY_ENCODER = json.JSONEncoder(sort_keys=True, default=str)
+
 
 class ErrorClass(Enum):
     """Classification of errors for retry policy selection."""
@@ -126,189 +160,82 @@ class RetryAttempt:
 
 
 # ============================================================================
-# Connection Pool for SQLite
+# Storage (shared SQLite engine)
 # ============================================================================
 
-class IdempotencyConnectionPool:
-    """
-    Thread-safe SQLite connection pool for idempotency cache.
+# Kept for backwards compatibility; all components share one pool type now
+IdempotencyConnectionPool = ConnectionPool
 
-    Uses WAL mode for concurrent read/write performance with 20+ agents.
-    """
 
-    def __init__(self, db_path: Path, pool_size: int = 20, timeout: float = 30.0):
+# Schema migrations for the idempotency tables in the shared storage engine
+IDEMPOTENCY_MIGRATIONS = [
+    Migration(1, "Create idempotency_cache and retry_attempts", statements=[
+        # Main cache table
         """
-        Initialize connection pool.
-
-        Args:
-            db_path: Path to SQLite database
-            pool_size: Maximum number of pooled connections
-            timeout: Timeout in seconds waiting for a connection
+        CREATE TABLE IF NOT EXISTS idempotency_cache (
+            idempotency_key TEXT PRIMARY KEY,
+            client_id TEXT NOT NULL,
+            module_id TEXT,
+            skill_name TEXT NOT NULL,
+            input_hash TEXT NOT NULL,
+            result_json TEXT NOT NULL,
+            success INTEGER NOT NULL,
+            error_class TEXT,
+            created_at TEXT NOT NULL,
+            expires_at TEXT NOT NULL,
+            attempt_count INTEGER DEFAULT 1,
+            total_duration_ms INTEGER DEFAULT 0
+        )
+        """,
+        # Index for cleanup queries
+        """
+        CREATE INDEX IF NOT EXISTS idx_cache_expires
+        ON idempotency_cache(expires_at)
+        """,
         """
-        self.db_path = str(db_path)
-        self.pool_size = pool_size
-        self.timeout = timeout
-        self._pool = queue.Queue(maxsize=pool_size)
-        self._lock = threading.Lock()
-        self._created_count = 0
-
-    def _create_connection(self) -> sqlite3.Connection:
-        """Create a new database connection with WAL mode."""
-        conn = sqlite3.connect(
-            self.db_path,
-            timeout=self.timeout,
-            check_same_thread=False,
-            isolation_level=None  # Autocommit mode
+        CREATE INDEX IF NOT EXISTS idx_cache_client
+        ON idempotency_cache(client_id, skill_name)
+        """,
+        # Retry attempts tracking table
+        """
+        CREATE TABLE IF NOT EXISTS retry_attempts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            idempotency_key TEXT NOT NULL,
+            attempt_number INTEGER NOT NULL,
+            timestamp TEXT NOT NULL,
+            duration_ms INTEGER,
+            success INTEGER NOT NULL,
+            error_class TEXT,
+            error_message TEXT,
+            FOREIGN KEY (idempotency_key) REFERENCES idempotency_cache(idempotency_key)
         )
-        conn.row_factory = sqlite3.Row
-
-        # Enable WAL mode for better concurrent access
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA cache_size=-32000")  # 32MB cache
-        conn.execute("PRAGMA foreign_keys=ON")
-        conn.execute("PRAGMA synchronous=NORMAL")
-        conn.execute("PRAGMA busy_timeout=30000")  # 30 seconds
-
-        return conn
-
-    def get_connection(self) -> sqlite3.Connection:
-        """Get a connection from the pool or create a new one."""
-        try:
-            return self._pool.get_nowait()
-        except queue.Empty:
-            with self._lock:
-                if self._created_count < self.pool_size:
-                    self._created_count += 1
-                    return self._create_connection()
-
-            try:
-                return self._pool.get(timeout=self.timeout)
-            except queue.Empty:
-                raise TimeoutError(f"Could not get database connection within {self.timeout}s")
-
-    def return_connection(self, conn: sqlite3.Connection):
-        """Return a connection to the pool."""
-        try:
-            self._pool.put_nowait(conn)
-        except queue.Full:
-            conn.close()
-            with self._lock:
-                self._created_count -= 1
-
-    def close_all(self):
-        """Close all pooled connections."""
-        while True:
-            try:
-                conn = self._pool.get_nowait()
-                conn.close()
-            except queue.Empty:
-                break
-        with self._lock:
-            self._created_count = 0
-
-
-# Global connection pool
-_idempotency_pool: Optional[IdempotencyConnectionPool] = None
-_pool_lock = threading.Lock()
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_attempts_key
+        ON retry_attempts(idempotency_key)
+        """,
+    ]),
+    Migration(
+        2,
+        "Import cache entries from legacy idempotency.db",
+        apply=lambda conn: copy_legacy_tables(
+            conn, LEGACY_CACHE_DB_PATH, ["idempotency_cache", "retry_attempts"]
+        )
+    ),
+]
 
 
-def _get_pool() -> IdempotencyConnectionPool:
-    """Get or create the global idempotency connection pool."""
-    global _idempotency_pool
-    if _idempotency_pool is None:
-        with _pool_lock:
-            if _idempotency_pool is None:
-                _idempotency_pool = IdempotencyConnectionPool(CACHE_DB_PATH, pool_size=20)
-    return _idempotency_pool
+def init_idempotency_db():
+    """Initialize idempotency tables in the shared storage engine. Thread-safe."""
+    get_storage_engine().migrate("idempotency", IDEMPOTENCY_MIGRATIONS)
 
 
 @contextmanager
 def get_idempotency_db():
-    """Thread-safe context manager for idempotency database connections."""
-    pool = _get_pool()
-    conn = pool.get_connection()
-    try:
+    """Thread-safe context manager for a pooled read connection."""
+    init_idempotency_db()
+    with get_storage_engine().read() as conn:
         yield conn
-    finally:
-        pool.return_connection(conn)
-
-
-# Thread-safe initialization
-_db_initialized = False
-_init_lock = threading.Lock()
-
-
-def init_idempotency_db():
-    """Initialize idempotency database with WAL mode. Thread-safe."""
-    global _db_initialized
-
-    if _db_initialized:
-        return
-
-    with _init_lock:
-        if _db_initialized:
-            return
-
-        with get_idempotency_db() as conn:
-            cursor = conn.cursor()
-            cursor.execute("BEGIN IMMEDIATE")
-
-            try:
-                # Main cache table
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS idempotency_cache (
-                        idempotency_key TEXT PRIMARY KEY,
-                        client_id TEXT NOT NULL,
-                        module_id TEXT,
-                        skill_name TEXT NOT NULL,
-                        input_hash TEXT NOT NULL,
-                        result_json TEXT NOT NULL,
-                        success INTEGER NOT NULL,
-                        error_class TEXT,
-                        created_at TEXT NOT NULL,
-                        expires_at TEXT NOT NULL,
-                        attempt_count INTEGER DEFAULT 1,
-                        total_duration_ms INTEGER DEFAULT 0
-                    )
-                """)
-
-                # Index for cleanup queries
-                cursor.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_cache_expires
-                    ON idempotency_cache(expires_at)
-                """)
-
-                cursor.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_cache_client
-                    ON idempotency_cache(client_id, skill_name)
-                """)
-
-                # Retry attempts tracking table
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS retry_attempts (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        idempotency_key TEXT NOT NULL,
-                        attempt_number INTEGER NOT NULL,
-                        timestamp TEXT NOT NULL,
-                        duration_ms INTEGER,
-                        success INTEGER NOT NULL,
-                        error_class TEXT,
-                        error_message TEXT,
-                        FOREIGN KEY (idempotency_key) REFERENCES idempotency_cache(idempotency_key)
-                    )
-                """)
-
-                cursor.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_attempts_key
-                    ON retry_attempts(idempotency_key)
-                """)
-
-                cursor.execute("COMMIT")
-                _db_initialized = True
-
-            except Exception:
-                cursor.execute("ROLLBACK")
-                raise
 
 
 # ============================================================================
@@ -337,6 +264,24 @@ class IdempotencyManager:
         manager.store(key, result)
     """
 
+    # Keys per IN (...) query in check_many (below SQLite's parameter limit)
+    BULK_CHUNK_SIZE = 500
+
+    _INSERT_CACHE_SQL = """
+        INSERT OR REPLACE INTO idempotency_cache
+        (idempotency_key, client_id, module_id, skill_name, input_hash,
+         result_json, success, error_class, created_at, expires_at,
+         attempt_count, total_duration_ms)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    _INSERT_ATTEMPT_SQL = """
+        INSERT INTO retry_attempts
+        (idempotency_key, attempt_number, timestamp, duration_ms,
+         success, error_class, error_message)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+
     def __init__(self, cache_dir: str = None, config_path: str = None):
         """
         Initialize IdempotencyManager.
@@ -398,7 +343,7 @@ class IdempotencyManager:
             Idempotency key string
         """
         # Hash the input data
-        input_str = json.dumps(input_data, sort_keys=True, default=str)
+        input_str = _KEY_ENCODER.encode(input_data)
         input_hash = hashlib.sha256(input_str.encode()).hexdigest()[:16]
 
         # Format key according to config
@@ -437,40 +382,122 @@ class IdempotencyManager:
             if not row:
                 return None
 
-            # Parse cached result
-            result_data = json.loads(row["result_json"])
-            success = bool(row["success"])
+            return self._row_to_result(key, row)
 
-            # Check policy for duplicates
-            idempotency_config = self.config.get("idempotency", {})
+    def check_many(self, keys: List[str]) -> Dict[str, ExecutionResult]:
+        """
+        Check cached results for many keys with chunked IN (...) queries.
 
-            if success:
-                policy = idempotency_config.get("on_duplicate_success", "SKIP")
-                if policy == "RETRY":
-                    return None  # Force re-execution
-            else:
-                policy = idempotency_config.get("on_duplicate_failure", "RETRY")
-                if policy == "RETRY":
-                    return None  # Force re-execution
+        Applies the same duplicate policy as check().
 
-            # Return cached result
-            error_class = None
-            if row["error_class"]:
-                try:
-                    error_class = ErrorClass(row["error_class"])
-                except ValueError:
-                    error_class = ErrorClass.UNKNOWN
+        Args:
+            keys: Idempotency keys
 
-            return ExecutionResult(
-                success=success,
-                output=result_data.get("output"),
-                error_class=error_class,
-                error_message=result_data.get("error_message"),
-                attempt_count=row["attempt_count"],
-                total_duration_ms=row["total_duration_ms"],
-                cached=True,
-                idempotency_key=key
-            )
+        Returns:
+            Map of key to cached ExecutionResult, for keys with a usable entry
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        found: Dict[str, ExecutionResult] = {}
+
+        with get_idempotency_db() as conn:
+            for start in range(0, len(unique_keys), self.BULK_CHUNK_SIZE):
+                chunk = unique_keys[start:start + self.BULK_CHUNK_SIZE]
+                placeholders = ", ".join("?" for _ in chunk)
+                rows = conn.execute(f"""
+                    SELECT idempotency_key, result_json, success, error_class, expires_at,
+                           attempt_count, total_duration_ms
+                    FROM idempotency_cache
+                    WHERE idempotency_key IN ({placeholders}) AND expires_at > datetime('now')
+                """, chunk).fetchall()
+
+                for row in rows:
+                    result = self._row_to_result(row["idempotency_key"], row)
+                    if result is not None:
+                        found[row["idempotency_key"]] = result
+
+        return found
+
+    def _row_to_result(self, key: str, row) -> Optional[ExecutionResult]:
+        """Turn a cache row into a cached ExecutionResult, honoring duplicate policy."""
+        # Parse cached result
+        result_data = json.loads(row["result_json"])
+        success = bool(row["success"])
+
+        # Check policy for duplicates
+        idempotency_config = self.config.get("idempotency", {})
+
+        if success:
+            policy = idempotency_config.get("on_duplicate_success", "SKIP")
+            if policy == "RETRY":
+                return None  # Force re-execution
+        else:
+            policy = idempotency_config.get("on_duplicate_failure", "RETRY")
+            if policy == "RETRY":
+                return None  # Force re-execution
+
+        # Return cached result
+        error_class = None
+        if row["error_class"]:
+            try:
+                error_class = ErrorClass(row["error_class"])
+            except ValueError:
+                error_class = ErrorClass.UNKNOWN
+
+        return ExecutionResult(
+            success=success,
+            output=result_data.get("output"),
+            error_class=error_class,
+            error_message=result_data.get("error_message"),
+            attempt_count=row["attempt_count"],
+            total_duration_ms=row["total_duration_ms"],
+            cached=True,
+            idempotency_key=key
+        )
+
+    def _cache_row(
+        self,
+        key: str,
+        result: ExecutionResult,
+        client_id: str = None,
+        module_id: str = None,
+        skill_name: str = None,
+        input_hash: str = None,
+        now: datetime = None
+    ) -> tuple:
+        """Build an idempotency_cache row for a result."""
+        ttl_hours = self.config.get("idempotency", {}).get("cache_ttl_hours", 24)
+
+        result_json = json.dumps({
+            "output": result.output,
+            "error_message": result.error_message
+        }, default=str)
+
+        now = now or datetime.now(timezone.utc)
+        expires = now + timedelta(hours=ttl_hours)
+
+        # Parse key to extract components if not provided
+        if not client_id:
+            parts = key.split(":")
+            if len(parts) >= 4:
+                client_id = parts[0]
+                module_id = parts[1]
+                skill_name = parts[2]
+                input_hash = parts[3]
+
+        return (
+            key,
+            client_id or "unknown",
+            module_id or "unknown",
+            skill_name or "unknown",
+            input_hash or "unknown",
+            result_json,
+            1 if result.success else 0,
+            result.error_class.value if result.error_class else None,
+            now.isoformat(),
+            expires.isoformat(),
+            result.attempt_count,
+            result.total_duration_ms
+        )
 
     def store(
         self,
@@ -492,56 +519,51 @@ class IdempotencyManager:
             skill_name: Skill name
             input_hash: Input data hash
         """
-        ttl_hours = self.config.get("idempotency", {}).get("cache_ttl_hours", 24)
+        row = self._cache_row(key, result, client_id, module_id, skill_name, input_hash)
+        get_storage_engine().execute(self._INSERT_CACHE_SQL, row)
 
-        result_json = json.dumps({
-            "output": result.output,
-            "error_message": result.error_message
-        }, default=str)
+    def store_many(
+        self,
+        results: List[ExecutionResult],
+        attempts: Dict[str, List[RetryAttempt]] = None
+    ):
+        """
+        Store many execution results (and their attempts) in one transaction.
+
+        Cache metadata (client, module, skill, input hash) is parsed from
+        each result's idempotency_key.
 
+        Args:
+            results: Results to cache; each must have idempotency_key set
+            attempts: Optional map of key to retry attempts to log
+        """
         now = datetime.now(timezone.utc)
-        expires = now + timedelta(hours=ttl_hours)
+        cache_rows = [
+            self._cache_row(result.idempotency_key, result, now=now)
+            for result in results
+        ]
+        attempt_rows = [
+            (
+                key,
+                attempt.attempt_number,
+                attempt.timestamp,
+                attempt.duration_ms,
+                1 if attempt.success else 0,
+                attempt.error_class,
+                attempt.error_message
+            )
+            for key, key_attempts in (attempts or {}).items()
+            for attempt in key_attempts
+        ]
 
-        with get_idempotency_db() as conn:
-            cursor = conn.cursor()
-            cursor.execute("BEGIN IMMEDIATE")
+        def write(conn):
+            # Cache rows first: retry_attempts references them
+            conn.executemany(self._INSERT_CACHE_SQL, cache_rows)
+            if attempt_rows:
+                conn.executemany(self._INSERT_ATTEMPT_SQL, attempt_rows)
 
-            try:
-                # Parse key to extract components if not provided
-                if not client_id:
-                    parts = key.split(":")
-                    if len(parts) >= 4:
-                        client_id = parts[0]
-                        module_id = parts[1]
-                        skill_name = parts[2]
-                        input_hash = parts[3]
-
-                cursor.execute("""
-                    INSERT OR REPLACE INTO idempotency_cache
-                    (idempotency_key, client_id, module_id, skill_name, input_hash,
-                     result_json, success, error_class, created_at, expires_at,
-                     attempt_count, total_duration_ms)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    key,
-                    client_id or "unknown",
-                    module_id or "unknown",
-                    skill_name or "unknown",
-                    input_hash or "unknown",
-                    result_json,
-                    1 if result.success else 0,
-                    result.error_class.value if result.error_class else None,
-                    now.isoformat(),
-                    expires.isoformat(),
-                    result.attempt_count,
-                    result.total_duration_ms
-                ))
-
-                cursor.execute("COMMIT")
-
-            except Exception:
-                cursor.execute("ROLLBACK")
-                raise
+        if cache_rows or attempt_rows:
+            get_storage_engine().write(write)
 
     def clear(self, key: str):
         """
@@ -550,47 +572,36 @@ class IdempotencyManager:
         Args:
             key: Idempotency key to remove
         """
-        with get_idempotency_db() as conn:
-            cursor = conn.cursor()
-            cursor.execute("BEGIN IMMEDIATE")
-            try:
-                cursor.execute(
-                    "DELETE FROM idempotency_cache WHERE idempotency_key = ?",
-                    (key,)
-                )
-                cursor.execute(
-                    "DELETE FROM retry_attempts WHERE idempotency_key = ?",
-                    (key,)
-                )
-                cursor.execute("COMMIT")
-            except Exception:
-                cursor.execute("ROLLBACK")
-                raise
+        def delete(conn):
+            conn.execute(
+                "DELETE FROM idempotency_cache WHERE idempotency_key = ?",
+                (key,)
+            )
+            conn.execute(
+                "DELETE FROM retry_attempts WHERE idempotency_key = ?",
+                (key,)
+            )
+
+        get_storage_engine().write(delete)
 
     def cleanup_expired(self):
         """Remove expired entries from the cache. Thread-safe."""
-        with get_idempotency_db() as conn:
-            cursor = conn.cursor()
-            cursor.execute("BEGIN IMMEDIATE")
-            try:
-                # Delete expired cache entries
-                cursor.execute("""
-                    DELETE FROM idempotency_cache
-                    WHERE expires_at <= datetime('now')
-                """)
-
-                # Delete orphaned retry attempts
-                cursor.execute("""
-                    DELETE FROM retry_attempts
-                    WHERE idempotency_key NOT IN (
-                        SELECT idempotency_key FROM idempotency_cache
-                    )
-                """)
-
-                cursor.execute("COMMIT")
-            except Exception:
-                cursor.execute("ROLLBACK")
-                raise
+        def cleanup(conn):
+            # Delete expired cache entries
+            conn.execute("""
+                DELETE FROM idempotency_cache
+                WHERE expires_at <= datetime('now')
+            """)
+
+            # Delete orphaned retry attempts
+            conn.execute("""
+                DELETE FROM retry_attempts
+                WHERE idempotency_key NOT IN (
+                    SELECT idempotency_key FROM idempotency_cache
+                )
+            """)
+
+        get_storage_engine().write(cleanup)
 
     def log_attempt(
         self,
@@ -604,28 +615,15 @@ class IdempotencyManager:
             key: Idempotency key
             attempt: Retry attempt details
         """
-        with get_idempotency_db() as conn:
-            cursor = conn.cursor()
-            cursor.execute("BEGIN IMMEDIATE")
-            try:
-                cursor.execute("""
-                    INSERT INTO retry_attempts
-                    (idempotency_key, attempt_number, timestamp, duration_ms,
-                     success, error_class, error_message)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    key,
-                    attempt.attempt_number,
-                    attempt.timestamp,
-                    attempt.duration_ms,
-                    1 if attempt.success else 0,
-                    attempt.error_class,
-                    attempt.error_message
-                ))
-                cursor.execute("COMMIT")
-            except Exception:
-                cursor.execute("ROLLBACK")
-                raise
+        get_storage_engine().execute(self._INSERT_ATTEMPT_SQL, (
+            key,
+            attempt.attempt_number,
+            attempt.timestamp,
+            attempt.duration_ms,
+            1 if attempt.success else 0,
+            attempt.error_class,
+            attempt.error_message
+        ))
 
     def get_attempts(self, key: str) -> List[RetryAttempt]:
         """
@@ -833,6 +831,17 @@ class RetryPolicy:
             "cooldown_between_module_retries_ms": 60000
         })
 
+    def get_adaptive_concurrency(self) -> Dict:
+        """Get AIMD concurrency settings for the async execution path."""
+        return self.config.get("adaptive_concurrency", {
+            "initial_limit": 16,
+            "min_limit": 1,
+            "max_limit": 256,
+            "increase_step": 1,
+            "decrease_factor": 0.5,
+            "backoff_on": ["TRANSIENT_API", "TIMEOUT"]
+        })
+
 
 # ============================================================================
 # Error Classifier
@@ -956,6 +965,157 @@ class ErrorClassifier:
         return ErrorClass.UNKNOWN
 
 
+# ============================================================================
+# Adaptive Concurrency
+# ============================================================================
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD limit on concurrent in-flight calls for the async execution path.
+
+    The limit grows by increase_step / limit per success (about
+    +increase_step per full window) and is multiplied by decrease_factor
+    when a call reports congestion. Only calls that started after the last
+    decrease can shrink the limit again, so one burst of rate-limit errors
+    halves the limit once instead of collapsing it to min_limit.
+
+    Usage:
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=16, max_limit=256)
+
+        token = await limiter.acquire()
+        try:
+            result = await call_api()
+            limiter.release(token)
+        except RateLimitError:
+            limiter.release(token, congested=True)
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 16,
+        min_limit: int = 1,
+        max_limit: int = 256,
+        increase_step: float = 1.0,
+        decrease_factor: float = 0.5
+    ):
+        """
+        Initialize AdaptiveConcurrencyLimiter.
+
+        Args:
+            initial_limit: Starting in-flight limit
+            min_limit: Floor for the limit
+            max_limit: Ceiling for the limit
+            increase_step: Additive increase per window of successes
+            decrease_factor: Multiplicative decrease on congestion (0-1)
+        """
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self._limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+
+        self._in_flight = 0
+        self._last_decrease = 0.0
+        self._loop = None
+        self._waiters: deque = deque()
+
+        self._stats = {"successes": 0, "congestion_events": 0, "decreases": 0}
+
+    @classmethod
+    def from_policy(cls, policy: "RetryPolicy") -> "AdaptiveConcurrencyLimiter":
+        """Build a limiter from RetryPolicy's adaptive_concurrency settings."""
+        settings = policy.get_adaptive_concurrency()
+        return cls(
+            initial_limit=settings.get("initial_limit", 16),
+            min_limit=settings.get("min_limit", 1),
+            max_limit=settings.get("max_limit", 256),
+            increase_step=settings.get("increase_step", 1),
+            decrease_factor=settings.get("decrease_factor", 0.5)
+        )
+
+    @property
+    def limit(self) -> int:
+        """Current in-flight limit."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Calls currently holding a slot."""
+        return self._in_flight
+
+    def _bind_loop(self) -> asyncio.AbstractEventLoop:
+        """Bind to the running loop (state is reset if the loop changed)."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._waiters = deque()
+            self._in_flight = 0
+        return loop
+
+    async def acquire(self) -> float:
+        """
+        Wait for a free slot.
+
+        Returns:
+            Token to pass to release() (the slot's start time)
+        """
+        loop = self._bind_loop()
+
+        if self._in_flight < int(self._limit) and not self._waiters:
+            self._in_flight += 1
+            return time.monotonic()
+
+        waiter = loop.create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # Hand the slot on if it was granted while we were being cancelled
+            if waiter.done() and not waiter.cancelled():
+                self._in_flight -= 1
+                self._wake_waiters()
+            raise
+        return time.monotonic()
+
+    def release(self, token: float, congested: bool = False):
+        """
+        Release a slot and adjust the limit.
+
+        Args:
+            token: Value returned by acquire()
+            congested: True if the call hit a rate limit or overload error
+        """
+        self._in_flight = max(0, self._in_flight - 1)
+
+        if congested:
+            self._stats["congestion_events"] += 1
+            if token >= self._last_decrease:
+                self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+                self._last_decrease = time.monotonic()
+                self._stats["decreases"] += 1
+        else:
+            self._stats["successes"] += 1
+            self._limit = min(self.max_limit, self._limit + self.increase_step / self._limit)
+
+        self._wake_waiters()
+
+    def _wake_waiters(self):
+        """Grant slots to waiters, in arrival order, up to the current limit."""
+        while self._waiters and self._in_flight < int(self._limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    def get_stats(self) -> Dict:
+        """Get limiter statistics."""
+        return {
+            **self._stats,
+            "limit": self.limit,
+            "in_flight": self._in_flight
+        }
+
+
 # ============================================================================
 # RetryExecutor
 # ============================================================================
@@ -1009,6 +1169,9 @@ class RetryExecutor:
         self._module_attempts: Dict[str, int] = {}
         self._module_lock = threading.Lock()
 
+        # AIMD limiter for the async path (created on first use)
+        self._async_limiter: Optional[AdaptiveConcurrencyLimiter] = None
+
     def _get_module_attempts(self, module_id: str) -> int:
         """Get current attempt count for a module."""
         with self._module_lock:
@@ -1059,151 +1222,284 @@ class RetryExecutor:
             if cached:
                 return cached
 
-        # Check module-level hard limits
-        hard_limits = self.policy.get_hard_limits()
-        module_max = hard_limits.get("max_total_attempts_per_module", 20)
+        result, _ = self._execute_attempts(
+            func, key, client_id, module_id, skill_name, input_data, max_attempts
+        )
+        return result
 
-        current_module_attempts = self._get_module_attempts(module_id)
-        if current_module_attempts >= module_max:
-            return ExecutionResult(
-                success=False,
-                output=None,
-                error_class=ErrorClass.UNKNOWN,
-                error_message=f"Module {module_id} exceeded max attempts ({module_max})",
-                idempotency_key=key
-            )
+    def _execute_attempts(
+        self,
+        func: Callable,
+        key: str,
+        client_id: str,
+        module_id: str,
+        skill_name: str,
+        input_data: Any,
+        max_attempts: int = None,
+        persist: bool = True
+    ) -> Tuple[ExecutionResult, Optional[List[RetryAttempt]]]:
+        """
+        Run the retry loop for one idempotency key.
+
+        With persist=True every attempt is written to the cache and attempt
+        log as it happens. With persist=False nothing is written; the result
+        and its attempts are returned for a later store_many().
+
+        Returns:
+            Tuple of (final result, attempts to log); attempts is None when
+            the module attempt limit stopped execution and nothing is stored
+        """
+        limited = self._module_limit_result(module_id, key)
+        if limited is not None:
+            return limited, None
 
-        # Execute with retry
+        attempts: List[RetryAttempt] = []
         attempt = 0
         total_duration_ms = 0
-        last_error_class = ErrorClass.UNKNOWN
-        last_error_message = ""
 
         while True:
             attempt += 1
             self._increment_module_attempts(module_id)
 
             start_time = time.time()
+            try:
+                result, error = func(input_data), None
+            except Exception as e:
+                result, error = None, e
+            duration_ms = int((time.time() - start_time) * 1000)
+            total_duration_ms += duration_ms
+
+            execution_result, retry_attempt, delay = self._attempt_outcome(
+                key, attempt, result, error, duration_ms, total_duration_ms, max_attempts
+            )
+            self._record_attempt(
+                key, execution_result, attempts, persist,
+                client_id, module_id, skill_name, retry_attempt
+            )
+            if delay is None:
+                return execution_result, attempts
+            time.sleep(delay)
+
+    async def _execute_attempts_async(
+        self,
+        func: Callable,
+        key: str,
+        client_id: str,
+        module_id: str,
+        skill_name: str,
+        input_data: Any,
+        max_attempts: int = None,
+        persist: bool = True,
+        limiter: "AdaptiveConcurrencyLimiter" = None
+    ) -> Tuple[ExecutionResult, Optional[List[RetryAttempt]]]:
+        """
+        Async twin of _execute_attempts.
+
+        Backoff uses asyncio.sleep, so waiting retries hold no limiter slot
+        and block no thread.
+        """
+        limited = self._module_limit_result(module_id, key)
+        if limited is not None:
+            return limited, None
+
+        attempts: List[RetryAttempt] = []
+        attempt = 0
+        total_duration_ms = 0
 
+        while True:
+            attempt += 1
+            self._increment_module_attempts(module_id)
+
+            start_time = time.time()
             try:
-                # Execute the function
-                result = func(input_data)
+                # Execute the function (under the concurrency limiter)
+                result, error = await self._call_async(func, input_data, limiter), None
+            except Exception as e:
+                result, error = None, e
+            duration_ms = int((time.time() - start_time) * 1000)
+            total_duration_ms += duration_ms
 
-                duration_ms = int((time.time() - start_time) * 1000)
-                total_duration_ms += duration_ms
+            execution_result, retry_attempt, delay = self._attempt_outcome(
+                key, attempt, result, error, duration_ms, total_duration_ms, max_attempts
+            )
+            await self._record_attempt_async(
+                key, execution_result, attempts, persist,
+                client_id, module_id, skill_name, retry_attempt
+            )
+            if delay is None:
+                return execution_result, attempts
+            await asyncio.sleep(delay)
+
+    def _module_limit_result(self, module_id: str, key: str) -> Optional[ExecutionResult]:
+        """Failure result if the module has used up its attempts, else None."""
+        module_max = self.policy.get_hard_limits().get("max_total_attempts_per_module", 20)
+        if self._get_module_attempts(module_id) < module_max:
+            return None
+        return ExecutionResult(
+            success=False,
+            output=None,
+            error_class=ErrorClass.UNKNOWN,
+            error_message=f"Module {module_id} exceeded max attempts ({module_max})",
+            idempotency_key=key
+        )
 
-                # Build success result
-                output = result.get("output") if isinstance(result, dict) else result
+    def _attempt_outcome(
+        self,
+        key: str,
+        attempt: int,
+        result: Any,
+        error: Optional[Exception],
+        duration_ms: int,
+        total_duration_ms: int,
+        max_attempts: Optional[int]
+    ) -> Tuple[ExecutionResult, RetryAttempt, Optional[float]]:
+        """
+        Classify one attempt.
 
-                execution_result = ExecutionResult(
-                    success=True,
-                    output=output,
-                    attempt_count=attempt,
-                    total_duration_ms=total_duration_ms,
-                    idempotency_key=key
-                )
+        A failed attempt that will be retried still gets a (failed) result,
+        since its cache entry satisfies the attempt log's foreign key.
 
-                # Store in cache first (before logging attempt, due to FK constraint)
-                self.idempotency.store(
-                    key,
-                    execution_result,
-                    client_id=client_id,
-                    module_id=module_id,
-                    skill_name=skill_name
-                )
+        Returns:
+            Tuple of (result, attempt record, backoff before the next
+            attempt or None when execution is done)
+        """
+        timestamp = datetime.now(timezone.utc).isoformat()
 
-                # Log successful attempt (after cache entry exists)
-                if self.enable_telemetry:
-                    self.idempotency.log_attempt(key, RetryAttempt(
-                        attempt_number=attempt,
-                        timestamp=datetime.now(timezone.utc).isoformat(),
-                        duration_ms=duration_ms,
-                        success=True
-                    ))
+        if error is None:
+            output = result.get("output") if isinstance(result, dict) else result
+            return ExecutionResult(
+                success=True,
+                output=output,
+                attempt_count=attempt,
+                total_duration_ms=total_duration_ms,
+                idempotency_key=key
+            ), RetryAttempt(
+                attempt_number=attempt,
+                timestamp=timestamp,
+                duration_ms=duration_ms,
+                success=True
+            ), None
+
+        error_class = self.classifier.classify(error)
+        error_message = str(error)
+
+        # Check if we should retry
+        effective_max = max_attempts or self.policy.get_policy(error_class).get("max_attempts", 1)
+        hard_skill_max = self.policy.get_hard_limits().get("max_total_attempts_per_skill", 5)
+        effective_max = min(effective_max, hard_skill_max)
+        delay = self.policy.get_delay(error_class, attempt) if attempt < effective_max else None
+
+        return ExecutionResult(
+            success=False,
+            output=None,
+            error_class=error_class,
+            error_message=error_message,
+            attempt_count=attempt,
+            total_duration_ms=total_duration_ms,
+            idempotency_key=key
+        ), RetryAttempt(
+            attempt_number=attempt,
+            timestamp=timestamp,
+            duration_ms=duration_ms,
+            success=False,
+            error_class=error_class.value,
+            error_message=error_message
+        ), delay
+
+    def _record_attempt(
+        self,
+        key: str,
+        result: ExecutionResult,
+        attempts: List[RetryAttempt],
+        persist: bool,
+        client_id: str,
+        module_id: str,
+        skill_name: str,
+        attempt: RetryAttempt
+    ):
+        """Store a result and log its attempt now, or collect the attempt for later."""
+        if not persist:
+            if self.enable_telemetry:
+                attempts.append(attempt)
+            return
 
-                return execution_result
+        # Store in cache first (before logging attempt, due to FK constraint)
+        self.idempotency.store(
+            key,
+            result,
+            client_id=client_id,
+            module_id=module_id,
+            skill_name=skill_name
+        )
 
-            except Exception as e:
-                duration_ms = int((time.time() - start_time) * 1000)
-                total_duration_ms += duration_ms
-
-                # Classify the error
-                error_class = self.classifier.classify(e)
-                last_error_class = error_class
-                last_error_message = str(e)
-
-                # Check if we should retry
-                effective_max = max_attempts or self.policy.get_policy(error_class).get("max_attempts", 1)
-                hard_skill_max = hard_limits.get("max_total_attempts_per_skill", 5)
-                effective_max = min(effective_max, hard_skill_max)
-
-                if attempt >= effective_max:
-                    # No more retries - return failure
-                    execution_result = ExecutionResult(
-                        success=False,
-                        output=None,
-                        error_class=error_class,
-                        error_message=last_error_message,
-                        attempt_count=attempt,
-                        total_duration_ms=total_duration_ms,
-                        idempotency_key=key
-                    )
-
-                    # Store failure in cache first (before logging, due to FK constraint)
-                    self.idempotency.store(
-                        key,
-                        execution_result,
-                        client_id=client_id,
-                        module_id=module_id,
-                        skill_name=skill_name
-                    )
-
-                    # Log failed attempt (after cache entry exists)
-                    if self.enable_telemetry:
-                        self.idempotency.log_attempt(key, RetryAttempt(
-                            attempt_number=attempt,
-                            timestamp=datetime.now(timezone.utc).isoformat(),
-                            duration_ms=duration_ms,
-                            success=False,
-                            error_class=error_class.value,
-                            error_message=last_error_message
-                        ))
-
-                    return execution_result
-
-                # For retry attempts, we need to store a temporary entry first to satisfy FK
-                # Create a temporary cache entry for logging purposes
-                temp_result = ExecutionResult(
-                    success=False,
-                    output=None,
-                    error_class=error_class,
-                    error_message=last_error_message,
-                    attempt_count=attempt,
-                    total_duration_ms=total_duration_ms,
-                    idempotency_key=key
-                )
-                self.idempotency.store(
-                    key,
-                    temp_result,
-                    client_id=client_id,
-                    module_id=module_id,
-                    skill_name=skill_name
-                )
+        # Log attempt (after cache entry exists)
+        if self.enable_telemetry:
+            self.idempotency.log_attempt(key, attempt)
 
-                # Log failed attempt
-                if self.enable_telemetry:
-                    self.idempotency.log_attempt(key, RetryAttempt(
-                        attempt_number=attempt,
-                        timestamp=datetime.now(timezone.utc).isoformat(),
-                        duration_ms=duration_ms,
-                        success=False,
-                        error_class=error_class.value,
-                        error_message=last_error_message
-                    ))
+    async def _record_attempt_async(
+        self,
+        key: str,
+        result: ExecutionResult,
+        attempts: List[RetryAttempt],
+        persist: bool,
+        client_id: str,
+        module_id: str,
+        skill_name: str,
+        attempt: RetryAttempt
+    ):
+        """_record_attempt, with SQLite writes moved off the event loop."""
+        args = (key, result, attempts, persist, client_id, module_id, skill_name, attempt)
+        if persist:
+            await asyncio.to_thread(self._record_attempt, *args)
+        else:
+            self._record_attempt(*args)
 
-                # Calculate and apply delay
-                delay = self.policy.get_delay(error_class, attempt)
-                time.sleep(delay)
+    @property
+    def async_limiter(self) -> AdaptiveConcurrencyLimiter:
+        """Limiter shared by async calls that do not pass their own."""
+        if self._async_limiter is None:
+            self._async_limiter = AdaptiveConcurrencyLimiter.from_policy(self.policy)
+        return self._async_limiter
+
+    @property
+    def congestion_classes(self) -> frozenset:
+        """Error classes that shrink the async concurrency limit."""
+        backoff_on = self.policy.get_adaptive_concurrency().get("backoff_on", [])
+        classes = set()
+        for name in backoff_on:
+            try:
+                classes.add(ErrorClass(str(name).lower()))
+            except ValueError:
+                continue
+        return frozenset(classes)
+
+    async def _call_async(
+        self,
+        func: Callable,
+        input_data: Any,
+        limiter: AdaptiveConcurrencyLimiter = None
+    ) -> Any:
+        """
+        Call a sync or async function, holding a limiter slot if given.
+
+        Sync functions run in the default thread pool. The slot is released
+        as congested when the error classifies into congestion_classes.
+        """
+        token = await limiter.acquire() if limiter is not None else None
+        congested = False
+        try:
+            if inspect.iscoroutinefunction(func):
+                return await func(input_data)
+            result = await asyncio.to_thread(func, input_data)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        except Exception as e:
+            congested = self.classifier.classify(e) in self.congestion_classes
+            raise
+        finally:
+            if limiter is not None:
+                limiter.release(token, congested=congested)
 
     def execute_batch_with_retry(
         self,
@@ -1212,11 +1508,17 @@ class RetryExecutor:
         client_id: str,
         module_id: str,
         skill_name: str,
-        max_parallel: int = 1
+        max_parallel: int = 1,
+        write_chunk_size: int = 500
     ) -> List[ExecutionResult]:
         """
         Execute a function for each item in a batch with retry.
 
+        Cached items are found with one check_many() lookup and are not
+        re-executed. Results of executed items are written back with
+        store_many() in chunks of write_chunk_size instead of one
+        transaction per item and attempt.
+
         Args:
             items: List of items to process
             item_func: Function to call for each item. Receives (item, index).
@@ -1224,41 +1526,188 @@ class RetryExecutor:
             module_id: Module identifier
             skill_name: Skill name
             max_parallel: Maximum parallel executions (default 1 = sequential)
+            write_chunk_size: Results per store_many() transaction
 
         Returns:
             List of ExecutionResults, one per item
         """
-        results = []
-
-        if max_parallel <= 1:
-            # Sequential execution
-            for i, item in enumerate(items):
-                result = self.execute_with_retry(
-                    func=lambda data: item_func(data["item"], data["index"]),
-                    client_id=client_id,
-                    module_id=module_id,
-                    skill_name=f"{skill_name}[{i}]",
-                    input_data={"item": item, "index": i}
-                )
-                results.append(result)
+        func = lambda data: item_func(data["item"], data["index"])
+        inputs = [{"item": item, "index": i} for i, item in enumerate(items)]
+        skill_names = [f"{skill_name}[{i}]" for i in range(len(items))]
+        keys = [
+            self.idempotency.generate_key(client_id, module_id, skill_names[i], inputs[i])
+            for i in range(len(items))
+        ]
+
+        cached = self.idempotency.check_many(keys)
+        results: List[Optional[ExecutionResult]] = [cached.get(key) for key in keys]
+        pending = [i for i, result in enumerate(results) if result is None]
+
+        to_store: List[ExecutionResult] = []
+        to_log: Dict[str, List[RetryAttempt]] = {}
+
+        def collect(i: int, outcome: Tuple[ExecutionResult, Optional[List[RetryAttempt]]]):
+            result, attempts = outcome
+            results[i] = result
+            if attempts is not None:
+                to_store.append(result)
+                if attempts:
+                    to_log[result.idempotency_key] = attempts
+            if len(to_store) >= write_chunk_size:
+                self.idempotency.store_many(to_store, to_log)
+                to_store.clear()
+                to_log.clear()
+
+        try:
+            if max_parallel <= 1:
+                # Sequential execution
+                for i in pending:
+                    collect(i, self._execute_attempts(
+                        func, keys[i], client_id, module_id, skill_names[i], inputs[i],
+                        persist=False
+                    ))
+            else:
+                # Parallel execution with thread pool
+                import concurrent.futures
+
+                with concurrent.futures.ThreadPoolExecutor(max_workers=max_parallel) as executor:
+                    futures = {
+                        executor.submit(
+                            self._execute_attempts,
+                            func, keys[i], client_id, module_id, skill_names[i], inputs[i],
+                            persist=False
+                        ): i
+                        for i in pending
+                    }
+                    for future in concurrent.futures.as_completed(futures):
+                        collect(futures[future], future.result())
+        finally:
+            if to_store:
+                self.idempotency.store_many(to_store, to_log)
+
+        return results
+
+
+    async def execute_with_retry_async(
+        self,
+        func: Callable,
+        client_id: str,
+        module_id: str,
+        skill_name: str,
+        input_data: Any,
+        max_attempts: int = None,
+        skip_cache: bool = False,
+        limiter: AdaptiveConcurrencyLimiter = None
+    ) -> ExecutionResult:
+        """
+        Async execute_with_retry for I/O-bound LLM and MCP calls.
+
+        Same idempotency and retry semantics as execute_with_retry, but
+        backoff uses asyncio.sleep and calls are gated by an AIMD limiter
+        that shrinks on rate-limit/overload errors and grows on success.
+
+        Args:
+            func: Sync or async function taking input_data. Sync functions
+                  run in the default thread pool.
+            client_id: Client/tenant identifier
+            module_id: Module or workflow identifier
+            skill_name: Name of the skill
+            input_data: Input data for the function
+            max_attempts: Override max attempts (uses policy default if None)
+            skip_cache: If True, bypass idempotency cache
+            limiter: Concurrency limiter (default: this executor's async_limiter)
+
+        Returns:
+            ExecutionResult with success status, output or error details
+        """
+        key = self.idempotency.generate_key(client_id, module_id, skill_name, input_data)
+
+        if not skip_cache:
+            cached = await asyncio.to_thread(self.idempotency.check, key)
+            if cached:
+                return cached
+
+        result, _ = await self._execute_attempts_async(
+            func, key, client_id, module_id, skill_name, input_data, max_attempts,
+            limiter=limiter or self.async_limiter
+        )
+        return result
+
+    async def execute_batch_async(
+        self,
+        items: List[Any],
+        item_func: Callable,
+        client_id: str,
+        module_id: str,
+        skill_name: str,
+        write_chunk_size: int = 500,
+        limiter: AdaptiveConcurrencyLimiter = None
+    ) -> List[ExecutionResult]:
+        """
+        Async execute_batch_with_retry.
+
+        All uncached items are scheduled at once; the AIMD limiter decides
+        how many calls are actually in flight. Cached items are skipped via
+        one check_many() lookup and results are written back with
+        store_many() in chunks of write_chunk_size.
+
+        Args:
+            items: List of items to process
+            item_func: Sync or async function called as item_func(item, index)
+            client_id: Client identifier
+            module_id: Module identifier
+            skill_name: Skill name
+            write_chunk_size: Results per store_many() transaction
+            limiter: Concurrency limiter (default: this executor's async_limiter)
+
+        Returns:
+            List of ExecutionResults, one per item
+        """
+        limiter = limiter or self.async_limiter
+
+        if inspect.iscoroutinefunction(item_func):
+            async def func(data):
+                return await item_func(data["item"], data["index"])
         else:
-            # Parallel execution with thread pool
-            import concurrent.futures
-
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_parallel) as executor:
-                futures = []
-                for i, item in enumerate(items):
-                    future = executor.submit(
-                        self.execute_with_retry,
-                        func=lambda data: item_func(data["item"], data["index"]),
-                        client_id=client_id,
-                        module_id=module_id,
-                        skill_name=f"{skill_name}[{i}]",
-                        input_data={"item": item, "index": i}
-                    )
-                    futures.append(future)
-
-                results = [f.result() for f in futures]
+            func = lambda data: item_func(data["item"], data["index"])
+
+        inputs = [{"item": item, "index": i} for i, item in enumerate(items)]
+        skill_names = [f"{skill_name}[{i}]" for i in range(len(items))]
+        keys = [
+            self.idempotency.generate_key(client_id, module_id, skill_names[i], inputs[i])
+            for i in range(len(items))
+        ]
+
+        cached = await asyncio.to_thread(self.idempotency.check_many, keys)
+        results: List[Optional[ExecutionResult]] = [cached.get(key) for key in keys]
+
+        to_store: List[ExecutionResult] = []
+        to_log: Dict[str, List[RetryAttempt]] = {}
+
+        async def run(i: int):
+            return i, await self._execute_attempts_async(
+                func, keys[i], client_id, module_id, skill_names[i], inputs[i],
+                persist=False, limiter=limiter
+            )
+
+        tasks = [asyncio.ensure_future(run(i)) for i, r in enumerate(results) if r is None]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                i, (result, attempts) = await next_done
+                results[i] = result
+                if attempts is not None:
+                    to_store.append(result)
+                    if attempts:
+                        to_log[result.idempotency_key] = attempts
+                if len(to_store) >= write_chunk_size:
+                    await asyncio.to_thread(self.idempotency.store_many, list(to_store), dict(to_log))
+                    to_store.clear()
+                    to_log.clear()
+        finally:
+            for task in tasks:
+                task.cancel()
+            if to_store:
+                await asyncio.to_thread(self.idempotency.store_many, to_store, to_log)
 
         return results
 
@@ -9,9 +9,12 @@ Pluggable adapters for domain-specific scoring:
 
 Universal Scoring Formula:
     Score = (Signal / Baseline) × Context × Confidence
+
+Batch scoring (score_batch / score_columns) takes many events at once as
+columns and is vectorized with NumPy when it is installed.
 """
 
-from .base import BaseDomainAdapter, ScoringResult
+from .base import BaseDomainAdapter, EventBatch, ScoringResult
 from .campaign import CampaignAdapter
 from .content import ContentAdapter
 from .health import HealthAdapter
@@ -19,6 +22,7 @@ from .revenue import RevenueAdapter
 
 __all__ = [
     "BaseDomainAdapter",
+    "EventBatch",
     "ScoringResult",
     "CampaignAdapter",
     "ContentAdapter",
@@ -4,11 +4,27 @@ MH1 Intelligence - Base Domain Adapter
 Abstract base class for domain-specific scoring adapters.
 Each domain (content, revenue, health, campaign) implements its own
 adapter with domain-specific signal interpretation and baseline calculation.
+
+Batch scoring:
+    score_batch() scores many events at once from columnar input. Adapters
+    override the _batch_* hooks with NumPy array operations; the default
+    hooks fall back to the per-event methods so every adapter supports it.
+    NumPy is optional - without it score_batch() loops over score().
 """
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+HAS_NUMPY = np is not None
+
+# Marks a key that is absent from an event (distinct from an explicit None)
+_MISSING = object()
 
 
 @dataclass
@@ -67,6 +83,200 @@ class ScoringResult:
         )
 
 
+class EventBatch:
+    """
+    Columnar view over a batch of events or contexts.
+    
+    Built once from a list of dicts (or directly from column arrays) so that
+    adapters can read each field as a whole array instead of calling
+    dict.get() per event. Missing keys and None values fall back to the
+    same defaults the scalar adapter methods use.
+    
+    Example:
+        >>> batch = EventBatch.from_records([{"nps_score": 40}, {}])
+        >>> batch.floats("nps_score", 0.0)
+        array([40.,  0.])
+        >>> batch.has("nps_score")
+        array([ True, False])
+    """
+    
+    def __init__(self, columns: Mapping[str, Sequence[Any]], size: int):
+        self._columns: Dict[str, Sequence[Any]] = dict(columns)
+        self.size = size
+        self._records: Optional[List[Dict[str, Any]]] = None
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    @classmethod
+    def from_records(cls, records: Sequence[Mapping[str, Any]]) -> "EventBatch":
+        """
+        Convert a list of dicts to columns in a single pass.
+        
+        Args:
+            records: Event or context dicts
+            
+        Returns:
+            EventBatch with one column per key seen in any record
+        """
+        size = len(records)
+        columns: Dict[str, List[Any]] = {}
+        
+        for i, record in enumerate(records):
+            for key, value in record.items():
+                column = columns.get(key)
+                if column is None:
+                    column = columns[key] = [_MISSING] * size
+                column[i] = value
+        
+        batch = cls(columns, size)
+        batch._records = list(records)
+        return batch
+    
+    @classmethod
+    def from_columns(cls, columns: Mapping[str, Sequence[Any]]) -> "EventBatch":
+        """
+        Wrap existing column arrays (e.g. NumPy arrays from a query result).
+        
+        Args:
+            columns: Mapping of field name to equal-length sequence
+            
+        Returns:
+            EventBatch over the given columns
+        """
+        sizes = {len(values) for values in columns.values()}
+        if len(sizes) > 1:
+            raise ValueError(f"Columns have mismatched lengths: {sorted(sizes)}")
+        return cls(columns, sizes.pop() if sizes else 0)
+    
+    @classmethod
+    def broadcast(cls, record: Optional[Mapping[str, Any]], size: int) -> "EventBatch":
+        """Build a batch where every row shares the same dict (e.g. one tenant context)."""
+        record = record or {}
+        return cls({key: [value] * size for key, value in record.items()}, size)
+    
+    def select(self, mask: Any) -> "EventBatch":
+        """Batch of the rows where the boolean mask is True, in order."""
+        columns = {}
+        for key, column in self._columns.items():
+            if isinstance(column, np.ndarray):
+                columns[key] = column[mask]
+            else:
+                columns[key] = [v for v, keep in zip(column, mask) if keep]
+        batch = EventBatch(columns, int(np.count_nonzero(mask)))
+        if self._records is not None:
+            batch._records = [r for r, keep in zip(self._records, mask) if keep]
+        return batch
+    
+    def has(self, key: str) -> Any:
+        """Boolean array: True where the key is present (like ``key in event``)."""
+        column = self._columns.get(key)
+        if column is None:
+            return np.zeros(self.size, dtype=bool)
+        if isinstance(column, np.ndarray) and column.dtype != object:
+            return np.ones(self.size, dtype=bool)
+        return np.fromiter((v is not _MISSING for v in column), dtype=bool, count=self.size)
+    
+    def not_none(self, key: str) -> Any:
+        """Boolean array: True where the key is present and not None."""
+        column = self._columns.get(key)
+        if column is None:
+            return np.zeros(self.size, dtype=bool)
+        if isinstance(column, np.ndarray) and column.dtype != object:
+            return np.ones(self.size, dtype=bool)
+        return np.fromiter(
+            (v is not _MISSING and v is not None for v in column),
+            dtype=bool,
+            count=self.size,
+        )
+    
+    def floats(self, key: str, default: float) -> Any:
+        """Float64 array of a numeric field, with default where missing/None."""
+        column = self._columns.get(key)
+        if column is None:
+            return np.full(self.size, float(default))
+        if isinstance(column, np.ndarray) and column.dtype != object:
+            return column.astype(float, copy=False)
+        return np.fromiter(
+            (default if v is _MISSING or v is None else v for v in column),
+            dtype=float,
+            count=self.size,
+        )
+    
+    def values(self, key: str, default: Any = None) -> List[Any]:
+        """Raw values of a field as a list, with default where missing."""
+        column = self._columns.get(key)
+        if column is None:
+            return [default] * self.size
+        return [default if v is _MISSING else v for v in column]
+    
+    def truthy(self, key: str) -> Any:
+        """Boolean array of ``bool(record.get(key))``."""
+        return np.fromiter(
+            (bool(v) for v in self.values(key, False)),
+            dtype=bool,
+            count=self.size,
+        )
+    
+    def lookup(
+        self,
+        key: str,
+        default: Any,
+        table: Mapping[Any, float],
+        fallback: float,
+        normalize: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        """
+        Map a categorical field through a lookup table.
+        
+        Each distinct value is resolved once, so the per-row cost is a
+        single dict hit rather than repeated normalization.
+        
+        Args:
+            key: Field name
+            default: Value used where the field is missing
+            table: Mapping of (normalized) value to float
+            fallback: Float used for values not in the table
+            normalize: Optional function applied to each distinct value
+            
+        Returns:
+            Float64 array of looked-up values
+        """
+        resolved: Dict[Any, float] = {}
+        out = np.empty(self.size, dtype=float)
+        for i, value in enumerate(self.values(key, default)):
+            try:
+                out[i] = resolved[value]
+            except KeyError:
+                norm = normalize(value) if normalize else value
+                out[i] = resolved[value] = table.get(norm, fallback)
+            except TypeError:
+                norm = normalize(value) if normalize else value
+                out[i] = table.get(norm, fallback)
+        return out
+    
+    def row_sizes(self) -> Any:
+        """Number of keys present in each row (like ``len(event)``)."""
+        sizes = np.zeros(self.size, dtype=int)
+        for key in self._columns:
+            sizes += self.has(key)
+        return sizes
+    
+    def records(self) -> List[Dict[str, Any]]:
+        """Reconstruct per-row dicts (used by the scalar fallback path)."""
+        if self._records is None:
+            self._records = [{} for _ in range(self.size)]
+            for key, column in self._columns.items():
+                for i, value in enumerate(column):
+                    if value is not _MISSING:
+                        self._records[i][key] = value.item() if hasattr(value, "item") else value
+        return self._records
+
+
+BatchInput = Union[EventBatch, Sequence[Mapping[str, Any]]]
+ContextInput = Union[EventBatch, Sequence[Mapping[str, Any]], Mapping[str, Any], None]
+
+
 class BaseDomainAdapter(ABC):
     """
     Abstract base class for domain-specific scoring adapters.
@@ -230,6 +440,233 @@ class BaseDomainAdapter(ABC):
     def calculate_score(self, event: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> ScoringResult:
         """Alias for score() - for compatibility with tests."""
         return self.score(event, context)
+    
+    # =========================================================================
+    # Batch Scoring
+    # =========================================================================
+    
+    @staticmethod
+    def _as_batches(events: BatchInput, contexts: ContextInput) -> Tuple[EventBatch, EventBatch]:
+        """Normalize batch inputs to a pair of equal-length EventBatches."""
+        if not isinstance(events, EventBatch):
+            events = EventBatch.from_records(events)
+        
+        if contexts is None or (isinstance(contexts, Mapping) and not isinstance(contexts, EventBatch)):
+            contexts = EventBatch.broadcast(contexts, events.size)
+        elif not isinstance(contexts, EventBatch):
+            contexts = EventBatch.from_records(contexts)
+        
+        if contexts.size != events.size:
+            raise ValueError(
+                f"events and contexts length mismatch: {events.size} != {contexts.size}"
+            )
+        return events, contexts
+    
+    def _batch_validate(self, events: EventBatch) -> Any:
+        """Vectorized validate_event(). Default: per-event fallback."""
+        return np.fromiter(
+            (self.validate_event(e) for e in events.records()),
+            dtype=bool,
+            count=events.size,
+        )
+    
+    def _batch_signal(self, events: EventBatch, contexts: EventBatch) -> Any:
+        """Vectorized get_signal(). Default: per-event fallback."""
+        return np.fromiter(
+            (self.get_signal(e, c) for e, c in zip(events.records(), contexts.records())),
+            dtype=float,
+            count=events.size,
+        )
+    
+    def _batch_baseline(self, events: EventBatch, contexts: EventBatch) -> Any:
+        """Vectorized get_baseline(). Default: per-event fallback."""
+        return np.fromiter(
+            (self.get_baseline(e, c) for e, c in zip(events.records(), contexts.records())),
+            dtype=float,
+            count=events.size,
+        )
+    
+    def _batch_context_multiplier(self, events: EventBatch, contexts: EventBatch) -> Any:
+        """Vectorized get_context_multiplier(). Default: per-event fallback."""
+        return np.fromiter(
+            (self.get_context_multiplier(e, c) for e, c in zip(events.records(), contexts.records())),
+            dtype=float,
+            count=events.size,
+        )
+    
+    def _batch_confidence(self, events: EventBatch, contexts: EventBatch) -> Any:
+        """Vectorized _calculate_confidence(). Default: per-event fallback."""
+        return np.fromiter(
+            (self._calculate_confidence(e, c) for e, c in zip(events.records(), contexts.records())),
+            dtype=float,
+            count=events.size,
+        )
+    
+    def score_columns(self, events: BatchInput, contexts: ContextInput = None) -> Dict[str, Any]:
+        """
+        Score a batch of events and return the results as arrays.
+        
+        This is the fast path for large exports: no per-event ScoringResult
+        objects are built. Values match score() element by element, including
+        the invalid-event result (score 0.0, confidence 0.0).
+        
+        Args:
+            events: List of event dicts or an EventBatch
+            contexts: One shared context dict, a list of per-event dicts,
+                an EventBatch, or None
+            
+        Returns:
+            Dict of arrays: valid, signal, baseline, multiplier, raw_score,
+            score, confidence
+            
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if not HAS_NUMPY:
+            raise ImportError(
+                "numpy package is required for score_columns. "
+                "Install with: pip install numpy"
+            )
+        
+        events, contexts = self._as_batches(events, contexts)
+        
+        # Like score(), compute nothing for invalid events: they get
+        # signal 0, baseline 1, multiplier 1, score 0 and confidence 0
+        valid = np.asarray(self._batch_validate(events), dtype=bool)
+        columns = {
+            "valid": valid,
+            "signal": np.zeros(events.size),
+            "baseline": np.ones(events.size),
+            "multiplier": np.ones(events.size),
+            "raw_score": np.zeros(events.size),
+            "score": np.zeros(events.size),
+            "confidence": np.zeros(events.size),
+        }
+        if not valid.any():
+            return columns
+        if not valid.all():
+            events, contexts = events.select(valid), contexts.select(valid)
+        
+        signal = self._batch_signal(events, contexts)
+        baseline = self._batch_baseline(events, contexts)
+        multiplier = self._batch_context_multiplier(events, contexts)
+        confidence = self._batch_confidence(events, contexts)
+        
+        # Avoid division by zero
+        baseline = np.where(baseline <= 0, 1.0, baseline)
+        
+        raw_score = signal / baseline
+        
+        columns["signal"][valid] = signal
+        columns["baseline"][valid] = baseline
+        columns["multiplier"][valid] = multiplier
+        columns["raw_score"][valid] = raw_score
+        columns["score"][valid] = raw_score * multiplier
+        columns["confidence"][valid] = confidence
+        return columns
+    
+    def score_batch(self, events: BatchInput, contexts: ContextInput = None) -> List[ScoringResult]:
+        """
+        Score a batch of events, returning the same results as score().
+        
+        Signal, baseline, context multiplier and confidence are computed as
+        array operations via score_columns(). Building one ScoringResult per
+        event still costs about as much as the scoring itself, so for large
+        exports prefer score_columns() and only materialize what you need.
+        Falls back to calling score() per event when NumPy is unavailable.
+        
+        Values equal score() up to floating-point rounding (NumPy's pow may
+        differ in the last bit, e.g. in ContentAdapter decay).
+        
+        Args:
+            events: List of event dicts or an EventBatch
+            contexts: One shared context dict, a list of per-event dicts,
+                an EventBatch, or None
+            
+        Returns:
+            List of ScoringResult, one per event, in input order
+        """
+        if not HAS_NUMPY:
+            events, contexts = self._as_batch_records(events, contexts)
+            return [self.score(e, c) for e, c in zip(events, contexts)]
+        
+        events, contexts = self._as_batches(events, contexts)
+        columns = self.score_columns(events, contexts)
+        domain = self.get_domain_name()
+        
+        rows = zip(
+            columns["valid"].tolist(),
+            columns["signal"].tolist(),
+            columns["baseline"].tolist(),
+            columns["multiplier"].tolist(),
+            columns["raw_score"].tolist(),
+            columns["score"].tolist(),
+            columns["confidence"].tolist(),
+            events.values("type", "unknown"),
+        )
+        results = []
+        
+        for valid, signal, baseline, multiplier, raw_score, final_score, confidence, event_type in rows:
+            if not valid:
+                results.append(ScoringResult(
+                    signal=0.0,
+                    baseline=1.0,
+                    score=0.0,
+                    confidence=0.0,
+                    components={"error": "invalid_event"},
+                    metadata={"domain": domain},
+                ))
+                continue
+            
+            results.append(ScoringResult(
+                signal=signal,
+                baseline=baseline,
+                score=final_score,
+                context_multiplier=multiplier,
+                confidence=confidence,
+                components={
+                    "raw_score": raw_score,
+                    "multiplier": multiplier,
+                    "signal": signal,
+                    "baseline": baseline,
+                },
+                explanation=(
+                    f"Score = (signal {signal:.2f} / baseline {baseline:.2f}) × "
+                    f"multiplier {multiplier:.2f} = {final_score:.2f}"
+                ),
+                domain=domain,
+                metadata={
+                    "event_type": event_type,
+                },
+            ))
+        
+        return results
+    
+    def calculate_score_batch(self, events: BatchInput, contexts: ContextInput = None) -> List[ScoringResult]:
+        """Batch counterpart of calculate_score()."""
+        return self.score_batch(events, contexts)
+    
+    @staticmethod
+    def _as_batch_records(
+        events: BatchInput,
+        contexts: ContextInput,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Normalize batch inputs to lists of dicts for the scalar fallback."""
+        if isinstance(events, EventBatch):
+            events = events.records()
+        events = list(events)
+        
+        if isinstance(contexts, EventBatch):
+            contexts = contexts.records()
+        elif contexts is None or isinstance(contexts, Mapping):
+            contexts = [dict(contexts or {}) for _ in events]
+        contexts = list(contexts)
+        
+        if len(contexts) != len(events):
+            raise ValueError(
+                f"events and contexts length mismatch: {len(events)} != {len(contexts)}"
+            )
+        return events, contexts
 
 
-__all__ = ["BaseDomainAdapter", "ScoringResult"]
+__all__ = ["BaseDomainAdapter", "EventBatch", "ScoringResult", "HAS_NUMPY"]
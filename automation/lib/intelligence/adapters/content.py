@@ -19,9 +19,14 @@ The Signal/Baseline formula for content:
     score = (signal / baseline) * context_multiplier
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, Sequence
 
-from .base import BaseDomainAdapter, ScoringResult
+from .base import BaseDomainAdapter, EventBatch, ScoringResult
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class ContentAdapter(BaseDomainAdapter):
@@ -318,6 +323,118 @@ class ContentAdapter(BaseDomainAdapter):
         )
         
         return has_impressions or has_engagements or has_individual_engagements
+    
+    # =========================================================================
+    # Batch Scoring (vectorized counterparts of the methods above)
+    # =========================================================================
+    
+    def _batch_engagements(self, events: EventBatch, include_clicks: bool) -> Any:
+        """Total engagements, summing individual types where no total is given."""
+        engagements = events.floats("engagements", 0)
+        summed = events.floats("likes", 0) + events.floats("comments", 0) + events.floats("shares", 0)
+        if include_clicks:
+            summed = summed + events.floats("clicks", 0)
+        return np.where(engagements == 0, summed, engagements)
+    
+    def _batch_validate(self, events: EventBatch) -> Any:
+        """Vectorized validate_event()."""
+        valid = events.not_none("impressions") | events.not_none("engagements")
+        for key in ["likes", "comments", "shares", "clicks"]:
+            valid = valid | events.not_none(key)
+        return valid
+    
+    def _batch_signal(self, events: EventBatch, contexts: EventBatch) -> Any:
+        """Vectorized get_signal()."""
+        impressions = events.floats("impressions", 0)
+        engagements = self._batch_engagements(events, include_clicks=True)
+        
+        engagement_rate = np.divide(
+            engagements,
+            impressions,
+            out=np.zeros(events.size),
+            where=impressions > 0,
+        )
+        
+        return impressions * (1 + engagement_rate)
+    
+    def _batch_platforms(self, events: EventBatch) -> Sequence[str]:
+        """Lowercased platform names, as used by get_baseline()."""
+        return [platform.lower() for platform in events.values("platform", "default")]
+    
+    def _batch_baseline(self, events: EventBatch, contexts: EventBatch) -> Any:
+        """Vectorized get_baseline()."""
+        follower_count = contexts.floats("follower_count", 1000)
+        
+        platforms = self._batch_platforms(events)
+        default_rates = self.PLATFORM_RATES["default"]
+        impression_rate = np.fromiter(
+            (self.PLATFORM_RATES.get(p, default_rates)["impression_rate"] for p in platforms),
+            dtype=float,
+            count=events.size,
+        )
+        
+        hours_since_post = events.floats("hours_since_post", 0)
+        decay_factor = self._calculate_decay_batch(hours_since_post, platforms)
+        
+        baseline = follower_count * impression_rate * decay_factor
+        return np.maximum(baseline, 1.0)
+    
+    def _batch_context_multiplier(self, events: EventBatch, contexts: EventBatch) -> Any:
+        """Vectorized get_context_multiplier()."""
+        multiplier = np.ones(events.size)
+        
+        has_sentiment = events.not_none("sentiment_score")
+        sentiment_score = np.clip(events.floats("sentiment_score", 0.0), -1.0, 1.0)
+        multiplier = np.where(has_sentiment, multiplier * (1.0 + (sentiment_score * 0.5)), multiplier)
+        
+        multiplier = np.where(events.truthy("is_paid"), multiplier * 1.2, multiplier)
+        
+        type_multiplier = events.lookup(
+            "content_type",
+            "default",
+            self.CONTENT_TYPE_MULTIPLIERS,
+            self.CONTENT_TYPE_MULTIPLIERS["default"],
+            normalize=str.lower,
+        )
+        return multiplier * type_multiplier
+    
+    def _calculate_decay_batch(self, hours_since_post: Any, platforms: Sequence[str]) -> Any:
+        """
+        Vectorized _calculate_decay() over arrays of post ages and platforms.
+        
+        Args:
+            hours_since_post: Array of hours since each post was published
+            platforms: Platform name per post
+            
+        Returns:
+            Array of decay factors between 0.1 and 1.0
+        """
+        default_rates = self.PLATFORM_RATES["default"]
+        half_life = np.fromiter(
+            (self.PLATFORM_RATES.get(p.lower(), default_rates)["decay_half_life_hours"] for p in platforms),
+            dtype=float,
+            count=len(platforms),
+        )
+        
+        decay = np.maximum(0.5 ** (hours_since_post / half_life), 0.1)
+        return np.where(hours_since_post <= 0, 1.0, decay)
+    
+    def _batch_confidence(self, events: EventBatch, contexts: EventBatch) -> Any:
+        """Vectorized _calculate_confidence()."""
+        confidence = np.full(events.size, 0.5)
+        
+        impressions = events.floats("impressions", 0)
+        confidence = np.where(impressions > 100, confidence + 0.1, confidence)
+        confidence = np.where(impressions > 1000, confidence + 0.1, confidence)
+        
+        # Unlike get_signal(), confidence does not count clicks as engagement
+        engagements = self._batch_engagements(events, include_clicks=False)
+        confidence = np.where(engagements > 10, confidence + 0.1, confidence)
+        confidence = np.where(engagements > 100, confidence + 0.1, confidence)
+        
+        confidence = np.where(contexts.has("follower_count"), confidence + 0.1, confidence)
+        
+        return np.minimum(confidence, 1.0)
 
 
 __all__ = [
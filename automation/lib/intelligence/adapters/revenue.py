@@ -30,11 +30,16 @@ Context Factors:
     - Historical win rates for the segment
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
-from .base import BaseDomainAdapter, ScoringResult
+from .base import BaseDomainAdapter, EventBatch, ScoringResult
 from ..types import Domain
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class RevenueAdapter(BaseDomainAdapter):
     """
@@ -93,6 +98,14 @@ class RevenueAdapter(BaseDomainAdapter):
         ("opportunity", "lost"): "opportunity_to_close",
     }
     
+    # Competition level adjustments
+    COMPETITION_FACTORS = {
+        "high": 0.8,    # Harder to win, dampen expectations
+        "medium": 1.0,  # Normal
+        "low": 1.2,     # Easier to win, boost score
+        "none": 1.3,    # No competition, significant boost
+    }
+    
     def get_domain_name(self) -> str:
         """Return the domain identifier."""
         return "revenue"
@@ -164,16 +177,7 @@ class RevenueAdapter(BaseDomainAdapter):
         Returns:
             Velocity score
         """
-        # Look up the transition
-        transition_key = (from_stage, to_stage)
-        benchmark_key = self.STAGE_TRANSITIONS.get(transition_key)
-        
-        if not benchmark_key:
-            # Try to infer from current stage if previous unknown
-            for (from_s, to_s), key in self.STAGE_TRANSITIONS.items():
-                if to_s == to_stage:
-                    benchmark_key = key
-                    break
+        benchmark_key = self._get_benchmark_key(from_stage, to_stage)
         
         if not benchmark_key:
             # No matching transition, return neutral score
@@ -186,6 +190,29 @@ class RevenueAdapter(BaseDomainAdapter):
         
         return expected_days / actual_days
     
+    def _get_benchmark_key(self, from_stage: str, to_stage: str) -> Optional[str]:
+        """
+        Find the benchmark key for a stage transition.
+        
+        Args:
+            from_stage: Previous stage
+            to_stage: Current stage
+            
+        Returns:
+            Benchmark key (e.g. "mql_to_sql") or None if no transition matches
+        """
+        # Look up the transition
+        benchmark_key = self.STAGE_TRANSITIONS.get((from_stage, to_stage))
+        
+        if not benchmark_key:
+            # Try to infer from current stage if previous unknown
+            for (from_s, to_s), key in self.STAGE_TRANSITIONS.items():
+                if to_s == to_stage:
+                    benchmark_key = key
+                    break
+        
+        return benchmark_key
+    
     def get_baseline(self, event: Dict[str, Any], context: Dict[str, Any]) -> float:
         """
         Calculate expected baseline using segment benchmarks and historical data.
@@ -256,13 +283,7 @@ class RevenueAdapter(BaseDomainAdapter):
         
         # Competition level adjustment
         competition_level = context.get("competition_level", "medium").lower()
-        competition_factors = {
-            "high": 0.8,    # Harder to win, dampen expectations
-            "medium": 1.0,  # Normal
-            "low": 1.2,     # Easier to win, boost score
-            "none": 1.3,    # No competition, significant boost
-        }
-        multiplier *= competition_factors.get(competition_level, 1.0)
+        multiplier *= self.COMPETITION_FACTORS.get(competition_level, 1.0)
         
         return multiplier
     
@@ -321,6 +342,110 @@ class RevenueAdapter(BaseDomainAdapter):
             True if event has required fields
         """
         return bool(event.get("current_stage")) or event.get("deal_value", 0) > 0
+    
+    # =========================================================================
+    # Batch Scoring (vectorized counterparts of the methods above)
+    # =========================================================================
+    
+    def _batch_segment_benchmark(self, contexts: EventBatch, key: str) -> Any:
+        """Per-row segment benchmark value (e.g. avg_deal_size)."""
+        table = {segment: values[key] for segment, values in self.SEGMENT_BENCHMARKS.items()}
+        return contexts.lookup("segment", "default", table, table["default"])
+    
+    def _batch_validate(self, events: EventBatch) -> Any:
+        """Vectorized validate_event()."""
+        return events.truthy("current_stage") | (events.floats("deal_value", 0) > 0)
+    
+    def _batch_signal(self, events: EventBatch, contexts: EventBatch) -> Any:
+        """Vectorized get_signal()."""
+        current_stages = [stage.lower() for stage in events.values("current_stage", "")]
+        previous_stages = [stage.lower() for stage in events.values("previous_stage", "")]
+        segments = contexts.values("segment", "default")
+        actual_days = events.floats("actual_days", 0)
+        
+        is_won = np.fromiter(
+            (stage in ("won", "closed_won") for stage in current_stages),
+            dtype=bool,
+            count=events.size,
+        )
+        
+        # Resolve each distinct (transition, segment) to its expected days once
+        resolved: Dict[Tuple[str, str, Any], float] = {}
+        expected_days = np.empty(events.size)
+        for i, (previous, current, segment) in enumerate(zip(previous_stages, current_stages, segments)):
+            to_stage = "closed" if is_won[i] else current
+            cache_key = (previous, to_stage, segment)
+            if cache_key not in resolved:
+                benchmark_key = self._get_benchmark_key(previous, to_stage)
+                benchmarks = self.SEGMENT_BENCHMARKS.get(segment, self.SEGMENT_BENCHMARKS["default"])
+                resolved[cache_key] = benchmarks.get(benchmark_key, 14) if benchmark_key else np.nan
+            expected_days[i] = resolved[cache_key]
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            velocity_score = np.where(
+                np.isnan(expected_days) | (actual_days <= 0),
+                1.0,
+                expected_days / actual_days,
+            )
+        
+        # Value bonus for closed-won deals, dampened and capped at 2x
+        deal_value = events.floats("deal_value", 0)
+        avg_deal_size = self._batch_segment_benchmark(contexts, "avg_deal_size")
+        has_bonus = is_won & (deal_value > 0) & (avg_deal_size > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            value_bonus = np.minimum(deal_value / avg_deal_size, 2.0)
+        
+        return np.where(has_bonus, velocity_score * (1 + (value_bonus - 1) * 0.5), velocity_score)
+    
+    def _batch_baseline(self, events: EventBatch, contexts: EventBatch) -> Any:
+        """Vectorized get_baseline()."""
+        typical_win_rate = self._batch_segment_benchmark(contexts, "typical_win_rate")
+        historical_win_rate = np.where(
+            contexts.has("historical_win_rate"),
+            contexts.floats("historical_win_rate", 0.0),
+            typical_win_rate,
+        )
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            multiplier = np.where(
+                typical_win_rate > 0,
+                historical_win_rate / typical_win_rate,
+                1.0,
+            )
+        
+        return 1.0 * multiplier
+    
+    def _batch_context_multiplier(self, events: EventBatch, contexts: EventBatch) -> Any:
+        """Vectorized get_context_multiplier()."""
+        multiplier = np.ones(events.size)
+        
+        deal_value = events.floats("deal_value", 0)
+        avg_deal_size = self._batch_segment_benchmark(contexts, "avg_deal_size")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            size_multiplier = 0.5 + np.minimum(deal_value / avg_deal_size, 3.0) * (1.0 / 3.0)
+        multiplier = np.where(
+            (deal_value > 0) & (avg_deal_size > 0),
+            multiplier * size_multiplier,
+            multiplier,
+        )
+        
+        multiplier = np.where(contexts.truthy("is_strategic"), multiplier * 1.5, multiplier)
+        
+        return multiplier * contexts.lookup(
+            "competition_level", "medium", self.COMPETITION_FACTORS, 1.0, normalize=str.lower
+        )
+    
+    def _batch_confidence(self, events: EventBatch, contexts: EventBatch) -> Any:
+        """Vectorized _calculate_confidence()."""
+        confidence = np.full(events.size, 0.6)
+        
+        confidence = np.where(events.floats("deal_value", 0) > 0, confidence + 0.1, confidence)
+        confidence = np.where(contexts.has("historical_win_rate"), confidence + 0.1, confidence)
+        
+        clear_progression = events.truthy("current_stage") & events.truthy("previous_stage")
+        confidence = np.where(clear_progression, confidence + 0.1, confidence)
+        
+        return np.minimum(confidence, 0.95)
 
 
 __all__ = ["RevenueAdapter"]
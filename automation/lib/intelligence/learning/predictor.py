@@ -180,6 +180,12 @@ class Predictor:
                     tenant_id=tenant_id,
                     domain=domain
                 )
+            elif hasattr(self._semantic_store, "retrieve_patterns"):
+                return self._semantic_store.retrieve_patterns(
+                    skill_name=skill_name,
+                    domain=domain,
+                    tenant_id=tenant_id
+                )
         except Exception as e:
             logger.warning(f"Failed to retrieve patterns: {e}")
         return []
@@ -57,8 +57,9 @@ class MemoryConsolidationManager:
     4. Promote cross-skill patterns to procedural knowledge
     
     Thread Safety:
-        All operations are protected by an RLock to ensure thread-safe access
-        in multi-threaded environments.
+        Consolidation runs are serialized by an RLock. The memory stores'
+        read paths never take it (or any store-wide lock), so guidance
+        lookups proceed while a cycle is running.
     
     Example:
         >>> consolidation = MemoryConsolidationManager(
@@ -7,19 +7,43 @@ and can be consolidated into semantic patterns.
 
 Firebase path: system/intelligence/episodic/{tenant_id}/{skill_name}/{episode_id}
 Archive path: system/intelligence/archive/{tenant_id}/{skill_name}/{episode_id}
+
+Retrieval metadata (retrieval_count, last_retrieved_at) is not written on
+the read path: hits are coalesced per episode in memory and flushed in
+batched writes by a background thread, on a timer or when enough episodes
+are pending.
 """
 
+import atexit
 import logging
 import threading
+import weakref
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..types import Domain, EpisodicMemory, Prediction, Outcome
 
 logger = logging.getLogger(__name__)
 
 
+# Stores with a running flush thread, closed at exit. Weak, so a closed
+# store is not kept alive by the registry.
+_open_stores: "weakref.WeakSet[EpisodicMemoryStore]" = weakref.WeakSet()
+_open_stores_lock = threading.Lock()
+
+
+def _close_open_stores():
+    """Flush every store still open at interpreter exit."""
+    with _open_stores_lock:
+        stores = list(_open_stores)
+    for store in stores:
+        store.close()
+
+
+atexit.register(_close_open_stores)
+
+
 @dataclass
 class EpisodicMemoryConfig:
     """Configuration for episodic memory behavior."""
@@ -28,6 +52,16 @@ class EpisodicMemoryConfig:
     max_episodes_per_skill: int = 1000    # Cap per skill to prevent unbounded growth
     ttl_days: int = 90                    # Days before archival
     consolidation_threshold: int = 10     # Episodes needed before pattern extraction
+    retrieval_flush_interval: float = 5.0 # Max seconds a retrieval update stays unwritten (0 = flush after each retrieve)
+    retrieval_flush_threshold: int = 200  # Pending episodes that trigger an early flush
+
+
+@dataclass
+class _PendingRetrieval:
+    """Coalesced retrieval hits for one episode, not yet written."""
+    base_count: int                       # Highest retrieval_count seen in Firestore
+    hits: int                             # Retrievals since then
+    last_retrieved_at: str
 
 
 class EpisodicMemoryStore:
@@ -36,6 +70,11 @@ class EpisodicMemoryStore:
     
     Manages storage, retrieval, decay, and archival of episodic memories.
     Episodes decay over time based on age and retrieval frequency.
+    
+    Thread Safety:
+        Reads and single-document writes take no store-wide lock, so
+        Firebase I/O from concurrent callers overlaps. Decay and cleanup
+        sweeps are serialized with each other only.
     """
     
     _collection_base = "system/intelligence/episodic"
@@ -56,7 +95,22 @@ class EpisodicMemoryStore:
         """
         self._firebase = firebase_client
         self._config = config or EpisodicMemoryConfig()
-        self._lock = threading.RLock()
+        # Serializes decay/cleanup sweeps (never taken by reads or writes)
+        self._maintenance_lock = threading.RLock()
+        
+        # Deferred retrieval metadata: (tenant_id, skill_name, episode_id) -> pending
+        self._pending: Dict[Tuple[str, str, str], _PendingRetrieval] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flush_event = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self._closed = False
+        self._flush_stats = {
+            "hits_recorded": 0,
+            "flushes": 0,
+            "episodes_written": 0,
+            "write_failures": 0,
+        }
     
     def _get_collection_path(self, tenant_id: str, skill_name: str) -> str:
         """
@@ -120,39 +174,38 @@ class EpisodicMemoryStore:
         Returns:
             The episode_id of the stored episode
         """
-        with self._lock:
-            tenant_id = episode.prediction.tenant_id
-            skill_name = episode.prediction.skill_name
-            
-            if not tenant_id or not skill_name:
-                raise ValueError("Episode must have tenant_id and skill_name in prediction")
-            
-            collection_path = self._get_collection_path(tenant_id, skill_name)
-            doc_data = episode.to_dict()
-            
-            # Store using available firebase method
-            if hasattr(self._firebase, "set_document"):
-                # Parse collection path - Firebase expects collection/doc format
-                parts = collection_path.split("/")
-                if len(parts) >= 3:
-                    # system/intelligence/episodic/tenant/skill -> use full path as collection
-                    self._firebase.set_document(
-                        collection=collection_path,
-                        doc_id=episode.episode_id,
-                        data=doc_data
-                    )
-                else:
-                    self._firebase.set_document(
-                        collection=collection_path,
-                        doc_id=episode.episode_id,
-                        data=doc_data
-                    )
+        tenant_id = episode.prediction.tenant_id
+        skill_name = episode.prediction.skill_name
+        
+        if not tenant_id or not skill_name:
+            raise ValueError("Episode must have tenant_id and skill_name in prediction")
+        
+        collection_path = self._get_collection_path(tenant_id, skill_name)
+        doc_data = episode.to_dict()
+        
+        # Store using available firebase method
+        if hasattr(self._firebase, "set_document"):
+            # Parse collection path - Firebase expects collection/doc format
+            parts = collection_path.split("/")
+            if len(parts) >= 3:
+                # system/intelligence/episodic/tenant/skill -> use full path as collection
+                self._firebase.set_document(
+                    collection=collection_path,
+                    doc_id=episode.episode_id,
+                    data=doc_data
+                )
             else:
-                logger.warning("Firebase client missing set_document method")
-                raise AttributeError("firebase_client missing set_document method")
-            
-            logger.debug(f"Stored episode {episode.episode_id} at {collection_path}")
-            return episode.episode_id
+                self._firebase.set_document(
+                    collection=collection_path,
+                    doc_id=episode.episode_id,
+                    data=doc_data
+                )
+        else:
+            logger.warning("Firebase client missing set_document method")
+            raise AttributeError("firebase_client missing set_document method")
+        
+        logger.debug(f"Stored episode {episode.episode_id} at {collection_path}")
+        return episode.episode_id
     
     def retrieve(
         self,
@@ -165,7 +218,8 @@ class EpisodicMemoryStore:
         """
         Retrieve episodes from Firebase with filtering and decay application.
         
-        Applies temporal decay on retrieval and updates retrieval metadata.
+        Applies temporal decay on retrieval. Retrieval metadata updates are
+        deferred and batched (see flush_retrieval_metadata).
         
         Args:
             tenant_id: Tenant identifier
@@ -177,98 +231,224 @@ class EpisodicMemoryStore:
         Returns:
             List of EpisodicMemory objects with decayed weights
         """
-        with self._lock:
-            collection_path = self._get_collection_path(tenant_id, skill_name)
-            
-            # Build filters
-            filters = []
-            if domain is not None:
-                filters.append(("prediction.domain", "==", domain.value))
-            
-            # Query Firebase
-            try:
-                if hasattr(self._firebase, "query") and filters:
-                    docs = self._firebase.query(
-                        collection=collection_path,
-                        filters=filters,
-                        limit=limit * 2,  # Over-fetch to account for weight filtering
-                        order_by="created_at",
-                        order_direction="DESCENDING"
-                    )
-                elif hasattr(self._firebase, "get_collection"):
-                    docs = self._firebase.get_collection(
-                        collection=collection_path,
-                        limit=limit * 2,
-                        order_by="created_at",
-                        order_direction="DESCENDING"
-                    )
-                else:
-                    logger.warning("Firebase client missing query/get_collection methods")
-                    return []
-            except Exception as e:
-                logger.error(f"Error querying episodes: {e}")
+        collection_path = self._get_collection_path(tenant_id, skill_name)
+        
+        # Build filters
+        filters = []
+        if domain is not None:
+            filters.append(("prediction.domain", "==", domain.value))
+        
+        # Query Firebase
+        try:
+            if hasattr(self._firebase, "query") and filters:
+                docs = self._firebase.query(
+                    collection=collection_path,
+                    filters=filters,
+                    limit=limit * 2,  # Over-fetch to account for weight filtering
+                    order_by="created_at",
+                    order_direction="DESCENDING"
+                )
+            elif hasattr(self._firebase, "get_collection"):
+                docs = self._firebase.get_collection(
+                    collection=collection_path,
+                    limit=limit * 2,
+                    order_by="created_at",
+                    order_direction="DESCENDING"
+                )
+            else:
+                logger.warning("Firebase client missing query/get_collection methods")
                 return []
+        except Exception as e:
+            logger.error(f"Error querying episodes: {e}")
+            return []
+        
+        if not docs:
+            return []
+        
+        # Convert to episodes and apply decay
+        episodes = []
+        now_iso = datetime.now(timezone.utc).isoformat()
+        
+        for doc in docs:
+            episode = self._doc_to_episode(doc)
+            if episode is None:
+                continue
             
-            if not docs:
-                return []
+            # Apply temporal decay
+            episode.weight = self._apply_decay(episode)
             
-            # Convert to episodes and apply decay
-            episodes = []
-            now_iso = datetime.now(timezone.utc).isoformat()
+            # Filter by min_weight after decay
+            if min_weight is not None and episode.weight < min_weight:
+                continue
             
-            for doc in docs:
-                episode = self._doc_to_episode(doc)
-                if episode is None:
-                    continue
-                
-                # Apply temporal decay
-                episode.weight = self._apply_decay(episode)
-                
-                # Filter by min_weight after decay
-                if min_weight is not None and episode.weight < min_weight:
-                    continue
-                
-                # Filter by domain if nested query didn't work
-                if domain is not None and episode.prediction.domain != domain:
-                    continue
-                
-                episodes.append(episode)
-                
-                # Update retrieval metadata asynchronously
-                self._update_retrieval_metadata(
-                    tenant_id, skill_name, episode.episode_id,
-                    episode.retrieval_count + 1, now_iso
-                )
-                
-                if len(episodes) >= limit:
-                    break
+            # Filter by domain if nested query didn't work
+            if domain is not None and episode.prediction.domain != domain:
+                continue
             
-            return episodes
+            episodes.append(episode)
+            
+            if len(episodes) >= limit:
+                break
+        
+        # Retrieval metadata is written later, in batches, off the read path
+        self._record_retrievals(tenant_id, skill_name, episodes, now_iso)
+        return episodes
+    
+    # =========================================================================
+    # Deferred retrieval metadata
+    # =========================================================================
     
-    def _update_retrieval_metadata(
+    def _record_retrievals(
         self,
         tenant_id: str,
         skill_name: str,
-        episode_id: str,
-        retrieval_count: int,
-        last_retrieved_at: str
+        episodes: List[EpisodicMemory],
+        retrieved_at: str
     ):
-        """Update retrieval count and timestamp for an episode."""
-        try:
-            collection_path = self._get_collection_path(tenant_id, skill_name)
-            
-            if hasattr(self._firebase, "update_document"):
-                self._firebase.update_document(
-                    collection=collection_path,
-                    doc_id=episode_id,
-                    data={
-                        "retrieval_count": retrieval_count,
-                        "last_retrieved_at": last_retrieved_at
+        """Coalesce retrieval hits in memory and schedule a flush."""
+        if not episodes:
+            return
+        
+        with self._pending_lock:
+            for episode in episodes:
+                key = (tenant_id, skill_name, episode.episode_id)
+                pending = self._pending.get(key)
+                if pending is None:
+                    self._pending[key] = _PendingRetrieval(
+                        base_count=episode.retrieval_count,
+                        hits=1,
+                        last_retrieved_at=retrieved_at
+                    )
+                else:
+                    pending.base_count = max(pending.base_count, episode.retrieval_count)
+                    pending.hits += 1
+                    pending.last_retrieved_at = retrieved_at
+            self._flush_stats["hits_recorded"] += len(episodes)
+            pending_count = len(self._pending)
+        
+        if self._config.retrieval_flush_interval <= 0 or self._closed:
+            self.flush_retrieval_metadata()
+            return
+        
+        self._ensure_flusher()
+        if pending_count >= self._config.retrieval_flush_threshold:
+            self._flush_event.set()
+    
+    def _ensure_flusher(self):
+        """Start the background flush thread on first use."""
+        if self._flusher is not None:
+            return
+        with self._pending_lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(
+                target=self._flush_loop,
+                name="episodic-retrieval-flush",
+                daemon=True
+            )
+            self._flusher.start()
+        with _open_stores_lock:
+            _open_stores.add(self)
+    
+    def _flush_loop(self):
+        """Flush on the interval timer or when woken by the size threshold."""
+        while not self._closed:
+            self._flush_event.wait(timeout=self._config.retrieval_flush_interval)
+            self._flush_event.clear()
+            if self._closed:
+                break
+            try:
+                self.flush_retrieval_metadata()
+            except Exception as e:
+                logger.warning(f"Retrieval metadata flush failed: {e}")
+    
+    def flush_retrieval_metadata(self) -> int:
+        """
+        Write pending retrieval counts/timestamps now.
+        
+        One batched write covers every pending episode (repeated hits on an
+        episode are a single update). Failures are logged and dropped:
+        retrieval metadata is best-effort.
+        
+        Returns:
+            Number of episodes written
+        """
+        with self._flush_lock:
+            with self._pending_lock:
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return 0
+            
+            updates = []
+            for (tenant_id, skill_name, episode_id), entry in pending.items():
+                updates.append((
+                    self._get_collection_path(tenant_id, skill_name),
+                    episode_id,
+                    {
+                        "retrieval_count": entry.base_count + entry.hits,
+                        "last_retrieved_at": entry.last_retrieved_at
                     }
-                )
+                ))
+            
+            written, failures = self._write_retrieval_updates(updates)
+            
+            with self._pending_lock:
+                self._flush_stats["flushes"] += 1
+                self._flush_stats["episodes_written"] += written
+                self._flush_stats["write_failures"] += failures
+            
+            logger.debug(f"Flushed retrieval metadata for {written} episodes ({failures} failed)")
+            return written
+    
+    def _write_retrieval_updates(self, updates: List[Tuple[str, str, Dict[str, Any]]]) -> Tuple[int, int]:
+        """Write updates with batch_write if available, else one update each."""
+        if hasattr(self._firebase, "batch_write"):
+            operations = [
+                {"type": "update", "collection": collection, "doc_id": doc_id, "data": data}
+                for collection, doc_id, data in updates
+            ]
+            try:
+                result = self._firebase.batch_write(operations, atomic=False)
+                failures = len(result.get("failed_operations", [])) if isinstance(result, dict) else 0
+                return len(updates) - failures, failures
+            except Exception as e:
+                logger.debug(f"Batched retrieval metadata write failed: {e}")
+                return 0, len(updates)
+        
+        written = failures = 0
+        if hasattr(self._firebase, "update_document"):
+            for collection, doc_id, data in updates:
+                try:
+                    self._firebase.update_document(collection=collection, doc_id=doc_id, data=data)
+                    written += 1
+                except Exception as e:
+                    # Non-critical operation, log and continue
+                    logger.debug(f"Failed to update retrieval metadata for {doc_id}: {e}")
+                    failures += 1
+        return written, failures
+    
+    def _discard_pending(self, tenant_id: str, skill_name: str, episode_id: str):
+        """Drop pending retrieval metadata for a deleted/archived episode."""
+        with self._pending_lock:
+            self._pending.pop((tenant_id, skill_name, episode_id), None)
+    
+    def get_flush_stats(self) -> Dict[str, Any]:
+        """Get deferred retrieval metadata statistics."""
+        with self._pending_lock:
+            stats = dict(self._flush_stats)
+            stats["pending"] = len(self._pending)
+        return stats
+    
+    def close(self):
+        """Stop the flush thread and write any pending retrieval metadata."""
+        self._closed = True
+        self._flush_event.set()
+        with _open_stores_lock:
+            _open_stores.discard(self)
+        try:
+            self.flush_retrieval_metadata()
         except Exception as e:
-            # Non-critical operation, log and continue
-            logger.debug(f"Failed to update retrieval metadata for {episode_id}: {e}")
+            logger.warning(f"Final retrieval metadata flush failed: {e}")
     
     def decay_all(self, tenant_id: Optional[str] = None) -> Dict[str, int]:
         """
@@ -280,7 +460,7 @@ class EpisodicMemoryStore:
         Returns:
             Statistics dict with keys: decayed, to_consolidate, archived
         """
-        with self._lock:
+        with self._maintenance_lock:
             stats = {"decayed": 0, "to_consolidate": 0, "archived": 0}
             
             try:
@@ -333,63 +513,62 @@ class EpisodicMemoryStore:
         Returns:
             List of low-weight episodes ready for consolidation
         """
-        with self._lock:
-            if limit is None:
-                limit = self._config.consolidation_threshold
+        if limit is None:
+            limit = self._config.consolidation_threshold
+        
+        collection_path = self._get_collection_path(tenant_id, skill_name)
+        
+        try:
+            # Query for episodes not yet consolidated
+            filters = [
+                ("consolidated_at", "==", None)
+            ]
             
-            collection_path = self._get_collection_path(tenant_id, skill_name)
+            if hasattr(self._firebase, "query"):
+                docs = self._firebase.query(
+                    collection=collection_path,
+                    filters=filters,
+                    limit=limit * 3,  # Over-fetch for weight filtering
+                    order_by="created_at",
+                    order_direction="ASCENDING"  # Oldest first
+                )
+            elif hasattr(self._firebase, "get_collection"):
+                docs = self._firebase.get_collection(
+                    collection=collection_path,
+                    limit=limit * 3,
+                    order_by="created_at",
+                    order_direction="ASCENDING"
+                )
+            else:
+                return []
             
-            try:
-                # Query for episodes not yet consolidated
-                filters = [
-                    ("consolidated_at", "==", None)
-                ]
-                
-                if hasattr(self._firebase, "query"):
-                    docs = self._firebase.query(
-                        collection=collection_path,
-                        filters=filters,
-                        limit=limit * 3,  # Over-fetch for weight filtering
-                        order_by="created_at",
-                        order_direction="ASCENDING"  # Oldest first
-                    )
-                elif hasattr(self._firebase, "get_collection"):
-                    docs = self._firebase.get_collection(
-                        collection=collection_path,
-                        limit=limit * 3,
-                        order_by="created_at",
-                        order_direction="ASCENDING"
-                    )
-                else:
-                    return []
-                
-                if not docs:
-                    return []
+            if not docs:
+                return []
+            
+            # Filter by weight threshold after decay
+            episodes = []
+            for doc in docs:
+                episode = self._doc_to_episode(doc)
+                if episode is None:
+                    continue
                 
-                # Filter by weight threshold after decay
-                episodes = []
-                for doc in docs:
-                    episode = self._doc_to_episode(doc)
-                    if episode is None:
-                        continue
-                    
-                    # Skip already consolidated
-                    if episode.consolidated_at is not None:
-                        continue
-                    
-                    # Apply decay and check threshold
-                    episode.weight = self._apply_decay(episode)
-                    
-                    if episode.weight < self._config.relevance_threshold:
-                        episodes.append(episode)
-                        if len(episodes) >= limit:
-                            break
+                # Skip already consolidated
+                if episode.consolidated_at is not None:
+                    continue
                 
-                return episodes
+                # Apply decay and check threshold
+                episode.weight = self._apply_decay(episode)
                 
-            except Exception as e:
-                logger.error(f"Error getting episodes for consolidation: {e}")
-                return []
+                if episode.weight < self._config.relevance_threshold:
+                    episodes.append(episode)
+                    if len(episodes) >= limit:
+                        break
+            
+            return episodes
+            
+        except Exception as e:
+            logger.error(f"Error getting episodes for consolidation: {e}")
+            return []
     
     def mark_consolidated(
         self,
@@ -405,22 +584,21 @@ class EpisodicMemoryStore:
             tenant_id: Tenant identifier
             skill_name: Name of the skill
         """
-        with self._lock:
-            collection_path = self._get_collection_path(tenant_id, skill_name)
-            now_iso = datetime.now(timezone.utc).isoformat()
-            
-            try:
-                if hasattr(self._firebase, "update_document"):
-                    self._firebase.update_document(
-                        collection=collection_path,
-                        doc_id=episode_id,
-                        data={"consolidated_at": now_iso}
-                    )
-                    logger.debug(f"Marked episode {episode_id} as consolidated")
-                else:
-                    logger.warning("Firebase client missing update_document method")
-            except Exception as e:
-                logger.error(f"Error marking episode consolidated: {e}")
+        collection_path = self._get_collection_path(tenant_id, skill_name)
+        now_iso = datetime.now(timezone.utc).isoformat()
+        
+        try:
+            if hasattr(self._firebase, "update_document"):
+                self._firebase.update_document(
+                    collection=collection_path,
+                    doc_id=episode_id,
+                    data={"consolidated_at": now_iso}
+                )
+                logger.debug(f"Marked episode {episode_id} as consolidated")
+            else:
+                logger.warning("Firebase client missing update_document method")
+        except Exception as e:
+            logger.error(f"Error marking episode consolidated: {e}")
     
     def _archive_episode(self, episode: EpisodicMemory):
         """
@@ -431,46 +609,46 @@ class EpisodicMemoryStore:
         Args:
             episode: The episode to archive
         """
-        with self._lock:
-            tenant_id = episode.prediction.tenant_id
-            skill_name = episode.prediction.skill_name
+        tenant_id = episode.prediction.tenant_id
+        skill_name = episode.prediction.skill_name
+        
+        if not tenant_id or not skill_name:
+            logger.error("Cannot archive episode without tenant_id and skill_name")
+            return
+        
+        active_path = self._get_collection_path(tenant_id, skill_name)
+        archive_path = self._get_archive_path(tenant_id, skill_name)
+        
+        try:
+            # Set archived timestamp
+            episode.archived_at = datetime.now(timezone.utc).isoformat()
+            doc_data = episode.to_dict()
             
-            if not tenant_id or not skill_name:
-                logger.error("Cannot archive episode without tenant_id and skill_name")
+            # Write to archive
+            if hasattr(self._firebase, "set_document"):
+                self._firebase.set_document(
+                    collection=archive_path,
+                    doc_id=episode.episode_id,
+                    data=doc_data
+                )
+            else:
+                logger.warning("Firebase client missing set_document method")
                 return
             
-            active_path = self._get_collection_path(tenant_id, skill_name)
-            archive_path = self._get_archive_path(tenant_id, skill_name)
+            # Delete from active
+            if hasattr(self._firebase, "delete_document"):
+                self._discard_pending(tenant_id, skill_name, episode.episode_id)
+                self._firebase.delete_document(
+                    collection=active_path,
+                    doc_id=episode.episode_id
+                )
+            else:
+                logger.warning("Firebase client missing delete_document method")
             
-            try:
-                # Set archived timestamp
-                episode.archived_at = datetime.now(timezone.utc).isoformat()
-                doc_data = episode.to_dict()
-                
-                # Write to archive
-                if hasattr(self._firebase, "set_document"):
-                    self._firebase.set_document(
-                        collection=archive_path,
-                        doc_id=episode.episode_id,
-                        data=doc_data
-                    )
-                else:
-                    logger.warning("Firebase client missing set_document method")
-                    return
-                
-                # Delete from active
-                if hasattr(self._firebase, "delete_document"):
-                    self._firebase.delete_document(
-                        collection=active_path,
-                        doc_id=episode.episode_id
-                    )
-                else:
-                    logger.warning("Firebase client missing delete_document method")
-                
-                logger.info(f"Archived episode {episode.episode_id}")
-                
-            except Exception as e:
-                logger.error(f"Error archiving episode {episode.episode_id}: {e}")
+            logger.info(f"Archived episode {episode.episode_id}")
+            
+        except Exception as e:
+            logger.error(f"Error archiving episode {episode.episode_id}: {e}")
     
     def _doc_to_episode(self, doc: Dict[str, Any]) -> Optional[EpisodicMemory]:
         """
@@ -538,27 +716,26 @@ class EpisodicMemoryStore:
         Returns:
             EpisodicMemory or None if not found
         """
-        with self._lock:
-            collection_path = self._get_collection_path(tenant_id, skill_name)
-            
-            try:
-                if hasattr(self._firebase, "get_document"):
-                    doc = self._firebase.get_document(
-                        collection=collection_path,
-                        doc_id=episode_id
-                    )
-                    if doc:
-                        episode = self._doc_to_episode(doc)
-                        if episode:
-                            episode.weight = self._apply_decay(episode)
-                        return episode
-                else:
-                    logger.warning("Firebase client missing get_document method")
-                
-            except Exception as e:
-                logger.error(f"Error getting episode {episode_id}: {e}")
+        collection_path = self._get_collection_path(tenant_id, skill_name)
+        
+        try:
+            if hasattr(self._firebase, "get_document"):
+                doc = self._firebase.get_document(
+                    collection=collection_path,
+                    doc_id=episode_id
+                )
+                if doc:
+                    episode = self._doc_to_episode(doc)
+                    if episode:
+                        episode.weight = self._apply_decay(episode)
+                    return episode
+            else:
+                logger.warning("Firebase client missing get_document method")
             
-            return None
+        except Exception as e:
+            logger.error(f"Error getting episode {episode_id}: {e}")
+        
+        return None
     
     def delete_episode(
         self,
@@ -577,24 +754,24 @@ class EpisodicMemoryStore:
         Returns:
             True if deleted, False otherwise
         """
-        with self._lock:
-            collection_path = self._get_collection_path(tenant_id, skill_name)
-            
-            try:
-                if hasattr(self._firebase, "delete_document"):
-                    self._firebase.delete_document(
-                        collection=collection_path,
-                        doc_id=episode_id
-                    )
-                    logger.debug(f"Deleted episode {episode_id}")
-                    return True
-                else:
-                    logger.warning("Firebase client missing delete_document method")
-                    
-            except Exception as e:
-                logger.error(f"Error deleting episode {episode_id}: {e}")
-            
-            return False
+        collection_path = self._get_collection_path(tenant_id, skill_name)
+        
+        try:
+            if hasattr(self._firebase, "delete_document"):
+                self._discard_pending(tenant_id, skill_name, episode_id)
+                self._firebase.delete_document(
+                    collection=collection_path,
+                    doc_id=episode_id
+                )
+                logger.debug(f"Deleted episode {episode_id}")
+                return True
+            else:
+                logger.warning("Firebase client missing delete_document method")
+                
+        except Exception as e:
+            logger.error(f"Error deleting episode {episode_id}: {e}")
+        
+        return False
     
     def count_episodes(self, tenant_id: str, skill_name: str) -> int:
         """
@@ -607,21 +784,20 @@ class EpisodicMemoryStore:
         Returns:
             Episode count
         """
-        with self._lock:
-            collection_path = self._get_collection_path(tenant_id, skill_name)
-            
-            try:
-                if hasattr(self._firebase, "get_collection"):
-                    docs = self._firebase.get_collection(
-                        collection=collection_path,
-                        limit=self._config.max_episodes_per_skill + 1
-                    )
-                    return len(docs) if docs else 0
-                    
-            except Exception as e:
-                logger.error(f"Error counting episodes: {e}")
-            
-            return 0
+        collection_path = self._get_collection_path(tenant_id, skill_name)
+        
+        try:
+            if hasattr(self._firebase, "get_collection"):
+                docs = self._firebase.get_collection(
+                    collection=collection_path,
+                    limit=self._config.max_episodes_per_skill + 1
+                )
+                return len(docs) if docs else 0
+                
+        except Exception as e:
+            logger.error(f"Error counting episodes: {e}")
+        
+        return 0
     
     def cleanup_old_episodes(
         self,
@@ -638,7 +814,7 @@ class EpisodicMemoryStore:
         Returns:
             Statistics dict with archived count
         """
-        with self._lock:
+        with self._maintenance_lock:
             stats = {"archived": 0, "checked": 0}
             collection_path = self._get_collection_path(tenant_id, skill_name)
             
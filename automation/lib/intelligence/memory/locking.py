@@ -0,0 +1,48 @@
+"""
+Per-Key Locking for the Memory Stores
+
+Read-modify-write updates (a pattern's Bayesian update, a procedural entry's
+validation map) must not interleave for the same document, but updates to
+different documents, and all reads, should run concurrently.
+
+StripedLock provides that with a fixed pool of locks selected by key hash:
+two keys share a lock only when their hashes collide, and the pool never
+grows with the number of keys seen.
+
+Thread Safety:
+    Stripe locks are not reentrant. Code holding a key's lock must not call
+    back into a method that acquires a key lock.
+"""
+
+import threading
+from typing import Hashable
+
+
+class StripedLock:
+    """
+    Fixed pool of locks addressed by key.
+
+    Example:
+        >>> locks = StripedLock()
+        >>> with locks.for_key(domain, pattern_id):
+        ...     doc = firebase.get_document(...)
+        ...     firebase.update_document(...)
+    """
+
+    def __init__(self, stripes: int = 64):
+        """
+        Initialize the lock pool.
+
+        Args:
+            stripes: Number of locks in the pool
+        """
+        self._locks = [threading.Lock() for _ in range(max(1, stripes))]
+
+    def for_key(self, *key: Hashable) -> threading.Lock:
+        """Get the lock guarding a key (all parts of the key are hashed together)."""
+        return self._locks[hash(key) % len(self._locks)]
+
+
+__all__ = [
+    "StripedLock",
+]
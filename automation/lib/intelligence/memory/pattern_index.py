@@ -0,0 +1,262 @@
+"""
+Inverted Index for Semantic Pattern Similarity Search
+
+In-process inverted index over SemanticPattern token sets, used by
+SemanticMemoryStore.find_similar_context so that similarity lookups no
+longer re-fetch and re-tokenize every pattern in a domain per query.
+
+Structure (one index per Domain):
+- Posting lists: token -> set of pattern_ids containing that token
+- Document frequencies: len(posting list), used for cached IDF weights
+- Forward entries: pattern_id -> (pattern, text, token set)
+
+Queries are answered by walking the query's posting lists rarest-first and
+accumulating per-pattern overlap counts. Once the best possible Jaccard
+score of a pattern that has not been seen yet drops below the current
+top-k threshold (or min_similarity), no new candidates are admitted and
+the remaining, more common, posting lists are only probed for existing
+candidates (MaxScore-style pruning).
+
+Thread Safety:
+    PatternIndex is not synchronized on its own. SemanticMemoryStore treats
+    a published index as an immutable snapshot: searches read it without a
+    lock, and writes mutate a copy() that then replaces it.
+"""
+
+import heapq
+import math
+import time
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from ..types import SemanticPattern
+
+
+@dataclass
+class IndexedPattern:
+    """A pattern entry held by the inverted index."""
+    pattern: SemanticPattern
+    text: str
+    tokens: FrozenSet[str]
+    seq: int                                # Insertion order, used for stable ties
+
+
+class PatternIndex:
+    """
+    Incrementally maintained inverted index for one domain's patterns.
+
+    Example:
+        >>> index = PatternIndex()
+        >>> index.add(pattern, text, tokens)
+        >>> hits = index.search(query_tokens, limit=5, min_similarity=0.1)
+        >>> for similarity, entry in hits:
+        ...     print(entry.pattern.pattern_id, similarity)
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, IndexedPattern] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        self._idf_cache: Optional[Dict[str, float]] = None
+        self._next_seq = 0
+        self.built_at = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, pattern_id: str) -> bool:
+        return pattern_id in self._entries
+
+    def copy(self) -> "PatternIndex":
+        """
+        Copy the index so the copy can be modified while this one is read.
+
+        Entries are shared (they are replaced, never mutated); posting sets
+        are copied. The copy keeps this index's built_at.
+        """
+        clone = PatternIndex.__new__(PatternIndex)
+        clone._entries = dict(self._entries)
+        clone._postings = {token: set(posting) for token, posting in self._postings.items()}
+        clone._idf_cache = self._idf_cache
+        clone._next_seq = self._next_seq
+        clone.built_at = self.built_at
+        return clone
+
+    def add(self, pattern: SemanticPattern, text: str, tokens: Iterable[str]):
+        """
+        Add or replace a pattern in the index.
+
+        Args:
+            pattern: The pattern to index
+            text: Searchable text representation of the pattern
+            tokens: Tokens produced from the text
+        """
+        token_set = frozenset(tokens)
+        existing = self._entries.get(pattern.pattern_id)
+
+        if existing is not None:
+            seq = existing.seq
+            self._unlink(pattern.pattern_id, existing.tokens - token_set)
+            new_tokens = token_set - existing.tokens
+        else:
+            seq = self._next_seq
+            self._next_seq += 1
+            new_tokens = token_set
+
+        for token in new_tokens:
+            self._postings.setdefault(token, set()).add(pattern.pattern_id)
+
+        self._entries[pattern.pattern_id] = IndexedPattern(
+            pattern=pattern,
+            text=text,
+            tokens=token_set,
+            seq=seq,
+        )
+
+        if new_tokens or existing is None or existing.tokens != token_set:
+            self._idf_cache = None
+
+    def remove(self, pattern_id: str) -> bool:
+        """
+        Remove a pattern from the index.
+
+        Args:
+            pattern_id: The pattern ID to remove
+
+        Returns:
+            True if the pattern was indexed, False otherwise
+        """
+        entry = self._entries.pop(pattern_id, None)
+        if entry is None:
+            return False
+
+        self._unlink(pattern_id, entry.tokens)
+        self._idf_cache = None
+        return True
+
+    def _unlink(self, pattern_id: str, tokens: Iterable[str]):
+        """Drop a pattern from the posting lists of the given tokens."""
+        for token in tokens:
+            posting = self._postings.get(token)
+            if posting is None:
+                continue
+            posting.discard(pattern_id)
+            if not posting:
+                del self._postings[token]
+
+    def document_frequency(self, token: str) -> int:
+        """Number of indexed patterns containing a token."""
+        return len(self._postings.get(token, ()))
+
+    def document_frequencies(self) -> Dict[str, int]:
+        """Document frequency for every indexed token."""
+        return {token: len(posting) for token, posting in self._postings.items()}
+
+    def idf_weights(self) -> Dict[str, float]:
+        """
+        Smoothed IDF weight per token, cached until the index changes.
+
+        Uses idf = ln((N + 1) / (df + 1)) + 1, so weights are always positive
+        and unseen tokens can default to 1.0 in _compute_weighted_similarity.
+        """
+        if self._idf_cache is None:
+            n_docs = len(self._entries)
+            self._idf_cache = {
+                token: math.log((n_docs + 1) / (len(posting) + 1)) + 1.0
+                for token, posting in self._postings.items()
+            }
+        return self._idf_cache
+
+    def search(
+        self,
+        query_tokens: Iterable[str],
+        limit: int,
+        min_similarity: float,
+        skill_filter: Optional[str] = None
+    ) -> List[Tuple[float, IndexedPattern]]:
+        """
+        Find the top-k patterns by Jaccard similarity to the query tokens.
+
+        Args:
+            query_tokens: Tokenized query
+            limit: Maximum number of results
+            min_similarity: Minimum Jaccard similarity [0, 1]
+            skill_filter: Optional skill name patterns must match
+
+        Returns:
+            List of (similarity, entry) tuples, best first
+        """
+        query_set = set(query_tokens)
+        query_size = len(query_set)
+        if not query_size or limit <= 0:
+            return []
+
+        # Rarest posting lists first so the candidate set stays small
+        terms = sorted(query_set, key=self.document_frequency)
+
+        overlap: Dict[str, int] = {}
+        threshold = min_similarity
+
+        for i, token in enumerate(terms):
+            posting = self._postings.get(token)
+            if not posting:
+                continue
+
+            # A pattern first seen now can match at most the remaining terms,
+            # and Jaccard <= overlap / |query| since |pattern| >= overlap.
+            max_new_score = (query_size - i) / query_size
+
+            if max_new_score >= threshold:
+                for pattern_id in posting:
+                    if pattern_id in overlap:
+                        overlap[pattern_id] += 1
+                    elif self._matches_skill(pattern_id, skill_filter):
+                        overlap[pattern_id] = 1
+            elif len(posting) < len(overlap):
+                for pattern_id in posting:
+                    if pattern_id in overlap:
+                        overlap[pattern_id] += 1
+            else:
+                for pattern_id in overlap:
+                    if pattern_id in posting:
+                        overlap[pattern_id] += 1
+
+            # Partial scores only grow, so the k-th best is a safe lower bound
+            if len(overlap) >= limit:
+                kth_best = heapq.nlargest(
+                    limit,
+                    (self._jaccard(query_size, pid, o) for pid, o in overlap.items())
+                )[-1]
+                threshold = max(min_similarity, kth_best)
+
+        scored = [
+            (self._jaccard(query_size, pattern_id, count), self._entries[pattern_id])
+            for pattern_id, count in overlap.items()
+        ]
+
+        # Patterns sharing no tokens score 0.0 and only qualify without a threshold
+        if min_similarity <= 0:
+            scored.extend(
+                (0.0, entry)
+                for pattern_id, entry in self._entries.items()
+                if pattern_id not in overlap and self._matches_skill(pattern_id, skill_filter)
+            )
+
+        scored = [item for item in scored if item[0] >= min_similarity]
+        return heapq.nsmallest(limit, scored, key=lambda item: (-item[0], item[1].seq))
+
+    def _jaccard(self, query_size: int, pattern_id: str, overlap: int) -> float:
+        """Jaccard similarity from a query size and an overlap count."""
+        union = query_size + len(self._entries[pattern_id].tokens) - overlap
+        return overlap / union if union > 0 else 0.0
+
+    def _matches_skill(self, pattern_id: str, skill_filter: Optional[str]) -> bool:
+        """Check a pattern against the optional skill filter."""
+        if not skill_filter:
+            return True
+        return self._entries[pattern_id].pattern.skill_name == skill_filter
+
+
+__all__ = [
+    "IndexedPattern",
+    "PatternIndex",
+]
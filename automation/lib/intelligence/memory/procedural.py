@@ -27,6 +27,7 @@ from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 from ..types import Domain, ProceduralKnowledge, SemanticPattern
+from .locking import StripedLock
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +76,12 @@ class ProceduralMemoryStore:
     - Has aggregate confidence based on all validating skills
     - Decays very slowly (knowledge is stable once established)
     - Can be applied to new skills that haven't validated it yet
+    
+    Thread Safety:
+        Reads take no store-wide lock, so concurrent lookups (e.g. from
+        Predictor.get_guidance) overlap their Firebase I/O. Validation
+        updates are serialized per knowledge entry; creation and decay
+        passes are serialized with each other only.
     """
     
     _collection_base = "system/intelligence/procedural"
@@ -94,7 +101,10 @@ class ProceduralMemoryStore:
         """
         self._firebase = firebase_client
         self._config = config or ProceduralMemoryConfig()
-        self._lock = threading.RLock()
+        # Serializes creation and decay passes (never taken by reads)
+        self._maintenance_lock = threading.RLock()
+        # Per-entry locks for read-modify-write validation updates
+        self._knowledge_locks = StripedLock()
     
     def store(self, knowledge: ProceduralKnowledge) -> str:
         """
@@ -109,24 +119,23 @@ class ProceduralMemoryStore:
         Raises:
             AttributeError: If firebase_client is missing required methods
         """
-        with self._lock:
-            doc_data = knowledge.to_dict()
-            
-            if hasattr(self._firebase, "set_document"):
-                self._firebase.set_document(
-                    collection=self._collection_base,
-                    doc_id=knowledge.knowledge_id,
-                    data=doc_data
-                )
-            else:
-                logger.warning("Firebase client missing set_document method")
-                raise AttributeError("firebase_client missing set_document method")
-            
-            logger.debug(
-                f"Stored procedural knowledge {knowledge.knowledge_id}: "
-                f"{knowledge.description[:50]}..."
+        doc_data = knowledge.to_dict()
+        
+        if hasattr(self._firebase, "set_document"):
+            self._firebase.set_document(
+                collection=self._collection_base,
+                doc_id=knowledge.knowledge_id,
+                data=doc_data
             )
-            return knowledge.knowledge_id
+        else:
+            logger.warning("Firebase client missing set_document method")
+            raise AttributeError("firebase_client missing set_document method")
+        
+        logger.debug(
+            f"Stored procedural knowledge {knowledge.knowledge_id}: "
+            f"{knowledge.description[:50]}..."
+        )
+        return knowledge.knowledge_id
     
     def retrieve(
         self,
@@ -153,55 +162,54 @@ class ProceduralMemoryStore:
         Returns:
             List of ProceduralKnowledge objects sorted by confidence descending
         """
-        with self._lock:
-            try:
-                # Query all procedural knowledge
-                if hasattr(self._firebase, "get_collection"):
-                    docs = self._firebase.get_collection(
-                        collection=self._collection_base,
-                        limit=limit * 3  # Over-fetch to account for filtering
-                    )
-                else:
-                    logger.warning("Firebase client missing get_collection method")
-                    return []
-                
-                if not docs:
-                    return []
+        try:
+            # Query all procedural knowledge
+            if hasattr(self._firebase, "get_collection"):
+                docs = self._firebase.get_collection(
+                    collection=self._collection_base,
+                    limit=limit * 3  # Over-fetch to account for filtering
+                )
+            else:
+                logger.warning("Firebase client missing get_collection method")
+                return []
+            
+            if not docs:
+                return []
+            
+            # Convert and filter
+            results = []
+            for doc in docs:
+                knowledge = self._doc_to_knowledge(doc)
+                if knowledge is None:
+                    continue
                 
-                # Convert and filter
-                results = []
-                for doc in docs:
-                    knowledge = self._doc_to_knowledge(doc)
-                    if knowledge is None:
+                # Filter by skill_name if in applicable_skills
+                if skill_name is not None:
+                    if skill_name not in knowledge.applicable_skills:
                         continue
-                    
-                    # Filter by skill_name if in applicable_skills
-                    if skill_name is not None:
-                        if skill_name not in knowledge.applicable_skills:
-                            continue
-                    
-                    # Filter by domain if in applicable_domains
-                    if domain is not None:
-                        domain_value = domain.value if isinstance(domain, Domain) else domain
-                        if domain_value not in knowledge.applicable_domains:
-                            continue
-                    
-                    # Filter by cross_skill_confidence >= min_confidence
-                    if min_confidence is not None:
-                        if knowledge.cross_skill_confidence < min_confidence:
-                            continue
-                    
-                    results.append(knowledge)
                 
-                # Sort by confidence descending
-                results.sort(key=lambda k: k.cross_skill_confidence, reverse=True)
+                # Filter by domain if in applicable_domains
+                if domain is not None:
+                    domain_value = domain.value if isinstance(domain, Domain) else domain
+                    if domain_value not in knowledge.applicable_domains:
+                        continue
                 
-                # Apply limit
-                return results[:limit]
+                # Filter by cross_skill_confidence >= min_confidence
+                if min_confidence is not None:
+                    if knowledge.cross_skill_confidence < min_confidence:
+                        continue
                 
-            except Exception as e:
-                logger.error(f"Error retrieving procedural knowledge: {e}")
-                return []
+                results.append(knowledge)
+            
+            # Sort by confidence descending
+            results.sort(key=lambda k: k.cross_skill_confidence, reverse=True)
+            
+            # Apply limit
+            return results[:limit]
+            
+        except Exception as e:
+            logger.error(f"Error retrieving procedural knowledge: {e}")
+            return []
     
     def get_knowledge(self, knowledge_id: str) -> Optional[ProceduralKnowledge]:
         """
@@ -213,22 +221,21 @@ class ProceduralMemoryStore:
         Returns:
             ProceduralKnowledge or None if not found
         """
-        with self._lock:
-            try:
-                if hasattr(self._firebase, "get_document"):
-                    doc = self._firebase.get_document(
-                        collection=self._collection_base,
-                        doc_id=knowledge_id
-                    )
-                    if doc:
-                        return self._doc_to_knowledge(doc)
-                else:
-                    logger.warning("Firebase client missing get_document method")
-                
-            except Exception as e:
-                logger.error(f"Error getting knowledge {knowledge_id}: {e}")
+        try:
+            if hasattr(self._firebase, "get_document"):
+                doc = self._firebase.get_document(
+                    collection=self._collection_base,
+                    doc_id=knowledge_id
+                )
+                if doc:
+                    return self._doc_to_knowledge(doc)
+            else:
+                logger.warning("Firebase client missing get_document method")
             
-            return None
+        except Exception as e:
+            logger.error(f"Error getting knowledge {knowledge_id}: {e}")
+        
+        return None
     
     def update_validation(
         self,
@@ -250,7 +257,7 @@ class ProceduralMemoryStore:
         Returns:
             True if updated successfully, False otherwise
         """
-        with self._lock:
+        with self._knowledge_locks.for_key(knowledge_id):
             try:
                 # Get current knowledge
                 knowledge = self.get_knowledge(knowledge_id)
@@ -320,7 +327,7 @@ class ProceduralMemoryStore:
             all show that morning sends perform better, this creates procedural
             knowledge capturing that timing insight.
         """
-        with self._lock:
+        with self._maintenance_lock:
             if not patterns:
                 logger.warning("Cannot create procedural knowledge from empty patterns")
                 return None
@@ -419,7 +426,7 @@ class ProceduralMemoryStore:
         Returns:
             Number of knowledge entries that had decay applied
         """
-        with self._lock:
+        with self._maintenance_lock:
             decayed_count = 0
             
             try:
@@ -526,22 +533,21 @@ class ProceduralMemoryStore:
         Returns:
             True if deleted, False otherwise
         """
-        with self._lock:
-            try:
-                if hasattr(self._firebase, "delete_document"):
-                    self._firebase.delete_document(
-                        collection=self._collection_base,
-                        doc_id=knowledge_id
-                    )
-                    logger.debug(f"Deleted procedural knowledge {knowledge_id}")
-                    return True
-                else:
-                    logger.warning("Firebase client missing delete_document method")
-                    
-            except Exception as e:
-                logger.error(f"Error deleting knowledge {knowledge_id}: {e}")
-            
-            return False
+        try:
+            if hasattr(self._firebase, "delete_document"):
+                self._firebase.delete_document(
+                    collection=self._collection_base,
+                    doc_id=knowledge_id
+                )
+                logger.debug(f"Deleted procedural knowledge {knowledge_id}")
+                return True
+            else:
+                logger.warning("Firebase client missing delete_document method")
+                
+        except Exception as e:
+            logger.error(f"Error deleting knowledge {knowledge_id}: {e}")
+        
+        return False
     
     def count_knowledge(self) -> int:
         """
@@ -550,18 +556,17 @@ class ProceduralMemoryStore:
         Returns:
             Knowledge entry count
         """
-        with self._lock:
-            try:
-                if hasattr(self._firebase, "get_collection"):
-                    docs = self._firebase.get_collection(
-                        collection=self._collection_base
-                    )
-                    return len(docs) if docs else 0
-                    
-            except Exception as e:
-                logger.error(f"Error counting knowledge: {e}")
-            
-            return 0
+        try:
+            if hasattr(self._firebase, "get_collection"):
+                docs = self._firebase.get_collection(
+                    collection=self._collection_base
+                )
+                return len(docs) if docs else 0
+                
+        except Exception as e:
+            logger.error(f"Error counting knowledge: {e}")
+        
+        return 0
 
 
 __all__ = [
@@ -9,23 +9,30 @@ Firebase path: system/intelligence/semantic/{domain}/patterns/{pattern_id}
 Archive path: system/intelligence/semantic/{domain}/archive/{pattern_id}
 
 Also provides semantic similarity search via:
-- Token-based Jaccard similarity (fast, no external dependencies)
+- Token-based Jaccard similarity (fast, no external dependencies), answered
+  from an incrementally maintained inverted index (see pattern_index.py)
 - Optional LLM-based similarity (more accurate, requires anthropic package)
 """
 
+import copy
 import hashlib
 import json
 import logging
+import math
 import os
 import re
 import threading
+import time
 import uuid
 from collections import Counter
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from ..types import Domain, EpisodicMemory, SemanticPattern
+from .locking import StripedLock
+from .pattern_index import PatternIndex
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +63,8 @@ class SemanticMemoryConfig:
     max_confidence: float = 0.99            # Maximum confidence ceiling
     forget_threshold: float = 0.1           # Below this, archive pattern
     min_evidence_for_trust: int = 5         # Minimum evidence before forgetting
+    index_ttl_seconds: float = 300.0        # Rebuild similarity index after this age
+    index_load_limit: int = 500             # Max patterns loaded per domain into the index
 
 
 @dataclass
@@ -75,6 +84,15 @@ class SemanticMemoryStore:
     
     Manages storage, retrieval, and Bayesian updating of semantic patterns.
     Patterns are learned generalizations from episodic memories.
+    
+    Thread Safety:
+        Reads take no store-wide lock. Firebase reads run concurrently, and
+        similarity searches read immutable index snapshots that writes
+        replace (copy-on-write). Read-modify-write updates are serialized
+        per pattern, and consolidation/forgetting passes are serialized with
+        each other, never with reads. Index updates made while a pass runs
+        are published together when it ends, so searches see the pass's
+        writes (and writes made concurrently) only then.
     """
     
     _collection_base = "system/intelligence/semantic"
@@ -94,7 +112,20 @@ class SemanticMemoryStore:
         """
         self._firebase = firebase_client
         self._config = config or SemanticMemoryConfig()
-        self._lock = threading.RLock()
+        # Serializes consolidation and forgetting passes (never taken by reads)
+        self._maintenance_lock = threading.RLock()
+        # Per-pattern locks for read-modify-write updates
+        self._pattern_locks = StripedLock()
+        
+        # Published index snapshots: the dict and the indexes in it are never
+        # mutated once published, so searches read them without locking
+        self._indexes: Dict[Domain, PatternIndex] = {}
+        self._index_lock = threading.Lock()
+        self._index_build_locks = {domain: threading.Lock() for domain in Domain}
+        # Index updates made while a domain's index is being rebuilt
+        self._index_replay: Dict[Domain, List[Callable[[PatternIndex], Any]]] = {}
+        # Index updates held back while a maintenance pass runs (None outside a pass)
+        self._index_pending: Optional[Dict[Domain, List[Callable[[PatternIndex], Any]]]] = None
     
     def _get_collection_path(self, domain: Domain) -> str:
         """
@@ -142,35 +173,41 @@ class SemanticMemoryStore:
         Returns:
             The pattern_id of the stored pattern
         """
-        with self._lock:
-            if not pattern.skill_name:
-                raise ValueError("Pattern must have skill_name")
-            
-            collection_path = self._get_collection_path(pattern.domain)
-            
-            # Build document data with extended fields
-            doc_data = pattern.to_dict()
-            
-            # Add extended fields not in base SemanticPattern
-            # These are stored in Firebase but not in the dataclass
-            if "tenant_ids" not in doc_data:
-                doc_data["tenant_ids"] = []  # Empty means all tenants
-            if "last_reinforced_at" not in doc_data:
-                doc_data["last_reinforced_at"] = pattern.updated_at
-            
-            # Store to Firebase
-            if hasattr(self._firebase, "set_document"):
-                self._firebase.set_document(
-                    collection=collection_path,
-                    doc_id=pattern.pattern_id,
-                    data=doc_data
-                )
-            else:
-                logger.warning("Firebase client missing set_document method")
-                raise AttributeError("firebase_client missing set_document method")
-            
-            logger.debug(f"Stored pattern {pattern.pattern_id} at {collection_path}")
-            return pattern.pattern_id
+        with self._pattern_locks.for_key(pattern.domain, pattern.pattern_id):
+            return self._write_pattern(pattern)
+    
+    def _write_pattern(self, pattern: SemanticPattern) -> str:
+        """Write a pattern document and refresh its index entry (pattern lock held)."""
+        if not pattern.skill_name:
+            raise ValueError("Pattern must have skill_name")
+        
+        collection_path = self._get_collection_path(pattern.domain)
+        
+        # Build document data with extended fields
+        doc_data = pattern.to_dict()
+        
+        # Add extended fields not in base SemanticPattern
+        # These are stored in Firebase but not in the dataclass
+        if "tenant_ids" not in doc_data:
+            doc_data["tenant_ids"] = []  # Empty means all tenants
+        if "last_reinforced_at" not in doc_data:
+            doc_data["last_reinforced_at"] = pattern.updated_at
+        
+        # Store to Firebase
+        if hasattr(self._firebase, "set_document"):
+            self._firebase.set_document(
+                collection=collection_path,
+                doc_id=pattern.pattern_id,
+                data=doc_data
+            )
+        else:
+            logger.warning("Firebase client missing set_document method")
+            raise AttributeError("firebase_client missing set_document method")
+        
+        self._index_pattern(pattern)
+        
+        logger.debug(f"Stored pattern {pattern.pattern_id} at {collection_path}")
+        return pattern.pattern_id
     
     def retrieve_patterns(
         self,
@@ -193,81 +230,80 @@ class SemanticMemoryStore:
         Returns:
             List of SemanticPattern objects with decayed confidence
         """
-        with self._lock:
-            collection_path = self._get_collection_path(domain)
+        collection_path = self._get_collection_path(domain)
+        
+        # Build filters
+        filters = [
+            ("skill_name", "==", skill_name)
+        ]
+        
+        # Query Firebase
+        try:
+            if hasattr(self._firebase, "query"):
+                docs = self._firebase.query(
+                    collection=collection_path,
+                    filters=filters,
+                    limit=limit * 3,  # Over-fetch for filtering
+                    order_by="confidence",
+                    order_direction="DESCENDING"
+                )
+            elif hasattr(self._firebase, "get_collection"):
+                docs = self._firebase.get_collection(
+                    collection=collection_path,
+                    limit=limit * 3,
+                    order_by="confidence",
+                    order_direction="DESCENDING"
+                )
+            else:
+                logger.warning("Firebase client missing query/get_collection methods")
+                return []
+        except Exception as e:
+            logger.error(f"Error querying patterns: {e}")
+            return []
+        
+        if not docs:
+            return []
+        
+        # Convert and filter patterns
+        patterns = []
+        
+        for doc in docs:
+            pattern = self._doc_to_pattern(doc)
+            if pattern is None:
+                continue
             
-            # Build filters
-            filters = [
-                ("skill_name", "==", skill_name)
-            ]
+            # Filter by skill_name (in case query didn't work)
+            if pattern.skill_name != skill_name:
+                continue
             
-            # Query Firebase
-            try:
-                if hasattr(self._firebase, "query"):
-                    docs = self._firebase.query(
-                        collection=collection_path,
-                        filters=filters,
-                        limit=limit * 3,  # Over-fetch for filtering
-                        order_by="confidence",
-                        order_direction="DESCENDING"
-                    )
-                elif hasattr(self._firebase, "get_collection"):
-                    docs = self._firebase.get_collection(
-                        collection=collection_path,
-                        limit=limit * 3,
-                        order_by="confidence",
-                        order_direction="DESCENDING"
-                    )
-                else:
-                    logger.warning("Firebase client missing query/get_collection methods")
-                    return []
-            except Exception as e:
-                logger.error(f"Error querying patterns: {e}")
-                return []
+            # Filter by tenant_id
+            # Pattern applies if tenant_ids is empty (global) or contains the tenant
+            pattern_tenant_ids = doc.get("tenant_ids", [])
+            if tenant_id is not None and pattern_tenant_ids:
+                if tenant_id not in pattern_tenant_ids:
+                    continue
             
-            if not docs:
-                return []
+            # Apply decay based on days since last reinforcement
+            last_reinforced = doc.get("last_reinforced_at", pattern.updated_at)
+            days_since = self._calculate_days_since(last_reinforced)
             
-            # Convert and filter patterns
-            patterns = []
+            if days_since > 0:
+                pattern.confidence *= (self._config.decay_rate ** days_since)
+                pattern.confidence = max(
+                    self._config.min_confidence,
+                    min(self._config.max_confidence, pattern.confidence)
+                )
             
-            for doc in docs:
-                pattern = self._doc_to_pattern(doc)
-                if pattern is None:
-                    continue
-                
-                # Filter by skill_name (in case query didn't work)
-                if pattern.skill_name != skill_name:
-                    continue
-                
-                # Filter by tenant_id
-                # Pattern applies if tenant_ids is empty (global) or contains the tenant
-                pattern_tenant_ids = doc.get("tenant_ids", [])
-                if tenant_id is not None and pattern_tenant_ids:
-                    if tenant_id not in pattern_tenant_ids:
-                        continue
-                
-                # Apply decay based on days since last reinforcement
-                last_reinforced = doc.get("last_reinforced_at", pattern.updated_at)
-                days_since = self._calculate_days_since(last_reinforced)
-                
-                if days_since > 0:
-                    pattern.confidence *= (self._config.decay_rate ** days_since)
-                    pattern.confidence = max(
-                        self._config.min_confidence,
-                        min(self._config.max_confidence, pattern.confidence)
-                    )
-                
-                # Filter by min_confidence after decay
-                if min_confidence is not None and pattern.confidence < min_confidence:
-                    continue
-                
-                patterns.append(pattern)
-                
-                if len(patterns) >= limit:
-                    break
+            # Filter by min_confidence after decay
+            if min_confidence is not None and pattern.confidence < min_confidence:
+                continue
+            
+            patterns.append(pattern)
             
-            return patterns
+            if len(patterns) >= limit:
+                break
+        
+        return patterns
     
     def consolidate_from_episodes(
         self,
@@ -284,7 +320,7 @@ class SemanticMemoryStore:
         Returns:
             SemanticPattern if consolidation successful, None otherwise
         """
-        with self._lock:
+        with self._maintenance_lock, self._index_batch():
             if not episodes:
                 return None
             
@@ -323,24 +359,29 @@ class SemanticMemoryStore:
             existing = self._find_similar_pattern(skill_name, domain, common_context)
             
             if existing:
-                # Update existing pattern with Bayesian update
-                new_confidence = self._bayesian_update(
-                    existing.confidence,
-                    existing.successes + successes,
-                    existing.failures + failures
-                )
-                
-                existing.confidence = new_confidence
-                existing.successes += successes
-                existing.failures += failures
-                existing.evidence_count += len(episodes)
-                existing.expected_value = 0.9 * existing.expected_value + 0.1 * expected_value
-                existing.variance = 0.9 * existing.variance + 0.1 * variance
-                existing.updated_at = datetime.now(timezone.utc).isoformat()
-                existing.source_episodes.extend([e.episode_id for e in episodes])
-                
-                # Store the update
-                self.store(existing)
+                with self._pattern_locks.for_key(domain, existing.pattern_id):
+                    # Re-read under the pattern lock so concurrent outcome
+                    # updates made since the search are not overwritten
+                    existing = self.get_pattern(existing.pattern_id, domain) or existing
+                    
+                    # Update existing pattern with Bayesian update
+                    new_confidence = self._bayesian_update(
+                        existing.confidence,
+                        existing.successes + successes,
+                        existing.failures + failures
+                    )
+                    
+                    existing.confidence = new_confidence
+                    existing.successes += successes
+                    existing.failures += failures
+                    existing.evidence_count += len(episodes)
+                    existing.expected_value = 0.9 * existing.expected_value + 0.1 * expected_value
+                    existing.variance = 0.9 * existing.variance + 0.1 * variance
+                    existing.updated_at = datetime.now(timezone.utc).isoformat()
+                    existing.source_episodes.extend([e.episode_id for e in episodes])
+                    
+                    # Store the update
+                    self._write_pattern(existing)
                 return existing
             else:
                 # Create new pattern
@@ -388,7 +429,7 @@ class SemanticMemoryStore:
             success: Whether the outcome was successful
             observed_ratio: The observed signal/baseline ratio
         """
-        with self._lock:
+        with self._pattern_locks.for_key(domain, pattern_id):
             collection_path = self._get_collection_path(domain)
             
             try:
@@ -454,6 +495,8 @@ class SemanticMemoryStore:
                         data=update_data
                     )
                 
+                self._index_pattern(pattern)
+                
                 logger.debug(
                     f"Updated pattern {pattern_id}: confidence={pattern.confidence:.3f}, "
                     f"expected_value={pattern.expected_value:.3f}"
@@ -472,7 +515,7 @@ class SemanticMemoryStore:
         Returns:
             Count of archived patterns
         """
-        with self._lock:
+        with self._maintenance_lock, self._index_batch():
             archived_count = 0
             
             # Iterate through all domains
@@ -492,34 +535,60 @@ class SemanticMemoryStore:
                         continue
                     
                     for doc in docs:
-                        pattern = self._doc_to_pattern(doc)
+                        pattern = self._stale_pattern(doc)
                         if pattern is None:
                             continue
                         
-                        # Apply decay
-                        last_reinforced = doc.get("last_reinforced_at", pattern.updated_at)
-                        days_since = self._calculate_days_since(last_reinforced)
-                        
-                        if days_since > 0:
-                            pattern.confidence *= (self._config.decay_rate ** days_since)
-                        
-                        # Check if should forget
-                        if (pattern.confidence < self._config.forget_threshold and
-                            pattern.evidence_count >= self._config.min_evidence_for_trust):
-                            
+                        with self._pattern_locks.for_key(domain, pattern.pattern_id):
+                            # Re-read under the pattern lock: an outcome update
+                            # since the scan may have reinforced the pattern
+                            if hasattr(self._firebase, "get_document"):
+                                doc = self._firebase.get_document(
+                                    collection=collection_path,
+                                    doc_id=pattern.pattern_id
+                                )
+                                pattern = self._stale_pattern(doc)
+                                if pattern is None:
+                                    continue
                             self._archive_pattern(pattern, domain, doc)
-                            archived_count += 1
-                            logger.info(
-                                f"Archived stale pattern {pattern.pattern_id} "
-                                f"(confidence={pattern.confidence:.3f}, "
-                                f"evidence={pattern.evidence_count})"
-                            )
+                        archived_count += 1
+                        logger.info(
+                            f"Archived stale pattern {pattern.pattern_id} "
+                            f"(confidence={pattern.confidence:.3f}, "
+                            f"evidence={pattern.evidence_count})"
+                        )
                 
                 except Exception as e:
                     logger.error(f"Error processing domain {domain.value} for stale patterns: {e}")
             
             return archived_count
     
+    def _stale_pattern(self, doc: Optional[Dict[str, Any]]) -> Optional[SemanticPattern]:
+        """
+        Apply confidence decay to a pattern document and check it for forgetting.
+        
+        Args:
+            doc: Firebase pattern document
+            
+        Returns:
+            The decayed pattern if it should be archived, None otherwise
+        """
+        pattern = self._doc_to_pattern(doc)
+        if pattern is None:
+            return None
+        
+        # Apply decay
+        last_reinforced = doc.get("last_reinforced_at", pattern.updated_at)
+        days_since = self._calculate_days_since(last_reinforced)
+        
+        if days_since > 0:
+            pattern.confidence *= (self._config.decay_rate ** days_since)
+        
+        if (pattern.confidence < self._config.forget_threshold and
+                pattern.evidence_count >= self._config.min_evidence_for_trust):
+            return pattern
+        return None
+    
     def _bayesian_update(
         self,
         prior: float,
@@ -826,6 +895,8 @@ class SemanticMemoryStore:
             else:
                 logger.warning("Firebase client missing delete_document method")
             
+            self._unindex_pattern(pattern.pattern_id, domain)
+            
             logger.info(f"Archived pattern {pattern.pattern_id}")
             
         except Exception as e:
@@ -897,24 +968,23 @@ class SemanticMemoryStore:
         Returns:
             SemanticPattern or None if not found
         """
-        with self._lock:
-            collection_path = self._get_collection_path(domain)
-            
-            try:
-                if hasattr(self._firebase, "get_document"):
-                    doc = self._firebase.get_document(
-                        collection=collection_path,
-                        doc_id=pattern_id
-                    )
-                    if doc:
-                        return self._doc_to_pattern(doc)
-                else:
-                    logger.warning("Firebase client missing get_document method")
-                
-            except Exception as e:
-                logger.error(f"Error getting pattern {pattern_id}: {e}")
+        collection_path = self._get_collection_path(domain)
+        
+        try:
+            if hasattr(self._firebase, "get_document"):
+                doc = self._firebase.get_document(
+                    collection=collection_path,
+                    doc_id=pattern_id
+                )
+                if doc:
+                    return self._doc_to_pattern(doc)
+            else:
+                logger.warning("Firebase client missing get_document method")
             
-            return None
+        except Exception as e:
+            logger.error(f"Error getting pattern {pattern_id}: {e}")
+        
+        return None
     
     def delete_pattern(
         self,
@@ -931,7 +1001,7 @@ class SemanticMemoryStore:
         Returns:
             True if deleted, False otherwise
         """
-        with self._lock:
+        with self._pattern_locks.for_key(domain, pattern_id):
             collection_path = self._get_collection_path(domain)
             
             try:
@@ -940,6 +1010,7 @@ class SemanticMemoryStore:
                         collection=collection_path,
                         doc_id=pattern_id
                     )
+                    self._unindex_pattern(pattern_id, domain)
                     logger.debug(f"Deleted pattern {pattern_id}")
                     return True
                 else:
@@ -1095,6 +1166,201 @@ class SemanticMemoryStore:
 
         return " ".join(parts)
 
+    # =========================================================================
+    # Inverted Index Maintenance
+    # =========================================================================
+
+    def _load_index(self, domain: Domain) -> PatternIndex:
+        """
+        Build the inverted index for a domain from Firebase.
+
+        Args:
+            domain: The business domain to index
+
+        Returns:
+            Freshly built PatternIndex (empty if the domain could not be read)
+        """
+        index = PatternIndex()
+        collection_path = self._get_collection_path(domain)
+
+        if hasattr(self._firebase, "get_collection"):
+            docs = self._firebase.get_collection(
+                collection=collection_path,
+                limit=self._config.index_load_limit
+            )
+        elif hasattr(self._firebase, "query"):
+            docs = self._firebase.query(
+                collection=collection_path,
+                filters=[],
+                limit=self._config.index_load_limit
+            )
+        else:
+            return index
+
+        for doc in docs or []:
+            pattern = self._doc_to_pattern(doc)
+            if pattern is None:
+                continue
+            pattern_text = self._pattern_to_text(pattern)
+            index.add(pattern, pattern_text, self._tokenize(pattern_text))
+
+        logger.debug(f"Indexed {len(index)} patterns for domain {domain.value}")
+        return index
+
+    def _index_expired(self, index: PatternIndex) -> bool:
+        """Check an index against index_ttl_seconds."""
+        ttl = self._config.index_ttl_seconds
+        return ttl > 0 and time.monotonic() - index.built_at > ttl
+
+    def _get_index(self, domain: Domain) -> PatternIndex:
+        """
+        Get the inverted index snapshot for a domain, building it on first use.
+
+        Indexes older than index_ttl_seconds are rebuilt so that writes made
+        by other processes become visible within a bounded time. One thread
+        rebuilds an expired index while the others keep searching the old
+        snapshot; only the first build of a domain makes callers wait.
+        """
+        index = self._indexes.get(domain)
+        if index is not None and not self._index_expired(index):
+            return index
+
+        build_lock = self._index_build_locks[domain]
+        if index is not None:
+            if not build_lock.acquire(blocking=False):
+                return index
+        else:
+            build_lock.acquire()
+
+        try:
+            current = self._indexes.get(domain)
+            if current is not None and current is not index and not self._index_expired(current):
+                return current
+
+            with self._index_lock:
+                self._index_replay[domain] = []
+            try:
+                fresh = self._load_index(domain)
+            finally:
+                with self._index_lock:
+                    replay = self._index_replay.pop(domain, [])
+
+            # Writes that landed during the load may be missing from it
+            with self._index_lock:
+                for update in replay:
+                    update(fresh)
+                self._indexes = {**self._indexes, domain: fresh}
+            return fresh
+        finally:
+            build_lock.release()
+
+    def _update_index(self, domain: Domain, update: Callable[[PatternIndex], Any]):
+        """
+        Apply an update to a domain's index by publishing a modified copy.
+
+        Searches holding the previous snapshot are unaffected. Does nothing
+        if the domain's index has not been built (beyond recording the update
+        for a build in progress). During a maintenance pass the update is
+        queued and published with the rest of the pass (see _index_batch).
+        """
+        with self._index_lock:
+            replay = self._index_replay.get(domain)
+            if replay is not None:
+                replay.append(update)
+
+            if self._index_pending is not None:
+                self._index_pending.setdefault(domain, []).append(update)
+                return
+            self._publish_index_updates(domain, [update])
+
+    def _publish_index_updates(self, domain: Domain, updates: List[Callable[[PatternIndex], Any]]):
+        """Apply updates to one copy of a domain's index and publish it (index lock held)."""
+        index = self._indexes.get(domain)
+        if index is None:
+            return
+        updated = index.copy()
+        for update in updates:
+            update(updated)
+        self._indexes = {**self._indexes, domain: updated}
+
+    @contextmanager
+    def _index_batch(self):
+        """
+        Queue index updates until the block ends, then publish one copy per domain.
+
+        Used by maintenance passes (maintenance lock held), which would
+        otherwise copy a domain's index once per pattern written. Updates
+        from other threads are queued too, so they are applied in order.
+        Nested passes publish with the outermost one.
+        """
+        if self._index_pending is not None:
+            yield
+            return
+
+        with self._index_lock:
+            self._index_pending = {}
+        try:
+            yield
+        finally:
+            with self._index_lock:
+                pending, self._index_pending = self._index_pending, None
+                for domain, updates in pending.items():
+                    self._publish_index_updates(domain, updates)
+
+    def _index_pattern(self, pattern: SemanticPattern):
+        """Add or refresh a pattern in its domain index, if that index is built."""
+        # Index a copy, as Firebase stores one: the caller keeps its object
+        # and may go on changing it after the write
+        pattern = copy.deepcopy(pattern)
+        pattern_text = self._pattern_to_text(pattern)
+        tokens = self._tokenize(pattern_text)
+        self._update_index(
+            pattern.domain,
+            lambda index: index.add(pattern, pattern_text, tokens)
+        )
+
+    def _unindex_pattern(self, pattern_id: str, domain: Domain):
+        """Remove a pattern from its domain index, if that index is built."""
+        self._update_index(domain, lambda index: index.remove(pattern_id))
+
+    def invalidate_index(self, domain: Optional[Domain] = None):
+        """
+        Drop cached similarity indexes so they are rebuilt on next query.
+
+        Args:
+            domain: Domain to invalidate (all domains if None)
+        """
+        with self._index_lock:
+            if domain is None:
+                self._indexes = {}
+            else:
+                self._indexes = {d: i for d, i in self._indexes.items() if d != domain}
+
+    def get_idf_weights(self, domain: Optional[Domain] = None) -> Dict[str, float]:
+        """
+        Get IDF weights for _compute_weighted_similarity from the index.
+
+        Args:
+            domain: Domain to compute weights for (all domains if None)
+
+        Returns:
+            Dict mapping token to IDF weight
+        """
+        if domain is not None:
+            return dict(self._get_index(domain).idf_weights())
+
+        n_docs = 0
+        doc_freq: Counter = Counter()
+        for d in Domain:
+            index = self._get_index(d)
+            n_docs += len(index)
+            doc_freq.update(index.document_frequencies())
+
+        return {
+            token: math.log((n_docs + 1) / (df + 1)) + 1.0
+            for token, df in doc_freq.items()
+        }
+
     def find_similar_context(
         self,
         query: str,
@@ -1107,7 +1373,8 @@ class SemanticMemoryStore:
         Find patterns with similar context using token-based similarity.
 
         This is the primary similarity search method. It uses Jaccard similarity
-        with optional TF-IDF weighting for fast, dependency-free matching.
+        for fast, dependency-free matching, answered from per-domain inverted
+        indexes that are built once and maintained on store/update/archive.
 
         Args:
             query: Search query text
@@ -1119,82 +1386,45 @@ class SemanticMemoryStore:
         Returns:
             List of dicts with keys: id, text, similarity, pattern, metadata
         """
-        with self._lock:
-            query_tokens = self._tokenize(query)
-
-            if not query_tokens:
-                logger.debug("Empty query after tokenization")
-                return []
-
-            results = []
-            domains_to_search = [domain] if domain else list(Domain)
-
-            # Build IDF weights from all patterns
-            all_documents: List[List[str]] = []
-
-            for d in domains_to_search:
-                collection_path = self._get_collection_path(d)
-
-                try:
-                    if hasattr(self._firebase, "get_collection"):
-                        docs = self._firebase.get_collection(
-                            collection=collection_path,
-                            limit=500
-                        )
-                    elif hasattr(self._firebase, "query"):
-                        docs = self._firebase.query(
-                            collection=collection_path,
-                            filters=[],
-                            limit=500
-                        )
-                    else:
-                        continue
-
-                    if not docs:
-                        continue
-
-                    for doc in docs:
-                        pattern = self._doc_to_pattern(doc)
-                        if pattern is None:
-                            continue
+        query_tokens = self._tokenize(query)
 
-                        # Apply skill filter if specified
-                        if skill_filter and pattern.skill_name != skill_filter:
-                            continue
-
-                        # Convert pattern to text and tokenize
-                        pattern_text = self._pattern_to_text(pattern)
-                        pattern_tokens = self._tokenize(pattern_text)
-
-                        if pattern_tokens:
-                            all_documents.append(pattern_tokens)
-
-                        # Compute similarity
-                        similarity = self._compute_jaccard_similarity(
-                            query_tokens, pattern_tokens
-                        )
-
-                        if similarity >= min_similarity:
-                            results.append({
-                                "id": pattern.pattern_id,
-                                "text": pattern_text,
-                                "similarity": similarity,
-                                "pattern": pattern,
-                                "metadata": {
-                                    "skill_name": pattern.skill_name,
-                                    "domain": pattern.domain.value if hasattr(pattern.domain, 'value') else str(pattern.domain),
-                                    "confidence": pattern.confidence,
-                                    "evidence_count": pattern.evidence_count,
-                                }
-                            })
-
-                except Exception as e:
-                    logger.error(f"Error searching domain {d}: {e}")
+        if not query_tokens:
+            logger.debug("Empty query after tokenization")
+            return []
 
-            # Sort by similarity descending
-            results.sort(key=lambda x: x["similarity"], reverse=True)
+        hits = []
+        domains_to_search = [domain] if domain else list(Domain)
 
-            return results[:limit]
+        for domain_rank, d in enumerate(domains_to_search):
+            try:
+                index = self._get_index(d)
+                for similarity, entry in index.search(
+                    query_tokens, limit, min_similarity, skill_filter
+                ):
+                    hits.append((similarity, domain_rank, entry))
+            except Exception as e:
+                logger.error(f"Error searching domain {d}: {e}")
+
+        # Sort by similarity descending, keeping domain/index order for ties
+        hits.sort(key=lambda hit: (-hit[0], hit[1], hit[2].seq))
+
+        results = []
+        for similarity, _, entry in hits[:limit]:
+            pattern = copy.deepcopy(entry.pattern)
+            results.append({
+                "id": pattern.pattern_id,
+                "text": entry.text,
+                "similarity": similarity,
+                "pattern": pattern,
+                "metadata": {
+                    "skill_name": pattern.skill_name,
+                    "domain": pattern.domain.value if hasattr(pattern.domain, 'value') else str(pattern.domain),
+                    "confidence": pattern.confidence,
+                    "evidence_count": pattern.evidence_count,
+                }
+            })
+
+        return results
 
     def find_similar_with_embeddings(
         self,
@@ -1225,30 +1455,29 @@ class SemanticMemoryStore:
             logger.info("anthropic package not available, falling back to token-based similarity")
             return self.find_similar_context(query, domain, limit, min_similarity)
 
-        with self._lock:
-            # First, get candidate patterns with loose token similarity
-            candidates = self.find_similar_context(
-                query=query,
-                domain=domain,
-                limit=limit * 3,  # Get more candidates for re-ranking
-                min_similarity=0.05  # Lower threshold for candidates
-            )
+        # First, get candidate patterns with loose token similarity
+        candidates = self.find_similar_context(
+            query=query,
+            domain=domain,
+            limit=limit * 3,  # Get more candidates for re-ranking
+            min_similarity=0.05  # Lower threshold for candidates
+        )
 
-            if not candidates:
-                return []
+        if not candidates:
+            return []
 
-            # Prepare patterns for Claude ranking
-            patterns_text = []
-            for i, candidate in enumerate(candidates):
-                patterns_text.append(
-                    f"{i+1}. [{candidate['id']}] {candidate['text']}"
-                )
+        # Prepare patterns for Claude ranking
+        patterns_text = []
+        for i, candidate in enumerate(candidates):
+            patterns_text.append(
+                f"{i+1}. [{candidate['id']}] {candidate['text']}"
+            )
 
-            # Use Claude to rank similarity
-            try:
-                client = Anthropic()
+        # Use Claude to rank similarity
+        try:
+            client = Anthropic()
 
-                prompt = f"""Rate the semantic similarity of each pattern to the query.
+            prompt = f"""Rate the semantic similarity of each pattern to the query.
 Query: "{query}"
 
 Patterns:
@@ -1258,40 +1487,40 @@ For each pattern, respond with its number and a similarity score from 0.0 to 1.0
 Format: NUMBER:SCORE (one per line)
 Only include patterns with similarity >= {min_similarity}"""
 
-                response = client.messages.create(
-                    model="claude-3-haiku-20240307",  # Use Haiku for fast/cheap ranking
-                    max_tokens=500,
-                    messages=[{"role": "user", "content": prompt}]
-                )
-
-                # Parse response
-                response_text = response.content[0].text
-                scored_results = []
+            response = client.messages.create(
+                model="claude-3-haiku-20240307",  # Use Haiku for fast/cheap ranking
+                max_tokens=500,
+                messages=[{"role": "user", "content": prompt}]
+            )
 
-                for line in response_text.strip().split('\n'):
-                    line = line.strip()
-                    if ':' in line:
-                        try:
-                            parts = line.split(':')
-                            idx = int(parts[0].strip()) - 1
-                            score = float(parts[1].strip())
+            # Parse response
+            response_text = response.content[0].text
+            scored_results = []
 
-                            if 0 <= idx < len(candidates) and score >= min_similarity:
-                                result = candidates[idx].copy()
-                                result['similarity'] = score
-                                result['similarity_method'] = 'embedding'
-                                scored_results.append(result)
-                        except (ValueError, IndexError):
-                            continue
+            for line in response_text.strip().split('\n'):
+                line = line.strip()
+                if ':' in line:
+                    try:
+                        parts = line.split(':')
+                        idx = int(parts[0].strip()) - 1
+                        score = float(parts[1].strip())
+
+                        if 0 <= idx < len(candidates) and score >= min_similarity:
+                            result = candidates[idx].copy()
+                            result['similarity'] = score
+                            result['similarity_method'] = 'embedding'
+                            scored_results.append(result)
+                    except (ValueError, IndexError):
+                        continue
 
-                # Sort by similarity
-                scored_results.sort(key=lambda x: x['similarity'], reverse=True)
+            # Sort by similarity
+            scored_results.sort(key=lambda x: x['similarity'], reverse=True)
 
-                return scored_results[:limit]
+            return scored_results[:limit]
 
-            except Exception as e:
-                logger.warning(f"Claude similarity ranking failed: {e}, using token-based fallback")
-                return candidates[:limit]
+        except Exception as e:
+            logger.warning(f"Claude similarity ranking failed: {e}, using token-based fallback")
+            return candidates[:limit]
 
     def store_concept(
         self,
@@ -1344,28 +1573,27 @@ Only include patterns with similarity >= {min_similarity}"""
             List of concept dictionaries
         """
         # Search for concepts with matching type in metadata
-        with self._lock:
-            results = []
-            domains_to_search = [domain] if domain else list(Domain)
+        results = []
+        domains_to_search = [domain] if domain else list(Domain)
+
+        for d in domains_to_search:
+            patterns = self.retrieve_patterns(
+                skill_name="concept",
+                domain=d,
+                limit=100
+            )
 
-            for d in domains_to_search:
-                patterns = self.retrieve_patterns(
-                    skill_name="concept",
-                    domain=d,
-                    limit=100
-                )
+            for pattern in patterns:
+                if pattern.recommendation.get("type") == concept_type:
+                    results.append({
+                        "id": pattern.pattern_id,
+                        "text": pattern.condition.get("text", ""),
+                        "type": concept_type,
+                        "metadata": pattern.recommendation,
+                        "confidence": pattern.confidence,
+                    })
 
-                for pattern in patterns:
-                    if pattern.recommendation.get("type") == concept_type:
-                        results.append({
-                            "id": pattern.pattern_id,
-                            "text": pattern.condition.get("text", ""),
-                            "type": concept_type,
-                            "metadata": pattern.recommendation,
-                            "confidence": pattern.confidence,
-                        })
-
-            return results
+        return results
 
     def consolidate_episodes(
         self,
@@ -1389,7 +1617,7 @@ Only include patterns with similarity >= {min_similarity}"""
             - created: Number of new patterns created
             - updated: Number of existing patterns updated
         """
-        with self._lock:
+        with self._maintenance_lock, self._index_batch():
             stats = {"created": 0, "updated": 0}
 
             if not episodes:
@@ -1441,48 +1669,47 @@ Only include patterns with similarity >= {min_similarity}"""
         Returns:
             List of SemanticPattern objects with confidence >= min_confidence
         """
-        with self._lock:
-            results = []
+        results = []
 
-            try:
-                for domain in Domain:
-                    collection_path = self._get_collection_path(domain)
+        try:
+            for domain in Domain:
+                collection_path = self._get_collection_path(domain)
 
-                    try:
-                        if hasattr(self._firebase, "get_collection"):
-                            docs = self._firebase.get_collection(
-                                collection=collection_path,
-                                limit=500
-                            )
-                        else:
-                            continue
+                try:
+                    if hasattr(self._firebase, "get_collection"):
+                        docs = self._firebase.get_collection(
+                            collection=collection_path,
+                            limit=500
+                        )
+                    else:
+                        continue
 
-                        if not docs:
-                            continue
+                    if not docs:
+                        continue
 
-                        for doc in docs:
-                            pattern = self._doc_to_pattern(doc)
-                            if pattern is None:
-                                continue
+                    for doc in docs:
+                        pattern = self._doc_to_pattern(doc)
+                        if pattern is None:
+                            continue
 
-                            # Apply decay
-                            last_reinforced = doc.get("last_reinforced_at", pattern.updated_at)
-                            days_since = self._calculate_days_since(last_reinforced)
+                        # Apply decay
+                        last_reinforced = doc.get("last_reinforced_at", pattern.updated_at)
+                        days_since = self._calculate_days_since(last_reinforced)
 
-                            if days_since > 0:
-                                pattern.confidence *= (self._config.decay_rate ** days_since)
+                        if days_since > 0:
+                            pattern.confidence *= (self._config.decay_rate ** days_since)
 
-                            if pattern.confidence >= min_confidence:
-                                results.append(pattern)
-                    except Exception as e:
-                        logger.debug(f"Error getting patterns for domain {domain.value}: {e}")
-                        continue
+                        if pattern.confidence >= min_confidence:
+                            results.append(pattern)
+                except Exception as e:
+                    logger.debug(f"Error getting patterns for domain {domain.value}: {e}")
+                    continue
 
-                return results
+            return results
 
-            except Exception as e:
-                logger.error(f"Error in get_high_confidence_patterns: {e}")
-                return []
+        except Exception as e:
+            logger.error(f"Error in get_high_confidence_patterns: {e}")
+            return []
 
     def get_all_patterns(self) -> List[SemanticPattern]:
         """
@@ -1503,43 +1730,42 @@ Only include patterns with similarity >= {min_similarity}"""
         Returns:
             List of skill names
         """
-        with self._lock:
-            skills = set()
+        skills = set()
 
-            try:
-                for domain in Domain:
-                    collection_path = self._get_collection_path(domain)
+        try:
+            for domain in Domain:
+                collection_path = self._get_collection_path(domain)
 
-                    try:
-                        if hasattr(self._firebase, "get_collection"):
-                            docs = self._firebase.get_collection(
-                                collection=collection_path,
-                                limit=500
-                            )
-                        else:
-                            continue
+                try:
+                    if hasattr(self._firebase, "get_collection"):
+                        docs = self._firebase.get_collection(
+                            collection=collection_path,
+                            limit=500
+                        )
+                    else:
+                        continue
 
-                        if not docs:
+                    if not docs:
+                        continue
+
+                    for doc in docs:
+                        # Check if pattern applies to this tenant
+                        tenant_ids = doc.get("tenant_ids", [])
+                        if tenant_ids and tenant_id not in tenant_ids:
                             continue
 
-                        for doc in docs:
-                            # Check if pattern applies to this tenant
-                            tenant_ids = doc.get("tenant_ids", [])
-                            if tenant_ids and tenant_id not in tenant_ids:
-                                continue
-
-                            skill_name = doc.get("skill_name")
-                            if skill_name:
-                                skills.add(skill_name)
-                    except Exception as e:
-                        logger.debug(f"Error getting skills for domain {domain.value}: {e}")
-                        continue
+                        skill_name = doc.get("skill_name")
+                        if skill_name:
+                            skills.add(skill_name)
+                except Exception as e:
+                    logger.debug(f"Error getting skills for domain {domain.value}: {e}")
+                    continue
 
-                return list(skills)
+            return list(skills)
 
-            except Exception as e:
-                logger.error(f"Error in get_skills_for_tenant: {e}")
-                return []
+        except Exception as e:
+            logger.error(f"Error in get_skills_for_tenant: {e}")
+            return []
 
 
 class SemanticMemory:
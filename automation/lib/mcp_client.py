@@ -1,7 +1,7 @@
 """
 MH1 MCP Client
 Handles connections to MCP servers (HubSpot, Snowflake, etc.)
-with retry logic and error handling.
+with retry logic, error handling and shared per-server rate limits.
 """
 
 import json
@@ -11,6 +11,11 @@ from pathlib import Path
 from typing import Any, Optional, Callable, Dict, Tuple
 from functools import wraps
 
+try:
+    from lib.rate_limiter import RateLimitExceeded, TokenBucket, get_rate_limiter
+except ImportError:
+    from rate_limiter import RateLimitExceeded, TokenBucket, get_rate_limiter
+
 SYSTEM_ROOT = Path(__file__).parent.parent
 
 
@@ -22,6 +27,7 @@ class MCPResponse:
     error: Optional[str] = None
     duration_ms: int = 0
     retries: int = 0
+    rate_limit_wait_ms: int = 0
 
 
 class CircuitBreaker:
@@ -87,6 +93,7 @@ class MCPClient:
     This client provides a wrapper with:
     - Retry logic
     - Circuit breaker
+    - Token-bucket rate limit per server, shared across clients and processes
     - Telemetry logging
     - Standardized error handling
     """
@@ -97,6 +104,9 @@ class MCPClient:
         self._idempotency_cache: Dict[str, Tuple[MCPResponse, float]] = {}
         self._cache_ttl_seconds = cache_ttl_seconds  # 1 hour default
         self._load_config()
+        self.rate_limiter: Optional[TokenBucket] = get_rate_limiter(
+            server_name, self.config.get("rate_limit")
+        )
 
     def _load_config(self):
         """Load MCP server config."""
@@ -112,6 +122,10 @@ class MCPClient:
         """Check if MCP server is available."""
         return self.circuit_breaker.can_execute()
 
+    def get_rate_limit_stats(self) -> Optional[Dict[str, Any]]:
+        """Wait-time metrics for this server's rate limiter (None if unlimited)."""
+        return self.rate_limiter.get_stats() if self.rate_limiter else None
+
     def call(
         self,
         tool_name: str,
@@ -124,6 +138,9 @@ class MCPClient:
         
         In practice, the actual MCP call is made by Claude Code's tool system.
         This wrapper handles the response standardization.
+
+        If the server has a rate limit, the call queues for a token first;
+        it only fails if the wait would exceed the limit's max_wait_seconds.
         
         Args:
             tool_name: The MCP tool to call (e.g., 'hubspot_search_contacts')
@@ -151,6 +168,13 @@ class MCPClient:
                 data=None,
                 error=f"Circuit breaker open for {self.server_name}. Retry after cooldown."
             )
+
+        rate_limit_wait = 0.0
+        if self.rate_limiter is not None:
+            try:
+                rate_limit_wait = self.rate_limiter.acquire()
+            except RateLimitExceeded as e:
+                return MCPResponse(success=False, data=None, error=str(e))
         
         start_time = time.time()
         
@@ -171,7 +195,8 @@ class MCPClient:
         response = MCPResponse(
             success=True,
             data=call_spec,  # Would be actual response data
-            duration_ms=duration
+            duration_ms=duration,
+            rate_limit_wait_ms=int(rate_limit_wait * 1000)
         )
         
         # Cache result if idempotency key provided and call was successful
@@ -0,0 +1,243 @@
+"""
+MH1 Rate Limiter
+Named token buckets for MCP servers, shared by every MCPClient in a
+process and, through the shared storage engine, by every process on the
+host.
+
+Each server gets one bucket that refills at requests_per_second up to
+burst tokens. Bucket state (tokens, last refill time) lives in the
+rate_limit_buckets table; a take is a single BEGIN IMMEDIATE transaction
+on the storage engine's writer, so concurrent skills and processes draw
+from the same quota instead of each assuming they own it.
+
+Callers queue rather than fail: a take always debits the bucket (it may
+go negative) and returns how long the caller must wait for its turn, so
+waiters are served in order. Only a wait longer than max_wait_seconds is
+refused, without debiting.
+
+Configured per server in config/mcp-servers.json:
+
+    {
+      "servers": {
+        "hubspot": {
+          "rate_limit": {"requests_per_second": 9, "burst": 10, "max_wait_seconds": 60}
+        }
+      }
+    }
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+try:
+    from lib.storage_engine import Migration, StorageEngine, get_storage_engine
+except ImportError:
+    from storage_engine import Migration, StorageEngine, get_storage_engine
+
+
+RATE_LIMIT_MIGRATIONS = [
+    Migration(1, "Create rate_limit_buckets", statements=[
+        """
+        CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+            name TEXT PRIMARY KEY,
+            tokens REAL NOT NULL,
+            updated_at REAL NOT NULL
+        )
+        """,
+    ]),
+]
+
+
+class RateLimitExceeded(Exception):
+    """Raised when the wait for a token would exceed max_wait_seconds."""
+
+    def __init__(self, name: str, wait_seconds: float, max_wait_seconds: float):
+        self.name = name
+        self.wait_seconds = wait_seconds
+        self.max_wait_seconds = max_wait_seconds
+        super().__init__(
+            f"Rate limit for {name}: wait {wait_seconds:.1f}s exceeds "
+            f"max_wait_seconds ({max_wait_seconds:.1f}s)"
+        )
+
+
+@dataclass
+class RateLimitConfig:
+    """Token-bucket settings for one server."""
+    requests_per_second: float
+    burst: float = 0                # Bucket capacity (default: max(1, requests_per_second))
+    max_wait_seconds: float = 60.0  # Longest a caller will queue for a token
+
+    def __post_init__(self):
+        if self.requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive")
+        if self.burst <= 0:
+            self.burst = max(1.0, self.requests_per_second)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RateLimitConfig":
+        return cls(
+            requests_per_second=float(data["requests_per_second"]),
+            burst=float(data.get("burst", 0)),
+            max_wait_seconds=float(data.get("max_wait_seconds", 60.0)),
+        )
+
+
+class TokenBucket:
+    """
+    Token bucket whose state is shared through the storage engine.
+
+    Thread-safe; bucket updates are serialized by SQLite, so the same
+    bucket name can be used from several processes at once.
+    """
+
+    def __init__(self, name: str, config: RateLimitConfig, engine: StorageEngine = None):
+        self.name = name
+        self.config = config
+        self.engine = engine or get_storage_engine()
+        self.engine.migrate("rate_limiter", RATE_LIMIT_MIGRATIONS)
+
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "acquired": 0,
+            "waited": 0,
+            "rejected": 0,
+            "total_wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+        }
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens, queueing behind earlier callers.
+
+        Args:
+            tokens: Tokens to take
+
+        Returns:
+            Seconds the caller must wait before proceeding (0.0 if none)
+
+        Raises:
+            RateLimitExceeded: If the wait would exceed max_wait_seconds
+                (nothing is debited)
+        """
+        rate = self.config.requests_per_second
+        burst = self.config.burst
+        max_wait = self.config.max_wait_seconds
+
+        def take(conn):
+            now = time.time()
+            row = conn.execute(
+                "SELECT tokens, updated_at FROM rate_limit_buckets WHERE name = ?",
+                (self.name,)
+            ).fetchone()
+            if row is None:
+                available = burst
+            else:
+                available = min(burst, row[0] + max(0.0, now - row[1]) * rate)
+
+            wait = max(0.0, (tokens - available) / rate)
+            if wait > max_wait:
+                return wait, False
+
+            conn.execute("""
+                INSERT INTO rate_limit_buckets (name, tokens, updated_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET
+                    tokens = excluded.tokens,
+                    updated_at = excluded.updated_at
+            """, (self.name, available - tokens, now))
+            return wait, True
+
+        wait, granted = self.engine.write(take)
+
+        with self._stats_lock:
+            if not granted:
+                self._stats["rejected"] += 1
+            else:
+                self._stats["acquired"] += 1
+                if wait > 0:
+                    self._stats["waited"] += 1
+                    self._stats["total_wait_seconds"] += wait
+                    self._stats["max_wait_seconds"] = max(self._stats["max_wait_seconds"], wait)
+
+        if not granted:
+            raise RateLimitExceeded(self.name, wait, max_wait)
+        return wait
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Block until tokens are available.
+
+        Args:
+            tokens: Tokens to take
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            RateLimitExceeded: If the wait would exceed max_wait_seconds
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get wait-time metrics for this process."""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["avg_wait_seconds"] = (
+            stats["total_wait_seconds"] / stats["waited"] if stats["waited"] else 0.0
+        )
+        stats["name"] = self.name
+        stats["requests_per_second"] = self.config.requests_per_second
+        stats["burst"] = self.config.burst
+        return stats
+
+
+# Process-wide registry: one bucket per server name
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_rate_limiter(name: str, config: Optional[Dict[str, Any]] = None) -> Optional[TokenBucket]:
+    """
+    Get the shared token bucket for a server.
+
+    Args:
+        name: Server name (bucket key)
+        config: The server's "rate_limit" settings. Used when the bucket is
+                first created; later calls reuse the existing bucket.
+
+    Returns:
+        The shared TokenBucket, or None if the server has no rate limit
+    """
+    bucket = _buckets.get(name)
+    if bucket is not None or not config:
+        return bucket
+
+    with _buckets_lock:
+        bucket = _buckets.get(name)
+        if bucket is None:
+            bucket = TokenBucket(name, RateLimitConfig.from_dict(config))
+            _buckets[name] = bucket
+        return bucket
+
+
+def get_rate_limit_stats() -> Dict[str, Dict[str, Any]]:
+    """Get wait-time metrics for every bucket used in this process."""
+    with _buckets_lock:
+        buckets = list(_buckets.values())
+    return {bucket.name: bucket.get_stats() for bucket in buckets}
+
+
+__all__ = [
+    "RATE_LIMIT_MIGRATIONS",
+    "RateLimitConfig",
+    "RateLimitExceeded",
+    "TokenBucket",
+    "get_rate_limiter",
+    "get_rate_limit_stats",
+]
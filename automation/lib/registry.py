@@ -4,12 +4,17 @@ Introspection layer to discover, validate, and manage skills.
 The "Brain" that knows what the system can do.
 """
 
-import json
-import yaml
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 
+try:
+    from lib.catalog import get_catalog
+    from lib.skill_retrieval import SkillRetriever
+except ImportError:
+    from catalog import get_catalog
+    from skill_retrieval import SkillRetriever
+
 SYSTEM_ROOT = Path(__file__).parent.parent
 SKILLS_DIR = SYSTEM_ROOT / "skills"
 
@@ -31,67 +36,32 @@ class SkillRegistry:
     
     def __init__(self):
         self.skills: Dict[str, SkillMetadata] = {}
+        self._retriever: Optional[SkillRetriever] = None
         self.refresh()
 
     def refresh(self):
-        """Scan the skills directory and rebuild registry."""
+        """Rebuild the registry from the skill catalog (re-parsing only changed skills)."""
         self.skills = {}
-        
-        if not SKILLS_DIR.exists():
-            return
-
-        for skill_dir in SKILLS_DIR.iterdir():
-            if skill_dir.is_dir() and not skill_dir.name.startswith('_'):
-                self._load_skill(skill_dir)
-
-    def _load_skill(self, skill_dir: Path):
-        """Parse SKILL.md and schemas to load skill metadata."""
-        skill_name = skill_dir.name
-        skill_md = skill_dir / "SKILL.md"
-        
-        if not skill_md.exists():
-            return
-
-        # Basic parsing of SKILL.md (in a real implementation, use a proper Markdown parser)
-        content = skill_md.read_text()
-        
-        # Extract version
-        version = "unknown"
-        for line in content.split('\n'):
-            if line.strip().startswith("Version:"):
-                version = line.split(":", 1)[1].strip()
-                break
-        
-        # Extract description (naive)
-        description = "No description provided."
-        
-        # Load inputs schema
-        input_schema = {}
-        input_file = skill_dir / "schemas" / "input.json"
-        if input_file.exists():
-            try:
-                input_schema = json.loads(input_file.read_text())
-            except:
-                pass
-
-        # Load outputs schema
-        output_schema = {}
-        output_file = skill_dir / "schemas" / "output.json"
-        if output_file.exists():
-            try:
-                output_schema = json.loads(output_file.read_text())
-            except:
-                pass
+
+        catalog = get_catalog(refresh=False)
+        catalog.refresh()
+
+        for entry in catalog.skills:
+            self._load_skill(entry)
+
+    def _load_skill(self, entry: Dict[str, Any]):
+        """Build skill metadata from a catalog entry."""
+        skill_name = entry["dir_name"]
 
         self.skills[skill_name] = SkillMetadata(
             name=skill_name,
-            path=str(skill_dir),
-            version=version,
-            description=description,
-            inputs=input_schema,
-            outputs=output_schema,
+            path=entry["path"],
+            version=entry["version"],
+            description=entry["description"] or "No description provided.",
+            inputs=entry["inputs"],
+            outputs=entry["outputs"],
             dependencies=[], # TODO: Parse dependencies
-            deprecated="deprecated" in content.lower() and "status: deprecated" in content.lower()
+            deprecated=entry["deprecated"]
         )
 
     def list_skills(self) -> List[SkillMetadata]:
@@ -102,20 +72,22 @@ class SkillRegistry:
         """Get metadata for a specific skill."""
         return self.skills.get(name)
 
-    def find_skills_for_task(self, task_description: str) -> List[SkillMetadata]:
+    def find_skills_for_task(self, task_description: str, top_k: int = 10) -> List[SkillMetadata]:
         """
-        Semantic search for skills relevant to a task.
-        (Placeholder for embedding-based search)
+        Search for skills relevant to a task, best match first.
+
+        Ranked with BM25 over skill names, tags, descriptions and inputs
+        (see lib.skill_retrieval).
         """
-        # Simple keyword matching for now
+        if self._retriever is None:
+            self._retriever = SkillRetriever()
+
         matches = []
-        task_words = set(task_description.lower().split())
-        
-        for skill in self.skills.values():
-            skill_words = set(skill.name.replace('-', ' ').split())
-            if task_words & skill_words:
+        for skill_name, _ in self._retriever.search(task_description, top_k=top_k):
+            skill = self.skills.get(skill_name)
+            if skill:
                 matches.append(skill)
-        
+
         return matches
 
 # Factory
@@ -0,0 +1,1304 @@
+"""
+Runner - Skill and workflow execution with chunked context handling.
+
+Provides the execution layer every skill's run.py builds on:
+- SkillRunner: single-call skill execution with input/output schema checks
+- WorkflowRunner: multi-step runs with retries, state checkpoints, human
+  review routing, and step/sub-call telemetry in the shape telemetry.log_run
+  expects
+- ContextManager: RLM-style processing of inputs too large for one prompt.
+  Data past the offload threshold is spilled to a disk-backed ChunkStore
+  (one JSONL file per chunk) while it is read, so a 100k-contact export is
+  never held as one in-memory list. map_chunks runs a function over the
+  chunks in a bounded worker pool and aggregates results as they complete,
+  logging one sub-call per chunk.
+- Model routing from config/model-routing.yaml, loaded once and reloaded
+  only when the file changes
+
+Context strategies (by estimated tokens, 4 characters per token):
+- INLINE: <= max_inline_tokens, processed in one call
+- CHUNKED: <= offload threshold (6x max_inline_tokens by default), held in
+  memory and processed in chunks
+- OFFLOADED: above the offload threshold, chunks live on disk
+
+Usage:
+    from lib.runner import ContextManager, ContextConfig, WorkflowRunner, RunStatus
+
+    runner = WorkflowRunner("lifecycle-audit", version="v2.0.0", tenant_id="acme")
+
+    def analysis_step(inputs):
+        with ContextManager(inputs["contacts"], ContextConfig(chunk_size=500)) as ctx:
+            ctx.map_chunks(analyze_chunk)
+            runner.record_sub_calls(ctx.get_telemetry().sub_calls)
+            return {"output": synthesize(ctx.get_aggregated("chunk_results"))}
+
+    result = runner.run_step("analysis", analysis_step, {"contacts": contacts})
+    telemetry = runner.complete(RunStatus.SUCCESS)
+    log_run(..., steps=telemetry.steps, tool_calls=telemetry.tool_calls)
+"""
+
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+import weakref
+import yaml
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    from lib.catalog import get_catalog
+    from lib.context_cache import estimate_tokens
+except ImportError:
+    from catalog import get_catalog
+    from context_cache import estimate_tokens
+
+try:
+    import jsonschema
+    HAS_JSONSCHEMA = True
+except ImportError:
+    HAS_JSONSCHEMA = False
+
+logger = logging.getLogger(__name__)
+
+# Paths
+SYSTEM_ROOT = Path(__file__).parent.parent
+ROUTING_CONFIG_PATH = SYSTEM_ROOT / "config" / "model-routing.yaml"
+RUNS_DIR = Path(os.environ.get("MH1_RUNS_DIR", SYSTEM_ROOT / "telemetry" / "runs"))
+
+DEFAULT_MODEL = "claude-sonnet-4"
+
+# Used when model-routing.yaml has no reliability_routing section
+DEFAULT_RELIABILITY_TIERS = {
+    "maximum_reliability": {"threshold": 0.99, "model": "claude-sonnet-4"},
+    "high_reliability": {"threshold": 0.96, "model": "claude-sonnet-4", "fallback": "claude-haiku"},
+    "standard": {"threshold": 0.90, "model": "claude-haiku"},
+}
+
+# Query shapes that map to direct knowledge-base lookups
+_SKU_PATTERN = re.compile(r"\b(?:sku|item|part|model)[\s#:-]*[a-z0-9-]*\d", re.IGNORECASE)
+_ENTITY_ID_PATTERN = re.compile(r"\b[A-Z]{2,}[-_]?\d{2,}\b")
+_CATALOG_TERMS = re.compile(
+    r"\b(price|pricing|cost of|in stock|availability|catalog|spec|specs|dimensions|warranty)\b",
+    re.IGNORECASE
+)
+_CONCEPTUAL_TERMS = re.compile(r"^\s*(how|why|what are|explain|describe|compare)\b", re.IGNORECASE)
+
+
+# =============================================================================
+# Model routing
+# =============================================================================
+
+@lru_cache(maxsize=4)
+def _read_routing_config(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse model-routing.yaml (cached per file modification time)."""
+    try:
+        with open(path) as f:
+            return yaml.safe_load(f) or {}
+    except (OSError, yaml.YAMLError) as e:
+        logger.warning(f"Could not load routing config {path}: {e}")
+        return {}
+
+
+def load_routing_config() -> Dict[str, Any]:
+    """
+    Get the model routing configuration.
+
+    The file is parsed once and re-parsed only when its mtime changes, so
+    per-chunk routing lookups cost a stat call. Treat the result as read-only.
+    """
+    try:
+        mtime = ROUTING_CONFIG_PATH.stat().st_mtime
+    except OSError:
+        return {}
+    return _read_routing_config(str(ROUTING_CONFIG_PATH), mtime)
+
+
+def _route(section_names: Tuple[str, ...], name: str) -> Dict[str, Any]:
+    """Look a task up in the first routing section that defines it."""
+    config = load_routing_config()
+    for section in section_names:
+        rule = (config.get(section) or {}).get(name)
+        if isinstance(rule, dict) and rule.get("model"):
+            return {k: v for k, v in rule.items() if k not in ("description", "examples")}
+    return {"model": config.get("default_model", DEFAULT_MODEL)}
+
+
+def get_model_for_task(task_type: str) -> Dict[str, Any]:
+    """
+    Get the model settings for a top-level task type (routing_rules).
+
+    Args:
+        task_type: Task type, e.g. "synthesis", "extraction", "classification"
+
+    Returns:
+        Dict with model, temperature and max_tokens (model only for
+        unknown task types, using default_model)
+    """
+    route = _route(("routing_rules",), task_type)
+    route["task_type"] = task_type
+    return route
+
+
+def get_model_for_subtask(subtask: str) -> Dict[str, Any]:
+    """
+    Get the model settings for a sub-call within a workflow.
+
+    Looks in sub_call_routing first, then routing_rules, then falls back
+    to default_model.
+
+    Args:
+        subtask: Sub-call type, e.g. "chunk_processing", "extraction", "synthesis"
+
+    Returns:
+        Dict with model, temperature and max_tokens
+    """
+    route = _route(("sub_call_routing", "routing_rules"), subtask)
+    route["subtask"] = subtask
+    return route
+
+
+class ModelCapacityRouter:
+    """
+    Select a model by required reliability (reliability_routing).
+
+    Client-facing output always gets the maximum-reliability tier; otherwise
+    the lowest tier whose threshold meets the required reliability is used,
+    with complex tasks never routed below high_reliability.
+    """
+
+    COMPLEX_TASKS = {"complex", "high", "strategy", "synthesis"}
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        config = config if config is not None else load_routing_config()
+        self.tiers = config.get("reliability_routing") or DEFAULT_RELIABILITY_TIERS
+        self.step_limits = config.get("step_count_limits") or {}
+
+    def select_tier(
+        self,
+        task_complexity: str,
+        required_reliability: float,
+        is_client_facing: bool = False
+    ) -> str:
+        """Get the reliability tier name for a task."""
+        if is_client_facing:
+            return "maximum_reliability"
+
+        # Tiers from least to most reliable
+        ordered = sorted(self.tiers.items(), key=lambda kv: kv[1].get("threshold", 0))
+        floor = "high_reliability" if task_complexity in self.COMPLEX_TASKS else None
+        reached_floor = floor is None or floor not in self.tiers
+
+        for name, tier in ordered:
+            reached_floor = reached_floor or name == floor
+            if reached_floor and tier.get("threshold", 0) >= required_reliability:
+                return name
+        return ordered[-1][0] if ordered else "maximum_reliability"
+
+    def select_model(
+        self,
+        task_complexity: str,
+        required_reliability: float,
+        is_client_facing: bool = False
+    ) -> str:
+        """
+        Get the model for a task.
+
+        Args:
+            task_complexity: "simple", "moderate" or "complex"
+            required_reliability: Minimum acceptable success rate (0-1)
+            is_client_facing: Output goes to a client without review
+
+        Returns:
+            Model name
+        """
+        tier = self.select_tier(task_complexity, required_reliability, is_client_facing)
+        return (self.tiers.get(tier) or {}).get("model", DEFAULT_MODEL)
+
+    def get_step_limit(self, model: str) -> Optional[int]:
+        """Expected maximum agent steps for a model (step_count_limits)."""
+        limit = self.step_limits.get(model)
+        return limit if isinstance(limit, int) else None
+
+
+class RetrievalStrategyRouter:
+    """
+    Select a retrieval strategy by query type (retrieval_routing).
+
+    Product, SKU and entity lookups go to direct knowledge-base mapping;
+    conceptual and general queries go to semantic embedding search.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        config = config if config is not None else load_routing_config()
+        self.strategies = config.get("retrieval_routing") or {
+            "direct_kb_mapping": {"query_types": ["product_specific", "catalog_lookup", "entity_match", "sku_search"]},
+            "semantic_embedding": {"query_types": ["conceptual", "general_knowledge", "thematic", "exploratory"]},
+        }
+
+    @staticmethod
+    def classify_query(query: str) -> str:
+        """Get the query type used for strategy selection."""
+        if _SKU_PATTERN.search(query):
+            return "sku_search"
+        if _ENTITY_ID_PATTERN.search(query):
+            return "entity_match"
+        if _CATALOG_TERMS.search(query):
+            return "catalog_lookup"
+        if _CONCEPTUAL_TERMS.search(query):
+            return "conceptual"
+        return "general_knowledge"
+
+    def select_strategy(self, query: str) -> Dict[str, Any]:
+        """
+        Get the retrieval strategy for a query.
+
+        Returns:
+            Dict with strategy, query_type and the configured rejection_rate
+        """
+        query_type = self.classify_query(query)
+        for name, strategy in self.strategies.items():
+            if query_type in (strategy.get("query_types") or []):
+                return {
+                    "strategy": name,
+                    "query_type": query_type,
+                    "rejection_rate": strategy.get("rejection_rate")
+                }
+        return {"strategy": "semantic_embedding", "query_type": query_type, "rejection_rate": None}
+
+
+# =============================================================================
+# Context management
+# =============================================================================
+
+class ContextStrategy(Enum):
+    """How a context is processed, by size."""
+    INLINE = "inline"
+    CHUNKED = "chunked"
+    OFFLOADED = "offloaded"
+
+
+@dataclass
+class ContextConfig:
+    """Thresholds and concurrency for ContextManager."""
+    max_inline_tokens: int = 8000
+    chunk_size: int = 500                         # Items per chunk
+    sub_model: str = "claude-haiku"               # Model for per-chunk sub-calls
+    synthesis_model: str = "claude-sonnet-4"      # Model for the final synthesis
+    offload_threshold_tokens: Optional[int] = None  # Default: 6x max_inline_tokens
+    max_workers: int = 8                          # Chunks processed concurrently
+    offload_dir: Optional[str] = None             # Parent dir for chunk files (default: system temp)
+
+    @property
+    def offload_threshold(self) -> int:
+        if self.offload_threshold_tokens is not None:
+            return self.offload_threshold_tokens
+        return self.max_inline_tokens * 6
+
+
+@dataclass
+class SubCallResult:
+    """One model sub-call made while processing a context."""
+    call_id: str
+    model: str
+    tokens_input: int
+    tokens_output: int
+    duration_ms: int
+    status: str                       # success, failed
+    output: Any = None
+    error: Optional[str] = None
+    chunk_index: Optional[int] = None
+    timestamp: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Telemetry record (without the output)."""
+        data = asdict(self)
+        data.pop("output")
+        return data
+
+
+@dataclass
+class ContextTelemetry:
+    """What a ContextManager did with its input."""
+    strategy: str
+    input_size_tokens: int
+    item_count: int
+    chunk_size: int
+    chunks_processed: int
+    offloaded: bool
+    sub_calls: List[Dict[str, Any]]
+    tokens_input: int
+    tokens_output: int
+    failed_sub_calls: int
+    max_workers: int
+    processing_ms: int
+
+
+def _strategy_for(tokens: int, config: ContextConfig) -> ContextStrategy:
+    if tokens <= config.max_inline_tokens:
+        return ContextStrategy.INLINE
+    if tokens <= config.offload_threshold:
+        return ContextStrategy.CHUNKED
+    return ContextStrategy.OFFLOADED
+
+
+def _json_size(items: Iterable[Any]) -> int:
+    """Length of json.dumps(list(items)) without building the whole string."""
+    chars = 2
+    for i, item in enumerate(items):
+        chars += len(json.dumps(item, default=str)) + (2 if i else 0)
+    return chars
+
+
+def _context_tokens(data: Any) -> int:
+    if data is None:
+        return 0
+    if isinstance(data, str):
+        return len(data) // 4
+    if isinstance(data, (list, tuple)):
+        return _json_size(data) // 4
+    return estimate_tokens(data)
+
+
+def should_offload_context(
+    data: Any,
+    config: Optional[ContextConfig] = None
+) -> Tuple[bool, ContextStrategy]:
+    """
+    Check whether data is too large to process inline.
+
+    Only sizes the data; nothing is copied or written to disk.
+
+    Args:
+        data: List, dict or string
+        config: Thresholds (defaults to ContextConfig())
+
+    Returns:
+        (should_offload, strategy)
+    """
+    strategy = _strategy_for(_context_tokens(data), config or ContextConfig())
+    return strategy != ContextStrategy.INLINE, strategy
+
+
+class ChunkStore:
+    """
+    Disk-backed sequence of fixed-size chunks.
+
+    Items are appended as JSON lines; every chunk_size items are written to
+    their own file, so reading one chunk back touches one small file. The
+    directory is removed by close() or when the store is garbage collected.
+
+    Items round-trip through JSON: tuples come back as lists and values
+    json cannot encode are stored as strings.
+    """
+
+    def __init__(self, chunk_size: int, parent_dir: Optional[str] = None):
+        self.chunk_size = max(1, chunk_size)
+        if parent_dir:
+            Path(parent_dir).mkdir(parents=True, exist_ok=True)
+        self.directory = Path(tempfile.mkdtemp(prefix="mh1-context-", dir=parent_dir))
+        self._finalizer = weakref.finalize(self, shutil.rmtree, str(self.directory), True)
+        self._paths: List[Path] = []
+        self._pending: List[str] = []
+        self.item_count = 0
+
+    def append(self, item: Any, encoded: Optional[str] = None):
+        """Add an item (pass encoded if it was already serialized)."""
+        self._pending.append(encoded if encoded is not None else json.dumps(item, default=str))
+        self.item_count += 1
+        if len(self._pending) >= self.chunk_size:
+            self._write_pending()
+
+    def seal(self):
+        """Write the final partial chunk."""
+        if self._pending:
+            self._write_pending()
+
+    def _write_pending(self):
+        path = self.directory / f"chunk-{len(self._paths):06d}.jsonl"
+        with open(path, "w") as f:
+            f.write("\n".join(self._pending))
+            f.write("\n")
+        self._paths.append(path)
+        self._pending = []
+
+    @property
+    def chunk_count(self) -> int:
+        return len(self._paths)
+
+    def read_chunk(self, index: int) -> List[Any]:
+        """Load one chunk."""
+        with open(self._paths[index]) as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def iter_chunks(self) -> Iterator[List[Any]]:
+        for index in range(len(self._paths)):
+            yield self.read_chunk(index)
+
+    def iter_items(self, start: int = 0) -> Iterator[Any]:
+        """Stream items from position start, reading only the chunks needed."""
+        first = start // self.chunk_size
+        skip = start - first * self.chunk_size
+        for index in range(first, len(self._paths)):
+            chunk = self.read_chunk(index)
+            yield from chunk[skip:] if skip else chunk
+            skip = 0
+
+    def close(self):
+        """Delete the chunk files."""
+        self._finalizer()
+
+
+class ContextManager:
+    """
+    Size-aware access to a skill's input data.
+
+    Accepts a list, dict (one {key: value} item per entry), string (one item
+    per line), None, or any iterable of JSON-serializable items such as a
+    paginated generator. Input is read once: items stay in memory until the
+    running size crosses the offload threshold, after which everything is
+    streamed into a ChunkStore and the in-memory copy is dropped.
+
+    Thread Safety:
+        map_chunks, aggregate_buffer and log_sub_call may be used from
+        worker threads.
+
+    Example:
+        >>> with ContextManager(contacts, ContextConfig(chunk_size=500)) as ctx:
+        ...     if ctx.should_offload():
+        ...         ctx.map_chunks(analyze_chunk, model="claude-haiku")
+        ...         results = ctx.get_aggregated("chunk_results")
+    """
+
+    def __init__(self, data: Any, config: Optional[ContextConfig] = None):
+        """
+        Read and size the input.
+
+        Args:
+            data: Input data (see class docstring)
+            config: Thresholds and concurrency (defaults to ContextConfig())
+        """
+        self.config = config or ContextConfig()
+        self._items: Optional[List[Any]] = None
+        self._store: Optional[ChunkStore] = None
+        self._item_count = 0
+        self.context_size = 0
+
+        self._lock = threading.Lock()
+        self._buffers: Dict[str, List[Any]] = {}
+        self._sub_calls: List[SubCallResult] = []
+        self._chunks_processed = 0
+        self._processing_ms = 0
+
+        if data is None:
+            self._items = []
+        elif isinstance(data, str):
+            self._ingest(data.splitlines(keepends=True), known_tokens=len(data) // 4)
+        elif isinstance(data, dict):
+            self._ingest({k: v} for k, v in data.items())
+        else:
+            self._ingest(data)
+
+    def _ingest(self, items: Iterable[Any], known_tokens: Optional[int] = None):
+        """Read items once, spilling to a ChunkStore past the offload threshold."""
+        limit_chars = (self.config.offload_threshold + 1) * 4
+        if known_tokens is not None and known_tokens > self.config.offload_threshold:
+            self._store = ChunkStore(self.config.chunk_size, self.config.offload_dir)
+
+        held: List[Any] = []
+        held_encoded: List[str] = []
+        chars = 2
+        count = 0
+
+        for item in items:
+            encoded = json.dumps(item, default=str)
+            chars += len(encoded) + (2 if count else 0)
+            count += 1
+
+            if self._store is not None:
+                self._store.append(item, encoded)
+                continue
+
+            held.append(item)
+            held_encoded.append(encoded)
+            if known_tokens is None and chars >= limit_chars:
+                self._store = ChunkStore(self.config.chunk_size, self.config.offload_dir)
+                for held_item, held_line in zip(held, held_encoded):
+                    self._store.append(held_item, held_line)
+                held, held_encoded = [], []
+
+        self._item_count = count
+        self.context_size = known_tokens if known_tokens is not None else chars // 4
+        if self._store is not None:
+            self._store.seal()
+            logger.info(
+                f"Offloaded {count:,} items (~{self.context_size:,} tokens) "
+                f"to {self._store.chunk_count} chunks in {self._store.directory}"
+            )
+        else:
+            self._items = held
+
+    # -------------------------------------------------------------------------
+    # Size and strategy
+    # -------------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._item_count
+
+    @property
+    def offloaded(self) -> bool:
+        """Whether the data lives in a disk-backed ChunkStore."""
+        return self._store is not None
+
+    def should_offload(self) -> bool:
+        """Whether the data is too large to process inline."""
+        return self.context_size > self.config.max_inline_tokens
+
+    def get_strategy(self) -> ContextStrategy:
+        return _strategy_for(self.context_size, self.config)
+
+    # -------------------------------------------------------------------------
+    # Access
+    # -------------------------------------------------------------------------
+
+    def iter_items(self, start: int = 0) -> Iterator[Any]:
+        """Stream items from position start."""
+        if self._store is not None:
+            return self._store.iter_items(start)
+        return iter(self._items[start:])
+
+    def _iter_chunks(self, size: int) -> Iterator[List[Any]]:
+        if self._store is not None and size == self._store.chunk_size:
+            yield from self._store.iter_chunks()
+            return
+        if self._items is not None:
+            for i in range(0, len(self._items), size):
+                yield self._items[i:i + size]
+            return
+        items = self._store.iter_items()
+        while True:
+            batch = list(islice(items, size))
+            if not batch:
+                return
+            yield batch
+
+    def chunk(self, size: Optional[int] = None) -> Iterator[List[Any]]:
+        """
+        Iterate over the data in chunks (counted as processed in telemetry).
+
+        Args:
+            size: Items per chunk (defaults to config.chunk_size)
+        """
+        for batch in self._iter_chunks(size or self.config.chunk_size):
+            with self._lock:
+                self._chunks_processed += 1
+            yield batch
+
+    def peek(self, start: int = 0, count: int = 5) -> List[Any]:
+        """Get count items from position start without loading the rest."""
+        return list(islice(self.iter_items(start), count))
+
+    def filter(self, predicate: Callable[[Any], bool]) -> List[Any]:
+        """Get all items matching predicate (streams offloaded data)."""
+        return [item for item in self.iter_items() if predicate(item)]
+
+    # -------------------------------------------------------------------------
+    # Concurrent processing
+    # -------------------------------------------------------------------------
+
+    def map_chunks(
+        self,
+        fn: Callable[[List[Any]], Any],
+        size: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        buffer: str = "chunk_results",
+        model: Optional[str] = None
+    ) -> List[Any]:
+        """
+        Run fn over every chunk in a bounded worker pool.
+
+        At most max_workers chunks are in flight at once, so offloaded data
+        is read from disk only as fast as it is processed. Each result is
+        appended to `buffer` as soon as its chunk completes and logged as a
+        SubCallResult. fn may return a SubCallResult to report the model and
+        token usage of a real model call; other return values are logged with
+        estimated tokens against `model`.
+
+        If a chunk raises, no further chunks are started; the chunks already
+        in flight finish and the first error is re-raised.
+
+        Args:
+            fn: Called with each chunk (a list of items)
+            size: Items per chunk (defaults to config.chunk_size)
+            max_workers: Concurrent chunks (defaults to config.max_workers)
+            buffer: Aggregation buffer receiving each result
+            model: Model recorded for sub-calls (defaults to config.sub_model)
+
+        Returns:
+            Results in chunk order
+        """
+        workers = max(1, max_workers or self.config.max_workers)
+        model = model or self.config.sub_model
+        results: Dict[int, Any] = {}
+        first_error: Optional[BaseException] = None
+        started = time.time()
+
+        def run_chunk(index: int, chunk: List[Any]) -> Tuple[SubCallResult, Optional[Exception]]:
+            call_start = time.time()
+            try:
+                value = fn(chunk)
+            except Exception as e:
+                return SubCallResult(
+                    call_id=f"chunk-{index}",
+                    model=model,
+                    tokens_input=estimate_tokens(chunk),
+                    tokens_output=0,
+                    duration_ms=int((time.time() - call_start) * 1000),
+                    status="failed",
+                    error=f"{type(e).__name__}: {e}",
+                    chunk_index=index
+                ), e
+            if isinstance(value, SubCallResult):
+                value.chunk_index = index
+                value.call_id = value.call_id or f"chunk-{index}"
+                return value, None
+            return SubCallResult(
+                call_id=f"chunk-{index}",
+                model=model,
+                tokens_input=estimate_tokens(chunk),
+                tokens_output=estimate_tokens(value),
+                duration_ms=int((time.time() - call_start) * 1000),
+                status="success",
+                output=value,
+                chunk_index=index
+            ), None
+
+        def harvest(done):
+            nonlocal first_error
+            for future in done:
+                result, error = future.result()
+                if error is not None:
+                    first_error = first_error or error
+                elif result.status == "success":
+                    results[result.chunk_index] = result.output
+                    self.aggregate_buffer(buffer, result.output)
+                self.log_sub_call(result)
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="context-chunk") as executor:
+            in_flight = set()
+            for index, chunk in enumerate(self.chunk(size)):
+                in_flight.add(executor.submit(run_chunk, index, chunk))
+                if len(in_flight) >= workers:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    harvest(done)
+                    if first_error is not None:
+                        break
+            harvest(wait(in_flight).done)
+
+        with self._lock:
+            self._processing_ms += int((time.time() - started) * 1000)
+
+        if first_error is not None:
+            raise first_error
+        return [results[i] for i in sorted(results)]
+
+    # -------------------------------------------------------------------------
+    # Aggregation and telemetry
+    # -------------------------------------------------------------------------
+
+    def aggregate_buffer(self, name: str, item: Any):
+        """Append an intermediate result to a named buffer."""
+        with self._lock:
+            self._buffers.setdefault(name, []).append(item)
+
+    def get_aggregated(self, name: str) -> List[Any]:
+        """Get a copy of a named buffer (empty if never written)."""
+        with self._lock:
+            return list(self._buffers.get(name, []))
+
+    def log_sub_call(self, result: SubCallResult):
+        """Record a sub-call made while processing this context."""
+        with self._lock:
+            self._sub_calls.append(result)
+
+    def get_telemetry(self) -> ContextTelemetry:
+        """Summarize strategy, chunking and sub-calls so far."""
+        with self._lock:
+            sub_calls = [call.to_dict() for call in self._sub_calls]
+            chunks_processed = self._chunks_processed
+            processing_ms = self._processing_ms
+
+        return ContextTelemetry(
+            strategy=self.get_strategy().value,
+            input_size_tokens=self.context_size,
+            item_count=self._item_count,
+            chunk_size=self.config.chunk_size,
+            chunks_processed=chunks_processed,
+            offloaded=self.offloaded,
+            sub_calls=sub_calls,
+            tokens_input=sum(c["tokens_input"] for c in sub_calls),
+            tokens_output=sum(c["tokens_output"] for c in sub_calls),
+            failed_sub_calls=sum(1 for c in sub_calls if c["status"] != "success"),
+            max_workers=self.config.max_workers,
+            processing_ms=processing_ms
+        )
+
+    def close(self):
+        """Delete offloaded chunk files."""
+        if self._store is not None:
+            self._store.close()
+
+    def __enter__(self) -> "ContextManager":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+# =============================================================================
+# Schema validation
+# =============================================================================
+
+_JSON_TYPES = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+    "null": type(None),
+}
+
+
+def _check_type(value: Any, expected: Union[str, List[str]]) -> bool:
+    for name in expected if isinstance(expected, list) else [expected]:
+        python_type = _JSON_TYPES.get(name)
+        if python_type is None:
+            return True
+        # bool is an int subclass but not a JSON integer/number
+        if isinstance(value, bool) and name in ("integer", "number"):
+            continue
+        if isinstance(value, python_type):
+            return True
+    return False
+
+
+def _basic_validate(data: Any, schema: Dict[str, Any], path: str = "") -> List[str]:
+    """Check type, enum, required and properties (subset of JSON Schema)."""
+    errors = []
+    where = path or "input"
+
+    expected = schema.get("type")
+    if expected and not _check_type(data, expected):
+        return [f"{where}: expected {expected}, got {type(data).__name__}"]
+    if "enum" in schema and data not in schema["enum"]:
+        errors.append(f"{where}: {data!r} not in {schema['enum']}")
+
+    if isinstance(data, dict):
+        for name in schema.get("required", []):
+            if name not in data:
+                errors.append(f"{where}: missing required field '{name}'")
+        for name, subschema in (schema.get("properties") or {}).items():
+            if name in data and isinstance(subschema, dict):
+                errors.extend(_basic_validate(data[name], subschema, f"{path}.{name}" if path else name))
+    elif isinstance(data, list) and isinstance(schema.get("items"), dict):
+        for i, item in enumerate(data):
+            errors.extend(_basic_validate(item, schema["items"], f"{where}[{i}]"))
+
+    return errors
+
+
+# =============================================================================
+# Skill execution
+# =============================================================================
+
+class RunStatus(Enum):
+    """Final (or current) status of a run."""
+    RUNNING = "running"
+    SUCCESS = "success"
+    FAILED = "failed"
+    REVIEW = "review"
+
+
+def _normalize_result(result: Any) -> Tuple[Any, int, int]:
+    """Split an executor's return into (output, tokens_input, tokens_output)."""
+    if isinstance(result, dict) and "output" in result:
+        return result["output"], result.get("tokens_input", 0), result.get("tokens_output", 0)
+    return result, 0, 0
+
+
+class SkillRunner:
+    """
+    Run a single skill call with schema validation.
+
+    Schemas come from the skill's schemas/input.json and schemas/output.json
+    via the skill catalog.
+    """
+
+    def __init__(self, skill_name: str, version: str = "v1.0.0", tenant_id: str = "default"):
+        self.skill_name = skill_name
+        self.version = version
+        self.tenant_id = tenant_id
+        self.run_id = str(uuid.uuid4())[:8]
+
+    def load_schema(self, schema_type: str = "input") -> Optional[Dict[str, Any]]:
+        """
+        Get the skill's input or output schema.
+
+        Args:
+            schema_type: "input" or "output"
+
+        Returns:
+            Schema dict, or None if the skill has none
+        """
+        entry = get_catalog().get_skill(self.skill_name)
+        if not entry:
+            return None
+        schema = entry.get("inputs" if schema_type == "input" else "outputs")
+        return schema or None
+
+    def validate(self, data: Any, schema: Optional[Dict[str, Any]]) -> Tuple[bool, List[str]]:
+        """
+        Validate data against a JSON schema.
+
+        Uses jsonschema when installed, otherwise checks type, enum,
+        required and nested properties.
+
+        Returns:
+            (is_valid, error messages)
+        """
+        if not schema:
+            return True, []
+        if HAS_JSONSCHEMA:
+            validator_cls = jsonschema.validators.validator_for(schema)
+            errors = [
+                f"{'.'.join(str(p) for p in e.absolute_path) or 'input'}: {e.message}"
+                for e in validator_cls(schema).iter_errors(data)
+            ]
+        else:
+            errors = _basic_validate(data, schema)
+        return not errors, errors
+
+    def run(self, inputs: Dict[str, Any], executor: Callable[[Dict[str, Any]], Any]) -> Dict[str, Any]:
+        """
+        Validate inputs, call the executor and validate its output.
+
+        The executor may return {"output", "tokens_input", "tokens_output"}
+        or the output itself. Output schema violations are reported in
+        output_errors without failing the run.
+
+        Returns:
+            Dict with status ("success" or "failed"), output, tokens and error
+        """
+        start = time.time()
+        result = {
+            "run_id": self.run_id,
+            "skill": self.skill_name,
+            "version": self.version,
+            "tenant_id": self.tenant_id,
+            "status": RunStatus.FAILED.value,
+            "output": None,
+            "tokens_input": 0,
+            "tokens_output": 0,
+            "error": None,
+        }
+
+        is_valid, errors = self.validate(inputs, self.load_schema("input"))
+        if not is_valid:
+            result["error"] = f"Input validation failed: {'; '.join(errors)}"
+            result["duration_seconds"] = time.time() - start
+            return result
+
+        try:
+            output, tokens_input, tokens_output = _normalize_result(executor(inputs))
+        except Exception as e:
+            logger.error(f"Skill {self.skill_name} failed: {e}")
+            result["error"] = f"{type(e).__name__}: {e}"
+            result["duration_seconds"] = time.time() - start
+            return result
+
+        is_valid, errors = self.validate(output, self.load_schema("output"))
+        if not is_valid:
+            logger.warning(f"Skill {self.skill_name} output failed validation: {errors}")
+            result["output_errors"] = errors
+
+        result.update(
+            status=RunStatus.SUCCESS.value,
+            output=output,
+            tokens_input=tokens_input,
+            tokens_output=tokens_output,
+            duration_seconds=time.time() - start
+        )
+        return result
+
+
+# =============================================================================
+# Workflow execution
+# =============================================================================
+
+@dataclass
+class StepResult:
+    """Outcome of one workflow step."""
+    step_name: str
+    status: str                    # success, failed
+    output: Any = None
+    error: Optional[str] = None
+    attempts: int = 1
+    duration_seconds: float = 0.0
+    tokens_input: int = 0
+    tokens_output: int = 0
+
+
+@dataclass
+class RunTelemetry:
+    """
+    Run-level telemetry for a workflow.
+
+    steps and tool_calls use the record shapes telemetry.log_run stores.
+    """
+    run_id: str
+    workflow: str
+    version: str
+    client: Optional[str]
+    tenant_id: str
+    start_time: str
+    status: str = RunStatus.RUNNING.value
+    end_time: Optional[str] = None
+    duration_seconds: Optional[float] = None
+    steps: List[Dict[str, Any]] = field(default_factory=list)
+    tool_calls: List[Dict[str, Any]] = field(default_factory=list)
+    tokens: Dict[str, int] = field(default_factory=lambda: {"input": 0, "output": 0, "total": 0})
+    evaluation: Optional[Dict[str, Any]] = None
+    review: Optional[Dict[str, Any]] = None
+
+
+class WorkflowRunner:
+    """
+    Run a multi-step workflow with retries and checkpoints.
+
+    After every step the run's state (steps so far and each step's output)
+    is written to run_dir/state.json.
+
+    Thread Safety:
+        Steps may run from different threads; step bookkeeping and
+        checkpoints are serialized.
+    """
+
+    def __init__(
+        self,
+        workflow_name: str,
+        version: str = "v1.0.0",
+        client: Optional[str] = None,
+        tenant_id: str = "default",
+        run_id: Optional[str] = None,
+        checkpoint: bool = True,
+        retry_delay: float = 0.5
+    ):
+        """
+        Start a run.
+
+        Args:
+            workflow_name: Workflow or skill name
+            version: Workflow version
+            client: Client the run is for
+            tenant_id: Tenant for cost attribution
+            run_id: Run id (generated if omitted)
+            checkpoint: Write state.json after each step
+            retry_delay: Base delay between step retries (doubles per attempt)
+        """
+        self.workflow_name = workflow_name
+        self.version = version
+        self.client = client
+        self.tenant_id = tenant_id
+        self.run_id = run_id or str(uuid.uuid4())[:8]
+        self.run_dir = RUNS_DIR / f"{workflow_name}-{self.run_id}"
+        self.checkpoint_enabled = checkpoint
+        self.retry_delay = retry_delay
+
+        self.telemetry = RunTelemetry(
+            run_id=self.run_id,
+            workflow=workflow_name,
+            version=version,
+            client=client,
+            tenant_id=tenant_id,
+            start_time=datetime.now(timezone.utc).isoformat()
+        )
+        self._outputs: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def run_step(
+        self,
+        step_name: str,
+        func: Callable[[Dict[str, Any]], Any],
+        inputs: Dict[str, Any],
+        max_retries: int = 0,
+        agent: Optional[str] = None,
+        persist_output: bool = True
+    ) -> StepResult:
+        """
+        Run one step, retrying on exceptions.
+
+        The step function may return {"output", "tokens_input",
+        "tokens_output"} or the output itself. Failures are returned, not
+        raised. A successful step's output is written once to
+        outputs/<step_name>.json in the run directory; state.json only
+        references that file.
+
+        Args:
+            step_name: Step name (key in state.json outputs)
+            func: Step function, called with inputs
+            inputs: Step inputs
+            max_retries: Retries after the first failed attempt
+            agent: Agent or model that ran the step, for telemetry
+            persist_output: Write the step output to disk (turn off for
+                large intermediate outputs and contact-level data)
+
+        Returns:
+            StepResult
+        """
+        start = time.time()
+        start_iso = datetime.now(timezone.utc).isoformat()
+        output, tokens_input, tokens_output = None, 0, 0
+        error = None
+        attempts = 0
+
+        self._local.step_name = step_name
+        try:
+            for attempt in range(max_retries + 1):
+                attempts = attempt + 1
+                try:
+                    output, tokens_input, tokens_output = _normalize_result(func(inputs))
+                    error = None
+                    break
+                except Exception as e:
+                    error = f"{type(e).__name__}: {e}"
+                    logger.warning(f"{self.workflow_name}/{step_name} attempt {attempts} failed: {error}")
+                    if attempt < max_retries:
+                        time.sleep(self.retry_delay * (2 ** attempt))
+        finally:
+            self._local.step_name = None
+
+        result = StepResult(
+            step_name=step_name,
+            status=RunStatus.FAILED.value if error else RunStatus.SUCCESS.value,
+            output=output,
+            error=error,
+            attempts=attempts,
+            duration_seconds=time.time() - start,
+            tokens_input=tokens_input,
+            tokens_output=tokens_output
+        )
+
+        output_path = None
+        if persist_output and self.checkpoint_enabled and result.status == RunStatus.SUCCESS.value:
+            output_path = self._persist_output(step_name, output)
+
+        with self._lock:
+            self.telemetry.steps.append({
+                "step_name": step_name,
+                "agent": agent,
+                "status": result.status,
+                "start_time": start_iso,
+                "end_time": datetime.now(timezone.utc).isoformat(),
+                "duration_seconds": result.duration_seconds,
+                "tokens_input": tokens_input,
+                "tokens_output": tokens_output,
+                "attempts": attempts,
+                "error": error
+            })
+            self._add_tokens(tokens_input, tokens_output)
+            if output_path:
+                self._outputs[step_name] = output_path
+            self._checkpoint()
+
+        return result
+
+    def record_sub_calls(self, sub_calls: Iterable[Dict[str, Any]], step_name: Optional[str] = None):
+        """
+        Record model sub-calls as tool calls for telemetry.log_run.
+
+        Args:
+            sub_calls: SubCallResult.to_dict() records (e.g. ContextTelemetry.sub_calls)
+            step_name: Step the calls belong to (defaults to the step running on this thread)
+        """
+        step_name = step_name or getattr(self._local, "step_name", None)
+        records = [
+            {
+                "step_name": step_name,
+                "tool": f"subcall:{call.get('model')}",
+                "timestamp": call.get("timestamp"),
+                "duration_ms": call.get("duration_ms"),
+                "status": call.get("status"),
+                "error": call.get("error"),
+                "tokens_input": call.get("tokens_input", 0),
+                "tokens_output": call.get("tokens_output", 0)
+            }
+            for call in sub_calls
+        ]
+        with self._lock:
+            self.telemetry.tool_calls.extend(records)
+
+    def record_tool_call(
+        self,
+        tool: str,
+        duration_ms: int,
+        status: str = "success",
+        error: Optional[str] = None,
+        step_name: Optional[str] = None,
+        timestamp: Optional[str] = None
+    ):
+        """
+        Record an external tool call (e.g. one MCP query) for telemetry.log_run.
+
+        Args:
+            tool: Tool name
+            duration_ms: Call duration
+            status: success or failed
+            error: Error message for failed calls
+            step_name: Step the call belongs to (defaults to the step running on this thread)
+            timestamp: When the call started (defaults to now)
+        """
+        record = {
+            "step_name": step_name or getattr(self._local, "step_name", None),
+            "tool": tool,
+            "timestamp": timestamp or datetime.now(timezone.utc).isoformat(),
+            "duration_ms": duration_ms,
+            "status": status,
+            "error": error
+        }
+        with self._lock:
+            self.telemetry.tool_calls.append(record)
+
+    def route_to_human(self, reason: str, context: Optional[Dict[str, Any]] = None) -> Path:
+        """
+        Flag the run for human review.
+
+        Writes run_dir/review.json with the reason and context.
+
+        Returns:
+            Path of the review file
+        """
+        review = {
+            "run_id": self.run_id,
+            "workflow": self.workflow_name,
+            "tenant_id": self.tenant_id,
+            "client": self.client,
+            "reason": reason,
+            "requested_at": datetime.now(timezone.utc).isoformat(),
+            "context": context or {}
+        }
+        path = self.run_dir / "review.json"
+        with self._lock:
+            self.telemetry.review = {"reason": reason, "requested_at": review["requested_at"]}
+            self._write_json(path, review)
+        logger.warning(f"Run {self.run_id} ({self.workflow_name}) routed to human review: {reason}")
+        return path
+
+    def complete(
+        self,
+        status: Union[RunStatus, str],
+        evaluation: Optional[Dict[str, Any]] = None
+    ) -> RunTelemetry:
+        """
+        Finish the run.
+
+        Does not log to the telemetry database; pass telemetry.steps and
+        telemetry.tool_calls to telemetry.log_run.
+
+        Returns:
+            The run's RunTelemetry
+        """
+        end = datetime.now(timezone.utc)
+        with self._lock:
+            self.telemetry.status = status.value if isinstance(status, RunStatus) else str(status)
+            self.telemetry.end_time = end.isoformat()
+            self.telemetry.duration_seconds = (
+                end - datetime.fromisoformat(self.telemetry.start_time)
+            ).total_seconds()
+            self.telemetry.evaluation = evaluation
+            self._checkpoint()
+        return self.telemetry
+
+    def _add_tokens(self, tokens_input: int, tokens_output: int):
+        tokens = self.telemetry.tokens
+        tokens["input"] += tokens_input or 0
+        tokens["output"] += tokens_output or 0
+        tokens["total"] = tokens["input"] + tokens["output"]
+
+    def _persist_output(self, step_name: str, output: Any) -> Optional[str]:
+        """Write a step's output to outputs/<step_name>.json; returns its path relative to run_dir."""
+        relative = Path("outputs") / f"{step_name.replace('/', '_')}.json"
+        try:
+            self._write_json(self.run_dir / relative, output)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not save output of {self.workflow_name}/{step_name}: {e}")
+            return None
+        return str(relative)
+
+    def _checkpoint(self):
+        """Write state.json with step metadata and output file references (caller holds the lock)."""
+        if not self.checkpoint_enabled:
+            return
+        state = {
+            "run_id": self.run_id,
+            "workflow": self.workflow_name,
+            "version": self.version,
+            "client": self.client,
+            "tenant_id": self.tenant_id,
+            "status": self.telemetry.status,
+            "start_time": self.telemetry.start_time,
+            "end_time": self.telemetry.end_time,
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+            "steps": self.telemetry.steps,
+            "tokens": self.telemetry.tokens,
+            "outputs": self._outputs
+        }
+        try:
+            self._write_json(self.run_dir / "state.json", state)
+        except OSError as e:
+            logger.warning(f"Could not checkpoint run {self.run_id}: {e}")
+
+    @staticmethod
+    def _write_json(path: Path, data: Any):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump(data, f, indent=2, default=str)
+        os.replace(tmp, path)
+
+
+__all__ = [
+    # Execution
+    "SkillRunner",
+    "WorkflowRunner",
+    "RunStatus",
+    "StepResult",
+    "RunTelemetry",
+    # Context
+    "ContextManager",
+    "ContextConfig",
+    "ContextStrategy",
+    "ContextTelemetry",
+    "ChunkStore",
+    "SubCallResult",
+    "estimate_tokens",
+    "should_offload_context",
+    # Routing
+    "load_routing_config",
+    "get_model_for_task",
+    "get_model_for_subtask",
+    "ModelCapacityRouter",
+    "RetrievalStrategyRouter",
+]
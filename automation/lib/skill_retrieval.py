@@ -0,0 +1,300 @@
+"""
+Skill Retrieval - Ranked skill lookup over the skill catalog.
+
+Replaces substring scanning of trigger keywords and name-word set
+intersection with one ranked retrieval pass:
+
+- BM25 over a per-skill document built from the skill's name, tags,
+  description, input property names and trigger keywords (fields are
+  weighted by repeating their terms)
+- An Aho-Corasick automaton over trigger phrases, so every trigger in the
+  query is found in a single scan of the query text; each hit boosts the
+  skills the trigger maps to
+
+Results are the top-k (skill, score) pairs, so callers load metadata only
+for the best few skills.
+
+Usage:
+    from lib.skill_retrieval import SkillRetriever
+
+    retriever = SkillRetriever(triggers={"churn": ["churn-prediction"]})
+    for skill_name, score in retriever.search("find churn risks", top_k=5):
+        print(skill_name, round(score, 2))
+"""
+
+import math
+import re
+import threading
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    from lib.catalog import Catalog, get_catalog
+except ImportError:
+    from catalog import Catalog, get_catalog
+
+STOPWORDS: Set[str] = {
+    'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'must', 'can', 'need', 'to', 'of', 'in',
+    'for', 'on', 'with', 'at', 'by', 'from', 'as', 'into', 'and', 'or',
+    'but', 'if', 'than', 'so', 'this', 'that', 'these', 'those', 'it',
+    'its', 'they', 'them', 'their', 'what', 'which', 'who', 'when', 'how',
+    'all', 'each', 'any', 'some', 'such', 'no', 'not', 'only', 'use',
+    'me', 'my', 'we', 'our', 'you', 'your', 'i', 'please', 'want',
+    'there', 'here', 'hello', 'hi', 'hey', 'thanks', 'thank',
+}
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stopwords, with a light plural strip."""
+    tokens = []
+    for token in TOKEN_PATTERN.findall(text.lower()):
+        if token in STOPWORDS or len(token) < 2:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+class TriggerAutomaton:
+    """
+    Aho-Corasick automaton for exact trigger phrases.
+
+    Matches are substring matches, like the `trigger in text` checks they
+    replace, but all triggers are found in one pass over the text.
+    """
+
+    def __init__(self, phrases: Iterable[str] = ()):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[str]] = [[]]
+        for phrase in phrases:
+            self.add(phrase)
+        self.build()
+
+    def add(self, phrase: str):
+        """Add a phrase (call build() afterwards)."""
+        state = 0
+        for char in phrase.lower():
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+        if phrase.lower() not in self._output[state]:
+            self._output[state].append(phrase.lower())
+
+    def build(self):
+        """Compute failure links (breadth-first)."""
+        queue = deque()
+        for state in self._goto[0].values():
+            self._fail[state] = 0
+            queue.append(state)
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def find(self, text: str) -> Set[str]:
+        """Return every phrase occurring in text."""
+        found: Set[str] = set()
+        state = 0
+        for char in text.lower():
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            if self._output[state]:
+                found.update(self._output[state])
+        return found
+
+
+@dataclass(frozen=True)
+class _Bm25Index:
+    """One build of the BM25 index; replaced whole, never mutated."""
+    generation: Any
+    postings: Dict[str, List[Tuple[str, int]]]
+    doc_lengths: Dict[str, int]
+    avg_length: float
+    idf: Dict[str, float]
+
+
+class SkillRetriever:
+    """
+    BM25 + trigger-phrase ranking over the skill catalog.
+
+    The index is rebuilt lazily whenever the catalog's generation changes
+    and published with a single assignment, so searches never see a
+    half-built index. Thread-safe.
+    """
+
+    # BM25 parameters
+    K1 = 1.2
+    B = 0.75
+
+    # Term repetitions per field (a simple BM25F-style field weighting)
+    FIELD_WEIGHTS = {
+        "name": 3,
+        "tags": 2,
+        "triggers": 2,
+        "description": 1,
+        "inputs": 1,
+    }
+
+    # Score added per matched trigger, decaying with the skill's position
+    # in the trigger's list (the first skill listed is the best fit)
+    TRIGGER_BOOST = 4.0
+    TRIGGER_POSITION_DECAY = 0.15
+
+    # Skills scoring below this are dropped (a lone common description
+    # word scores around 1; a name or trigger match scores well above)
+    MIN_SCORE = 1.0
+
+    def __init__(
+        self,
+        catalog: Optional[Catalog] = None,
+        triggers: Optional[Dict[str, List[str]]] = None
+    ):
+        """
+        Initialize SkillRetriever.
+
+        Args:
+            catalog: Skill catalog (default: the shared catalog)
+            triggers: Trigger phrase -> skill names, best fit first
+        """
+        self._catalog = catalog
+        self.triggers = {k.lower(): list(v) for k, v in (triggers or {}).items()}
+        self._automaton = TriggerAutomaton(self.triggers)
+
+        self._lock = threading.Lock()
+        self._index: Optional[_Bm25Index] = None
+
+    @property
+    def catalog(self) -> Catalog:
+        return self._catalog if self._catalog is not None else get_catalog()
+
+    def _skill_triggers(self) -> Dict[str, List[str]]:
+        """Skill name -> trigger phrases that map to it."""
+        by_skill: Dict[str, List[str]] = {}
+        for trigger, skills in self.triggers.items():
+            for skill in skills:
+                by_skill.setdefault(skill, []).append(trigger)
+        return by_skill
+
+    def _document(self, skill: Dict[str, Any], triggers: List[str]) -> Counter:
+        """Weighted term frequencies for one skill."""
+        properties = skill.get("inputs", {}).get("properties", {})
+        fields = {
+            "name": f"{skill['name']} {skill['dir_name']}",
+            "tags": " ".join(str(t) for t in skill.get("tags") or []),
+            "triggers": " ".join(triggers),
+            "description": skill.get("description", ""),
+            "inputs": " ".join(properties) if isinstance(properties, dict) else "",
+        }
+        terms: Counter = Counter()
+        for field, text in fields.items():
+            for token in tokenize(text):
+                terms[token] += self.FIELD_WEIGHTS[field]
+        return terms
+
+    def _ensure_index(self) -> _Bm25Index:
+        """Return the BM25 index, rebuilding it if the catalog changed."""
+        catalog = self.catalog
+        index = self._index
+        if index is not None and index.generation == catalog.generation:
+            return index
+
+        with self._lock:
+            index = self._index
+            if index is not None and index.generation == catalog.generation:
+                return index
+
+            skill_triggers = self._skill_triggers()
+            postings: Dict[str, List[Tuple[str, int]]] = {}
+            doc_lengths: Dict[str, int] = {}
+
+            for skill in catalog.skills:
+                doc_id = skill["dir_name"]
+                if doc_id in doc_lengths:
+                    continue
+                terms = self._document(skill, skill_triggers.get(doc_id, []))
+                doc_lengths[doc_id] = sum(terms.values())
+                for term, tf in terms.items():
+                    postings.setdefault(term, []).append((doc_id, tf))
+
+            n_docs = len(doc_lengths)
+            index = _Bm25Index(
+                generation=catalog.generation,
+                postings=postings,
+                doc_lengths=doc_lengths,
+                avg_length=sum(doc_lengths.values()) / n_docs if n_docs else 0.0,
+                idf={
+                    term: math.log(1 + (n_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+                    for term, docs in postings.items()
+                }
+            )
+            self._index = index
+            return index
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 5,
+        min_score: Optional[float] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Rank skills for a query.
+
+        Args:
+            query: Free-text query
+            top_k: Maximum results (None for all scoring skills)
+            min_score: Drop skills scoring below this (default: MIN_SCORE)
+
+        Returns:
+            List of (skill directory name, score), best first; empty if
+            nothing in the query matches a skill
+        """
+        min_score = self.MIN_SCORE if min_score is None else min_score
+        index = self._ensure_index()
+        scores: Dict[str, float] = {}
+
+        for term in set(tokenize(query)):
+            docs = index.postings.get(term)
+            if not docs:
+                continue
+            idf = index.idf[term]
+            for doc_id, tf in docs:
+                length_norm = 1 - self.B + self.B * index.doc_lengths[doc_id] / index.avg_length
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.K1 + 1) / (tf + self.K1 * length_norm)
+
+        for trigger in self._automaton.find(query):
+            for position, skill in enumerate(self.triggers[trigger]):
+                boost = self.TRIGGER_BOOST * max(0.1, 1 - self.TRIGGER_POSITION_DECAY * position)
+                scores[skill] = scores.get(skill, 0.0) + boost
+
+        ranked = sorted(
+            (item for item in scores.items() if item[1] >= min_score),
+            key=lambda item: (-item[1], item[0])
+        )
+        return ranked if top_k is None else ranked[:top_k]
+
+
+__all__ = [
+    "SkillRetriever",
+    "TriggerAutomaton",
+    "tokenize",
+]
@@ -0,0 +1,655 @@
+"""
+MH1 Shared SQLite Storage Engine
+One database, one writer thread, many readers.
+
+Telemetry, budget and idempotency data all live in a single SQLite file
+(WAL mode) served by one StorageEngine:
+
+1. Readers - a bounded pool of connections for concurrent reads
+2. Writer - a single background thread owning the only write connection;
+   queued writes are grouped into one transaction per batch (group commit),
+   each isolated by a SAVEPOINT so a failing write only rolls back itself
+3. Prepared statements - every connection keeps a statement cache, and the
+   long-lived writer and reader connections reuse it across calls
+4. Migrations - each component registers versioned migrations that are
+   applied once and recorded in the schema_migrations table
+
+Sharing one file means cross-component queries (e.g. budget spend joined
+with reservations) run as a single SQL statement, and 20+ concurrent agents
+share one set of connections instead of three pools of 20.
+
+Usage:
+    from lib.storage_engine import get_storage_engine, Migration
+
+    engine = get_storage_engine()
+    engine.migrate("example", [
+        Migration(1, "Create items", statements=[
+            "CREATE TABLE IF NOT EXISTS items (id TEXT PRIMARY KEY, value TEXT)"
+        ])
+    ])
+
+    engine.execute("INSERT OR REPLACE INTO items VALUES (?, ?)", ("a", "1"))
+
+    with engine.read() as conn:
+        rows = conn.execute("SELECT * FROM items").fetchall()
+"""
+
+import atexit
+import logging
+import os
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+SYSTEM_ROOT = Path(__file__).parent.parent
+STORAGE_DIR = SYSTEM_ROOT / "telemetry"
+STORAGE_DB_PATH = Path(os.environ.get("MH1_STORAGE_DB", STORAGE_DIR / "mh1.db"))
+
+# Ensure directory exists
+STORAGE_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+
+
+def connect(db_path: Path, timeout: float = 30.0, cached_statements: int = 256) -> sqlite3.Connection:
+    """
+    Open a SQLite connection with the MH1 PRAGMAs.
+
+    Args:
+        db_path: Path to SQLite database
+        timeout: Busy timeout in seconds
+        cached_statements: Size of the per-connection prepared statement cache
+
+    Returns:
+        Connection in autocommit mode with WAL enabled
+    """
+    conn = sqlite3.connect(
+        str(db_path),
+        timeout=timeout,
+        check_same_thread=False,  # Allow connection sharing with proper locking
+        isolation_level=None,  # Autocommit mode; transactions are explicit
+        cached_statements=cached_statements
+    )
+    conn.row_factory = sqlite3.Row
+
+    # Enable WAL mode for concurrent readers alongside the writer
+    conn.execute("PRAGMA journal_mode=WAL")
+    # Increase cache size for better performance
+    conn.execute("PRAGMA cache_size=-64000")  # 64MB cache
+    # Enable foreign keys
+    conn.execute("PRAGMA foreign_keys=ON")
+    # Synchronous mode for durability with good performance
+    conn.execute("PRAGMA synchronous=NORMAL")
+    # Increase busy timeout for concurrent writes
+    conn.execute(f"PRAGMA busy_timeout={int(timeout * 1000)}")
+
+    return conn
+
+
+class ConnectionPool:
+    """
+    Thread-safe SQLite connection pool for concurrent access.
+
+    Uses WAL mode for better concurrent read/write performance.
+    Maintains a pool of connections to avoid connection overhead.
+    """
+
+    def __init__(self, db_path: Path, pool_size: int = 20, timeout: float = 30.0):
+        """
+        Initialize connection pool.
+
+        Args:
+            db_path: Path to SQLite database
+            pool_size: Maximum number of pooled connections
+            timeout: Timeout in seconds waiting for a connection
+        """
+        self.db_path = str(db_path)
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._pool = queue.Queue(maxsize=pool_size)
+        self._lock = threading.Lock()
+        self._created_count = 0
+
+    def _create_connection(self) -> sqlite3.Connection:
+        """Create a new database connection with WAL mode."""
+        return connect(self.db_path, timeout=self.timeout)
+
+    def get_connection(self) -> sqlite3.Connection:
+        """Get a connection from the pool or create a new one."""
+        try:
+            # Try to get from pool (non-blocking)
+            return self._pool.get_nowait()
+        except queue.Empty:
+            # Pool is empty, create new connection if under limit
+            with self._lock:
+                if self._created_count < self.pool_size:
+                    self._created_count += 1
+                    return self._create_connection()
+
+            # At limit, wait for a connection to be returned
+            try:
+                return self._pool.get(timeout=self.timeout)
+            except queue.Empty:
+                raise TimeoutError(f"Could not get database connection within {self.timeout}s")
+
+    def return_connection(self, conn: sqlite3.Connection):
+        """Return a connection to the pool."""
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            # Pool is full, close the connection
+            conn.close()
+            with self._lock:
+                self._created_count -= 1
+
+    def close_all(self):
+        """Close all pooled connections."""
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+                conn.close()
+            except queue.Empty:
+                break
+        with self._lock:
+            self._created_count = 0
+
+
+@dataclass
+class Migration:
+    """
+    A versioned schema change for one storage component.
+
+    Attributes:
+        version: Monotonic version number within the component
+        description: Human-readable summary
+        statements: SQL statements executed in order
+        apply: Optional callable run after the statements, given the connection
+    """
+    version: int
+    description: str
+    statements: Sequence[str] = field(default_factory=tuple)
+    apply: Optional[Callable[[sqlite3.Connection], None]] = None
+
+
+@dataclass
+class _WriteJob:
+    """A queued unit of work for the writer thread."""
+    fn: Callable[[sqlite3.Connection], Any]
+    future: Future
+
+
+_STOP = object()
+
+WRITER_POLL_SECONDS = 1.0  # How often a waiting write() checks the writer is alive
+
+
+class StorageEngine:
+    """
+    Shared SQLite engine with a single writer thread and pooled readers.
+
+    All writes go through write()/execute()/executemany(), which hand a
+    callable to the writer thread. The writer drains up to batch_size queued
+    jobs into one BEGIN IMMEDIATE ... COMMIT, so bursts of small writes from
+    many agents cost one fsync instead of one each.
+
+    Reads use read(), which lends out a pooled connection. Because writes
+    wait for their commit by default, a read issued after write() returns
+    always sees it.
+
+    Thread Safety:
+        All public methods are safe to call from any thread. Write callables
+        run on the writer thread and must not block on other writes.
+    """
+
+    def __init__(
+        self,
+        db_path: Path = None,
+        reader_pool_size: int = 8,
+        batch_size: int = 64,
+        timeout: float = 30.0
+    ):
+        """
+        Initialize the engine and start its writer thread.
+
+        Args:
+            db_path: Path to SQLite database (default STORAGE_DB_PATH)
+            reader_pool_size: Maximum pooled reader connections
+            batch_size: Maximum queued writes committed per transaction
+            timeout: Busy/pool timeout in seconds
+        """
+        self.db_path = Path(db_path or STORAGE_DB_PATH)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.timeout = timeout
+
+        self._readers = ConnectionPool(self.db_path, pool_size=reader_pool_size, timeout=timeout)
+        self._queue: "queue.Queue" = queue.Queue()
+        self._closed = False
+        self._close_lock = threading.Lock()
+
+        self._migration_lock = threading.Lock()
+        self._applied: Dict[str, int] = {}
+
+        self._stats_lock = threading.Lock()
+        self._stats = {"writes": 0, "failed_writes": 0, "commits": 0}
+
+        self._writer_conn = connect(self.db_path, timeout=timeout)
+        self._writer = threading.Thread(
+            target=self._writer_loop,
+            name="storage-writer",
+            daemon=True
+        )
+        self._writer.start()
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    @contextmanager
+    def read(self):
+        """
+        Thread-safe context manager lending out a reader connection.
+
+        Reader connections run in autocommit mode; use write() for changes.
+        """
+        conn = self._readers.get_connection()
+        try:
+            yield conn
+        finally:
+            self._readers.return_connection(conn)
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    def submit(self, fn: Callable[[sqlite3.Connection], Any]) -> Future:
+        """
+        Queue a write callable for the writer thread.
+
+        Args:
+            fn: Callable receiving the writer connection inside a transaction
+
+        Returns:
+            Future resolving to fn's return value once committed
+        """
+        future: Future = Future()
+
+        if threading.current_thread() is self._writer:
+            # Nested write from inside a write callable: run in the current
+            # transaction, under its own savepoint so a failure only undoes itself
+            conn = self._writer_conn
+            conn.execute("SAVEPOINT nested_write")
+            try:
+                result = fn(conn)
+            except Exception as e:
+                conn.execute("ROLLBACK TO SAVEPOINT nested_write")
+                conn.execute("RELEASE SAVEPOINT nested_write")
+                future.set_exception(e)
+            else:
+                conn.execute("RELEASE SAVEPOINT nested_write")
+                future.set_result(result)
+            return future
+
+        with self._close_lock:
+            if self._closed:
+                raise RuntimeError("StorageEngine is closed")
+            if not self._writer.is_alive():
+                raise RuntimeError("StorageEngine writer thread is not running")
+            self._queue.put(_WriteJob(fn=fn, future=future))
+        return future
+
+    def _wait(self, future: Future, timeout: Optional[float] = None) -> Any:
+        """
+        Wait for a write's future, failing instead of hanging if the writer dies.
+
+        Raises:
+            RuntimeError: If the writer thread stopped before resolving the future
+            TimeoutError: If timeout elapsed first
+        """
+        remaining = timeout
+        while True:
+            wait = WRITER_POLL_SECONDS if remaining is None else min(WRITER_POLL_SECONDS, remaining)
+            try:
+                return future.result(timeout=wait)
+            except FutureTimeoutError:
+                if future.done():
+                    return future.result()
+                if not self._writer.is_alive():
+                    raise RuntimeError("StorageEngine writer thread stopped before the write committed")
+                if remaining is not None:
+                    remaining -= wait
+                    if remaining <= 0:
+                        raise
+
+    def write(self, fn: Callable[[sqlite3.Connection], Any], wait: bool = True) -> Any:
+        """
+        Run a write callable on the writer thread.
+
+        Args:
+            fn: Callable receiving the writer connection inside a transaction
+            wait: Block until committed and return fn's result (default True).
+                  If False, return the Future immediately.
+
+        Returns:
+            fn's return value, or a Future if wait is False
+
+        Raises:
+            Exception: Whatever fn raised, or the commit error
+        """
+        future = self.submit(fn)
+        if not wait:
+            return future
+        return self._wait(future)
+
+    def execute(self, sql: str, params: Sequence = (), wait: bool = True) -> Any:
+        """
+        Execute a single write statement.
+
+        Returns:
+            Number of affected rows, or a Future if wait is False
+        """
+        return self.write(lambda conn: conn.execute(sql, params).rowcount, wait=wait)
+
+    def executemany(self, sql: str, seq_of_params: Iterable[Sequence], wait: bool = True) -> Any:
+        """
+        Execute a write statement for each parameter set, in one job.
+
+        Returns:
+            Number of affected rows, or a Future if wait is False
+        """
+        rows = list(seq_of_params)
+        return self.write(lambda conn: conn.executemany(sql, rows).rowcount, wait=wait)
+
+    def flush(self, timeout: Optional[float] = None):
+        """Block until every write queued before this call is committed."""
+        if threading.current_thread() is self._writer:
+            return
+        self._wait(self.write(lambda conn: None, wait=False), timeout=timeout)
+
+    def _writer_loop(self):
+        """Drain the write queue, committing each batch in one transaction."""
+        stopping = False
+        while not stopping:
+            job = self._queue.get()
+            if job is _STOP:
+                break
+
+            batch = [job]
+            while len(batch) < self.batch_size:
+                try:
+                    job = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if job is _STOP:
+                    stopping = True
+                    break
+                batch.append(job)
+
+            try:
+                self._commit_batch(batch)
+            except BaseException as e:
+                # Never leave a caller waiting on a batch the writer gave up on
+                self._abort_batch(batch, e)
+                if not isinstance(e, Exception):
+                    self._fail_queued(e)
+                    raise
+
+        self._writer_conn.close()
+
+    def _abort_batch(self, batch: List[_WriteJob], error: BaseException):
+        """Roll back and fail every unresolved job of a batch that raised."""
+        logger.error(f"Storage writer failed on batch of {len(batch)}: {error!r}")
+        if self._writer_conn.in_transaction:
+            try:
+                self._writer_conn.execute("ROLLBACK")
+            except sqlite3.Error:
+                pass
+        failed = 0
+        for job in batch:
+            if not job.future.done():
+                job.future.set_exception(error)
+                failed += 1
+        self._record(failed=failed)
+
+    def _fail_queued(self, error: BaseException):
+        """Fail every job still queued (the writer is exiting)."""
+        with self._close_lock:
+            self._closed = True
+        while True:
+            try:
+                job = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if job is not _STOP and not job.future.done():
+                job.future.set_exception(RuntimeError(f"StorageEngine writer stopped: {error!r}"))
+
+    def _commit_batch(self, batch: List[_WriteJob]):
+        """Run a batch of write jobs in one transaction, one savepoint each."""
+        conn = self._writer_conn
+        outcomes: List[tuple] = []
+
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+        except Exception as e:
+            for job in batch:
+                job.future.set_exception(e)
+            self._record(failed=len(batch))
+            return
+
+        for job in batch:
+            conn.execute("SAVEPOINT write_job")
+            try:
+                result = job.fn(conn)
+                conn.execute("RELEASE SAVEPOINT write_job")
+                outcomes.append((job, True, result))
+            except Exception as e:
+                conn.execute("ROLLBACK TO SAVEPOINT write_job")
+                conn.execute("RELEASE SAVEPOINT write_job")
+                outcomes.append((job, False, e))
+
+        try:
+            conn.execute("COMMIT")
+        except Exception as e:
+            logger.error(f"Storage commit failed for batch of {len(batch)}: {e}")
+            try:
+                conn.execute("ROLLBACK")
+            except sqlite3.Error:
+                pass
+            for job in batch:
+                job.future.set_exception(e)
+            self._record(failed=len(batch))
+            return
+
+        failed = 0
+        for job, ok, value in outcomes:
+            if ok:
+                job.future.set_result(value)
+            else:
+                failed += 1
+                job.future.set_exception(value)
+        self._record(writes=len(batch) - failed, failed=failed, commits=1)
+
+    def _record(self, writes: int = 0, failed: int = 0, commits: int = 0):
+        with self._stats_lock:
+            self._stats["writes"] += writes
+            self._stats["failed_writes"] += failed
+            self._stats["commits"] += commits
+
+    # -------------------------------------------------------------------------
+    # Migrations
+    # -------------------------------------------------------------------------
+
+    def migrate(self, component: str, migrations: Sequence[Migration]) -> int:
+        """
+        Apply any pending migrations for a component. Thread-safe, idempotent.
+
+        Migrations run on the writer thread, each in its own transaction,
+        and are recorded in schema_migrations.
+
+        Args:
+            component: Component name (e.g. "telemetry", "budget")
+            migrations: The component's full migration list
+
+        Returns:
+            The component's schema version after migrating
+        """
+        latest = max((m.version for m in migrations), default=0)
+        if self._applied.get(component, -1) >= latest:
+            return self._applied[component]
+
+        with self._migration_lock:
+            if self._applied.get(component, -1) >= latest:
+                return self._applied[component]
+
+            def ensure_table(conn):
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS schema_migrations (
+                        component TEXT NOT NULL,
+                        version INTEGER NOT NULL,
+                        description TEXT,
+                        applied_at TEXT NOT NULL,
+                        PRIMARY KEY (component, version)
+                    )
+                """)
+                row = conn.execute(
+                    "SELECT MAX(version) FROM schema_migrations WHERE component = ?",
+                    (component,)
+                ).fetchone()
+                return row[0] or 0
+
+            current = self.write(ensure_table)
+
+            for migration in sorted(migrations, key=lambda m: m.version):
+                if migration.version <= current:
+                    continue
+
+                def apply(conn, migration=migration):
+                    for statement in migration.statements:
+                        conn.execute(statement)
+                    if migration.apply:
+                        migration.apply(conn)
+                    conn.execute("""
+                        INSERT INTO schema_migrations (component, version, description, applied_at)
+                        VALUES (?, ?, ?, ?)
+                    """, (
+                        component,
+                        migration.version,
+                        migration.description,
+                        datetime.now(timezone.utc).isoformat()
+                    ))
+
+                self.write(apply)
+                current = migration.version
+                logger.info(f"Applied {component} migration {migration.version}: {migration.description}")
+
+            self._applied[component] = current
+            return current
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Write/commit counters and current queue depth."""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["queued"] = self._queue.qsize()
+        stats["avg_batch_size"] = (
+            (stats["writes"] + stats["failed_writes"]) / stats["commits"]
+            if stats["commits"] else 0.0
+        )
+        return stats
+
+    def close(self, timeout: Optional[float] = None):
+        """Commit outstanding writes, stop the writer and close connections."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._writer.join(timeout=timeout)
+        self._readers.close_all()
+
+
+def copy_legacy_tables(conn: sqlite3.Connection, legacy_path: Path, tables: Sequence[str]) -> int:
+    """
+    Copy rows from a pre-storage-engine database file into the shared one.
+
+    Used by migrations to carry over data from the old per-module database
+    files. Only columns present in both tables are copied; existing rows win.
+
+    Args:
+        conn: Writer connection (inside a transaction)
+        legacy_path: Path to the old database file
+        tables: Tables to copy
+
+    Returns:
+        Number of rows copied
+    """
+    legacy_path = Path(legacy_path)
+    if not legacy_path.exists():
+        return 0
+
+    copied = 0
+    legacy = sqlite3.connect(f"file:{legacy_path}?mode=ro", uri=True)
+    try:
+        for table in tables:
+            exists = legacy.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+            ).fetchone()
+            if not exists:
+                continue
+
+            legacy_columns = [row[1] for row in legacy.execute(f"PRAGMA table_info({table})")]
+            target_columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+            columns = [c for c in legacy_columns if c in target_columns]
+            if not columns:
+                continue
+
+            column_list = ", ".join(columns)
+            placeholders = ", ".join("?" for _ in columns)
+            rows = legacy.execute(f"SELECT {column_list} FROM {table}")
+            cursor = conn.executemany(
+                f"INSERT OR IGNORE INTO {table} ({column_list}) VALUES ({placeholders})",
+                rows
+            )
+            copied += max(cursor.rowcount, 0)
+    finally:
+        legacy.close()
+
+    if copied:
+        logger.info(f"Imported {copied} rows from legacy database {legacy_path}")
+    return copied
+
+
+# Global engine (initialized lazily)
+_engine: Optional[StorageEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_storage_engine() -> StorageEngine:
+    """Get or create the global storage engine."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = StorageEngine(STORAGE_DB_PATH)
+                atexit.register(_engine.close)
+    return _engine
+
+
+__all__ = [
+    "STORAGE_DB_PATH",
+    "ConnectionPool",
+    "Migration",
+    "StorageEngine",
+    "connect",
+    "copy_legacy_tables",
+    "get_storage_engine",
+]
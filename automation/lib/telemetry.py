@@ -3,251 +3,283 @@ MH1 Telemetry Collector
 Logs workflow runs, token usage, and errors.
 
 Thread-safe with SQLite WAL mode for concurrent agent access (20+ agents).
+Stored in the shared database served by lib.storage_engine.
 """
 
+import atexit
 import json
+import logging
 import os
-import sqlite3
-import threading
 import queue
-from datetime import datetime, timezone
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from contextlib import contextmanager
 
+# Skills import this module both as lib.telemetry and as top-level telemetry
+try:
+    from lib.storage_engine import (
+        Migration,
+        STORAGE_DB_PATH,
+        copy_legacy_tables,
+        get_storage_engine,
+    )
+except ImportError:
+    from storage_engine import (
+        Migration,
+        STORAGE_DB_PATH,
+        copy_legacy_tables,
+        get_storage_engine,
+    )
+
 SYSTEM_ROOT = Path(__file__).parent.parent
 TELEMETRY_DIR = SYSTEM_ROOT / "telemetry"
-RUNS_DIR = TELEMETRY_DIR / "runs"
-DB_PATH = TELEMETRY_DIR / "telemetry.db"
+RUNS_DIR = Path(os.environ.get("MH1_RUNS_DIR", TELEMETRY_DIR / "runs"))
+DB_PATH = STORAGE_DB_PATH
+LEGACY_DB_PATH = TELEMETRY_DIR / "telemetry.db"
 
 # Ensure directories exist
 RUNS_DIR.mkdir(parents=True, exist_ok=True)
 
-# Thread-safety: lock for init operations
-_init_lock = threading.Lock()
-_db_initialized = False
+logger = logging.getLogger(__name__)
 
 
-class ConnectionPool:
-    """
-    Thread-safe SQLite connection pool for concurrent access.
-    
-    Uses WAL mode for better concurrent read/write performance.
-    Maintains a pool of connections to avoid connection overhead.
-    """
-    
-    def __init__(self, db_path: Path, pool_size: int = 20, timeout: float = 30.0):
-        """
-        Initialize connection pool.
-        
-        Args:
-            db_path: Path to SQLite database
-            pool_size: Maximum number of pooled connections (default 20 for 20 agents)
-            timeout: Timeout in seconds waiting for a connection
-        """
-        self.db_path = str(db_path)
-        self.pool_size = pool_size
-        self.timeout = timeout
-        self._pool = queue.Queue(maxsize=pool_size)
-        self._lock = threading.Lock()
-        self._created_count = 0
-    
-    def _create_connection(self) -> sqlite3.Connection:
-        """Create a new database connection with WAL mode."""
-        conn = sqlite3.connect(
-            self.db_path,
-            timeout=self.timeout,
-            check_same_thread=False,  # Allow connection sharing with proper locking
-            isolation_level=None  # Autocommit mode for better concurrency
-        )
-        conn.row_factory = sqlite3.Row
-        
-        # Enable WAL mode for better concurrent access
-        conn.execute("PRAGMA journal_mode=WAL")
-        # Increase cache size for better performance
-        conn.execute("PRAGMA cache_size=-64000")  # 64MB cache
-        # Enable foreign keys
-        conn.execute("PRAGMA foreign_keys=ON")
-        # Synchronous mode for durability with good performance
-        conn.execute("PRAGMA synchronous=NORMAL")
-        # Increase busy timeout for concurrent writes
-        conn.execute("PRAGMA busy_timeout=30000")  # 30 seconds
-        
-        return conn
-    
-    def get_connection(self) -> sqlite3.Connection:
-        """Get a connection from the pool or create a new one."""
-        try:
-            # Try to get from pool (non-blocking)
-            return self._pool.get_nowait()
-        except queue.Empty:
-            # Pool is empty, create new connection if under limit
-            with self._lock:
-                if self._created_count < self.pool_size:
-                    self._created_count += 1
-                    return self._create_connection()
-            
-            # At limit, wait for a connection to be returned
-            try:
-                return self._pool.get(timeout=self.timeout)
-            except queue.Empty:
-                raise TimeoutError(f"Could not get database connection within {self.timeout}s")
-    
-    def return_connection(self, conn: sqlite3.Connection):
-        """Return a connection to the pool."""
-        try:
-            self._pool.put_nowait(conn)
-        except queue.Full:
-            # Pool is full, close the connection
-            conn.close()
-            with self._lock:
-                self._created_count -= 1
-    
-    def close_all(self):
-        """Close all pooled connections."""
-        while True:
-            try:
-                conn = self._pool.get_nowait()
-                conn.close()
-            except queue.Empty:
-                break
-        with self._lock:
-            self._created_count = 0
+# Spend rollup tables and the start_time prefix length they are keyed by
+# (ISO timestamps: "YYYY-MM-DD" for days, "YYYY-MM" for months)
+SPEND_ROLLUPS = [
+    ("tenant_spend_daily", 10),
+    ("tenant_spend_monthly", 7),
+]
 
 
-# Global connection pool (initialized lazily)
-_connection_pool: Optional[ConnectionPool] = None
-_pool_lock = threading.Lock()
+def _rollup_sql(row: str, sign: int) -> str:
+    """Trigger body adding (sign=1) or removing (sign=-1) a run from the rollups."""
+    return "\n".join(
+        f"""
+            INSERT INTO {table} (tenant_id, period, cost_usd, run_count, tokens_input, tokens_output)
+            VALUES (
+                {row}.tenant_id, substr({row}.start_time, 1, {width}),
+                {sign} * COALESCE({row}.cost_estimate_usd, 0), {sign},
+                {sign} * COALESCE({row}.tokens_input, 0), {sign} * COALESCE({row}.tokens_output, 0)
+            )
+            ON CONFLICT (tenant_id, period) DO UPDATE SET
+                cost_usd = cost_usd + excluded.cost_usd,
+                run_count = run_count + excluded.run_count,
+                tokens_input = tokens_input + excluded.tokens_input,
+                tokens_output = tokens_output + excluded.tokens_output;"""
+        for table, width in SPEND_ROLLUPS
+    )
 
 
-def _get_pool() -> ConnectionPool:
-    """Get or create the global connection pool."""
-    global _connection_pool
-    if _connection_pool is None:
-        with _pool_lock:
-            if _connection_pool is None:
-                _connection_pool = ConnectionPool(DB_PATH, pool_size=20)
-    return _connection_pool
+# Schema migrations for the telemetry tables in the shared storage engine
+TELEMETRY_MIGRATIONS = [
+    Migration(1, "Create runs, steps and tool_calls", statements=[
+        """
+        CREATE TABLE IF NOT EXISTS runs (
+            run_id TEXT PRIMARY KEY,
+            tenant_id TEXT,
+            type TEXT NOT NULL,
+            name TEXT NOT NULL,
+            version TEXT,
+            status TEXT NOT NULL,
+            start_time TEXT NOT NULL,
+            end_time TEXT,
+            duration_seconds REAL,
+            tokens_input INTEGER DEFAULT 0,
+            tokens_output INTEGER DEFAULT 0,
+            tokens_total INTEGER DEFAULT 0,
+            cost_estimate_usd REAL,
+            model TEXT,
+            client TEXT,
+            error_type TEXT,
+            error_message TEXT,
+            eval_score REAL,
+            eval_pass INTEGER,
+            tags TEXT,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS steps (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            run_id TEXT NOT NULL,
+            step_number INTEGER,
+            step_name TEXT NOT NULL,
+            agent TEXT,
+            status TEXT NOT NULL,
+            start_time TEXT,
+            end_time TEXT,
+            duration_seconds REAL,
+            tokens_input INTEGER DEFAULT 0,
+            tokens_output INTEGER DEFAULT 0,
+            error TEXT,
+            FOREIGN KEY (run_id) REFERENCES runs(run_id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS tool_calls (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            run_id TEXT NOT NULL,
+            step_name TEXT,
+            tool TEXT NOT NULL,
+            timestamp TEXT,
+            duration_ms INTEGER,
+            status TEXT,
+            error TEXT,
+            FOREIGN KEY (run_id) REFERENCES runs(run_id)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_runs_status ON runs(status)",
+        "CREATE INDEX IF NOT EXISTS idx_runs_name ON runs(name)",
+        "CREATE INDEX IF NOT EXISTS idx_runs_start_time ON runs(start_time)",
+        "CREATE INDEX IF NOT EXISTS idx_runs_tenant_id ON runs(tenant_id)",
+    ]),
+    Migration(
+        2,
+        "Import runs from legacy telemetry.db",
+        apply=lambda conn: copy_legacy_tables(conn, LEGACY_DB_PATH, ["runs", "steps", "tool_calls"])
+    ),
+    Migration(3, "Per-tenant daily and monthly spend rollups", statements=[
+        *[
+            f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                tenant_id TEXT NOT NULL,
+                period TEXT NOT NULL,
+                cost_usd REAL NOT NULL DEFAULT 0,
+                run_count INTEGER NOT NULL DEFAULT 0,
+                tokens_input INTEGER NOT NULL DEFAULT 0,
+                tokens_output INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (tenant_id, period)
+            ) WITHOUT ROWID
+            """
+            for table, _ in SPEND_ROLLUPS
+        ],
+        # Backfill from existing runs
+        *[
+            f"""
+            INSERT OR REPLACE INTO {table} (tenant_id, period, cost_usd, run_count, tokens_input, tokens_output)
+            SELECT tenant_id, substr(start_time, 1, {width}),
+                   SUM(COALESCE(cost_estimate_usd, 0)), COUNT(*),
+                   SUM(COALESCE(tokens_input, 0)), SUM(COALESCE(tokens_output, 0))
+            FROM runs
+            WHERE tenant_id IS NOT NULL
+            GROUP BY tenant_id, substr(start_time, 1, {width})
+            """
+            for table, width in SPEND_ROLLUPS
+        ],
+        # Keep rollups current as runs are written, replaced or deleted
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_runs_spend_insert
+        AFTER INSERT ON runs WHEN NEW.tenant_id IS NOT NULL
+        BEGIN
+            {_rollup_sql("NEW", 1)}
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_runs_spend_delete
+        AFTER DELETE ON runs WHEN OLD.tenant_id IS NOT NULL
+        BEGIN
+            {_rollup_sql("OLD", -1)}
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_runs_spend_update_old
+        AFTER UPDATE ON runs WHEN OLD.tenant_id IS NOT NULL
+        BEGIN
+            {_rollup_sql("OLD", -1)}
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_runs_spend_update_new
+        AFTER UPDATE ON runs WHEN NEW.tenant_id IS NOT NULL
+        BEGIN
+            {_rollup_sql("NEW", 1)}
+        END
+        """,
+    ]),
+    Migration(4, "Covering analytics indexes and compacted runs archive", statements=[
+        # Composite covering indexes for time-bounded slicing by skill and tenant;
+        # they make the single-column name/tenant/start_time indexes redundant
+        """
+        CREATE INDEX IF NOT EXISTS idx_runs_start_cover ON runs(
+            start_time, name, tenant_id, status,
+            cost_estimate_usd, tokens_total, duration_seconds, eval_score
+        )
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_runs_name_start_cover ON runs(
+            name, start_time, tenant_id, status,
+            duration_seconds, cost_estimate_usd, tokens_total, eval_score
+        )
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_runs_tenant_start_cover ON runs(
+            tenant_id, start_time, name, status, cost_estimate_usd,
+            tokens_input, tokens_output, tokens_total, duration_seconds, eval_score
+        )
+        """,
+        "DROP INDEX IF EXISTS idx_runs_name",
+        "DROP INDEX IF EXISTS idx_runs_tenant_id",
+        "DROP INDEX IF EXISTS idx_runs_start_time",
+        # Daily aggregates of compacted runs (see lib.telemetry_analytics);
+        # tenant_id is '' for runs without a tenant
+        """
+        CREATE TABLE IF NOT EXISTS runs_archive (
+            day TEXT NOT NULL,
+            name TEXT NOT NULL,
+            tenant_id TEXT NOT NULL DEFAULT '',
+            status TEXT NOT NULL,
+            run_count INTEGER NOT NULL DEFAULT 0,
+            cost_usd REAL NOT NULL DEFAULT 0,
+            tokens_input INTEGER NOT NULL DEFAULT 0,
+            tokens_output INTEGER NOT NULL DEFAULT 0,
+            tokens_total INTEGER NOT NULL DEFAULT 0,
+            duration_sum REAL NOT NULL DEFAULT 0,
+            duration_count INTEGER NOT NULL DEFAULT 0,
+            eval_sum REAL NOT NULL DEFAULT 0,
+            eval_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, name, tenant_id, status)
+        ) WITHOUT ROWID
+        """,
+        # Compaction deletes raw runs that are already counted in the spend
+        # rollups; it sets this flag so the delete trigger leaves them alone
+        "CREATE TABLE IF NOT EXISTS telemetry_flags (name TEXT PRIMARY KEY)",
+        "DROP TRIGGER IF EXISTS trg_runs_spend_delete",
+        f"""
+        CREATE TRIGGER trg_runs_spend_delete
+        AFTER DELETE ON runs
+        WHEN OLD.tenant_id IS NOT NULL
+         AND NOT EXISTS (SELECT 1 FROM telemetry_flags WHERE name = 'compacting')
+        BEGIN
+            {_rollup_sql("OLD", -1)}
+        END
+        """,
+    ]),
+]
 
 
 def init_db():
     """
-    Initialize SQLite database for telemetry.
-    
-    Thread-safe initialization with WAL mode for concurrent access.
+    Initialize telemetry tables in the shared storage engine.
+
+    Thread-safe and idempotent; migrations are applied once per process.
     """
-    global _db_initialized
-    
-    if _db_initialized:
-        return
-    
-    with _init_lock:
-        if _db_initialized:
-            return
-        
-        pool = _get_pool()
-        conn = pool.get_connection()
-        try:
-            cursor = conn.cursor()
-            
-            # Begin transaction for schema creation
-            cursor.execute("BEGIN IMMEDIATE")
-            
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS runs (
-                    run_id TEXT PRIMARY KEY,
-                    tenant_id TEXT,
-                    type TEXT NOT NULL,
-                    name TEXT NOT NULL,
-                    version TEXT,
-                    status TEXT NOT NULL,
-                    start_time TEXT NOT NULL,
-                    end_time TEXT,
-                    duration_seconds REAL,
-                    tokens_input INTEGER DEFAULT 0,
-                    tokens_output INTEGER DEFAULT 0,
-                    tokens_total INTEGER DEFAULT 0,
-                    cost_estimate_usd REAL,
-                    model TEXT,
-                    client TEXT,
-                    error_type TEXT,
-                    error_message TEXT,
-                    eval_score REAL,
-                    eval_pass INTEGER,
-                    tags TEXT,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS steps (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    run_id TEXT NOT NULL,
-                    step_number INTEGER,
-                    step_name TEXT NOT NULL,
-                    agent TEXT,
-                    status TEXT NOT NULL,
-                    start_time TEXT,
-                    end_time TEXT,
-                    duration_seconds REAL,
-                    tokens_input INTEGER DEFAULT 0,
-                    tokens_output INTEGER DEFAULT 0,
-                    error TEXT,
-                    FOREIGN KEY (run_id) REFERENCES runs(run_id)
-                )
-            """)
-            
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS tool_calls (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    run_id TEXT NOT NULL,
-                    step_name TEXT,
-                    tool TEXT NOT NULL,
-                    timestamp TEXT,
-                    duration_ms INTEGER,
-                    status TEXT,
-                    error TEXT,
-                    FOREIGN KEY (run_id) REFERENCES runs(run_id)
-                )
-            """)
-            
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_runs_status ON runs(status)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_runs_name ON runs(name)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_runs_start_time ON runs(start_time)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_runs_tenant_id ON runs(tenant_id)
-            """)
-            
-            cursor.execute("COMMIT")
-            _db_initialized = True
-            
-        except Exception as e:
-            cursor.execute("ROLLBACK")
-            raise
-        finally:
-            pool.return_connection(conn)
+    get_storage_engine().migrate("telemetry", TELEMETRY_MIGRATIONS)
 
 
 @contextmanager
 def get_db():
     """
-    Thread-safe context manager for database connections.
-    
-    Uses connection pooling for efficient concurrent access.
+    Thread-safe context manager for a pooled read connection.
+
+    Writes should go through the storage engine's writer (see log_run).
     """
     init_db()
-    pool = _get_pool()
-    conn = pool.get_connection()
-    try:
+    with get_storage_engine().read() as conn:
         yield conn
-    finally:
-        pool.return_connection(conn)
 
 
 # Token costs (approximate, per 1M tokens)
@@ -270,6 +302,278 @@ def estimate_cost(tokens_input: int, tokens_output: int, model: str = "claude-so
 _file_write_lock = threading.Lock()
 
 
+# Column order of _QueuedRun.run_row
+RUN_COLUMNS = (
+    "run_id", "tenant_id", "type", "name", "version", "status", "start_time", "end_time",
+    "duration_seconds", "tokens_input", "tokens_output", "tokens_total",
+    "cost_estimate_usd", "model", "client", "error_type", "error_message",
+    "eval_score", "eval_pass", "tags",
+)
+
+
+@dataclass
+class _QueuedRun:
+    """A run waiting in the write-behind queue, with its rows pre-built."""
+    run_row: tuple
+    step_rows: List[tuple]
+    tool_call_rows: List[tuple]
+    run_data: dict
+
+
+class _FlushRequest:
+    """Queue marker asking the writer to commit everything queued before it."""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+_STOP = object()
+
+
+class TelemetryWriteBehind:
+    """
+    Bounded write-behind queue for telemetry runs.
+
+    log_run() enqueues and returns immediately; a single background thread
+    drains the queue and writes runs, steps and tool calls with one
+    executemany per table in one storage engine transaction. A batch is
+    written once batch_size runs are queued or flush_interval seconds have
+    passed since the first one, whichever comes first, and on interpreter
+    exit. When the queue is full, new runs are dropped and counted rather
+    than blocking the caller.
+
+    Reads in this module call flush() first, so a process always sees the
+    runs it has logged.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 10000,
+        batch_size: int = 200,
+        flush_interval: float = 1.0
+    ):
+        """
+        Initialize the queue and start its writer thread.
+
+        Args:
+            max_queue_size: Maximum queued runs before new runs are dropped
+            batch_size: Runs written per transaction at most
+            flush_interval: Max seconds a run waits before being written
+        """
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.engine = get_storage_engine()
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue_size)
+        self._stats_lock = threading.Lock()
+        self._stats = {"enqueued": 0, "written": 0, "dropped": 0, "failed": 0, "batches": 0}
+        self._closed = False
+
+        self._thread = threading.Thread(
+            target=self._run,
+            name="telemetry-write-behind",
+            daemon=True
+        )
+        self._thread.start()
+
+    def enqueue(self, item: _QueuedRun) -> bool:
+        """
+        Queue a run without blocking.
+
+        Returns:
+            True if queued, False if dropped because the queue is full
+        """
+        if self._closed:
+            self._write_batch([item])
+            return True
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            with self._stats_lock:
+                self._stats["dropped"] += 1
+                dropped = self._stats["dropped"]
+            if dropped == 1 or dropped % 1000 == 0:
+                logger.warning(f"Telemetry queue full, dropped {dropped} runs so far")
+            return False
+        with self._stats_lock:
+            self._stats["enqueued"] += 1
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every run queued before this call is written.
+
+        Returns:
+            True if flushed, False on timeout
+        """
+        if self._closed or threading.current_thread() is self._thread:
+            return True
+        with self._stats_lock:
+            pending = self._stats["enqueued"] - self._stats["written"] - self._stats["failed"]
+        if pending <= 0:
+            return True
+        request = _FlushRequest()
+        self._queue.put(request)
+        return request.done.wait(timeout)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Queue depth plus enqueued/written/dropped/failed/batch counters."""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["queue_depth"] = self._queue.qsize()
+        return stats
+
+    def close(self, timeout: Optional[float] = 10.0):
+        """Write everything still queued and stop the writer thread."""
+        if self._closed:
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout=timeout)
+        self._closed = True
+
+    def _run(self):
+        """Writer loop: gather up to batch_size runs or flush_interval seconds."""
+        batch: List[_QueuedRun] = []
+        waiters: List[_FlushRequest] = []
+        deadline = None
+        stopping = False
+
+        while not stopping:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is _STOP:
+                stopping = True
+            elif isinstance(item, _FlushRequest):
+                waiters.append(item)
+            elif item is not None:
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+
+            due = deadline is not None and time.monotonic() >= deadline
+            if batch and (len(batch) >= self.batch_size or due or waiters or stopping):
+                self._write_batch(batch)
+                batch = []
+                deadline = None
+
+            for waiter in waiters:
+                waiter.done.set()
+            waiters = []
+
+    def _write_batch(self, batch: List[_QueuedRun]):
+        """
+        Write a batch of runs in one transaction, then their JSON files.
+
+        If the batch fails, each run is retried as its own write job (the
+        engine gives each job its own savepoint), so one bad row only loses
+        its own run.
+        """
+        try:
+            self.engine.write(lambda conn: _insert_runs(conn, batch))
+            written = list(batch)
+        except Exception as e:
+            if len(batch) == 1:
+                logger.error(f"Telemetry write failed for run {batch[0].run_row[0]}: {e}")
+                written = []
+            else:
+                logger.warning(f"Telemetry batch write failed ({len(batch)} runs), retrying per run: {e}")
+                futures = [
+                    (item, self.engine.write(lambda conn, item=item: _insert_runs(conn, [item]), wait=False))
+                    for item in batch
+                ]
+                written = []
+                for item, future in futures:
+                    try:
+                        future.result()
+                        written.append(item)
+                    except Exception as run_error:
+                        logger.error(f"Telemetry write failed for run {item.run_row[0]}: {run_error}")
+
+        with self._stats_lock:
+            self._stats["written"] += len(written)
+            self._stats["failed"] += len(batch) - len(written)
+            if written:
+                self._stats["batches"] += 1
+
+        for item in written:
+            _write_run_json(item.run_data)
+
+
+def _insert_runs(conn, items: List[_QueuedRun]):
+    """Insert runs with their steps and tool calls (inside a write job)."""
+    # Upsert rather than REPLACE so re-logged runs fire the UPDATE
+    # triggers that keep the spend rollups correct
+    conn.executemany(f"""
+        INSERT INTO runs ({", ".join(RUN_COLUMNS)})
+        VALUES ({", ".join("?" for _ in RUN_COLUMNS)})
+        ON CONFLICT (run_id) DO UPDATE SET
+            {", ".join(f"{c} = excluded.{c}" for c in RUN_COLUMNS[1:])}
+    """, [item.run_row for item in items])
+
+    conn.executemany("""
+        INSERT INTO steps (
+            run_id, step_number, step_name, agent, status,
+            start_time, end_time, duration_seconds,
+            tokens_input, tokens_output, error
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, [row for item in items for row in item.step_rows])
+
+    conn.executemany("""
+        INSERT INTO tool_calls (
+            run_id, step_name, tool, timestamp, duration_ms, status, error
+        ) VALUES (?, ?, ?, ?, ?, ?, ?)
+    """, [row for item in items for row in item.tool_call_rows])
+
+
+def _write_run_json(run_data: dict):
+    """Write the per-run JSON file. Thread-safe."""
+    json_path = RUNS_DIR / f"{run_data['run_id']}.json"
+    try:
+        with _file_write_lock:
+            with open(json_path, "w") as f:
+                json.dump(run_data, f, indent=2)
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Could not write run file {json_path}: {e}")
+
+
+# Global write-behind queue (initialized lazily)
+_write_behind: Optional[TelemetryWriteBehind] = None
+_write_behind_lock = threading.Lock()
+
+
+def _get_write_behind() -> TelemetryWriteBehind:
+    """Get or create the global write-behind queue."""
+    global _write_behind
+    if _write_behind is None:
+        with _write_behind_lock:
+            if _write_behind is None:
+                _write_behind = TelemetryWriteBehind()
+                # Registered after the storage engine, so atexit runs it first
+                atexit.register(_write_behind.close)
+    return _write_behind
+
+
+def flush(timeout: Optional[float] = None) -> bool:
+    """
+    Block until all runs logged so far are written.
+
+    Returns:
+        True if flushed, False on timeout
+    """
+    if _write_behind is None:
+        return True
+    return _write_behind.flush(timeout)
+
+
+def get_queue_stats() -> Dict[str, int]:
+    """Write-behind queue depth and enqueued/written/dropped/failed counters."""
+    return _get_write_behind().get_stats()
+
+
 def log_run(
     run_id: str,
     type: str,
@@ -288,103 +592,77 @@ def log_run(
     evaluation: dict = None,
     steps: list = None,
     tool_calls: list = None,
-    tags: list = None
+    tags: list = None,
+    wait: bool = False
 ):
     """
     Log a workflow/skill run to the database.
     
     Thread-safe for concurrent calls from 20+ agents.
-    Uses WAL mode and connection pooling for optimal performance.
+    Non-blocking: the run is queued and written by a background thread
+    together with other runs (see TelemetryWriteBehind). Pass wait=True to
+    block until it is committed.
     """
     init_db()
     
     tokens_total = tokens_input + tokens_output
     cost = estimate_cost(tokens_input, tokens_output, model or "claude-sonnet-4")
-    
-    with get_db() as conn:
-        cursor = conn.cursor()
-        
-        # Use IMMEDIATE transaction for write operations to avoid SQLITE_BUSY
-        cursor.execute("BEGIN IMMEDIATE")
-        
-        try:
-            # Insert main run record
-            cursor.execute("""
-                INSERT OR REPLACE INTO runs (
-                    run_id, tenant_id, type, name, version, status, start_time, end_time,
-                    duration_seconds, tokens_input, tokens_output, tokens_total,
-                    cost_estimate_usd, model, client, error_type, error_message,
-                    eval_score, eval_pass, tags
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                run_id,
-                tenant_id,
-                type,
-                name,
-                version,
-                status,
-                start_time,
-                end_time,
-                duration_seconds,
-                tokens_input,
-                tokens_output,
-                tokens_total,
-                cost,
-                model,
-                client,
-                error.get("type") if error else None,
-                error.get("message") if error else None,
-                evaluation.get("score") if evaluation else None,
-                1 if evaluation and evaluation.get("pass") else 0 if evaluation else None,
-                json.dumps(tags) if tags else None
-            ))
-            
-            # Insert steps
-            if steps:
-                for i, step in enumerate(steps):
-                    cursor.execute("""
-                        INSERT INTO steps (
-                            run_id, step_number, step_name, agent, status,
-                            start_time, end_time, duration_seconds,
-                            tokens_input, tokens_output, error
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        run_id,
-                        i + 1,
-                        step.get("step_name"),
-                        step.get("agent"),
-                        step.get("status"),
-                        step.get("start_time"),
-                        step.get("end_time"),
-                        step.get("duration_seconds"),
-                        step.get("tokens_input", 0),
-                        step.get("tokens_output", 0),
-                        step.get("error")
-                    ))
-            
-            # Insert tool calls
-            if tool_calls:
-                for call in tool_calls:
-                    cursor.execute("""
-                        INSERT INTO tool_calls (
-                            run_id, step_name, tool, timestamp, duration_ms, status, error
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        run_id,
-                        call.get("step_name"),
-                        call.get("tool"),
-                        call.get("timestamp"),
-                        call.get("duration_ms"),
-                        call.get("status"),
-                        call.get("error")
-                    ))
-            
-            cursor.execute("COMMIT")
-            
-        except Exception as e:
-            cursor.execute("ROLLBACK")
-            raise
-    
+    steps = list(steps) if steps else steps
+    tool_calls = list(tool_calls) if tool_calls else tool_calls
+
+    run_row = (
+        run_id,
+        tenant_id,
+        type,
+        name,
+        version,
+        status,
+        start_time,
+        end_time,
+        duration_seconds,
+        tokens_input,
+        tokens_output,
+        tokens_total,
+        cost,
+        model,
+        client,
+        error.get("type") if error else None,
+        error.get("message") if error else None,
+        evaluation.get("score") if evaluation else None,
+        1 if evaluation and evaluation.get("pass") else 0 if evaluation else None,
+        json.dumps(tags) if tags else None
+    )
+
+    step_rows = [
+        (
+            run_id,
+            i + 1,
+            step.get("step_name"),
+            step.get("agent"),
+            step.get("status"),
+            step.get("start_time"),
+            step.get("end_time"),
+            step.get("duration_seconds"),
+            step.get("tokens_input", 0),
+            step.get("tokens_output", 0),
+            step.get("error")
+        )
+        for i, step in enumerate(steps or [])
+    ]
+
+    tool_call_rows = [
+        (
+            run_id,
+            call.get("step_name"),
+            call.get("tool"),
+            call.get("timestamp"),
+            call.get("duration_ms"),
+            call.get("status"),
+            call.get("error")
+        )
+        for call in tool_calls or []
+    ]
+
     # Build run data for JSON file and return value
     run_data = {
         "run_id": run_id,
@@ -407,11 +685,15 @@ def log_run(
         "tags": tags
     }
     
-    # Thread-safe JSON file write
-    json_path = RUNS_DIR / f"{run_id}.json"
-    with _file_write_lock:
-        with open(json_path, "w") as f:
-            json.dump(run_data, f, indent=2)
+    write_behind = _get_write_behind()
+    write_behind.enqueue(_QueuedRun(
+        run_row=run_row,
+        step_rows=step_rows,
+        tool_call_rows=tool_call_rows,
+        run_data=run_data
+    ))
+    if wait:
+        write_behind.flush()
     
     return run_data
 
@@ -437,6 +719,7 @@ def query_runs(
         List of run records
     """
     init_db()
+    flush()
     
     query = "SELECT * FROM runs WHERE 1=1"
     params = []
@@ -469,6 +752,7 @@ def get_stats(days: int = 7) -> dict:
     Get aggregate statistics for the last N days.
     """
     init_db()
+    flush()
     
     since = datetime.now(timezone.utc).replace(
         hour=0, minute=0, second=0, microsecond=0
@@ -538,6 +822,7 @@ def get_stats(days: int = 7) -> dict:
 def get_failures(hours: int = 24) -> list:
     """Get recent failures for debugging."""
     init_db()
+    flush()
     
     from datetime import timedelta
     since = (datetime.now(timezone.utc) - timedelta(hours=hours)).isoformat()
@@ -565,6 +850,7 @@ def get_tenant_costs(tenant_id: str, days: int = 30) -> dict:
         Dict with run_count, total_input_tokens, total_output_tokens, total_cost_usd
     """
     init_db()
+    flush()
     
     from datetime import timedelta
     cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
@@ -592,12 +878,69 @@ def get_tenant_costs(tenant_id: str, days: int = 30) -> dict:
         }
 
 
+def _rolling_spend(conn, tenant_id: str, days: int, now: datetime) -> Tuple[float, int]:
+    """
+    Sum a tenant's spend over the last N days, as get_tenant_costs does.
+
+    Whole days after the cutoff come from tenant_spend_daily; only the
+    partial day the window starts in is read from runs.
+    """
+    cutoff = now - timedelta(days=days)
+    next_day = (cutoff + timedelta(days=1)).strftime("%Y-%m-%d")
+
+    row = conn.execute("""
+        SELECT SUM(cost_usd), SUM(run_count)
+        FROM tenant_spend_daily
+        WHERE tenant_id = ? AND period >= ?
+    """, (tenant_id, next_day)).fetchone()
+    edge = conn.execute("""
+        SELECT SUM(cost_estimate_usd), COUNT(*)
+        FROM runs
+        WHERE tenant_id = ? AND start_time > ? AND start_time < ?
+    """, (tenant_id, cutoff.isoformat(), next_day)).fetchone()
+
+    return (row[0] or 0.0) + (edge[0] or 0.0), (row[1] or 0) + (edge[1] or 0)
+
+
+def get_tenant_spend(tenant_id: str, at: datetime = None) -> dict:
+    """
+    Get a tenant's rolling 1- and 30-day spend from the daily rollups.
+
+    Matches get_tenant_costs(days=1) and get_tenant_costs(days=30), but
+    reads at most 31 rollup rows plus the runs of one partial day, however
+    many runs are stored.
+
+    Args:
+        tenant_id: Tenant identifier
+        at: Point in time the windows end at (default now)
+
+    Returns:
+        Dict with daily_cost_usd, monthly_cost_usd and run counts
+    """
+    init_db()
+    flush()
+
+    at = at or datetime.now(timezone.utc)
+
+    with get_db() as conn:
+        daily_cost, daily_runs = _rolling_spend(conn, tenant_id, 1, at)
+        monthly_cost, monthly_runs = _rolling_spend(conn, tenant_id, 30, at)
+
+    return {
+        "tenant_id": tenant_id,
+        "daily_cost_usd": round(daily_cost, 4),
+        "daily_run_count": daily_runs,
+        "monthly_cost_usd": round(monthly_cost, 4),
+        "monthly_run_count": monthly_runs
+    }
+
+
 class TelemetryCollector:
     """
     Thread-safe class wrapper around telemetry functions for use by other modules.
     
     Provides object-oriented interface while using the same underlying
-    database and connection pool. Safe for use by 20+ concurrent agents.
+    storage engine. Safe for use by 20+ concurrent agents.
     """
     
     # Class-level lock for thread-safe instance operations
@@ -610,6 +953,7 @@ class TelemetryCollector:
         Thread-safe initialization using global connection pool.
         """
         self.db_path = db_path or DB_PATH
+        self.engine = get_storage_engine()
         self._local = threading.local()  # Thread-local storage for per-thread state
         init_db()
     
@@ -617,10 +961,18 @@ class TelemetryCollector:
         """
         Log a run. Thread-safe. See module-level log_run for args.
         
-        Uses connection pool for concurrent access.
+        Non-blocking; the run is written by the write-behind queue.
         """
         return log_run(**kwargs)
     
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until all queued runs are written. See module-level flush."""
+        return flush(timeout)
+    
+    def get_queue_stats(self) -> Dict[str, int]:
+        """Write-behind queue depth and counters. See module-level function."""
+        return get_queue_stats()
+    
     def get_tenant_costs(self, tenant_id: str, days: int = 30) -> dict:
         """
         Get cost summary for a tenant. Thread-safe.
@@ -629,6 +981,10 @@ class TelemetryCollector:
         """
         return get_tenant_costs(tenant_id, days)
     
+    def get_tenant_spend(self, tenant_id: str, at: datetime = None) -> dict:
+        """Get rolling 1- and 30-day spend from the rollups. See module-level function."""
+        return get_tenant_spend(tenant_id, at)
+    
     def query_runs(self, **kwargs) -> list:
         """Query runs. Thread-safe. See module-level function."""
         return query_runs(**kwargs)
@@ -641,16 +997,14 @@ class TelemetryCollector:
         """Get recent failures. Thread-safe. See module-level function."""
         return get_failures(hours)
     
-    def log_run_async(self, **kwargs) -> threading.Thread:
+    def log_run_async(self, **kwargs) -> dict:
         """
-        Log a run asynchronously in a background thread.
+        Log a run without blocking.
         
-        Returns the thread handle for optional joining.
-        Useful for non-blocking telemetry in hot paths.
+        Kept for compatibility: log_run is already write-behind, so this no
+        longer starts a thread per call.
         """
-        thread = threading.Thread(target=log_run, kwargs=kwargs, daemon=True)
-        thread.start()
-        return thread
+        return log_run(**kwargs)
 
 
 if __name__ == "__main__":
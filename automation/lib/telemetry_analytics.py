@@ -0,0 +1,522 @@
+"""
+MH1 Telemetry Analytics
+Grouped percentiles, time series and top-N queries over telemetry runs.
+
+Dashboards slice cost, latency and eval score by skill x tenant x time.
+This module answers those questions from the covering indexes added by
+telemetry migration 4, and keeps the raw runs table small by compacting
+old runs into daily aggregates (runs_archive):
+
+1. percentiles() - p50/p95/p99 (or any) of a metric per group, raw runs only
+2. time_series() - bucketed counts, cost, tokens, avg duration and eval score
+3. top_n()       - groups ranked by cost, runs, tokens, duration or failures
+4. compact()     - fold runs older than N days into runs_archive
+5. export()      - write runs to Parquet or Arrow IPC (requires pyarrow)
+
+time_series() and top_n() include archived aggregates whenever the grouping
+only uses archive dimensions (name, tenant_id, status) and the bucket is a
+day or coarser. Percentiles cannot be rebuilt from aggregates, so they only
+cover runs that have not been compacted.
+
+Usage:
+    from lib.telemetry_analytics import TelemetryAnalytics
+
+    analytics = TelemetryAnalytics()
+    analytics.percentiles("duration_seconds", group_by=["name"], since="2026-01-01")
+    analytics.time_series(bucket="day", group_by=["tenant_id"], since="2026-01-01")
+    analytics.top_n(by="cost", group_by=["name", "tenant_id"], n=10)
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    from lib.telemetry import flush, get_db, get_storage_engine, init_db
+except ImportError:
+    from telemetry import flush, get_db, get_storage_engine, init_db
+
+logger = logging.getLogger(__name__)
+
+# Dimensions that can be grouped or filtered on (whitelisted column names)
+DIMENSIONS = ("name", "tenant_id", "status", "type", "model", "client")
+
+# Dimensions kept in runs_archive
+ARCHIVE_DIMENSIONS = ("name", "tenant_id", "status")
+
+# Metrics available to percentiles()
+METRICS = ("duration_seconds", "cost_estimate_usd", "tokens_total", "eval_score")
+
+# Rows fetched and written per Arrow record batch by export()
+EXPORT_BATCH_ROWS = 10000
+
+# Time bucket -> length of the ISO start_time prefix
+BUCKETS = {"hour": 13, "day": 10, "month": 7}
+
+# top_n() rankings: name -> aggregate over the unified run/archive rows
+RANKINGS = {
+    "cost": "SUM(cost_usd)",
+    "runs": "SUM(run_count)",
+    "tokens": "SUM(tokens_total)",
+    "duration": "SUM(duration_sum)",
+    "failures": "SUM(CASE WHEN status = 'failed' THEN run_count ELSE 0 END)",
+}
+
+TimeBound = Optional[Union[str, datetime]]
+
+
+def _iso(value: TimeBound) -> Optional[str]:
+    """Normalize a time bound to an ISO string."""
+    if value is None or isinstance(value, str):
+        return value
+    return value.isoformat()
+
+
+def _percentile(sorted_values: Sequence[float], pct: float) -> Optional[float]:
+    """Percentile with linear interpolation between closest ranks."""
+    if not sorted_values:
+        return None
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    rank = (len(sorted_values) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+def _check_dimensions(group_by: Sequence[str]):
+    unknown = [d for d in group_by if d not in DIMENSIONS]
+    if unknown:
+        raise ValueError(f"Unknown dimensions {unknown}; expected any of {list(DIMENSIONS)}")
+
+
+class TelemetryAnalytics:
+    """
+    Read-side analytics over the telemetry runs table and its archive.
+
+    All queries flush the telemetry write-behind queue first, so they see
+    every run logged by this process.
+    """
+
+    def __init__(self):
+        init_db()
+        self.engine = get_storage_engine()
+
+    # -------------------------------------------------------------------------
+    # Query helpers
+    # -------------------------------------------------------------------------
+
+    def _where(
+        self,
+        since: TimeBound,
+        until: TimeBound,
+        filters: Dict[str, Any],
+        time_column: str = "start_time"
+    ) -> Tuple[str, List[Any]]:
+        """Build a WHERE clause for a time range and dimension filters."""
+        _check_dimensions(list(filters))
+        clauses, params = ["1=1"], []
+        # runs_archive is keyed by day, so compare on the date prefix
+        width = 10 if time_column == "day" else None
+        if since is not None:
+            clauses.append(f"{time_column} >= ?")
+            params.append(_iso(since)[:width])
+        if until is not None:
+            clauses.append(f"{time_column} < ?")
+            params.append(_iso(until)[:width])
+        for column, value in filters.items():
+            if value is None:
+                continue
+            if time_column == "day" and column == "tenant_id":
+                clauses.append("NULLIF(tenant_id, '') = ?")
+            else:
+                clauses.append(f"{column} = ?")
+            params.append(value)
+        return " AND ".join(clauses), params
+
+    def _unified_rows(
+        self,
+        group_by: Sequence[str],
+        bucket: Optional[str],
+        since: TimeBound,
+        until: TimeBound,
+        filters: Dict[str, Any]
+    ) -> Tuple[str, List[Any]]:
+        """
+        SQL yielding one row per raw run plus one per archive aggregate, with
+        columns bucket, <group_by...>, status, run_count, cost_usd,
+        tokens_total, duration_sum, duration_count, eval_sum, eval_count.
+        """
+        _check_dimensions(group_by)
+        width = BUCKETS[bucket] if bucket else None
+        dims = [d for d in group_by if d != "status"]
+
+        raw_where, raw_params = self._where(since, until, filters)
+        raw_select = ", ".join(
+            [f"substr(start_time, 1, {width}) AS bucket" if width else "NULL AS bucket"]
+            + dims
+            + [
+                "status",
+                "1 AS run_count",
+                "COALESCE(cost_estimate_usd, 0) AS cost_usd",
+                "COALESCE(tokens_total, 0) AS tokens_total",
+                "COALESCE(duration_seconds, 0) AS duration_sum",
+                "duration_seconds IS NOT NULL AS duration_count",
+                "COALESCE(eval_score, 0) AS eval_sum",
+                "eval_score IS NOT NULL AS eval_count",
+            ]
+        )
+        sql = f"SELECT {raw_select} FROM runs WHERE {raw_where}"
+        params = list(raw_params)
+
+        use_archive = (
+            set(group_by) <= set(ARCHIVE_DIMENSIONS)
+            and set(filters) <= set(ARCHIVE_DIMENSIONS)
+            and bucket != "hour"
+        )
+        if use_archive:
+            archive_where, archive_params = self._where(since, until, filters, time_column="day")
+            archive_select = ", ".join(
+                [f"substr(day, 1, {width}) AS bucket" if width else "NULL AS bucket"]
+                + [("NULLIF(tenant_id, '') AS tenant_id" if d == "tenant_id" else d) for d in dims]
+                + [
+                    "status", "run_count", "cost_usd", "tokens_total",
+                    "duration_sum", "duration_count", "eval_sum", "eval_count",
+                ]
+            )
+            sql += f" UNION ALL SELECT {archive_select} FROM runs_archive WHERE {archive_where}"
+            params += archive_params
+
+        return sql, params
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    def percentiles(
+        self,
+        metric: str = "duration_seconds",
+        group_by: Sequence[str] = ("name",),
+        percentiles: Sequence[float] = (50, 95, 99),
+        since: TimeBound = None,
+        until: TimeBound = None,
+        **filters
+    ) -> List[Dict[str, Any]]:
+        """
+        Percentiles of a metric per group, over raw (uncompacted) runs.
+
+        Args:
+            metric: One of METRICS
+            group_by: Dimensions to group by (see DIMENSIONS)
+            percentiles: Percentiles to compute, 0-100
+            since: Inclusive start_time lower bound (ISO string or datetime)
+            until: Exclusive start_time upper bound
+            **filters: Dimension equality filters, e.g. tenant_id="acme"
+
+        Returns:
+            One dict per group: group columns, count, mean, and p<N> keys
+        """
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric {metric!r}; expected one of {list(METRICS)}")
+        _check_dimensions(group_by)
+        flush()
+
+        where, params = self._where(since, until, filters)
+        dims = list(group_by)
+        order = ", ".join(dims + [metric])
+        select = ", ".join(dims + [metric])
+
+        results = []
+        with get_db() as conn:
+            rows = conn.execute(
+                f"SELECT {select} FROM runs WHERE {where} AND {metric} IS NOT NULL ORDER BY {order}",
+                params
+            )
+
+            current_key, values = None, []
+
+            def emit():
+                if not values:
+                    return
+                entry = dict(zip(dims, current_key))
+                entry["count"] = len(values)
+                entry["mean"] = sum(values) / len(values)
+                for pct in percentiles:
+                    entry[f"p{pct:g}"] = _percentile(values, pct)
+                results.append(entry)
+
+            # Rows arrive sorted by group then metric, so groups stream in order
+            for row in rows:
+                key = tuple(row[:len(dims)])
+                if key != current_key:
+                    emit()
+                    current_key, values = key, []
+                values.append(row[len(dims)])
+            emit()
+
+        return results
+
+    def time_series(
+        self,
+        bucket: str = "day",
+        group_by: Sequence[str] = (),
+        since: TimeBound = None,
+        until: TimeBound = None,
+        **filters
+    ) -> List[Dict[str, Any]]:
+        """
+        Time-bucketed run counts, cost, tokens, avg duration and eval score.
+
+        Args:
+            bucket: "hour", "day" or "month" (UTC, by start_time prefix)
+            group_by: Dimensions to split each bucket by
+            since: Inclusive lower bound
+            until: Exclusive upper bound
+            **filters: Dimension equality filters
+
+        Returns:
+            One dict per (bucket, group), ordered by bucket
+        """
+        if bucket not in BUCKETS:
+            raise ValueError(f"Unknown bucket {bucket!r}; expected one of {list(BUCKETS)}")
+        flush()
+
+        inner, params = self._unified_rows(group_by, bucket, since, until, filters)
+        dims = list(group_by)
+        group_cols = ", ".join(["bucket"] + dims)
+
+        sql = f"""
+            SELECT {group_cols},
+                   SUM(run_count) AS runs,
+                   SUM(CASE WHEN status = 'failed' THEN run_count ELSE 0 END) AS failures,
+                   SUM(cost_usd) AS cost_usd,
+                   SUM(tokens_total) AS tokens_total,
+                   SUM(duration_sum) / NULLIF(SUM(duration_count), 0) AS avg_duration_seconds,
+                   SUM(eval_sum) / NULLIF(SUM(eval_count), 0) AS avg_eval_score
+            FROM ({inner})
+            GROUP BY {group_cols}
+            ORDER BY {group_cols}
+        """
+        with get_db() as conn:
+            return [dict(row) for row in conn.execute(sql, params)]
+
+    def top_n(
+        self,
+        by: str = "cost",
+        group_by: Sequence[str] = ("name",),
+        n: int = 10,
+        since: TimeBound = None,
+        until: TimeBound = None,
+        **filters
+    ) -> List[Dict[str, Any]]:
+        """
+        Top groups ranked by cost, runs, tokens, duration or failures.
+
+        Args:
+            by: One of RANKINGS
+            group_by: Dimensions to group by
+            n: Number of groups to return
+            since: Inclusive lower bound
+            until: Exclusive upper bound
+            **filters: Dimension equality filters
+
+        Returns:
+            Up to n dicts with group columns, value and summary totals
+        """
+        if by not in RANKINGS:
+            raise ValueError(f"Unknown ranking {by!r}; expected one of {list(RANKINGS)}")
+        if not group_by:
+            raise ValueError("top_n needs at least one group_by dimension")
+        flush()
+
+        inner, params = self._unified_rows(group_by, None, since, until, filters)
+        group_cols = ", ".join(group_by)
+
+        sql = f"""
+            SELECT {group_cols},
+                   {RANKINGS[by]} AS value,
+                   SUM(run_count) AS runs,
+                   SUM(cost_usd) AS cost_usd,
+                   SUM(tokens_total) AS tokens_total
+            FROM ({inner})
+            GROUP BY {group_cols}
+            ORDER BY value DESC
+            LIMIT ?
+        """
+        with get_db() as conn:
+            return [dict(row) for row in conn.execute(sql, params + [n])]
+
+    def compact(self, older_than_days: int = 90) -> Dict[str, int]:
+        """
+        Fold raw runs older than a cutoff into daily runs_archive aggregates.
+
+        Runs, their steps and tool calls are deleted after being archived.
+        The per-tenant spend rollups are left untouched. Each day is
+        compacted in its own write transaction to keep writer stalls short.
+
+        Args:
+            older_than_days: Compact runs that started before now - N days
+
+        Returns:
+            Dict with days and runs compacted
+        """
+        flush()
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=older_than_days)).isoformat()
+
+        with get_db() as conn:
+            days = [
+                row[0] for row in conn.execute(
+                    "SELECT DISTINCT substr(start_time, 1, 10) FROM runs WHERE start_time < ?",
+                    (cutoff,)
+                )
+            ]
+
+        def compact_day(conn, day: str) -> int:
+            day_range = (day, day, cutoff)
+            run_filter = "start_time >= ? AND substr(start_time, 1, 10) = ? AND start_time < ?"
+
+            conn.execute(f"""
+                INSERT INTO runs_archive (
+                    day, name, tenant_id, status, run_count, cost_usd,
+                    tokens_input, tokens_output, tokens_total,
+                    duration_sum, duration_count, eval_sum, eval_count
+                )
+                SELECT substr(start_time, 1, 10), name, COALESCE(tenant_id, ''), status,
+                       COUNT(*), SUM(COALESCE(cost_estimate_usd, 0)),
+                       SUM(COALESCE(tokens_input, 0)), SUM(COALESCE(tokens_output, 0)),
+                       SUM(COALESCE(tokens_total, 0)),
+                       SUM(COALESCE(duration_seconds, 0)), COUNT(duration_seconds),
+                       SUM(COALESCE(eval_score, 0)), COUNT(eval_score)
+                FROM runs
+                WHERE {run_filter}
+                GROUP BY 1, 2, 3, 4
+                ON CONFLICT (day, name, tenant_id, status) DO UPDATE SET
+                    run_count = run_count + excluded.run_count,
+                    cost_usd = cost_usd + excluded.cost_usd,
+                    tokens_input = tokens_input + excluded.tokens_input,
+                    tokens_output = tokens_output + excluded.tokens_output,
+                    tokens_total = tokens_total + excluded.tokens_total,
+                    duration_sum = duration_sum + excluded.duration_sum,
+                    duration_count = duration_count + excluded.duration_count,
+                    eval_sum = eval_sum + excluded.eval_sum,
+                    eval_count = eval_count + excluded.eval_count
+            """, day_range)
+
+            for child in ("steps", "tool_calls"):
+                conn.execute(
+                    f"DELETE FROM {child} WHERE run_id IN (SELECT run_id FROM runs WHERE {run_filter})",
+                    day_range
+                )
+
+            conn.execute("INSERT OR IGNORE INTO telemetry_flags (name) VALUES ('compacting')")
+            deleted = conn.execute(f"DELETE FROM runs WHERE {run_filter}", day_range).rowcount
+            conn.execute("DELETE FROM telemetry_flags WHERE name = 'compacting'")
+            return deleted
+
+        total = 0
+        for day in days:
+            total += self.engine.write(lambda conn, day=day: compact_day(conn, day))
+
+        if total:
+            logger.info(f"Compacted {total} runs over {len(days)} days into runs_archive")
+        return {"days": len(days), "runs": total}
+
+    def export(
+        self,
+        path: Union[str, Path],
+        format: str = "parquet",
+        since: TimeBound = None,
+        until: TimeBound = None,
+        table: str = "runs",
+        **filters
+    ) -> int:
+        """
+        Export runs (or runs_archive) to Parquet or Arrow IPC for offline analysis.
+
+        Rows are streamed from the cursor in chunks of EXPORT_BATCH_ROWS,
+        so memory does not grow with the table. Column types come from the
+        table's declared SQLite types. Requires the optional pyarrow
+        dependency.
+
+        Args:
+            path: Output file path
+            format: "parquet" or "arrow"
+            since: Inclusive lower bound
+            until: Exclusive upper bound
+            table: "runs" or "runs_archive"
+            **filters: Dimension equality filters
+
+        Returns:
+            Number of rows exported
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("pyarrow is required for export: pip install pyarrow")
+
+        if format not in ("parquet", "arrow"):
+            raise ValueError(f"Unknown export format {format!r}; expected 'parquet' or 'arrow'")
+        if table not in ("runs", "runs_archive"):
+            raise ValueError(f"Unknown table {table!r}; expected 'runs' or 'runs_archive'")
+        flush()
+
+        time_column = "start_time" if table == "runs" else "day"
+        where, params = self._where(since, until, filters, time_column=time_column)
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        exported = 0
+
+        with get_db() as conn:
+            schema = pa.schema([
+                (name, _arrow_type(pa, declared))
+                for _, name, declared, *_ in conn.execute(f"PRAGMA table_info({table})")
+            ])
+            cursor = conn.execute(
+                f"SELECT {', '.join(schema.names)} FROM {table} WHERE {where}", params
+            )
+
+            if format == "parquet":
+                import pyarrow.parquet as pq
+                writer = pq.ParquetWriter(path, schema)
+            else:
+                writer = pa.ipc.new_file(path, schema)
+
+            try:
+                while True:
+                    rows = cursor.fetchmany(EXPORT_BATCH_ROWS)
+                    if not rows:
+                        break
+                    writer.write_table(pa.Table.from_pydict(
+                        {name: [row[i] for row in rows] for i, name in enumerate(schema.names)},
+                        schema=schema
+                    ))
+                    exported += len(rows)
+            finally:
+                writer.close()
+
+        return exported
+
+
+def _arrow_type(pa: Any, declared: str) -> Any:
+    """Arrow type for a declared SQLite column type (by SQLite affinity rules)."""
+    declared = (declared or "").upper()
+    if "INT" in declared:
+        return pa.int64()
+    if any(name in declared for name in ("REAL", "FLOA", "DOUB")):
+        return pa.float64()
+    if "BLOB" in declared:
+        return pa.binary()
+    return pa.string()
+
+
+__all__ = [
+    "ARCHIVE_DIMENSIONS",
+    "BUCKETS",
+    "DIMENSIONS",
+    "EXPORT_BATCH_ROWS",
+    "METRICS",
+    "RANKINGS",
+    "TelemetryAnalytics",
+]
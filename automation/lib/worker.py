@@ -0,0 +1,657 @@
+"""
+MH1 Skill Worker
+A long-lived local process that runs skill helper scripts in-process, so
+repeated invocations skip interpreter start-up, heavy imports and Firebase
+initialization.
+
+Each script is loaded once as a module (and reloaded when its file
+changes); a job calls its main() with the job's argv, cwd and stdin and
+captures stdout, stderr and the exit code, as if the script had run as a
+subprocess. firebase_admin keeps its default app between jobs, so the
+scripts' own `if not firebase_admin._apps` guard skips credential lookup
+and app initialization after the first job, and firestore.client() returns
+the app's existing client.
+
+Only scripts listed in WARM_SCRIPTS run in the worker: they keep per-run
+state inside main() rather than in module globals. Jobs run one at a time,
+since argv, cwd and the standard streams are process-wide. The worker
+enforces a job's timeout itself: a job that overruns is reported as timed
+out but cannot be interrupted, so the worker refuses new jobs until it ends.
+
+The protocol is JSON-RPC 2.0, one request or response per line, over a Unix
+socket (MH1_WORKER_SOCKET, default automation/.mh1/worker.sock) or over
+stdin/stdout. Methods: run, ping, shutdown.
+
+Callers use run_script(), which sends the job to a running worker and falls
+back to a plain subprocess when there is none, the script is not warm-safe
+or the worker turns the job down before running it, so nothing changes when
+no worker is running. Once the worker has accepted a job, failures are
+raised rather than retried, so a script never runs twice. Set
+MH1_WORKER_AUTOSTART=1 to have run_script start a worker on first use, or
+MH1_WORKER_DISABLE=1 to always use subprocesses.
+
+Usage:
+    python automation/lib/worker.py serve                 # Unix socket daemon
+    python automation/lib/worker.py serve --stdio         # JSON-RPC over stdin/stdout
+    python automation/lib/worker.py status
+    python automation/lib/worker.py stop
+    python automation/lib/worker.py run path/to/script.py [args...]
+"""
+
+import argparse
+import importlib.util
+import io
+import json
+import logging
+import os
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+SYSTEM_ROOT = Path(__file__).parent.parent
+PROJECT_ROOT = SYSTEM_ROOT.parent
+SOCKET_PATH = Path(os.environ.get("MH1_WORKER_SOCKET", SYSTEM_ROOT / ".mh1" / "worker.sock"))
+IDLE_TIMEOUT_SECONDS = 1800  # Worker exits after this long without a request
+STARTUP_TIMEOUT_SECONDS = 5.0
+CONNECT_TIMEOUT_SECONDS = 2.0
+RESPONSE_GRACE_SECONDS = 5.0  # Extra client wait beyond a job's timeout for the worker's answer
+LOCK_POLL_SECONDS = 0.1
+
+# Scripts that are safe to run repeatedly in one process (relative to PROJECT_ROOT)
+WARM_SCRIPTS = frozenset(
+    (PROJECT_ROOT / path).resolve() for path in [
+        "skills/generation-skills/ghostwrite-content/scripts/fetch_source_posts.py",
+        "skills/generation-skills/ghostwrite-content/scripts/fetch_thought_leader_posts.py",
+        "skills/generation-skills/ghostwrite-content/scripts/fetch_parallel_events.py",
+        "skills/generation-skills/ghostwrite-content/scripts/preload_all_context.py",
+        "skills/operations-skills/firebase-bulk-upload/update_post_scores.py",
+        "skills/operations-skills/firebase-bulk-upload/upload_mentions.py",
+    ]
+)
+
+# JSON-RPC error codes
+PARSE_ERROR = -32700
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+JOB_TIMEOUT = -32001
+WORKER_BUSY = -32002
+
+
+class WorkerUnavailable(Exception):
+    """Raised when the worker is unreachable or declined the job before running it (callers fall back to a subprocess)."""
+
+
+class WorkerBusy(Exception):
+    """Raised when a timed-out job is still running in the worker."""
+
+
+class WorkerError(Exception):
+    """Raised when the worker failed after accepting a job (it may have run)."""
+
+
+@dataclass
+class ScriptResult:
+    """Outcome of one script run, in subprocess terms."""
+    returncode: int
+    stdout: str
+    stderr: str
+    duration_ms: int
+    warm: bool = False  # True if the script ran inside the worker
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def is_warm_script(path: Path) -> bool:
+    """Whether a script may run inside the worker."""
+    return Path(path).resolve() in WARM_SCRIPTS
+
+
+def _exit_code(code: Any, stderr: io.StringIO) -> int:
+    """Map a SystemExit code to a process exit status, as the interpreter does."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=stderr)
+    return 1
+
+
+class ScriptWorker:
+    """
+    Runs warm-safe scripts in this process, keeping their modules loaded.
+
+    Thread Safety:
+        Jobs are serialized; run() may be called from any thread.
+    """
+
+    def __init__(self):
+        self._modules: Dict[Path, Tuple[float, ModuleType]] = {}
+        self._lock = threading.Lock()
+        self._overrun: Optional[threading.Thread] = None
+        self.started_at = time.time()
+        self.jobs_run = 0
+
+    def _load(self, path: Path) -> ModuleType:
+        """Import a script as a module, reusing it until the file changes."""
+        mtime = path.stat().st_mtime
+        cached = self._modules.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        name = f"_mh1_worker_{path.parent.name}_{path.stem}".replace("-", "_")
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(name, None)
+            raise
+        self._modules[path] = (mtime, module)
+        return module
+
+    def run(
+        self,
+        script: str,
+        argv: Sequence[str] = (),
+        cwd: Optional[str] = None,
+        stdin: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> ScriptResult:
+        """
+        Run a script's main() in-process.
+
+        The job runs on its own thread so the timeout can be enforced here.
+        A job that overruns keeps running (Python threads cannot be
+        interrupted); until it ends, new jobs raise WorkerBusy.
+
+        Args:
+            script: Script path (must be in WARM_SCRIPTS)
+            argv: Arguments after the script name
+            cwd: Working directory for the job (default: PROJECT_ROOT)
+            stdin: Text to present on sys.stdin
+            timeout: Seconds to wait for the job, including time queued
+                behind other jobs
+
+        Returns:
+            ScriptResult with captured output and exit code
+
+        Raises:
+            ValueError: If the script is not warm-safe
+            WorkerBusy: If a timed-out job is still running, or the job
+                could not start within timeout
+            subprocess.TimeoutExpired: If the job started but did not finish
+                within timeout
+        """
+        path = Path(script).resolve()
+        if path not in WARM_SCRIPTS:
+            raise ValueError(f"Not a warm-safe script: {script}")
+        if cwd and not os.path.isdir(cwd):
+            raise ValueError(f"No such directory: {cwd}")
+
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while not self._lock.acquire(timeout=LOCK_POLL_SECONDS):
+            if self._overrun is not None and self._overrun.is_alive():
+                raise WorkerBusy(f"A timed-out job is still running; not starting {path.name}")
+            if deadline is not None and time.monotonic() >= deadline:
+                raise WorkerBusy(f"{path.name} could not start within {timeout}s")
+
+        # The job thread releases the lock when it finishes
+        outcome: Dict[str, ScriptResult] = {}
+        job = threading.Thread(
+            target=self._run_job,
+            args=(path, list(argv), cwd, stdin, outcome),
+            name=f"worker-job-{path.stem}",
+            daemon=True
+        )
+        try:
+            job.start()
+        except BaseException:
+            self._lock.release()
+            raise
+        job.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        if job.is_alive():
+            self._overrun = job
+            logger.warning(f"{path.name} exceeded its {timeout}s timeout; refusing jobs until it finishes")
+            raise subprocess.TimeoutExpired(str(path), timeout)
+        return outcome["result"]
+
+    def _run_job(
+        self,
+        path: Path,
+        argv: List[str],
+        cwd: Optional[str],
+        stdin: Optional[str],
+        outcome: Dict[str, ScriptResult]
+    ):
+        """Run one job with its argv, cwd and streams (the caller acquired the lock)."""
+        stdout, stderr = io.StringIO(), io.StringIO()
+        saved_argv, saved_stdin, saved_cwd = sys.argv, sys.stdin, os.getcwd()
+        start = time.perf_counter()
+        returncode = 0
+        try:
+            sys.argv = [str(path), *argv]
+            sys.stdin = io.StringIO(stdin or "")
+            os.chdir(cwd or PROJECT_ROOT)
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                try:
+                    self._load(path).main()
+                except SystemExit as e:
+                    returncode = _exit_code(e.code, stderr)
+                except Exception:
+                    traceback.print_exc()
+                    returncode = 1
+        except OSError as e:
+            print(f"{type(e).__name__}: {e}", file=stderr)
+            returncode = 1
+        finally:
+            sys.argv, sys.stdin = saved_argv, saved_stdin
+            os.chdir(saved_cwd)
+            self.jobs_run += 1
+            self._lock.release()
+
+        outcome["result"] = ScriptResult(
+            returncode=returncode,
+            stdout=stdout.getvalue(),
+            stderr=stderr.getvalue(),
+            duration_ms=int((time.perf_counter() - start) * 1000),
+            warm=True
+        )
+
+    def status(self) -> Dict[str, Any]:
+        """Process and cache stats (the ping result)."""
+        return {
+            "pid": os.getpid(),
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "jobs_run": self.jobs_run,
+            "busy": bool(self._overrun is not None and self._overrun.is_alive()),
+            "scripts_loaded": sorted(str(p) for p in self._modules)
+        }
+
+    def handle(self, line: str) -> Tuple[Dict[str, Any], bool]:
+        """
+        Answer one JSON-RPC request line.
+
+        Returns:
+            (response, shutdown requested)
+        """
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            return _error(None, PARSE_ERROR, str(e)), False
+
+        request_id = request.get("id") if isinstance(request, dict) else None
+        method = request.get("method") if isinstance(request, dict) else None
+        params = (request.get("params") or {}) if isinstance(request, dict) else {}
+
+        if method == "ping":
+            return _result(request_id, self.status()), False
+        if method == "shutdown":
+            return _result(request_id, {"stopping": True}), True
+        if method != "run":
+            return _error(request_id, METHOD_NOT_FOUND, f"Unknown method: {method}"), False
+
+        try:
+            result = self.run(
+                params["script"],
+                params.get("argv", []),
+                cwd=params.get("cwd"),
+                stdin=params.get("stdin"),
+                timeout=params.get("timeout")
+            )
+        except subprocess.TimeoutExpired as e:
+            return _error(request_id, JOB_TIMEOUT, str(e)), False
+        except WorkerBusy as e:
+            return _error(request_id, WORKER_BUSY, str(e)), False
+        except (KeyError, TypeError, ValueError) as e:
+            return _error(request_id, INVALID_PARAMS, str(e)), False
+        except Exception as e:
+            logger.exception("Worker job failed")
+            return _error(request_id, INTERNAL_ERROR, str(e)), False
+        return _result(request_id, result.to_dict()), False
+
+
+def _result(request_id: Any, result: Dict[str, Any]) -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+def _error(request_id: Any, code: int, message: str) -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+# =============================================================================
+# Server
+# =============================================================================
+
+class _WorkerServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, worker: ScriptWorker):
+        super().__init__(path, _RequestHandler)
+        self.worker = worker
+        self.last_activity = time.monotonic()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for raw in self.rfile:
+            line = raw.decode("utf-8").strip()
+            if not line:
+                continue
+            self.server.last_activity = time.monotonic()
+            response, stop = self.server.worker.handle(line)
+            self.server.last_activity = time.monotonic()
+            try:
+                self.wfile.write((json.dumps(response, default=str) + "\n").encode("utf-8"))
+                self.wfile.flush()
+            except OSError as e:
+                logger.warning("Client went away before the reply was sent: %s", e)
+                return
+            if stop:
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+
+def serve(socket_path: Path = SOCKET_PATH, idle_timeout: float = IDLE_TIMEOUT_SECONDS):
+    """
+    Serve JSON-RPC on a Unix socket until shutdown or idle_timeout.
+
+    Raises:
+        RuntimeError: If another worker is already serving socket_path
+    """
+    socket_path = Path(socket_path)
+    if socket_path.exists():
+        try:
+            _call("ping", {}, socket_path=socket_path, timeout=1.0)
+        except WorkerUnavailable:
+            socket_path.unlink()  # Stale socket from a worker that died
+        else:
+            raise RuntimeError(f"A worker is already serving {socket_path}")
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+    server = _WorkerServer(str(socket_path), ScriptWorker())
+    os.chmod(socket_path, 0o600)
+
+    def watch_idle():
+        while True:
+            time.sleep(min(idle_timeout, 30))
+            if time.monotonic() - server.last_activity > idle_timeout:
+                logger.info("Worker idle for %ss, shutting down", idle_timeout)
+                server.shutdown()
+                return
+
+    if idle_timeout:
+        threading.Thread(target=watch_idle, daemon=True).start()
+
+    logger.info("Worker %s serving %s", os.getpid(), socket_path)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        try:
+            socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def serve_stdio():
+    """Serve JSON-RPC over stdin/stdout until EOF or shutdown."""
+    worker = ScriptWorker()
+    stdin, stdout = sys.stdin, sys.stdout
+    for raw in stdin:
+        line = raw.strip()
+        if not line:
+            continue
+        response, stop = worker.handle(line)
+        stdout.write(json.dumps(response, default=str) + "\n")
+        stdout.flush()
+        if stop:
+            return
+
+
+# =============================================================================
+# Client
+# =============================================================================
+
+def _call(
+    method: str,
+    params: Dict[str, Any],
+    socket_path: Path = SOCKET_PATH,
+    timeout: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Send one request to the worker and return its result.
+
+    Only failures before the request is sent, and replies saying the job was
+    not started, raise WorkerUnavailable; anything after that raises
+    WorkerError or TimeoutExpired, since the job may have run.
+
+    Args:
+        method: JSON-RPC method
+        params: Method params
+        socket_path: Worker socket
+        timeout: Seconds the job may take; the reply is awaited for
+            RESPONSE_GRACE_SECONDS longer so the worker can report the timeout
+
+    Raises:
+        WorkerUnavailable: If the worker cannot be reached or declined the job
+        WorkerError: If the connection or the worker failed after the request was sent
+        subprocess.TimeoutExpired: If the job (or the reply) exceeded timeout
+    """
+    if not hasattr(socket, "AF_UNIX") or not Path(socket_path).exists():
+        raise WorkerUnavailable(f"No worker at {socket_path}")
+
+    request = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.settimeout(CONNECT_TIMEOUT_SECONDS)
+            sock.connect(str(socket_path))
+            sock.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        except OSError as e:
+            raise WorkerUnavailable(str(e))
+
+        try:
+            sock.settimeout(None if timeout is None else timeout + RESPONSE_GRACE_SECONDS)
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+        except socket.timeout:
+            raise subprocess.TimeoutExpired(f"worker:{method}", timeout)
+        except OSError as e:
+            raise WorkerError(f"Lost connection to worker: {e}")
+
+    if not line:
+        raise WorkerError("Worker closed the connection before replying")
+    try:
+        response = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise WorkerError(f"Unreadable worker reply: {e}")
+
+    if "error" in response:
+        code = response["error"].get("code")
+        message = response["error"].get("message", "Worker error")
+        if code == JOB_TIMEOUT:
+            raise subprocess.TimeoutExpired(f"worker:{method}", timeout)
+        if code in (PARSE_ERROR, METHOD_NOT_FOUND, INVALID_PARAMS, WORKER_BUSY):
+            raise WorkerUnavailable(message)
+        raise WorkerError(message)
+    return response["result"]
+
+
+def ping(socket_path: Path = SOCKET_PATH) -> Optional[Dict[str, Any]]:
+    """Worker status, or None if no worker is running."""
+    try:
+        return _call("ping", {}, socket_path=socket_path, timeout=2.0)
+    except (WorkerUnavailable, WorkerError, subprocess.TimeoutExpired):
+        return None
+
+
+def start_worker(socket_path: Path = SOCKET_PATH) -> bool:
+    """
+    Start a detached worker if none is running.
+
+    Returns:
+        True once a worker answers on socket_path
+    """
+    if ping(socket_path):
+        return True
+    env = dict(os.environ, MH1_WORKER_SOCKET=str(socket_path))
+    subprocess.Popen(
+        [sys.executable, str(Path(__file__).resolve()), "serve"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        cwd=str(PROJECT_ROOT),
+        env=env,
+        start_new_session=True
+    )
+    deadline = time.monotonic() + STARTUP_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        if ping(socket_path):
+            return True
+        time.sleep(0.1)
+    return False
+
+
+def run_script(
+    script: str,
+    args: Sequence[str] = (),
+    cwd: Optional[str] = None,
+    stdin: Optional[str] = None,
+    timeout: Optional[float] = None
+) -> ScriptResult:
+    """
+    Run a helper script, in the warm worker when possible.
+
+    Falls back to `python script args...` in a subprocess when the script
+    is not warm-safe, no worker is running (and autostart is off), or the
+    worker declines the job without running it. Errors after the worker
+    accepted the job are raised, not retried in a subprocess.
+
+    Args:
+        script: Script path
+        args: Command-line arguments
+        cwd: Working directory
+        stdin: Text piped to the script's stdin
+        timeout: Seconds to wait for the script (enforced by the worker for
+            warm jobs)
+
+    Returns:
+        ScriptResult
+
+    Raises:
+        subprocess.TimeoutExpired: If the script runs longer than timeout
+        WorkerError: If the worker failed after accepting the job
+    """
+    path = Path(script).resolve()
+    args = [str(a) for a in args]
+    cwd = cwd or os.getcwd()
+
+    if is_warm_script(path) and not os.environ.get("MH1_WORKER_DISABLE"):
+        if os.environ.get("MH1_WORKER_AUTOSTART"):
+            start_worker()
+        try:
+            result = _call(
+                "run",
+                {"script": str(path), "argv": args, "cwd": cwd, "stdin": stdin, "timeout": timeout},
+                timeout=timeout
+            )
+            return ScriptResult(**result)
+        except WorkerUnavailable as e:
+            logger.debug("Worker unavailable (%s), running %s in a subprocess", e, path.name)
+
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, str(path), *args],
+        input=stdin,
+        capture_output=True,
+        text=True,
+        cwd=cwd,
+        timeout=timeout
+    )
+    return ScriptResult(
+        returncode=proc.returncode,
+        stdout=proc.stdout,
+        stderr=proc.stderr,
+        duration_ms=int((time.perf_counter() - start) * 1000)
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="MH1 warm skill worker")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = sub.add_parser("serve", help="Run the worker")
+    serve_parser.add_argument("--stdio", action="store_true", help="JSON-RPC over stdin/stdout instead of a socket")
+    serve_parser.add_argument("--idle-timeout", type=float, default=IDLE_TIMEOUT_SECONDS,
+                              help="Exit after this many idle seconds (0 = never)")
+    sub.add_parser("status", help="Show worker status")
+    sub.add_parser("stop", help="Stop the worker")
+    run_parser = sub.add_parser("run", help="Run a script (in the worker if one is running)")
+    run_parser.add_argument("script")
+    run_parser.add_argument("args", nargs=argparse.REMAINDER)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+        if args.stdio:
+            serve_stdio()
+        else:
+            serve(idle_timeout=args.idle_timeout)
+        return 0
+
+    if args.command == "status":
+        status = ping()
+        print(json.dumps(status, indent=2) if status else "No worker running")
+        return 0 if status else 1
+
+    if args.command == "stop":
+        try:
+            _call("shutdown", {}, timeout=5.0)
+        except (WorkerUnavailable, WorkerError):
+            print("No worker running")
+            return 1
+        return 0
+
+    # Both bulk-upload tools read their JSON from stdin when given "-"
+    stdin = sys.stdin.read() if "-" in args.args else None
+    result = run_script(args.script, args.args, cwd=os.getcwd(), stdin=stdin)
+    sys.stdout.write(result.stdout)
+    sys.stderr.write(result.stderr)
+    return result.returncode
+
+
+__all__ = [
+    "IDLE_TIMEOUT_SECONDS",
+    "SOCKET_PATH",
+    "WARM_SCRIPTS",
+    "ScriptResult",
+    "ScriptWorker",
+    "WorkerBusy",
+    "WorkerError",
+    "WorkerUnavailable",
+    "is_warm_script",
+    "ping",
+    "run_script",
+    "serve",
+    "serve_stdio",
+    "start_worker",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Benchmark for BudgetManager.check_budget against a large run history
+
+Compares, for tenants with a long telemetry history:
+1. Legacy path: rolling 1-day and 30-day scans over runs, a reservation SUM
+   and an expired-reservation cleanup write per check (the pre-rollup
+   check_budget)
+2. Rollup path: BudgetManager.check_budget, summing per-tenant daily
+   rollups (plus one partial day of runs) and the in-memory reservation
+   ledger
+
+The benchmark uses a throwaway database (MH1_STORAGE_DB), never the real one.
+
+Usage:
+    python automation/scripts/benchmark_budget.py
+    python automation/scripts/benchmark_budget.py --runs 1000000 --tenants 100 --checks 2000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Point the storage engine at a scratch database before lib is imported
+SCRATCH_DIR = Path(tempfile.mkdtemp(prefix="mh1-budget-bench-"))
+os.environ["MH1_STORAGE_DB"] = str(SCRATCH_DIR / "bench.db")
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from lib.budget import BudgetManager
+from lib.telemetry import RUN_COLUMNS, estimate_cost, get_storage_engine, init_db
+
+
+def populate(n_runs: int, n_tenants: int, days: int, seed: int) -> float:
+    """Insert n_runs historical runs spread over the last `days` days."""
+    rng = random.Random(seed)
+    engine = get_storage_engine()
+    now = datetime.now(timezone.utc)
+    chunk = 50000
+
+    sql = (
+        f"INSERT INTO runs ({', '.join(RUN_COLUMNS)}) "
+        f"VALUES ({', '.join('?' for _ in RUN_COLUMNS)})"
+    )
+
+    start = time.perf_counter()
+    for offset in range(0, n_runs, chunk):
+        rows = []
+        for i in range(offset, min(offset + chunk, n_runs)):
+            tokens_input = rng.randint(1000, 20000)
+            tokens_output = rng.randint(200, 4000)
+            started = now - timedelta(seconds=rng.uniform(0, days * 86400))
+            row = dict.fromkeys(RUN_COLUMNS)
+            row.update(
+                run_id=f"bench-{i}",
+                tenant_id=f"tenant-{i % n_tenants}",
+                type="skill",
+                name="benchmark",
+                status="success",
+                start_time=started.isoformat(),
+                tokens_input=tokens_input,
+                tokens_output=tokens_output,
+                tokens_total=tokens_input + tokens_output,
+                cost_estimate_usd=estimate_cost(tokens_input, tokens_output),
+            )
+            rows.append(tuple(row[c] for c in RUN_COLUMNS))
+        engine.executemany(sql, rows)
+    return time.perf_counter() - start
+
+
+def legacy_check(tenant_id: str) -> tuple:
+    """The pre-rollup check_budget queries, for comparison."""
+    engine = get_storage_engine()
+    now = datetime.now(timezone.utc)
+
+    engine.execute("""
+        UPDATE budget_reservations
+        SET status = 'expired'
+        WHERE status = 'active' AND expires_at <= datetime('now')
+    """)
+
+    with engine.read() as conn:
+        totals = []
+        for days in (1, 30):
+            cutoff = (now - timedelta(days=days)).isoformat()
+            totals.append(conn.execute("""
+                SELECT COUNT(*), SUM(tokens_input), SUM(tokens_output), SUM(cost_estimate_usd)
+                FROM runs
+                WHERE tenant_id = ? AND start_time > ?
+            """, (tenant_id, cutoff)).fetchone()[3] or 0)
+        reserved = conn.execute("""
+            SELECT COALESCE(SUM(amount_usd), 0.0)
+            FROM budget_reservations
+            WHERE tenant_id = ? AND status = 'active' AND expires_at > datetime('now')
+        """, (tenant_id,)).fetchone()[0]
+    return totals[0], totals[1], reserved
+
+
+def timed_checks(fn, tenants: list, n_checks: int) -> float:
+    """Average seconds per call of fn over n_checks tenant lookups."""
+    start = time.perf_counter()
+    for i in range(n_checks):
+        fn(tenants[i % len(tenants)])
+    return (time.perf_counter() - start) / n_checks
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark budget checks over a large run history")
+    parser.add_argument("--runs", type=int, default=1_000_000, help="Historical runs to insert")
+    parser.add_argument("--tenants", type=int, default=100)
+    parser.add_argument("--days", type=int, default=90, help="Days of history")
+    parser.add_argument("--checks", type=int, default=2000, help="Budget checks per path")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"Scratch database: {os.environ['MH1_STORAGE_DB']}")
+    init_db()
+    budget = BudgetManager()
+
+    insert_time = populate(args.runs, args.tenants, args.days, args.seed)
+    print(f"Inserted {args.runs:,} runs for {args.tenants} tenants in {insert_time:.1f}s "
+          f"({args.runs / insert_time:,.0f} runs/s with rollup triggers)")
+
+    tenants = [f"tenant-{i}" for i in range(args.tenants)]
+    for tenant_id in tenants[:10]:
+        budget.reserve_budget(tenant_id, 0.25)
+
+    legacy = timed_checks(legacy_check, tenants, args.checks)
+    rollup = timed_checks(budget.check_budget, tenants, args.checks)
+
+    print(f"\n=== check_budget ({args.checks:,} checks) ===")
+    print(f"  legacy  (scans + cleanup write): {legacy * 1000:8.3f} ms/check")
+    print(f"  rollup  (daily rollups + ledger): {rollup * 1000:8.3f} ms/check  "
+          f"({legacy / rollup:5.1f}x)")
+
+    status = budget.check_budget(tenants[0])
+    print(f"\n  {tenants[0]}: last 24h ${status.daily_spent:.2f}, last 30 days ${status.monthly_spent:.2f}, "
+          f"status {status.status}")
+
+    get_storage_engine().close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
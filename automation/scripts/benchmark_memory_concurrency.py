@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Concurrency benchmark for Predictor.get_guidance over the memory stores
+
+Runs get_guidance from many threads (20 by default) against semantic and
+procedural stores backed by an in-memory Firebase stand-in that adds a fixed
+latency to every call, with a consolidation sweep running in the background.
+
+Compares:
+1. Serialized path: every store call wrapped in that store's single RLock,
+   and the consolidation sweep holding the semantic lock throughout (how
+   the stores behaved before the lock-free read path)
+2. Lock-free path: the stores as they are, with reads taking no store-wide
+   lock and consolidation serialized only with itself
+
+No real Firebase project is used.
+
+Usage:
+    python automation/scripts/benchmark_memory_concurrency.py
+    python automation/scripts/benchmark_memory_concurrency.py --threads 20 --latency-ms 20 --calls 50
+"""
+
+import argparse
+import copy
+import logging
+import random
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from lib.intelligence.learning.predictor import Predictor
+from lib.intelligence.memory import ProceduralMemoryStore, SemanticMemoryStore
+from lib.intelligence.types import Domain, ProceduralKnowledge, SemanticPattern
+
+DOMAINS = [Domain.CONTENT, Domain.REVENUE, Domain.HEALTH, Domain.CAMPAIGN]
+
+
+class LatencyFirebase:
+    """In-memory document store that sleeps `latency` seconds per call."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+        self._docs = {}
+        self._lock = threading.Lock()
+
+    def _io(self):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.latency)
+
+    def set_document(self, collection, doc_id, data, merge=False):
+        self._io()
+        with self._lock:
+            self._docs.setdefault(collection, {})[doc_id] = copy.deepcopy(data)
+        return True
+
+    def get_document(self, collection, doc_id):
+        self._io()
+        with self._lock:
+            doc = self._docs.get(collection, {}).get(doc_id)
+            return dict(copy.deepcopy(doc), _id=doc_id) if doc is not None else None
+
+    def update_document(self, collection, doc_id, data):
+        self._io()
+        with self._lock:
+            self._docs.setdefault(collection, {}).setdefault(doc_id, {}).update(copy.deepcopy(data))
+        return True
+
+    def delete_document(self, collection, doc_id):
+        self._io()
+        with self._lock:
+            self._docs.get(collection, {}).pop(doc_id, None)
+        return True
+
+    def query(self, collection, filters=None, limit=None, order_by=None, order_direction="ASCENDING"):
+        self._io()
+        with self._lock:
+            docs = [dict(copy.deepcopy(d), _id=k) for k, d in self._docs.get(collection, {}).items()]
+        for field, op, value in filters or []:
+            if op == "==":
+                docs = [d for d in docs if d.get(field) == value]
+        if order_by:
+            docs.sort(key=lambda d: d.get(order_by) or 0, reverse=order_direction == "DESCENDING")
+        return docs[:limit] if limit else docs
+
+    def get_collection(self, collection, limit=None, order_by=None, order_direction="ASCENDING"):
+        return self.query(collection, None, limit, order_by, order_direction)
+
+
+class SerializedStore:
+    """Proxy running every store method under one RLock, like the old stores."""
+
+    def __init__(self, store):
+        self._store = store
+        self._lock = threading.RLock()
+
+    def __getattr__(self, name):
+        attr = getattr(self._store, name)
+        if not callable(attr):
+            return attr
+
+        def locked(*args, **kwargs):
+            with self._lock:
+                return attr(*args, **kwargs)
+        return locked
+
+
+def seed(firebase: LatencyFirebase, n_skills: int, rng: random.Random) -> list:
+    """Write patterns and procedural knowledge directly (no latency)."""
+    latency, firebase.latency = firebase.latency, 0.0
+    semantic = SemanticMemoryStore(firebase)
+    procedural = ProceduralMemoryStore(firebase)
+    skills = [f"skill-{i}" for i in range(n_skills)]
+
+    for i, skill in enumerate(skills):
+        domain = DOMAINS[i % len(DOMAINS)]
+        for j in range(5):
+            semantic.store(SemanticPattern(
+                skill_name=skill,
+                domain=domain,
+                condition={"segment": rng.choice(["smb", "enterprise"])},
+                recommendation={"send_hour": rng.randint(6, 20), "variant": j},
+                confidence=rng.uniform(0.5, 0.95),
+                evidence_count=rng.randint(1, 40),
+                recent_accuracy=rng.uniform(0.5, 1.0),
+            ))
+    for i in range(10):
+        procedural.store(ProceduralKnowledge(
+            description=f"cross-skill rule {i}",
+            pattern_type="timing",
+            knowledge={"send_hour": rng.randint(6, 20)},
+            applicable_skills=rng.sample(skills, k=min(len(skills), 4)),
+            applicable_domains=[d.value for d in DOMAINS],
+            cross_skill_confidence=rng.uniform(0.6, 0.9),
+        ))
+
+    firebase.latency = latency
+    firebase.calls = 0
+    return skills
+
+
+def run(predictor, semantic, skills, threads: int, calls: int, consolidate: bool) -> dict:
+    """Call get_guidance `calls` times from each of `threads` threads."""
+    latencies = []
+    latencies_lock = threading.Lock()
+    stop = threading.Event()
+    sweeps = [0]
+
+    def consolidation_loop():
+        while not stop.is_set():
+            semantic.forget_stale_patterns()
+            sweeps[0] += 1
+
+    def worker(worker_id: int):
+        rng = random.Random(worker_id)
+        local = []
+        for _ in range(calls):
+            i = rng.randrange(len(skills))
+            start = time.perf_counter()
+            predictor.get_guidance(
+                skill_name=skills[i],
+                tenant_id="bench-tenant",
+                domain=DOMAINS[i % len(DOMAINS)],
+                context={"segment": "smb"},
+            )
+            local.append(time.perf_counter() - start)
+        with latencies_lock:
+            latencies.extend(local)
+
+    background = threading.Thread(target=consolidation_loop, daemon=True) if consolidate else None
+    if background:
+        background.start()
+
+    workers = [threading.Thread(target=worker, args=(w,)) for w in range(threads)]
+    start = time.perf_counter()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    if background:
+        background.join()
+
+    latencies.sort()
+    return {
+        "throughput": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "sweeps": sweeps[0],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark concurrent get_guidance throughput")
+    parser.add_argument("--threads", type=int, default=20)
+    parser.add_argument("--calls", type=int, default=25, help="get_guidance calls per thread")
+    parser.add_argument("--latency-ms", type=float, default=10.0, help="Simulated Firebase latency per call")
+    parser.add_argument("--skills", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    # Keep the exploration fallback's warnings out of the output
+    logging.basicConfig(level=logging.ERROR)
+
+    firebase = LatencyFirebase(args.latency_ms / 1000)
+    skills = seed(firebase, args.skills, random.Random(args.seed))
+
+    semantic = SemanticMemoryStore(firebase)
+    procedural = ProceduralMemoryStore(firebase)
+    legacy_semantic = SerializedStore(SemanticMemoryStore(firebase))
+    legacy_procedural = SerializedStore(ProceduralMemoryStore(firebase))
+
+    paths = [
+        ("serialized", Predictor(legacy_semantic, legacy_procedural), legacy_semantic),
+        ("lock-free", Predictor(semantic, procedural), semantic),
+    ]
+
+    total = args.threads * args.calls
+    print(f"{args.threads} threads x {args.calls} calls, {args.latency_ms:.0f} ms per Firebase call, "
+          f"{args.skills} skills")
+
+    for consolidate in (False, True):
+        label = "with consolidation sweeps" if consolidate else "reads only"
+        print(f"\n=== get_guidance, {label} ({total:,} calls) ===")
+        baseline = None
+        for name, predictor, store in paths:
+            result = run(predictor, store, skills, args.threads, args.calls, consolidate)
+            baseline = baseline or result["throughput"]
+            sweeps = f", {result['sweeps']} sweeps" if consolidate else ""
+            print(f"  {name:<10} {result['throughput']:8.1f} calls/s  "
+                  f"p50 {result['p50_ms']:7.1f} ms  p95 {result['p95_ms']:7.1f} ms  "
+                  f"({result['throughput'] / baseline:5.1f}x{sweeps})")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
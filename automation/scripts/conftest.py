@@ -0,0 +1,100 @@
+"""
+Shared fixtures for the automation/lib tests.
+"""
+
+import copy
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add automation/ to path for lib.* imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+@pytest.fixture
+def isolated_storage(tmp_path, monkeypatch):
+    """
+    Point the shared storage engine and run files at tmp_path.
+
+    The paths are read at import, so the already-loaded modules are
+    repointed as well as the environment. Yields the StorageEngine.
+    """
+    from lib import rate_limiter, storage_engine, telemetry
+
+    runs_dir = tmp_path / "runs"
+    runs_dir.mkdir()
+    db_path = tmp_path / "mh1.db"
+    monkeypatch.setenv("MH1_RUNS_DIR", str(runs_dir))
+    monkeypatch.setenv("MH1_STORAGE_DB", str(db_path))
+
+    engine = storage_engine.StorageEngine(db_path)
+    monkeypatch.setattr(storage_engine, "STORAGE_DB_PATH", db_path)
+    monkeypatch.setattr(storage_engine, "_engine", engine)
+    monkeypatch.setattr(rate_limiter, "_buckets", {})
+    monkeypatch.setattr(telemetry, "RUNS_DIR", runs_dir)
+    monkeypatch.setattr(telemetry, "_write_behind", None)
+
+    yield engine
+
+    if telemetry._write_behind is not None:
+        telemetry._write_behind.close()
+    engine.close()
+
+
+class InMemoryFirebase:
+    """Document store with the FirebaseClient methods the memory stores use."""
+
+    def __init__(self):
+        self.calls = 0
+        self._docs = {}
+        self._lock = threading.Lock()
+
+    def _count(self):
+        with self._lock:
+            self.calls += 1
+
+    def set_document(self, collection, doc_id, data, merge=False):
+        self._count()
+        with self._lock:
+            self._docs.setdefault(collection, {})[doc_id] = copy.deepcopy(data)
+        return True
+
+    def get_document(self, collection, doc_id):
+        self._count()
+        with self._lock:
+            doc = self._docs.get(collection, {}).get(doc_id)
+            return dict(copy.deepcopy(doc), _id=doc_id) if doc is not None else None
+
+    def update_document(self, collection, doc_id, data):
+        self._count()
+        with self._lock:
+            self._docs.setdefault(collection, {}).setdefault(doc_id, {}).update(copy.deepcopy(data))
+        return True
+
+    def delete_document(self, collection, doc_id):
+        self._count()
+        with self._lock:
+            self._docs.get(collection, {}).pop(doc_id, None)
+        return True
+
+    def query(self, collection, filters=None, limit=None, order_by=None, order_direction="ASCENDING"):
+        self._count()
+        with self._lock:
+            docs = [dict(copy.deepcopy(d), _id=k) for k, d in self._docs.get(collection, {}).items()]
+        for field, op, value in filters or []:
+            if op == "==":
+                docs = [d for d in docs if d.get(field) == value]
+        if order_by:
+            docs.sort(key=lambda d: d.get(order_by) or 0, reverse=order_direction == "DESCENDING")
+        return docs[:limit] if limit else docs
+
+    def get_collection(self, collection, limit=None, order_by=None, order_direction="ASCENDING"):
+        return self.query(collection, None, limit, order_by, order_direction)
+
+
+@pytest.fixture
+def memory_firebase():
+    """An empty in-memory stand-in for the Firebase client."""
+    return InMemoryFirebase()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Tests for batch scoring in lib/intelligence/adapters.
+
+score_batch() must return what score() returns for each event, including
+invalid and partial events.
+
+Run with:
+    python -m pytest automation/scripts/test_adapters.py -v
+"""
+
+import math
+import random
+from unittest.mock import patch
+
+import pytest
+
+from lib.intelligence.adapters import (
+    CampaignAdapter,
+    ContentAdapter,
+    HealthAdapter,
+    RevenueAdapter,
+)
+from lib.intelligence.adapters import base
+from lib.intelligence.adapters.base import EventBatch
+
+
+def health_events(rng):
+    event = {
+        "days_since_last_activity": rng.randint(0, 120),
+        "activities_per_month": rng.randint(0, 30),
+        "nps_score": rng.randint(-100, 100),
+    }
+    context = {
+        "contract_tier": rng.choice(["enterprise", "starter", "free"]),
+        "customer_age_months": rng.randint(1, 48),
+        "open_support_tickets": rng.randint(0, 5),
+    }
+    return event, context
+
+
+def content_events(rng):
+    event = {
+        "impressions": rng.randint(0, 50000),
+        "likes": rng.randint(0, 500),
+        "comments": rng.randint(0, 50),
+        "platform": rng.choice(["linkedin", "twitter", "email"]),
+        "hours_since_post": rng.uniform(0, 96),
+    }
+    context = {"follower_count": rng.randint(100, 100000)}
+    return event, context
+
+
+def campaign_events(rng):
+    event = {
+        "spend": rng.uniform(0, 5000),
+        "conversions": rng.randint(0, 50),
+        "channel": rng.choice(["paid_search", "display", "email"]),
+    }
+    context = {"funnel_stage": rng.choice(["awareness", "decision"])}
+    return event, context
+
+
+def revenue_events(rng):
+    event = {
+        "previous_stage": rng.choice(["lead", "mql", "sql"]),
+        "current_stage": rng.choice(["mql", "sql", "won"]),
+        "actual_days": rng.randint(1, 90),
+        "deal_value": rng.randint(0, 200000),
+    }
+    context = {"segment": rng.choice(["enterprise", "smb"])}
+    return event, context
+
+
+ADAPTERS = [
+    (HealthAdapter, health_events),
+    (ContentAdapter, content_events),
+    (CampaignAdapter, campaign_events),
+    (RevenueAdapter, revenue_events),
+]
+
+
+def make_batch(make, size=60, seed=3):
+    """Full, partial (some keys dropped) and empty events with contexts."""
+    rng = random.Random(seed)
+    events, contexts = [], []
+    for i in range(size):
+        event, context = make(rng)
+        if i % 3 == 1:
+            for key in rng.sample(sorted(event), k=rng.randint(1, len(event))):
+                del event[key]
+        elif i % 3 == 2:
+            event = {}
+        events.append(event)
+        contexts.append(context)
+    return events, contexts
+
+
+def assert_same(batch_result, scalar_result):
+    """Compare ScoringResult dicts, allowing last-bit float differences."""
+    def compare(a, b, path):
+        assert a.keys() == b.keys(), path
+        for key, value in a.items():
+            if isinstance(value, dict):
+                compare(value, b[key], f"{path}.{key}")
+            elif isinstance(value, float):
+                assert math.isclose(value, b[key], rel_tol=1e-12, abs_tol=1e-12), f"{path}.{key}"
+            elif key != "explanation":
+                assert value == b[key], f"{path}.{key}"
+
+    compare(batch_result.to_dict(), scalar_result.to_dict(), "result")
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "fallback"])
+def use_numpy(request):
+    if request.param and not base.HAS_NUMPY:
+        pytest.skip("NumPy not installed")
+    with patch.object(base, "HAS_NUMPY", request.param):
+        yield request.param
+
+
+class TestScoreBatch:
+    """Test that batch and scalar scoring agree."""
+
+    @pytest.mark.parametrize("adapter_cls, make", ADAPTERS, ids=lambda a: getattr(a, "__name__", ""))
+    def test_matches_scalar(self, adapter_cls, make, use_numpy):
+        """Test score_batch(events) == [score(e) for e in events]."""
+        adapter = adapter_cls()
+        events, contexts = make_batch(make)
+
+        batch = adapter.score_batch(events, contexts)
+        scalar = [adapter.score(e, c) for e, c in zip(events, contexts)]
+
+        assert len(batch) == len(scalar)
+        for batch_result, scalar_result in zip(batch, scalar):
+            assert_same(batch_result, scalar_result)
+
+    @pytest.mark.parametrize("adapter_cls, make", ADAPTERS, ids=lambda a: getattr(a, "__name__", ""))
+    def test_invalid_events(self, adapter_cls, make, use_numpy):
+        """Test that invalid events give score()'s invalid-event result."""
+        adapter = adapter_cls()
+        results = adapter.score_batch([{}, {}], {})
+
+        for result in results:
+            assert_same(result, adapter.score({}, {}))
+            assert result.components == {"error": "invalid_event"}
+
+    def test_invalid_events_not_scored(self):
+        """Test that the batch hooks only see valid events."""
+        if not base.HAS_NUMPY:
+            pytest.skip("NumPy not installed")
+        adapter = RevenueAdapter()
+        seen = []
+        signal = adapter._batch_signal
+
+        def record_signal(events, contexts):
+            seen.append(events.values("deal_value"))
+            return signal(events, contexts)
+
+        events = [{"deal_value": 100}, {}, {"deal_value": 300, "current_stage": "sql"}]
+        with patch.object(adapter, "_batch_signal", side_effect=record_signal):
+            columns = adapter.score_columns(events, {})
+
+        assert seen == [[100, 300]]
+        assert columns["valid"].tolist() == [True, False, True]
+        assert columns["score"][1] == 0.0
+
+    def test_shared_context_and_event_batch_input(self):
+        """Test EventBatch input with one shared context."""
+        if not base.HAS_NUMPY:
+            pytest.skip("NumPy not installed")
+        adapter = HealthAdapter()
+        events, _ = make_batch(health_events, size=12)
+        context = {"contract_tier": "enterprise"}
+
+        batch = adapter.score_batch(EventBatch.from_records(events), context)
+        for result, event in zip(batch, events):
+            assert_same(result, adapter.score(event, context))
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Tests for dependency-aware phase scheduling (lib/agent_council.py).
+
+Run with:
+    python -m pytest automation/scripts/test_agent_council.py -v
+"""
+
+import threading
+import time
+
+import pytest
+
+from lib.agent_council import (
+    Agent,
+    AgentCouncil,
+    AgentRegistry,
+    AgentRole,
+    CouncilAssignment,
+    ExecutionPlan,
+)
+
+# Diamond a -> (b, c) -> d, plus e with no dependencies
+DEPENDENCIES = {"b": ["a"], "c": ["a"], "d": ["b", "c"]}
+DURATIONS = {"a": 0.05, "b": 0.15, "c": 0.05, "d": 0.05, "e": 0.1}
+
+
+@pytest.fixture
+def council(tmp_path):
+    return AgentCouncil(registry=AgentRegistry(agents_dir=str(tmp_path)), max_concurrency=4)
+
+
+def make_plan(dependencies=DEPENDENCIES, workers=("w1", "w2")):
+    assignment = CouncilAssignment(
+        orchestrator=Agent(name="lead", role=AgentRole.ORCHESTRATOR, path="lead.md"),
+        workers=[Agent(name=w, role=AgentRole.WORKER, path=f"{w}.md") for w in workers],
+        evaluators=[Agent(name="checker", role=AgentRole.EVALUATOR, path="checker.md")],
+        task_type="research",
+    )
+    plan = ExecutionPlan(
+        plan_id="plan-1",
+        task_description="test",
+        assignment=assignment,
+        phases=[
+            {"phase_id": phase_id, "name": phase_id, "workers": list(workers)}
+            for phase_id in DURATIONS
+        ],
+        dependencies=dependencies,
+    )
+    return assignment, plan
+
+
+class RecordingExecutor:
+    """An executor that sleeps per phase and records when each call runs."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = []
+        self.seen_dependencies = {}
+
+    def __call__(self, worker_name, context):
+        phase_id = context["phase_id"]
+        start = time.monotonic()
+        time.sleep(DURATIONS[phase_id])
+        with self.lock:
+            self.calls.append((phase_id, start, time.monotonic()))
+            self.seen_dependencies[phase_id] = sorted(context["dependencies"])
+        return {"worker": worker_name}
+
+    def span(self, phase_id):
+        starts, ends = zip(*[(s, e) for p, s, e in self.calls if p == phase_id])
+        return min(starts), max(ends)
+
+
+class TestPhaseDag:
+    """Test that execute_with_council schedules phases as a DAG."""
+
+    def test_phase_never_starts_before_dependencies(self, council):
+        """Test that every worker call starts after all its phase's dependencies finished."""
+        assignment, plan = make_plan()
+        executor = RecordingExecutor()
+
+        result = council.execute_with_council(assignment, plan, executor=executor)
+
+        assert result["status"] == "completed"
+        for phase_id, deps in DEPENDENCIES.items():
+            start, _ = executor.span(phase_id)
+            for dep in deps:
+                assert executor.span(dep)[1] <= start, f"{phase_id} started before {dep} finished"
+            assert executor.seen_dependencies[phase_id] == sorted(deps)
+
+    def test_independent_phases_overlap(self, council):
+        """Test that phases without a dependency path between them run concurrently."""
+        assignment, plan = make_plan()
+        executor = RecordingExecutor()
+
+        result = council.execute_with_council(assignment, plan, executor=executor)
+
+        b_start, b_end = executor.span("b")
+        c_start, c_end = executor.span("c")
+        e_start, e_end = executor.span("e")
+        assert c_start < b_end and b_start < c_end
+        assert e_start < executor.span("a")[1]
+        assert result["timing"]["critical_path"] == ["a", "b", "d"]
+        assert [p["phase_id"] for p in result["phases"]] == list(DURATIONS)
+
+    def test_cycle_fails_without_running(self, council):
+        """Test that a dependency cycle fails the run before any phase starts."""
+        assignment, plan = make_plan(dependencies={"a": ["d"], **DEPENDENCIES})
+        executor = RecordingExecutor()
+
+        result = council.execute_with_council(assignment, plan, executor=executor)
+
+        assert result["status"] == "failed"
+        assert "cycle" in result["error"]
+        assert executor.calls == []
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for the BudgetManager reservation ledger.
+
+Run with:
+    python -m pytest automation/scripts/test_budget.py -v
+"""
+
+import threading
+import time
+
+import pytest
+
+from lib import budget
+from lib.budget import BudgetManager, ReservationLedger
+
+
+@pytest.fixture
+def manager(isolated_storage, monkeypatch):
+    """A BudgetManager on a scratch database with a fresh ledger."""
+    monkeypatch.setattr(budget, "_reservation_ledger", ReservationLedger())
+    return BudgetManager()
+
+
+class TestReservationLedger:
+    """Test the in-memory ledger against its database rows."""
+
+    def test_reserve_and_release(self, manager):
+        """Test that reservations count until released."""
+        reservation_id = manager.reserve_budget("tenant_a", 2.5)
+
+        assert manager._get_active_reservations("tenant_a") == pytest.approx(2.5)
+        manager.release_reservation(reservation_id)
+        assert manager._get_active_reservations("tenant_a") == 0
+
+    def test_reserve_release_during_forced_reloads(self, manager, monkeypatch):
+        """Test that reloads racing reserve/release neither drop nor revive entries."""
+        manager.get_config("tenant_a")
+        execute = manager.engine.execute
+
+        def slow_execute(*args, **kwargs):
+            # Widen the gap between the ledger change and the queued write
+            time.sleep(0.001)
+            return execute(*args, **kwargs)
+
+        monkeypatch.setattr(manager.engine, "execute", slow_execute)
+        stop = threading.Event()
+        kept = []
+        kept_lock = threading.Lock()
+
+        def reload_loop():
+            while not stop.is_set():
+                budget._reservation_ledger._loaded_at.pop("tenant_a", None)
+                manager._ensure_ledger_loaded("tenant_a")
+
+        def reserve_loop(worker):
+            for i in range(40):
+                reservation_id = manager.reserve_budget("tenant_a", 0.01)
+                assert reservation_id is not None
+                if i % 2:
+                    manager.release_reservation(reservation_id)
+                else:
+                    with kept_lock:
+                        kept.append(reservation_id)
+
+        reloaders = [threading.Thread(target=reload_loop) for _ in range(2)]
+        workers = [threading.Thread(target=reserve_loop, args=(w,)) for w in range(4)]
+        for thread in reloaders + workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        stop.set()
+        for thread in reloaders:
+            thread.join()
+
+        expected = pytest.approx(0.01 * len(kept))
+        assert budget._reservation_ledger.total("tenant_a") == expected
+
+        # A reload from the database agrees with the ledger
+        budget._reservation_ledger._loaded_at.pop("tenant_a", None)
+        assert manager._get_active_reservations("tenant_a") == expected
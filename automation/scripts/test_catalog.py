@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Tests for the incremental skill and agent catalog (lib/catalog.py).
+
+Run with:
+    python -m pytest automation/scripts/test_catalog.py -v
+"""
+
+import json
+import os
+import shutil
+
+import pytest
+
+from lib.catalog import Catalog
+
+
+def write_skill(root, category, name, description, version="1.0.0"):
+    skill_dir = root / category / name
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    skill_md = skill_dir / "SKILL.md"
+    skill_md.write_text(
+        f"---\nname: {name}\ndescription: {description}\n"
+        f"metadata:\n  version: {version}\n---\n\n# {name}\n"
+    )
+    return skill_dir
+
+
+def bump_mtime(path, seconds=10):
+    """Move a path's mtime forward so the change is visible at any resolution."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 1_000_000_000))
+
+
+@pytest.fixture
+def tree(tmp_path):
+    skills = tmp_path / "skills"
+    agents = tmp_path / "agents"
+    write_skill(skills, "analysis-skills", "lifecycle-audit", "Audit customer lifecycle")
+    write_skill(skills, "search-skills", "reddit-keyword-search", "Search Reddit")
+    (agents / "workers").mkdir(parents=True)
+    (agents / "workers" / "researcher.md").write_text("---\nname: researcher\n---\nResearches topics\n")
+    return tmp_path
+
+
+def make_catalog(tree):
+    catalog = Catalog(
+        path=tree / "catalog.json",
+        skill_roots=[tree / "skills"],
+        agent_roots=[tree / "agents"],
+    )
+    catalog.refresh()
+    return catalog
+
+
+class TestCatalogRebuild:
+    """Test that refresh() follows SKILL.md and agent changes."""
+
+    def test_initial_scan(self, tree):
+        """Test that skills and agents are indexed with their metadata."""
+        catalog = make_catalog(tree)
+
+        assert [s["dir_name"] for s in catalog.skills] == ["lifecycle-audit", "reddit-keyword-search"]
+        skill = catalog.get_skill("lifecycle-audit")
+        assert skill["category"] == "analysis"
+        assert skill["version"] == "1.0.0"
+        assert catalog.get_agent("researcher")["role"] == "worker"
+
+    def test_unchanged_tree_is_not_reparsed(self, tree):
+        """Test that a refresh with no changes reuses every entry."""
+        catalog = make_catalog(tree)
+        parsed = catalog.get_stats()["parsed"]
+        generation = catalog.generation
+
+        assert catalog.refresh() is False
+        assert catalog.get_stats()["parsed"] == parsed
+        assert catalog.generation == generation
+
+    def test_edited_skill_md_is_reparsed(self, tree):
+        """Test that editing one SKILL.md re-parses only that skill."""
+        catalog = make_catalog(tree)
+        parsed = catalog.get_stats()["parsed"]
+        untouched = catalog.get_skill("reddit-keyword-search")
+
+        skill_md = tree / "skills" / "analysis-skills" / "lifecycle-audit" / "SKILL.md"
+        write_skill(tree / "skills", "analysis-skills", "lifecycle-audit", "Audit churn risk", "2.0.0")
+        bump_mtime(skill_md)
+
+        assert catalog.refresh() is True
+        skill = catalog.get_skill("lifecycle-audit")
+        assert skill["description"] == "Audit churn risk"
+        assert skill["version"] == "2.0.0"
+        assert catalog.get_stats()["parsed"] == parsed + 1
+        assert catalog.get_skill("reddit-keyword-search") is untouched
+
+    def test_schema_change_is_reparsed(self, tree):
+        """Test that a new input schema updates the skill entry."""
+        catalog = make_catalog(tree)
+        schemas = tree / "skills" / "analysis-skills" / "lifecycle-audit" / "schemas"
+        schemas.mkdir()
+        (schemas / "input.json").write_text(json.dumps({"type": "object"}))
+
+        assert catalog.refresh() is True
+        assert catalog.get_skill("lifecycle-audit")["inputs"] == {"type": "object"}
+
+    def test_added_and_removed_skills(self, tree):
+        """Test that new skill directories appear and deleted ones disappear."""
+        catalog = make_catalog(tree)
+        category = tree / "skills" / "search-skills"
+
+        write_skill(tree / "skills", "search-skills", "twitter-keyword-search", "Search Twitter")
+        bump_mtime(category)
+        assert catalog.refresh() is True
+        assert catalog.get_skill("twitter-keyword-search") is not None
+
+        shutil.rmtree(category / "reddit-keyword-search")
+        bump_mtime(category, seconds=20)
+        assert catalog.refresh() is True
+        assert catalog.get_skill("reddit-keyword-search") is None
+        assert len(catalog.skills) == 2
+
+    def test_persisted_catalog_is_reused(self, tree):
+        """Test that a new process loads the file and only re-parses changes."""
+        make_catalog(tree)
+        write_skill(tree / "skills", "search-skills", "reddit-keyword-search", "Search subreddits")
+        bump_mtime(tree / "skills" / "search-skills" / "reddit-keyword-search" / "SKILL.md")
+
+        catalog = Catalog(
+            path=tree / "catalog.json",
+            skill_roots=[tree / "skills"],
+            agent_roots=[tree / "agents"],
+        )
+        assert catalog.get_stats()["loaded_from_disk"] is True
+        assert catalog.refresh() is True
+
+        assert catalog.get_stats()["parsed"] == 1
+        assert catalog.get_skill("reddit-keyword-search")["description"] == "Search subreddits"
+
+    def test_force_reparses_everything(self, tree):
+        """Test that refresh(force=True) ignores the previous signatures."""
+        catalog = make_catalog(tree)
+        parsed = catalog.get_stats()["parsed"]
+
+        assert catalog.refresh(force=True) is True
+        assert catalog.get_stats()["parsed"] == parsed + 3
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Tests for the bounded context cache (lib/context_cache.py).
+
+Run with:
+    python -m pytest automation/scripts/test_context_cache.py -v
+"""
+
+import os
+import threading
+
+import pytest
+
+from lib import context_cache
+from lib.context_cache import ContextCache
+
+
+class FakeClock:
+    """Stands in for time.monotonic() so TTLs do not depend on wall time."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(context_cache.time, "monotonic", clock)
+    return clock
+
+
+def touch(path, mtime_ns):
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestLruEviction:
+    """Test the entry and token bounds."""
+
+    def test_evicts_least_recently_used_entry(self):
+        """Test that the oldest untouched entry goes first."""
+        cache = ContextCache(max_entries=3)
+        for key in ("a", "b", "c"):
+            cache.set(key, key)
+
+        assert cache.get("a") == "a"  # a is now most recently used
+        cache.set("d", "d")
+
+        assert cache.get("b") is None
+        assert [cache.get(k) for k in ("a", "c", "d")] == ["a", "c", "d"]
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_token_bound(self):
+        """Test that total estimated tokens stay within max_tokens."""
+        cache = ContextCache(max_tokens=10, sizeof=len)
+        cache.set("a", "x" * 4)
+        cache.set("b", "x" * 4)
+        cache.set("c", "x" * 4)
+
+        stats = cache.get_stats()
+        assert cache.get("a") is None
+        assert stats["size_tokens"] == 8
+        assert stats["entries"] == 2
+
+    def test_oversized_value_rejected(self):
+        """Test that a value larger than the whole cache is not stored."""
+        cache = ContextCache(max_tokens=10, sizeof=len)
+        cache.set("small", "x")
+        cache.set("huge", "x" * 11)
+
+        assert cache.get("huge") is None
+        assert cache.get("small") == "x"
+        assert cache.get_stats()["rejected"] == 1
+
+
+class TestFileInvalidation:
+    """Test file-backed entries."""
+
+    def test_mtime_change_invalidates(self, tmp_path):
+        """Test that editing a source file drops the entry."""
+        source = tmp_path / "SKILL.md"
+        source.write_text("v1")
+        touch(source, 1_000_000_000)
+        cache = ContextCache()
+        cache.set("skill_metadata:x", {"v": 1}, sources=[source])
+
+        assert cache.get("skill_metadata:x") == {"v": 1}
+        touch(source, 2_000_000_000)
+
+        assert cache.get("skill_metadata:x") is None
+        assert cache.get_stats()["invalidations"] == 1
+
+    def test_size_change_invalidates(self, tmp_path):
+        """Test that a same-mtime edit that changes size is caught."""
+        source = tmp_path / "SKILL.md"
+        source.write_text("v1")
+        touch(source, 1_000_000_000)
+        cache = ContextCache()
+        cache.set("k", "v1", sources=[source])
+
+        source.write_text("version 2")
+        touch(source, 1_000_000_000)
+        assert cache.get("k") is None
+
+    def test_new_source_file_invalidates(self, tmp_path):
+        """Test that a missing source that appears drops the entry."""
+        missing = tmp_path / "agent.md"
+        cache = ContextCache()
+        cache.set("agent_metadata:x", None, sources=[missing])
+        cache.set("agent_metadata:y", "kept", sources=[tmp_path / "other.md"])
+
+        missing.write_text("new agent")
+        assert cache.get("agent_metadata:x") is None
+        assert cache.get("agent_metadata:y") == "kept"
+
+    def test_file_backed_entries_do_not_expire(self, tmp_path, clock):
+        """Test that file-backed entries ignore default_ttl."""
+        source = tmp_path / "SKILL.md"
+        source.write_text("v1")
+        cache = ContextCache(default_ttl=300)
+        cache.set("file", "v1", sources=[source])
+        cache.set("ttl", "v1")
+
+        clock.now += 301
+        assert cache.get("file") == "v1"
+        assert cache.get("ttl") is None
+
+
+class TestStaleWhileRevalidate:
+    """Test get_or_load() with stale_ttl."""
+
+    def test_serves_stale_and_refreshes_once(self, clock):
+        """Test that a stale value is served while one background load runs."""
+        cache = ContextCache()
+        release = threading.Event()
+        loads = []
+
+        def loader():
+            loads.append(1)
+            if len(loads) > 1:
+                release.wait(5)
+            return len(loads)
+
+        assert cache.get_or_load("profile", loader, ttl=300, stale_ttl=3600) == 1
+        clock.now += 301
+        assert cache.get_or_load("profile", loader, ttl=300, stale_ttl=3600) == 1
+        assert cache.get_or_load("profile", loader, ttl=300, stale_ttl=3600) == 1
+
+        release.set()
+        cache._refresh_pool.shutdown(wait=True)
+        assert cache.get_or_load("profile", loader, ttl=300, stale_ttl=3600) == 2
+        assert len(loads) == 2
+        assert cache.get_stats()["stale_hits"] == 2
+
+    def test_loads_synchronously_past_stale_window(self, clock):
+        """Test that a value past ttl + stale_ttl is reloaded inline."""
+        cache = ContextCache()
+        values = iter(["old", "new"])
+        cache.get_or_load("profile", lambda: next(values), ttl=300, stale_ttl=60)
+
+        clock.now += 361
+        assert cache.get_or_load("profile", lambda: next(values), ttl=300, stale_ttl=60) == "new"
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Tests for concurrent context loading (lib/context_orchestrator.py).
+
+Run with:
+    python -m pytest automation/scripts/test_context_orchestrator.py -v
+"""
+
+import threading
+import time
+
+import pytest
+
+from lib.context_orchestrator import ContextOrchestrator
+
+
+@pytest.fixture
+def orchestrator():
+    with ContextOrchestrator(source_timeout=2.0) as orchestrator:
+        yield orchestrator
+
+
+def loader_threads():
+    return [t for t in threading.enumerate() if t.name.startswith("context-loader")]
+
+
+class TestConcurrentLoading:
+    """Test _load_concurrently() and the loader pool."""
+
+    def test_sources_load_in_parallel(self, orchestrator):
+        """Test that independent sources overlap instead of running one after another."""
+        barrier = threading.Barrier(3, timeout=2.0)
+
+        def loader(value):
+            def load():
+                barrier.wait()  # Only passes if all three run at once
+                return value
+            return load
+
+        results, degraded = orchestrator._load_concurrently({
+            name: (f"key:{name}", loader(name), None) for name in ("a", "b", "c")
+        })
+
+        assert results == {"a": "a", "b": "b", "c": "c"}
+        assert degraded == []
+
+    def test_slow_and_failing_sources_degrade(self, orchestrator):
+        """Test that a source past its timeout or raising gets its default."""
+        orchestrator.source_timeout = 0.1
+        release = threading.Event()
+
+        def slow():
+            release.wait(2.0)
+            return "late"
+
+        def broken():
+            raise OSError("unreachable")
+
+        try:
+            results, degraded = orchestrator._load_concurrently({
+                "slow": ("key:slow", slow, {}),
+                "broken": ("key:broken", broken, []),
+                "fast": ("key:fast", lambda: "ok", None),
+            })
+        finally:
+            release.set()
+
+        assert results == {"slow": {}, "broken": [], "fast": "ok"}
+        assert sorted(degraded) == ["broken", "slow"]
+        stats = orchestrator.get_loader_stats()
+        assert stats["timeouts"] == 1
+        assert stats["failures"] == 1
+
+    def test_in_flight_load_is_joined(self, orchestrator):
+        """Test that a second load of a running key waits for it instead of repeating it."""
+        calls = []
+        release = threading.Event()
+
+        def load():
+            calls.append(1)
+            release.wait(2.0)
+            return "value"
+
+        first = orchestrator._submit("key:shared", load)
+        threading.Timer(0.05, release.set).start()
+        results, _ = orchestrator._load_concurrently({"shared": ("key:shared", load, None)})
+
+        assert results == {"shared": "value"}
+        assert first.result() == "value"
+        assert calls == [1]
+        assert orchestrator.get_loader_stats()["sources_joined"] == 1
+
+    def test_close_shuts_down_loader_pool(self):
+        """Test that close() stops the loader threads and a later load starts a new pool."""
+        orchestrator = ContextOrchestrator()
+        before = set(loader_threads())
+        orchestrator._load_concurrently({"a": ("key:a", lambda: 1, None)})
+        threads = set(loader_threads()) - before
+        assert threads
+
+        orchestrator.close()
+        for thread in threads:
+            thread.join(timeout=2.0)
+        assert not any(t.is_alive() for t in threads)
+
+        results, _ = orchestrator._load_concurrently({"b": ("key:b", lambda: 2, None)})
+        assert results == {"b": 2}
+        orchestrator.close()
+
+    def test_close_does_not_wait_for_running_loads(self):
+        """Test that close() returns while a load is still running."""
+        orchestrator = ContextOrchestrator()
+        release = threading.Event()
+        future = orchestrator._submit("key:slow", lambda: release.wait(2.0))
+
+        started = time.monotonic()
+        orchestrator.close()
+        assert time.monotonic() - started < 1.0
+
+        release.set()
+        assert future.result(timeout=2.0) is True
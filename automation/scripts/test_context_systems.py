@@ -30,9 +30,10 @@ from lib.budget import (
     BudgetConnectionPool, init_budget_db, get_budget_db, BUDGET_DB_PATH
 )
 from lib.telemetry import (
-    TelemetryCollector, ConnectionPool, init_db, get_db, DB_PATH,
+    TelemetryCollector, init_db, get_db, DB_PATH,
     log_run, get_tenant_costs
 )
+from lib.storage_engine import ConnectionPool
 
 SYSTEM_ROOT = Path(__file__).parent.parent
 OUTPUT_PATH = SYSTEM_ROOT / "telemetry" / "context_systems_test.json"
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Tests for deferred retrieval metadata in episodic memory
+(lib/intelligence/memory/episodic.py).
+
+Run with:
+    python -m pytest automation/scripts/test_episodic_memory.py -v
+"""
+
+import gc
+import time
+import weakref
+
+import pytest
+
+from lib.intelligence.memory import episodic
+from lib.intelligence.memory.episodic import EpisodicMemoryConfig, EpisodicMemoryStore
+from lib.intelligence.types import EpisodicMemory, Prediction
+
+COLLECTION = "system/intelligence/episodic/acme/lifecycle-audit"
+
+
+def make_store(firebase, **config):
+    store = EpisodicMemoryStore(firebase, EpisodicMemoryConfig(**config))
+    for i in range(3):
+        store.store(EpisodicMemory(
+            episode_id=f"e{i}",
+            prediction=Prediction(tenant_id="acme", skill_name="lifecycle-audit"),
+        ))
+    return store
+
+
+def retrieval_counts(firebase):
+    return {
+        episode_id: doc["retrieval_count"]
+        for episode_id, doc in firebase._docs[COLLECTION].items()
+    }
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@pytest.fixture
+def store(memory_firebase):
+    store = make_store(memory_firebase, retrieval_flush_interval=60.0)
+    yield store
+    store.close()
+
+
+class TestDeferredRetrievalFlush:
+    """Test that retrieval hits are coalesced and written off the read path."""
+
+    def test_retrieve_does_not_write(self, store, memory_firebase):
+        """Test that retrieve() only reads; hits stay pending until a flush."""
+        calls = memory_firebase.calls
+
+        for _ in range(3):
+            assert len(store.retrieve("acme", "lifecycle-audit")) == 3
+
+        assert memory_firebase.calls == calls + 3  # One query per retrieve
+        assert retrieval_counts(memory_firebase) == {"e0": 0, "e1": 0, "e2": 0}
+        assert store.get_flush_stats()["pending"] == 3
+
+    def test_flush_writes_coalesced_counts(self, store, memory_firebase):
+        """Test that repeated hits on an episode become one write of the summed count."""
+        for _ in range(3):
+            store.retrieve("acme", "lifecycle-audit")
+        calls = memory_firebase.calls
+
+        assert store.flush_retrieval_metadata() == 3
+        assert memory_firebase.calls == calls + 3
+        assert retrieval_counts(memory_firebase) == {"e0": 3, "e1": 3, "e2": 3}
+
+        store.retrieve("acme", "lifecycle-audit")
+        store.flush_retrieval_metadata()
+        assert retrieval_counts(memory_firebase) == {"e0": 4, "e1": 4, "e2": 4}
+
+    def test_interval_flush_in_background(self, memory_firebase):
+        """Test that the flush thread writes pending hits after the interval."""
+        store = make_store(memory_firebase, retrieval_flush_interval=0.05)
+        try:
+            store.retrieve("acme", "lifecycle-audit")
+            assert wait_for(lambda: store.get_flush_stats()["episodes_written"] == 3)
+            assert retrieval_counts(memory_firebase) == {"e0": 1, "e1": 1, "e2": 1}
+        finally:
+            store.close()
+
+    def test_threshold_wakes_flusher_early(self, memory_firebase):
+        """Test that reaching retrieval_flush_threshold flushes before the interval."""
+        store = make_store(memory_firebase, retrieval_flush_interval=60.0, retrieval_flush_threshold=3)
+        try:
+            store.retrieve("acme", "lifecycle-audit")
+            assert wait_for(lambda: store.get_flush_stats()["flushes"] == 1)
+        finally:
+            store.close()
+
+    def test_zero_interval_writes_immediately(self, memory_firebase):
+        """Test that retrieval_flush_interval=0 flushes after each retrieve."""
+        store = make_store(memory_firebase, retrieval_flush_interval=0)
+
+        store.retrieve("acme", "lifecycle-audit")
+
+        assert retrieval_counts(memory_firebase) == {"e0": 1, "e1": 1, "e2": 1}
+        assert store._flusher is None
+
+
+class TestClose:
+    """Test close() and the exit hook."""
+
+    def test_close_flushes_and_unregisters(self, memory_firebase):
+        """Test that close() writes pending hits, stops the thread and frees the store."""
+        store = make_store(memory_firebase, retrieval_flush_interval=60.0)
+        store.retrieve("acme", "lifecycle-audit")
+        flusher = store._flusher
+        assert store in episodic._open_stores
+
+        store.close()
+        flusher.join(timeout=2.0)
+
+        assert not flusher.is_alive()
+        assert retrieval_counts(memory_firebase) == {"e0": 1, "e1": 1, "e2": 1}
+        assert store not in episodic._open_stores
+
+        ref = weakref.ref(store)
+        del store, flusher
+        gc.collect()
+        assert ref() is None
+
+    def test_exit_hook_flushes_open_stores(self, memory_firebase):
+        """Test that the atexit hook closes every store still open."""
+        store = make_store(memory_firebase, retrieval_flush_interval=60.0)
+        store.retrieve("acme", "lifecycle-audit")
+
+        episodic._close_open_stores()
+
+        assert retrieval_counts(memory_firebase) == {"e0": 1, "e1": 1, "e2": 1}
+        assert store not in episodic._open_stores
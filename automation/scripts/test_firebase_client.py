@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+Tests for the Firestore client (lib/firebase_client.py).
+
+Firestore is replaced by an in-memory fake passed as firestore_client, so
+these tests run without firebase-admin or credentials.
+
+Run with:
+    python -m pytest automation/scripts/test_firebase_client.py -v
+"""
+
+import copy
+import itertools
+import operator
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from lib import firebase_client
+from lib.firebase_client import (
+    ConnectionPool,
+    FirebaseClient,
+    FirebaseConnectionError,
+    FirestoreReadCache,
+    PoolConfig,
+    ReadCacheConfig,
+)
+
+OPERATORS = {"==": operator.eq, "!=": operator.ne, "<": operator.lt, "<=": operator.le,
+             ">": operator.gt, ">=": operator.ge}
+
+
+class FakeSnapshot:
+    def __init__(self, reference, data, fields=None):
+        self.reference = reference
+        self.id = reference.id
+        self.exists = data is not None
+        self._data = data
+        self._fields = fields
+
+    def to_dict(self):
+        if self._data is None:
+            return None
+        data = copy.deepcopy(self._data)
+        if self._fields is not None:
+            data = {k: v for k, v in data.items() if k in self._fields}
+        return data
+
+
+class FakeDocument:
+    def __init__(self, db, path):
+        self.db = db
+        self.path = path
+        self.id = path.rsplit("/", 1)[-1]
+
+    def collection(self, name):
+        return FakeQuery(self.db, f"{self.path}/{name}")
+
+    def get(self):
+        self.db.reads += 1
+        return FakeSnapshot(self, self.db.docs.get(self.path))
+
+    def set(self, data, merge=False):
+        if merge and self.path in self.db.docs:
+            self.db.docs[self.path].update(copy.deepcopy(data))
+        else:
+            self.db.docs[self.path] = copy.deepcopy(data)
+
+    def update(self, data):
+        self.db.docs[self.path].update(copy.deepcopy(data))
+
+    def delete(self):
+        self.db.docs.pop(self.path, None)
+
+
+class FakeQuery:
+    """A collection reference and query over FakeFirestore.docs."""
+
+    def __init__(self, db, path):
+        self.db = db
+        self.path = path
+        self.filters = []
+        self.order = None
+        self.count = None
+        self.cursor = None
+        self.fields = None
+
+    def _derive(self, **changes):
+        query = copy.copy(self)
+        query.filters = list(self.filters)
+        for name, value in changes.items():
+            setattr(query, name, value)
+        return query
+
+    def document(self, doc_id):
+        return FakeDocument(self.db, f"{self.path}/{doc_id}")
+
+    def add(self, data):
+        ref = self.document(f"auto{next(self.db.ids)}")
+        ref.set(data)
+        return None, ref
+
+    def where(self, field_path, op, value):
+        return self._derive(filters=self.filters + [(field_path, OPERATORS[op], value)])
+
+    def order_by(self, field_path, direction="ASCENDING"):
+        return self._derive(order=(field_path, direction))
+
+    def limit(self, count):
+        return self._derive(count=count)
+
+    def start_after(self, snapshot):
+        return self._derive(cursor=snapshot)
+
+    def select(self, fields):
+        return self._derive(fields=set(fields))
+
+    def stream(self):
+        self.db.queries += 1
+        docs = [
+            (path, data) for path, data in sorted(self.db.docs.items())
+            if path.rsplit("/", 1)[0] == self.path
+            and all(f in data and op(data[f], v) for f, op, v in self.filters)
+        ]
+        if self.order:
+            field_path, direction = self.order
+            docs = [(path, data) for path, data in docs if field_path in data]  # As in Firestore
+            docs.sort(key=lambda item: (item[1][field_path], item[0]), reverse=direction == "DESCENDING")
+        if self.cursor is not None:
+            paths = [path for path, _ in docs]
+            docs = docs[paths.index(self.cursor.reference.path) + 1:]
+        if self.count is not None:
+            docs = docs[:self.count]
+        self.db.reads += len(docs)
+        for path, data in docs:
+            yield FakeSnapshot(FakeDocument(self.db, path), data, self.fields)
+
+
+class FakeFirestore:
+    """In-memory Firestore client counting document reads."""
+
+    def __init__(self):
+        self.docs = {}
+        self.reads = 0
+        self.queries = 0
+        self.ids = itertools.count(1)
+
+    def collection(self, name):
+        return FakeQuery(self, name)
+
+
+@pytest.fixture
+def firestore():
+    return FakeFirestore()
+
+
+class FakeAdmin:
+    """Stand-in for the firebase_admin and firestore modules, tracking live apps."""
+
+    def __init__(self):
+        self.apps = {}
+        self.deleted = []
+        self.credentials = SimpleNamespace(Certificate=lambda path: ("cert", path),
+                                           ApplicationDefault=lambda: ("default",))
+        self.firestore = SimpleNamespace(
+            Query=SimpleNamespace(ASCENDING="ASCENDING", DESCENDING="DESCENDING"),
+            client=lambda app: app.client,
+        )
+
+    def initialize_app(self, cred, options, name):
+        app = SimpleNamespace(name=name, options=options, client=FakeFirestore())
+        self.apps[name] = app
+        return app
+
+    def delete_app(self, app):
+        del self.apps[app.name]
+        self.deleted.append(app.name)
+
+
+@pytest.fixture
+def sdk(monkeypatch):
+    """Replace the lazily imported firebase_admin SDK with FakeAdmin."""
+    admin = FakeAdmin()
+    monkeypatch.setattr(firebase_client, "_ensure_firebase", lambda: (admin, admin.firestore))
+    monkeypatch.delenv("GOOGLE_APPLICATION_CREDENTIALS", raising=False)
+    return admin
+
+
+@pytest.fixture
+def cached_client(firestore):
+    return FirebaseClient("test-project", firestore_client=firestore, cache_config=ReadCacheConfig())
+
+
+class TestReadThroughCache:
+    """Test that cached reads are served until a write invalidates them."""
+
+    def test_document_read_is_cached(self, cached_client, firestore):
+        """Test that a second read of a document does not reach Firestore."""
+        firestore.docs["clients/acme"] = {"name": "Acme"}
+
+        assert cached_client.get_document("clients", "acme")["name"] == "Acme"
+        assert cached_client.get_document("clients", "acme")["name"] == "Acme"
+        assert firestore.reads == 1
+        assert cached_client.get_cache_stats()["hits"] == 1
+
+    def test_write_invalidates_document(self, cached_client, firestore):
+        """Test that set, update and delete through the client drop the cached document."""
+        firestore.docs["clients/acme"] = {"name": "Acme"}
+        cached_client.get_document("clients", "acme")
+
+        cached_client.set_document("clients", "acme", {"name": "Acme Corp"})
+        assert cached_client.get_document("clients", "acme")["name"] == "Acme Corp"
+
+        cached_client.update_document("clients", "acme", {"tier": "gold"})
+        assert cached_client.get_document("clients", "acme")["tier"] == "gold"
+
+        cached_client.delete_document("clients", "acme")
+        assert cached_client.get_document("clients", "acme") is None
+
+    def test_write_invalidates_queries_on_its_collection(self, cached_client, firestore):
+        """Test that a write drops cached queries of its collection and keeps others."""
+        firestore.docs["clients/acme"] = {"tier": "gold"}
+        firestore.docs["skills/audit"] = {"tier": "gold"}
+        gold = [("tier", "==", "gold")]
+        assert len(cached_client.query("clients", gold)) == 1
+        assert len(cached_client.query("skills", gold)) == 1
+        queries = firestore.queries
+
+        cached_client.add_document("clients", {"tier": "gold"})
+
+        assert len(cached_client.query("clients", gold)) == 2
+        assert len(cached_client.query("skills", gold)) == 1
+        assert firestore.queries == queries + 1
+
+    def test_subcollection_write_invalidates_subcollection(self, cached_client, firestore):
+        """Test that a subcollection write drops that subcollection's cached reads."""
+        firestore.docs["clients/acme/signals/s1"] = {"score": 1}
+        assert len(cached_client.get_collection("signals", parent_doc="acme", parent_collection="clients")) == 1
+
+        cached_client.set_document("clients", "acme", {"score": 2}, subcollection="signals", subdoc_id="s2")
+
+        assert len(cached_client.get_collection("signals", parent_doc="acme", parent_collection="clients")) == 2
+
+    def test_read_racing_a_write_is_not_cached(self):
+        """Test that a read result captured before an invalidation is not stored."""
+        cache = FirestoreReadCache()
+        version = cache.version("clients")
+        cache.invalidate_document("clients/acme")  # A write lands mid-read
+
+        cache.put("clients/acme", "clients", {"name": "stale"}, version)
+
+        assert cache.get("clients/acme") == (False, None)
+
+    def test_cached_value_is_a_copy(self, cached_client, firestore):
+        """Test that mutating a returned document does not change the cache."""
+        firestore.docs["clients/acme"] = {"tags": ["a"]}
+        cached_client.get_document("clients", "acme")["tags"].append("b")
+
+        assert cached_client.get_document("clients", "acme")["tags"] == ["a"]
+
+
+class TestPagedIteration:
+    """Test iter_query() and iter_collection() paging."""
+
+    @pytest.mark.parametrize("count", [6, 7])
+    def test_each_document_yielded_once_across_pages(self, firestore, count):
+        """Test that paging past a page boundary neither skips nor repeats documents."""
+        for i in range(count):
+            firestore.docs[f"posts/p{i}"] = {"n": i}
+        client = FirebaseClient("test-project", firestore_client=firestore)
+
+        ids = [doc["_id"] for doc in client.iter_collection("posts", page_size=3)]
+
+        assert sorted(ids) == [f"p{i}" for i in range(count)]
+        assert firestore.queries == count // 3 + 1  # A full last page needs one more fetch
+
+    @pytest.mark.usefixtures("sdk")
+    def test_ordered_pages_follow_the_order(self, firestore):
+        """Test that ordered paging resumes after the last document of each page."""
+        for i in range(10):
+            firestore.docs[f"posts/p{i}"] = {"postedAt": f"2026-01-{i % 5 + 1:02d}"}
+        firestore.docs["posts/undated"] = {}
+
+        client = FirebaseClient("test-project", firestore_client=firestore)
+        docs = list(client.iter_query("posts", order_by="postedAt", order_direction="DESCENDING", page_size=4))
+
+        dates = [doc["postedAt"] for doc in docs]
+        assert len({doc["_id"] for doc in docs}) == 10
+        assert dates == sorted(dates, reverse=True)
+
+    def test_limit_and_filters_span_pages(self, firestore):
+        """Test that a total limit caps the last page and filters apply to every page."""
+        for i in range(20):
+            firestore.docs[f"posts/p{i:02d}"] = {"n": i}
+        client = FirebaseClient("test-project", firestore_client=firestore)
+
+        docs = list(client.iter_query("posts", filters=[("n", ">=", 5)], limit=7, page_size=3))
+
+        assert [doc["n"] for doc in docs] == list(range(5, 12))
+        assert firestore.reads == 7
+
+    def test_stopping_early_fetches_no_more_pages(self, firestore):
+        """Test that an abandoned iterator does not fetch the next page."""
+        for i in range(10):
+            firestore.docs[f"posts/p{i}"] = {"n": i}
+        client = FirebaseClient("test-project", firestore_client=firestore)
+
+        docs = client.iter_collection("posts", page_size=4, select=["n"])
+        first = [next(docs) for _ in range(4)]
+
+        assert [set(doc) for doc in first] == [{"n", "_id", "_path"}] * 4
+        assert firestore.queries == 1
+
+
+class TestConnectionPool:
+    """Test that threads share a few pooled Firestore channels."""
+
+    def test_threads_share_one_channel(self, sdk):
+        """Test that concurrent leases reuse the project's single channel."""
+        pool = ConnectionPool(PoolConfig(max_connections=8))
+        barrier = threading.Barrier(8, timeout=5.0)
+        clients = []
+
+        def work():
+            with pool.lease("proj") as client:
+                barrier.wait()  # All eight leases are outstanding at once
+                clients.append(client)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(clients) == 8 and len(set(map(id, clients))) == 1
+        assert len(sdk.apps) == 1
+        stats = pool.get_stats()
+        assert stats["creations"] == 1
+        assert stats["active_leases"] == 0
+        assert stats["channels"] == {"proj": 1}
+
+    def test_extra_channel_only_while_busy(self, sdk):
+        """Test that a second channel opens only when every channel has a lease."""
+        pool = ConnectionPool(PoolConfig(channels_per_project=2))
+
+        with pool.lease("proj") as first:
+            pass
+        with pool.lease("proj") as again:
+            assert again is first
+
+        with pool.lease("proj") as a, pool.lease("proj") as b, pool.lease("proj") as c:
+            assert a is not b
+            assert c in (a, b)
+        assert pool.get_stats()["channels"] == {"proj": 2}
+
+        with pool.lease("other") as other:
+            assert other not in (a, b)
+        assert len(sdk.apps) == 3
+
+    def test_max_connections_waits_then_times_out(self, sdk):
+        """Test that a full pool blocks new leases until one is released."""
+        pool = ConnectionPool(PoolConfig(max_connections=1, connection_timeout=0.1))
+        held = pool.acquire("proj")
+
+        with pytest.raises(FirebaseConnectionError):
+            pool.acquire("proj")
+
+        pool.config.connection_timeout = 5.0
+        threading.Timer(0.05, held.release).start()
+        with pool.lease("proj") as client:
+            assert client is held.client
+
+        stats = pool.get_stats()
+        assert stats["waits"] == 2
+        assert stats["timeouts"] == 1
+
+    def test_idle_channels_are_torn_down_unless_pinned(self, sdk):
+        """Test that cleanup deletes idle apps but keeps channels with listeners."""
+        pool = ConnectionPool(PoolConfig(idle_timeout=0.0))
+        lease = pool.acquire("watched")
+        channel = pool.pin(lease)
+        lease.release()
+        with pool.lease("idle"):
+            pass
+
+        pool.cleanup_idle()
+        assert pool.get_stats()["channels"] == {"watched": 1}
+        assert len(sdk.deleted) == 1
+
+        pool.unpin(channel)
+        pool.cleanup_idle()
+        assert pool.get_stats()["channels"] == {}
+        assert sdk.apps == {}
+
+    def test_get_connection_is_paired_per_thread(self, sdk):
+        """Test the get_connection()/release_connection() compatibility API."""
+        pool = ConnectionPool()
+        client = pool.get_connection("proj")
+        assert pool.get_stats()["active_leases"] == 1
+
+        pool.release_connection("other")  # No lease for that project: no-op
+        assert pool.get_stats()["active_leases"] == 1
+        pool.release_connection("proj")
+        assert pool.get_stats()["active_leases"] == 0
+        assert pool.get_connection("proj") is client
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Tests for idempotent execution with retry (lib/idempotency.py).
+
+Run with:
+    python -m pytest automation/scripts/test_idempotency.py -v
+"""
+
+import asyncio
+from contextlib import contextmanager
+
+import pytest
+import yaml
+
+from lib import idempotency
+from lib.idempotency import (
+    AdaptiveConcurrencyLimiter,
+    ErrorClass,
+    ErrorClassifier,
+    ExecutionResult,
+    IdempotencyManager,
+    RetryAttempt,
+    RetryExecutor,
+    RetryPolicy,
+)
+
+FAST_POLICY = {
+    "idempotency": {
+        "cache_ttl_hours": 24,
+        "on_duplicate_success": "SKIP",
+        "on_duplicate_failure": "RETRY",
+    },
+    "retry_policy": {
+        "TRANSIENT_API": {"max_attempts": 3, "backoff_type": "fixed", "delay_ms": 1},
+        "TIMEOUT": {"max_attempts": 2, "backoff_type": "fixed", "delay_ms": 1},
+        "VALIDATION_ERROR": {"max_attempts": 1},
+        "UNKNOWN": {"max_attempts": 1},
+    },
+    "hard_limits": {
+        "max_total_attempts_per_skill": 5,
+        "max_total_attempts_per_module": 10_000,
+    },
+    "adaptive_concurrency": {
+        "initial_limit": 4,
+        "min_limit": 1,
+        "max_limit": 4,
+        "backoff_on": ["TRANSIENT_API", "TIMEOUT"],
+    },
+}
+
+
+@pytest.fixture
+def executor(isolated_storage, tmp_path, monkeypatch):
+    """A RetryExecutor on a scratch database with millisecond backoff."""
+    monkeypatch.setattr(idempotency, "LEGACY_CACHE_DB_PATH", tmp_path / "legacy.db")
+    config = tmp_path / "retry_policy.yaml"
+    config.write_text(yaml.safe_dump(FAST_POLICY))
+    return RetryExecutor(
+        idempotency=IdempotencyManager(cache_dir=str(tmp_path / "cache"), config_path=str(config)),
+        policy=RetryPolicy(str(config)),
+        classifier=ErrorClassifier(str(config)),
+    )
+
+
+def flaky(failures, error=ConnectionError):
+    """A function failing `failures` times per input, then echoing it."""
+    calls = []
+
+    def func(data):
+        calls.append(data)
+        if sum(1 for c in calls if c == data) <= failures:
+            raise error("service unavailable")
+        return {"output": data}
+
+    func.calls = calls
+    return func
+
+
+class TestBulkCache:
+    """Test check_many() and store_many()."""
+
+    def results(self, manager, count, success=True):
+        return [
+            ExecutionResult(
+                success=success,
+                output={"n": i} if success else None,
+                error_class=None if success else ErrorClass.TRANSIENT_API,
+                error_message=None if success else "boom",
+                attempt_count=1,
+                idempotency_key=manager.generate_key("acme", "m", f"s[{i}]", {"n": i}),
+            )
+            for i in range(count)
+        ]
+
+    def test_store_many_keys_readable_via_check_many(self, executor):
+        """Test that every stored key is found, with its output, past one chunk."""
+        manager = executor.idempotency
+        manager.BULK_CHUNK_SIZE = 7
+        results = self.results(manager, 30)
+        manager.store_many(results)
+
+        keys = [r.idempotency_key for r in results]
+        found = manager.check_many(keys + ["acme:m:missing:0"] + keys[:5])
+
+        assert set(found) == set(keys)
+        assert all(found[r.idempotency_key].output == r.output for r in results)
+        assert all(found[k].cached for k in keys)
+        assert manager.check(keys[-1]).output == {"n": 29}
+
+    def test_check_many_chunks_queries(self, executor, monkeypatch):
+        """Test that lookups past BULK_CHUNK_SIZE are split into chunks."""
+        manager = executor.idempotency
+        results = self.results(manager, IdempotencyManager.BULK_CHUNK_SIZE + 20)
+        manager.store_many(results)
+        keys = [r.idempotency_key for r in results]
+
+        chunks = []
+        engine_read = idempotency.get_storage_engine().read
+
+        class CountingConn:
+            def __init__(self, conn):
+                self.conn = conn
+
+            def execute(self, sql, params=()):
+                chunks.append(len(params))
+                return self.conn.execute(sql, params)
+
+        @contextmanager
+        def read():
+            with engine_read() as conn:
+                yield CountingConn(conn)
+
+        monkeypatch.setattr(idempotency.get_storage_engine(), "read", read)
+        found = manager.check_many(keys)
+
+        assert len(found) == len(keys)
+        assert chunks == [IdempotencyManager.BULK_CHUNK_SIZE, 20]
+
+    def test_check_many_applies_duplicate_policy(self, executor):
+        """Test that cached failures are not returned (on_duplicate_failure: RETRY)."""
+        manager = executor.idempotency
+        failed = self.results(manager, 3, success=False)
+        manager.store_many(failed)
+
+        assert manager.check_many([r.idempotency_key for r in failed]) == {}
+
+    def test_store_many_logs_attempts(self, executor):
+        """Test that attempts passed to store_many() are logged with their keys."""
+        manager = executor.idempotency
+        results = self.results(manager, 2)
+        key = results[0].idempotency_key
+        attempts = [
+            RetryAttempt(attempt_number=1, timestamp="2026-01-01T00:00:00+00:00", duration_ms=5,
+                         success=False, error_class="transient_api", error_message="boom"),
+            RetryAttempt(attempt_number=2, timestamp="2026-01-01T00:00:01+00:00", duration_ms=5,
+                         success=True),
+        ]
+        manager.store_many(results, {key: attempts})
+
+        logged = manager.get_attempts(key)
+        assert [a.attempt_number for a in logged] == [1, 2]
+        assert manager.get_attempts(results[1].idempotency_key) == []
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Test AIMD limit changes."""
+
+    def test_additive_increase(self):
+        """Test that a window of successes raises the limit by about one."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=6)
+
+        async def succeed(n):
+            for _ in range(n):
+                limiter.release(await limiter.acquire())
+
+        asyncio.run(succeed(5))
+        assert limiter.limit == 5
+
+        asyncio.run(succeed(100))
+        assert limiter.limit == 6  # capped at max_limit
+
+    def test_halves_on_congestion(self):
+        """Test that a congested call halves the limit, down to min_limit."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, min_limit=3)
+
+        async def congest():
+            limiter.release(await limiter.acquire(), congested=True)
+
+        asyncio.run(congest())
+        assert limiter.limit == 4
+        asyncio.run(congest())
+        assert limiter.limit == 3
+
+    def test_one_decrease_per_window(self):
+        """Test that failures of calls started before a decrease do not shrink it again."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+
+        async def burst():
+            tokens = [await limiter.acquire() for _ in range(4)]
+            for token in tokens:
+                limiter.release(token, congested=True)
+            limiter.release(await limiter.acquire(), congested=True)
+
+        asyncio.run(burst())
+        stats = limiter.get_stats()
+        assert stats["congestion_events"] == 5
+        assert stats["decreases"] == 2
+        assert limiter.limit == 2
+
+    def test_waiters_get_slots_in_order(self):
+        """Test that calls past the limit wait and are admitted in arrival order."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+        admitted = []
+
+        async def call(n, release):
+            token = await limiter.acquire()
+            admitted.append(n)
+            await release.wait()
+            limiter.release(token)
+
+        async def main():
+            release = asyncio.Event()
+            tasks = [asyncio.create_task(call(n, release)) for n in range(5)]
+            await asyncio.sleep(0.01)
+            assert admitted == [0, 1]
+            assert limiter.in_flight == 2
+            release.set()
+            await asyncio.gather(*tasks)
+
+        asyncio.run(main())
+        assert admitted == [0, 1, 2, 3, 4]
+        assert limiter.in_flight == 0
+
+
+class TestExecuteWithRetryAsync:
+    """Test the async single-call path."""
+
+    def test_retries_transient_errors_then_caches(self, executor):
+        """Test that transient failures are retried and the success is cached."""
+        func = flaky(failures=2)
+
+        result = asyncio.run(executor.execute_with_retry_async(func, "acme", "m", "s", {"id": 1}))
+        assert result.success and result.output == {"id": 1}
+        assert result.attempt_count == 3
+        assert len(executor.idempotency.get_attempts(result.idempotency_key)) == 3
+
+        again = asyncio.run(executor.execute_with_retry_async(func, "acme", "m", "s", {"id": 1}))
+        assert again.cached is True
+        assert len(func.calls) == 3
+
+    def test_does_not_retry_validation_errors(self, executor):
+        """Test that non-retryable errors fail after one attempt."""
+        func = flaky(failures=5, error=ValueError)
+
+        result = asyncio.run(executor.execute_with_retry_async(func, "acme", "m", "s", {"id": 2}))
+        assert not result.success
+        assert result.error_class == ErrorClass.VALIDATION_ERROR
+        assert result.attempt_count == 1
+
+    def test_async_function_and_congestion(self, executor):
+        """Test an async function whose transient errors shrink the limiter."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+        failures = []
+
+        async def func(data):
+            if not failures:
+                failures.append(data)
+                raise ConnectionError("429 Too Many Requests")
+            return {"output": "ok"}
+
+        result = asyncio.run(executor.execute_with_retry_async(
+            func, "acme", "m", "s", {"id": 3}, limiter=limiter
+        ))
+        assert result.success and result.output == "ok"
+        assert limiter.get_stats()["decreases"] == 1
+        assert limiter.in_flight == 0
+
+
+class TestExecuteBatchAsync:
+    """Test the async batch path."""
+
+    def test_limits_in_flight_calls(self, executor):
+        """Test that no more than the limiter's limit run at once."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=3, max_limit=3)
+        in_flight = []
+        peak = []
+
+        async def item_func(item, index):
+            in_flight.append(index)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.005)
+            in_flight.remove(index)
+            return {"output": item * 2}
+
+        results = asyncio.run(executor.execute_batch_async(
+            list(range(20)), item_func, "acme", "m", "double", limiter=limiter
+        ))
+        assert [r.output for r in results] == [i * 2 for i in range(20)]
+        assert max(peak) == 3
+
+    def test_caches_successes_and_retries_failures(self, executor):
+        """Test that a second batch reuses successes and re-runs only failures."""
+        calls = []
+
+        def item_func(item, index):
+            calls.append(index)
+            if item % 4 == 0:
+                raise ValueError("bad item")
+            return {"output": item}
+
+        items = list(range(12))
+        first = asyncio.run(executor.execute_batch_async(
+            items, item_func, "acme", "m", "batch", write_chunk_size=5
+        ))
+        assert [r.success for r in first] == [i % 4 != 0 for i in items]
+        assert sorted(calls) == items
+
+        calls.clear()
+        second = asyncio.run(executor.execute_batch_async(items, item_func, "acme", "m", "batch"))
+        assert sorted(calls) == [0, 4, 8]
+        assert all(r.cached for r, i in zip(second, items) if i % 4)
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared token-bucket rate limiter (lib/rate_limiter.py).
+
+Run with:
+    python -m pytest automation/scripts/test_rate_limiter.py -v
+"""
+
+import threading
+
+import pytest
+
+from lib import rate_limiter
+from lib.rate_limiter import RateLimitConfig, RateLimitExceeded, TokenBucket, get_rate_limiter
+from lib.storage_engine import StorageEngine
+
+
+class FakeClock:
+    """Stands in for time.time() so refill does not depend on wall time."""
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter.time, "time", clock)
+    return clock
+
+
+class TestTokenBucket:
+    """Test refill, queueing and refusal."""
+
+    def test_burst_then_refill_over_time(self, isolated_storage, clock):
+        """Test that a drained bucket refills at requests_per_second up to burst."""
+        bucket = TokenBucket("svc", RateLimitConfig(requests_per_second=2, burst=4, max_wait_seconds=0))
+
+        for _ in range(4):
+            assert bucket.reserve() == 0.0
+        with pytest.raises(RateLimitExceeded):
+            bucket.reserve()
+
+        clock.now += 1.0  # two tokens back
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        with pytest.raises(RateLimitExceeded):
+            bucket.reserve()
+
+        clock.now += 60.0  # refill is capped at burst
+        for _ in range(4):
+            assert bucket.reserve() == 0.0
+        with pytest.raises(RateLimitExceeded):
+            bucket.reserve()
+
+    def test_waiters_queue_in_order(self, isolated_storage, clock, monkeypatch):
+        """Test that callers past the burst are told to wait their turn."""
+        slept = []
+        monkeypatch.setattr(rate_limiter.time, "sleep", slept.append)
+        bucket = TokenBucket("svc", RateLimitConfig(requests_per_second=2, burst=1, max_wait_seconds=10))
+
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == pytest.approx(0.5)
+        assert bucket.acquire() == pytest.approx(1.0)
+        assert slept == [pytest.approx(0.5), pytest.approx(1.0)]
+
+        stats = bucket.get_stats()
+        assert stats["acquired"] == 3
+        assert stats["waited"] == 2
+        assert stats["max_wait_seconds"] == pytest.approx(1.0)
+
+    def test_deny_does_not_debit(self, isolated_storage, clock):
+        """Test that a wait over max_wait_seconds is refused without taking tokens."""
+        bucket = TokenBucket("svc", RateLimitConfig(requests_per_second=1, burst=1, max_wait_seconds=2))
+
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(1.0)
+        assert bucket.reserve() == pytest.approx(2.0)
+        with pytest.raises(RateLimitExceeded) as exc:
+            bucket.reserve()
+        assert exc.value.wait_seconds == pytest.approx(3.0)
+
+        # The refused take left the queue as it was
+        with pytest.raises(RateLimitExceeded):
+            bucket.reserve()
+        clock.now += 1.0
+        assert bucket.reserve() == pytest.approx(2.0)
+        assert bucket.get_stats()["rejected"] == 2
+
+    def test_shared_bucket_never_exceeds_capacity(self, isolated_storage):
+        """Test that two engines on one database share a single bucket."""
+        config = RateLimitConfig(requests_per_second=0.001, burst=5, max_wait_seconds=0)
+        other_engine = StorageEngine(isolated_storage.db_path)
+        buckets = [
+            TokenBucket("shared", config, engine=isolated_storage),
+            TokenBucket("shared", config, engine=other_engine),
+        ]
+        granted = []
+        lock = threading.Lock()
+
+        def take(bucket):
+            for _ in range(20):
+                try:
+                    bucket.reserve()
+                except RateLimitExceeded:
+                    continue
+                with lock:
+                    granted.append(bucket)
+
+        threads = [threading.Thread(target=take, args=(buckets[i % 2],)) for i in range(6)]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            other_engine.close()
+
+        assert len(granted) == 5
+        assert sum(b.get_stats()["rejected"] for b in buckets) == 6 * 20 - 5
+
+
+class TestRegistry:
+    """Test the process-wide bucket registry."""
+
+    def test_one_bucket_per_name(self, isolated_storage):
+        """Test that get_rate_limiter() reuses the first bucket for a name."""
+        first = get_rate_limiter("hubspot", {"requests_per_second": 9, "burst": 10})
+        again = get_rate_limiter("hubspot", {"requests_per_second": 1})
+
+        assert again is first
+        assert first.config.burst == 10
+        assert get_rate_limiter("hubspot") is first
+
+    def test_no_config_no_bucket(self, isolated_storage):
+        """Test that servers without a rate_limit get no bucket."""
+        assert get_rate_limiter("unlimited") is None
+        assert get_rate_limiter("unlimited", {}) is None
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Tests for semantic memory similarity search (lib/intelligence/memory).
+
+Run with:
+    python -m pytest automation/scripts/test_semantic_memory.py -v
+"""
+
+import random
+import threading
+
+import pytest
+
+from lib.intelligence.memory import SemanticMemoryStore
+from lib.intelligence.memory.pattern_index import PatternIndex
+from lib.intelligence.types import Domain, SemanticPattern
+
+VOCAB = [f"t{i}" for i in range(40)]
+SKILLS = ["lifecycle-audit", "churn-prediction", "ghostwrite-content"]
+
+
+def random_index(rng, size):
+    """An index of patterns whose tokens follow a skewed (Zipf-like) distribution."""
+    weights = [1 / (rank + 1) for rank in range(len(VOCAB))]
+    index = PatternIndex()
+    for i in range(size):
+        tokens = set(rng.choices(VOCAB, weights=weights, k=rng.randint(1, 12)))
+        pattern = SemanticPattern(pattern_id=f"p{i}", skill_name=rng.choice(SKILLS))
+        index.add(pattern, " ".join(sorted(tokens)), tokens)
+    return index
+
+
+def exhaustive_search(index, query_tokens, limit, min_similarity, skill_filter=None):
+    """Score every indexed pattern, as the full-scan search did."""
+    query = set(query_tokens)
+    scored = []
+    for entry in index._entries.values():
+        if skill_filter and entry.pattern.skill_name != skill_filter:
+            continue
+        overlap = len(query & entry.tokens)
+        similarity = overlap / len(query | entry.tokens)
+        if similarity >= min_similarity:
+            scored.append((similarity, entry))
+    scored.sort(key=lambda item: (-item[0], item[1].seq))
+    return scored[:limit]
+
+
+def ranked(hits):
+    return [(similarity, entry.pattern.pattern_id) for similarity, entry in hits]
+
+
+class TestPatternIndex:
+    """Test the inverted index against a full scan."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_maxscore_top_k_matches_exhaustive(self, seed):
+        """Test that pruned search returns exactly the exhaustive top-k."""
+        rng = random.Random(seed)
+        index = random_index(rng, 300)
+
+        for _ in range(50):
+            query = rng.sample(VOCAB, rng.randint(1, 10))
+            limit = rng.choice([1, 3, 5, 20])
+            min_similarity = rng.choice([0.0, 0.05, 0.1, 0.3])
+            skill_filter = rng.choice([None, None, SKILLS[0]])
+
+            assert ranked(index.search(query, limit, min_similarity, skill_filter)) == ranked(
+                exhaustive_search(index, query, limit, min_similarity, skill_filter)
+            )
+
+    def test_copy_is_independent(self):
+        """Test that changing a copy leaves the original's postings and results alone."""
+        index = PatternIndex()
+        index.add(SemanticPattern(pattern_id="p1", skill_name="s"), "a b", ["a", "b"])
+
+        clone = index.copy()
+        clone.add(SemanticPattern(pattern_id="p2", skill_name="s"), "a c", ["a", "c"])
+        clone.remove("p1")
+
+        assert ranked(index.search(["a"], 5, 0.0)) == [(0.5, "p1")]
+        assert index.document_frequencies() == {"a": 1, "b": 1}
+        assert ranked(clone.search(["a"], 5, 0.0)) == [(0.5, "p2")]
+        assert clone.built_at == index.built_at
+
+    def test_updates_keep_postings_consistent(self):
+        """Test that replacing and removing patterns update the posting lists."""
+        index = PatternIndex()
+        pattern = SemanticPattern(pattern_id="p1", skill_name="s")
+        index.add(pattern, "a b", ["a", "b"])
+        index.add(pattern, "b c", ["b", "c"])
+
+        assert index.document_frequency("a") == 0
+        assert index.document_frequency("c") == 1
+        assert ranked(index.search(["c"], 5, 0.1)) == [(0.5, "p1")]
+
+        assert index.remove("p1") is True
+        assert index.document_frequencies() == {}
+        assert index.search(["b"], 5, 0.0) == []
+
+
+class TestSemanticMemoryStore:
+    """Test find_similar_context over the store's indexes."""
+
+    def make_pattern(self, pattern_id, **condition):
+        return SemanticPattern(
+            pattern_id=pattern_id,
+            skill_name="lifecycle-audit",
+            domain=Domain.HEALTH,
+            condition=condition,
+            confidence=0.7,
+        )
+
+    def test_indexed_pattern_is_a_copy(self, memory_firebase):
+        """Test that changing a pattern after store() does not change the index."""
+        store = SemanticMemoryStore(memory_firebase)
+        store.find_similar_context("warmup", domain=Domain.HEALTH)  # build the index
+
+        pattern = self.make_pattern("p1", segment="enterprise", stage="renewal")
+        store.store(pattern)
+        pattern.confidence = 0.1
+        pattern.condition["segment"] = "starter"
+
+        hits = store.find_similar_context("enterprise renewal", domain=Domain.HEALTH)
+        assert [hit["id"] for hit in hits] == ["p1"]
+        assert hits[0]["pattern"].confidence == 0.7
+        assert hits[0]["pattern"].condition["segment"] == "enterprise"
+        assert store.find_similar_context("starter", domain=Domain.HEALTH) == []
+
+    def test_results_are_copies(self, memory_firebase):
+        """Test that changing a search result does not change the index."""
+        store = SemanticMemoryStore(memory_firebase)
+        store.store(self.make_pattern("p1", segment="enterprise"))
+
+        first = store.find_similar_context("enterprise", domain=Domain.HEALTH)
+        first[0]["pattern"].confidence = 0.0
+
+        again = store.find_similar_context("enterprise", domain=Domain.HEALTH)
+        assert again[0]["pattern"].confidence == 0.7
+
+
+class TestCopyOnWriteIndexes:
+    """Test that writes publish new index snapshots instead of changing the searched one."""
+
+    def make_pattern(self, pattern_id, segment):
+        return SemanticPattern(
+            pattern_id=pattern_id,
+            skill_name="lifecycle-audit",
+            domain=Domain.HEALTH,
+            condition={"segment": segment},
+        )
+
+    def test_writes_publish_a_new_snapshot(self, memory_firebase):
+        """Test that store() and delete_pattern() leave a held snapshot unchanged."""
+        store = SemanticMemoryStore(memory_firebase)
+        store.store(self.make_pattern("p1", "enterprise"))
+        snapshot = store._get_index(Domain.HEALTH)
+        assert "p1" in snapshot
+
+        store.store(self.make_pattern("p2", "enterprise"))
+        store.delete_pattern("p1", Domain.HEALTH)
+
+        assert "p1" in snapshot and "p2" not in snapshot
+        published = store._get_index(Domain.HEALTH)
+        assert published is not snapshot
+        assert "p1" not in published and "p2" in published
+
+    def test_maintenance_batch_publishes_once(self, memory_firebase):
+        """Test that writes in a maintenance pass appear together when it ends."""
+        store = SemanticMemoryStore(memory_firebase)
+        before = store._get_index(Domain.HEALTH)
+
+        with store._index_batch():
+            for i in range(5):
+                store.store(self.make_pattern(f"p{i}", "enterprise"))
+            assert store._get_index(Domain.HEALTH) is before
+
+        after = store._get_index(Domain.HEALTH)
+        assert len(before) == 0
+        assert len(after) == 5
+
+    def test_write_during_rebuild_is_replayed(self, memory_firebase):
+        """Test that a write landing while the index loads is applied to the new index."""
+        store = SemanticMemoryStore(memory_firebase)
+        loading = threading.Event()
+        release = threading.Event()
+        get_collection = memory_firebase.get_collection
+
+        def slow_get_collection(*args, **kwargs):
+            docs = get_collection(*args, **kwargs)  # Read before the write lands
+            loading.set()
+            release.wait(2.0)
+            return docs
+
+        memory_firebase.get_collection = slow_get_collection
+        builder = threading.Thread(target=store._get_index, args=(Domain.HEALTH,))
+        builder.start()
+        assert loading.wait(2.0)
+
+        store.store(self.make_pattern("p1", "enterprise"))
+        release.set()
+        builder.join()
+
+        memory_firebase.get_collection = get_collection
+        assert [hit["id"] for hit in store.find_similar_context("enterprise", domain=Domain.HEALTH)] == ["p1"]
+
+    def test_searches_during_writes(self, memory_firebase):
+        """Test that searches racing a writer see whole snapshots and never fail."""
+        store = SemanticMemoryStore(memory_firebase)
+        store.find_similar_context("enterprise", domain=Domain.HEALTH)
+        counts = []
+        errors = []
+        done = threading.Event()
+
+        def search():
+            while not done.is_set():
+                try:
+                    hits = store.find_similar_context("enterprise", domain=Domain.HEALTH, limit=100)
+                    counts.append(len(hits))
+                except Exception as e:
+                    errors.append(e)
+
+        readers = [threading.Thread(target=search) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for i in range(50):
+            store.store(self.make_pattern(f"p{i}", "enterprise"))
+        done.set()
+        for reader in readers:
+            reader.join()
+
+        assert errors == []
+        assert counts and max(counts) <= 50
+        assert len(store.find_similar_context("enterprise", domain=Domain.HEALTH, limit=100)) == 50
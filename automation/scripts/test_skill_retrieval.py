@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Tests for BM25 + trigger-phrase skill ranking (lib/skill_retrieval.py).
+
+Run with:
+    python -m pytest automation/scripts/test_skill_retrieval.py -v
+"""
+
+import pytest
+
+from lib.catalog import Catalog
+from lib.skill_retrieval import SkillRetriever, TriggerAutomaton, tokenize
+
+
+SKILLS = {
+    "churn-prediction": "Predict which accounts will cancel next quarter",
+    "lifecycle-audit": "Audit lifecycle stages and flag churn risk in the customer base",
+    "reddit-keyword-search": "Search Reddit posts for keywords",
+    "ghostwrite-content": "Write LinkedIn posts in the client's voice",
+    "find-skills": "Is there a skill for X? Discover and install agent skills",
+}
+
+
+def write_skill(root, name, description):
+    skill_dir = root / "test-skills" / name
+    skill_dir.mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text(f"---\nname: {name}\ndescription: {description}\n---\n")
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    for name, description in SKILLS.items():
+        write_skill(tmp_path / "skills", name, description)
+    catalog = Catalog(path=None, skill_roots=[tmp_path / "skills"], agent_roots=[])
+    catalog.refresh()
+    return catalog
+
+
+def names(results):
+    return [name for name, _ in results]
+
+
+class TestBm25Ranking:
+    """Test BM25 ranking over the catalog."""
+
+    def test_name_match_outranks_description_match(self, catalog):
+        """Test that the skill named for a term ranks above one mentioning it."""
+        retriever = SkillRetriever(catalog=catalog)
+        results = retriever.search("churn", min_score=0)
+
+        assert names(results) == ["churn-prediction", "lifecycle-audit"]
+        assert results[0][1] > results[1][1]
+
+    def test_more_matched_terms_rank_higher(self, catalog):
+        """Test that matching more query terms raises the score."""
+        retriever = SkillRetriever(catalog=catalog)
+
+        assert names(retriever.search("reddit keyword posts"))[0] == "reddit-keyword-search"
+        assert names(retriever.search("linkedin posts voice"))[0] == "ghostwrite-content"
+
+    def test_top_k(self, catalog):
+        """Test that top_k limits results and None returns every scoring skill."""
+        retriever = SkillRetriever(catalog=catalog)
+
+        assert len(retriever.search("churn posts skill", top_k=2, min_score=0)) == 2
+        assert len(retriever.search("churn posts skill", top_k=None, min_score=0)) > 2
+
+    def test_no_matching_term_returns_nothing(self, catalog):
+        """Test that queries with no matching terms return no skills."""
+        retriever = SkillRetriever(catalog=catalog)
+
+        assert retriever.search("hello there") == []
+        assert retriever.search("quantum chromodynamics") == []
+        assert retriever.search("") == []
+
+    def test_min_score(self, catalog):
+        """Test that skills scoring below min_score are dropped."""
+        retriever = SkillRetriever(catalog=catalog)
+        results = retriever.search("churn", top_k=None, min_score=0)
+        cutoff = results[0][1]
+
+        assert names(retriever.search("churn", top_k=None, min_score=cutoff)) == [results[0][0]]
+        assert retriever.search("churn", min_score=cutoff + 1) == []
+
+    def test_index_follows_catalog_changes(self, catalog, tmp_path):
+        """Test that a new skill is searchable after the catalog refreshes."""
+        retriever = SkillRetriever(catalog=catalog)
+        assert retriever.search("newsletter") == []
+
+        write_skill(tmp_path / "skills", "newsletter-builder", "Build the weekly newsletter")
+        catalog.refresh()
+
+        assert names(retriever.search("newsletter")) == ["newsletter-builder"]
+
+
+class TestTriggers:
+    """Test the Aho-Corasick trigger automaton and trigger boosts."""
+
+    def test_automaton_finds_every_phrase(self):
+        """Test that overlapping and nested phrases are all found in one pass."""
+        automaton = TriggerAutomaton(["churn", "churn risk", "risk", "at-risk", "she", "he", "hers"])
+
+        assert automaton.find("Flag AT-RISK accounts with churn risk") == {
+            "churn", "churn risk", "risk", "at-risk"
+        }
+        assert automaton.find("ushers") == {"she", "he", "hers"}
+        assert automaton.find("no match") == set()
+
+    def test_automaton_matches_substrings(self):
+        """Test that triggers match inside words, like `trigger in text`."""
+        phrases = ["audit", "lifecycle"]
+        automaton = TriggerAutomaton(phrases)
+        text = "run the lifecycleaudit now"
+
+        assert automaton.find(text) == {p for p in phrases if p in text}
+
+    def test_trigger_boosts_listed_skills_in_order(self, catalog):
+        """Test that a trigger hit boosts its skills, the first listed most."""
+        retriever = SkillRetriever(
+            catalog=catalog,
+            triggers={"retention": ["lifecycle-audit", "churn-prediction"]}
+        )
+        results = retriever.search("improve retention")
+
+        assert names(results) == ["lifecycle-audit", "churn-prediction"]
+        assert results[1][1] > SkillRetriever.TRIGGER_BOOST * (1 - SkillRetriever.TRIGGER_POSITION_DECAY)
+
+    def test_triggers_are_indexed_terms(self, catalog):
+        """Test that trigger words also count as BM25 terms for their skills."""
+        retriever = SkillRetriever(catalog=catalog, triggers={"cancellations": ["churn-prediction"]})
+
+        assert names(retriever.search("cancellation"))[0] == "churn-prediction"
+
+
+def test_tokenize():
+    """Test stopword removal and plural stripping."""
+    assert tokenize("Is there a skill for the Reddit posts?") == ["skill", "reddit", "post"]
+    assert tokenize("business class") == ["business", "class"]
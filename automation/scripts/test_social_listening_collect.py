@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Tests for concurrent NDJSON platform collection in the social-listening-collect
+skill (skills/extraction-skills/social-listening-collect/run.py).
+
+The platform collectors are replaced by small stand-in scripts, so no API
+credentials are needed.
+
+Run with:
+    python -m pytest automation/scripts/test_social_listening_collect.py -v
+"""
+
+import asyncio
+import importlib.util
+import time
+from pathlib import Path
+
+import pytest
+
+RUN_PY = (
+    Path(__file__).resolve().parents[2]
+    / "skills" / "extraction-skills" / "social-listening-collect" / "run.py"
+)
+
+STREAMING = """
+import json, sys, time
+print(json.dumps({"post_id": "a1", "text": "first"}), flush=True)
+time.sleep(0.4)
+print("not json", flush=True)
+print(json.dumps({"post_id": "a1", "text": "again"}), flush=True)
+print(json.dumps({"post_id": "a2", "text": "second"}), flush=True)
+"""
+
+LEGACY_JSON = """
+import json, time
+time.sleep(0.4)
+print(json.dumps({"posts": [{"tweet_id": "t1"}, {"tweet_id": "t2"}, {"tweet_id": "t3"}]}))
+"""
+
+HANGS = """
+import json, sys, time
+print(json.dumps({"permalink": "/r/x/1"}), flush=True)
+time.sleep(30)
+"""
+
+FAILS = """
+import sys
+print("bad credentials", file=sys.stderr)
+sys.exit(2)
+"""
+
+
+@pytest.fixture(scope="module")
+def run_module():
+    spec = importlib.util.spec_from_file_location("social_listening_collect_run", RUN_PY)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def make_skill(run_module, tmp_path, monkeypatch):
+    """A skill instance whose platform collectors are the given stand-in scripts."""
+    monkeypatch.setattr(run_module, "SYSTEM_ROOT", tmp_path)
+
+    def make(scripts):
+        paths = {}
+        for platform, source in scripts.items():
+            path = tmp_path / f"{platform}_collection_template.py"
+            path.write_text(source)
+            paths[path.name] = path
+
+        skill = run_module.SocialListeningCollectSkill("test-client")
+        skill._find_skill_script = lambda skill_name, script_name: paths.get(script_name)
+        return skill
+
+    return make
+
+
+class Collector:
+    """on_post callback deduplicating like SocialListeningCollectSkill.run()."""
+
+    def __init__(self, run_module):
+        self.post_key = run_module._post_key
+        self.seen = set()
+        self.posts = []
+
+    def __call__(self, platform, post):
+        key = self.post_key(platform, post)
+        if key in self.seen:
+            return False
+        self.seen.add(key)
+        self.posts.append((platform, post, time.perf_counter()))
+        return True
+
+
+class TestPlatformCollection:
+    """Test _collect_platforms() with stand-in collectors."""
+
+    def test_platforms_run_concurrently(self, run_module, make_skill):
+        """Test that wall time is the slowest platform, not the sum."""
+        skill = make_skill({"linkedin": STREAMING, "twitter": LEGACY_JSON, "reddit": LEGACY_JSON})
+        collector = Collector(run_module)
+
+        started = time.perf_counter()
+        results = skill._collect_platforms(["linkedin", "twitter", "reddit"], {}, "7d", collector, timeout=10)
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 1.0  # Three ~0.4s collectors in sequence would take 1.2s or more
+        assert {p: r["status"] for p, r in results.items()} == {
+            "linkedin": "success", "twitter": "success", "reddit": "success"
+        }
+        assert results["twitter"]["count"] == 3
+
+    def test_ndjson_lines_are_consumed_as_they_arrive(self, run_module, make_skill):
+        """Test that posts reach on_post before the collector exits, deduplicated."""
+        skill = make_skill({"linkedin": STREAMING})
+        collector = Collector(run_module)
+
+        result = skill._collect_platforms(["linkedin"], {}, "7d", collector, timeout=10)["linkedin"]
+        finished = time.perf_counter()
+
+        assert [post["text"] for _, post, _ in collector.posts] == ["first", "second"]
+        assert finished - collector.posts[0][2] >= 0.3  # Seen while the script slept
+        assert result["first_post_seconds"] < result["latency_seconds"]
+        assert result["count"] == 2
+        assert result["duplicates"] == 1
+        assert result["unparsed_lines"] == 1
+
+    def test_timeout_keeps_streamed_posts(self, run_module, make_skill):
+        """Test that a hung collector is killed and its streamed posts are kept."""
+        skill = make_skill({"reddit": HANGS, "twitter": LEGACY_JSON})
+        collector = Collector(run_module)
+
+        started = time.perf_counter()
+        results = skill._collect_platforms(["reddit", "twitter"], {}, "7d", collector, timeout=1.0)
+
+        assert time.perf_counter() - started < 5.0
+        assert results["reddit"]["status"] == "partial"
+        assert results["reddit"]["count"] == 1
+        assert results["twitter"]["status"] == "success"
+
+    def test_failed_collector_reports_stderr(self, run_module, make_skill):
+        """Test that a non-zero exit with no posts is an error carrying stderr."""
+        skill = make_skill({"linkedin": FAILS})
+
+        result = skill._collect_platforms(["linkedin"], {}, "7d", Collector(run_module), timeout=10)["linkedin"]
+
+        assert result["status"] == "error"
+        assert result["returncode"] == 2
+        assert "bad credentials" in result["error"]
+
+    def test_missing_script_and_unknown_platform(self, run_module, make_skill):
+        """Test that platforms without a collector fail without running anything."""
+        skill = make_skill({})
+
+        results = skill._collect_platforms(["twitter", "mastodon"], {}, "7d", Collector(run_module), timeout=10)
+
+        assert results["twitter"]["status"] == "error"
+        assert "Script not found" in results["twitter"]["error"]
+        assert results["mastodon"]["error"] == "Unknown platform: mastodon"
+
+    def test_sync_collection_inside_running_loop(self, run_module, make_skill):
+        """Test that _collect_platforms works when called from a running event loop."""
+        skill = make_skill({"twitter": LEGACY_JSON})
+        collector = Collector(run_module)
+
+        async def caller():
+            return skill._collect_platforms(["twitter"], {}, "7d", collector, timeout=10)
+
+        results = asyncio.run(caller())
+
+        assert results["twitter"]["count"] == 3
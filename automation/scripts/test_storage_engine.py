@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared SQLite storage engine (lib/storage_engine.py).
+
+Run with:
+    python -m pytest automation/scripts/test_storage_engine.py -v
+"""
+
+import threading
+
+import pytest
+
+from lib.storage_engine import Migration, StorageEngine
+
+
+ITEMS = [
+    Migration(1, "Create items", statements=[
+        "CREATE TABLE IF NOT EXISTS items (id INTEGER PRIMARY KEY, source TEXT, value TEXT)"
+    ]),
+]
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = StorageEngine(tmp_path / "engine.db", batch_size=16)
+    engine.migrate("items", ITEMS)
+    yield engine
+    engine.close()
+
+
+def values(engine, sql="SELECT value FROM items ORDER BY id"):
+    with engine.read() as conn:
+        return [row[0] for row in conn.execute(sql).fetchall()]
+
+
+class TestWriter:
+    """Test the single writer thread."""
+
+    def test_writes_run_on_one_thread_in_submission_order(self, engine):
+        """Test that every write runs on the writer thread, in order per submitter."""
+        threads_seen = set()
+
+        def insert(source, i):
+            def fn(conn):
+                threads_seen.add(threading.current_thread().name)
+                conn.execute("INSERT INTO items (source, value) VALUES (?, ?)", (source, str(i)))
+            return fn
+
+        def submitter(source):
+            futures = [engine.write(insert(source, i), wait=False) for i in range(100)]
+            for future in futures:
+                future.result(timeout=10)
+
+        threads = [threading.Thread(target=submitter, args=(f"s{n}",)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert threads_seen == {"storage-writer"}
+        for n in range(4):
+            seen = values(engine, f"SELECT value FROM items WHERE source = 's{n}' ORDER BY id")
+            assert seen == [str(i) for i in range(100)]
+        assert engine.get_stats()["writes"] >= 400
+
+    def test_read_after_write_sees_it(self, engine):
+        """Test that a read after a waited write sees the row."""
+        engine.execute("INSERT INTO items (source, value) VALUES ('a', 'x')")
+        assert values(engine) == ["x"]
+
+    def test_flush_commits_queued_writes(self, engine):
+        """Test that flush() waits for writes queued with wait=False."""
+        for i in range(50):
+            engine.execute("INSERT INTO items (source, value) VALUES ('a', ?)", (str(i),), wait=False)
+        engine.flush(timeout=10)
+        assert len(values(engine)) == 50
+
+
+class TestSavepoints:
+    """Test that a failing write only rolls back itself."""
+
+    def test_failed_job_rolls_back_only_itself(self, engine):
+        """Test a failing job in a batch leaves the other jobs committed."""
+        def good(value):
+            return lambda conn: conn.execute(
+                "INSERT INTO items (source, value) VALUES ('a', ?)", (value,)
+            )
+
+        def bad(conn):
+            conn.execute("INSERT INTO items (source, value) VALUES ('a', 'bad')")
+            raise ValueError("boom")
+
+        futures = [
+            engine.write(good("1"), wait=False),
+            engine.write(bad, wait=False),
+            engine.write(good("2"), wait=False),
+        ]
+        futures[0].result(timeout=10)
+        with pytest.raises(ValueError):
+            futures[1].result(timeout=10)
+        futures[2].result(timeout=10)
+
+        assert values(engine) == ["1", "2"]
+
+    def test_nested_write_failure_rolls_back_nested_only(self, engine):
+        """Test a failing nested write undoes its own changes, not the outer job's."""
+        def nested_bad(conn):
+            conn.execute("INSERT INTO items (source, value) VALUES ('a', 'nested')")
+            raise ValueError("nested failure")
+
+        def nested_good(conn):
+            conn.execute("INSERT INTO items (source, value) VALUES ('a', 'nested-ok')")
+
+        def outer(conn):
+            conn.execute("INSERT INTO items (source, value) VALUES ('a', 'outer')")
+            with pytest.raises(ValueError):
+                engine.write(nested_bad)
+            engine.write(nested_good)
+            return "done"
+
+        assert engine.write(outer) == "done"
+        assert values(engine) == ["outer", "nested-ok"]
+
+    def test_outer_failure_rolls_back_nested_writes(self, engine):
+        """Test a failing outer job also undoes its successful nested writes."""
+        def outer(conn):
+            engine.write(lambda c: c.execute("INSERT INTO items (source, value) VALUES ('a', 'n')"))
+            raise RuntimeError("outer failure")
+
+        with pytest.raises(RuntimeError):
+            engine.write(outer)
+        assert values(engine) == []
+
+
+class TestMigrations:
+    """Test versioned migrations."""
+
+    def test_migration_runs_once(self, engine):
+        """Test that migrating twice, even from a new engine, applies nothing again."""
+        calls = []
+        migrations = [
+            Migration(1, "Create counters", statements=[
+                "CREATE TABLE counters (name TEXT PRIMARY KEY, n INTEGER)"
+            ]),
+            Migration(2, "Seed counters", apply=lambda conn: (
+                calls.append(1),
+                conn.execute("INSERT INTO counters VALUES ('a', 1)"),
+            )),
+        ]
+
+        assert engine.migrate("counters", migrations) == 2
+        assert engine.migrate("counters", migrations) == 2
+
+        other = StorageEngine(engine.db_path)
+        try:
+            assert other.migrate("counters", migrations) == 2
+        finally:
+            other.close()
+
+        assert calls == [1]
+        assert values(engine, "SELECT n FROM counters") == [1]
+        assert values(
+            engine,
+            "SELECT version FROM schema_migrations WHERE component = 'counters' ORDER BY version"
+        ) == [1, 2]
+
+    def test_new_migration_applied_on_top(self, engine):
+        """Test that only migrations newer than the recorded version run."""
+        engine.migrate("items", ITEMS + [
+            Migration(2, "Add items index", statements=[
+                "CREATE INDEX IF NOT EXISTS idx_items_source ON items(source)"
+            ]),
+        ])
+        assert values(
+            engine,
+            "SELECT version FROM schema_migrations WHERE component = 'items' ORDER BY version"
+        ) == [1, 2]
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for the telemetry write-behind queue (lib/telemetry.py).
+
+Run with:
+    python -m pytest automation/scripts/test_telemetry.py -v
+"""
+
+import pytest
+
+from lib import telemetry
+from lib.telemetry import TelemetryWriteBehind
+
+
+@pytest.fixture
+def write_behind(isolated_storage, monkeypatch):
+    """A write-behind queue that only writes on flush, close or a full batch."""
+    telemetry.init_db()
+    queue = TelemetryWriteBehind(batch_size=1000, flush_interval=60)
+    monkeypatch.setattr(telemetry, "_write_behind", queue)
+    return queue
+
+
+def log_runs(count, prefix="run"):
+    for i in range(count):
+        telemetry.log_run(
+            run_id=f"{prefix}_{i}",
+            type="skill",
+            name="test-skill",
+            status="success",
+            start_time=f"2026-01-01T00:00:{i % 60:02d}+00:00",
+            tenant_id="tenant_a",
+            tokens_input=1000,
+            tokens_output=100,
+            steps=[{"step_name": "fetch", "status": "success"}],
+        )
+
+
+def count_rows(engine, table="runs"):
+    with engine.read() as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+class TestWriteBehind:
+    """Test that queued runs are written on flush and at shutdown."""
+
+    def test_log_run_does_not_block_on_write(self, isolated_storage, write_behind):
+        """Test that log_run() queues without writing."""
+        log_runs(5)
+
+        assert count_rows(isolated_storage) == 0
+        assert write_behind.get_stats()["enqueued"] == 5
+
+    def test_flush_makes_queued_runs_visible(self, isolated_storage, write_behind):
+        """Test that flush() writes every run queued before it."""
+        log_runs(25)
+
+        assert telemetry.flush(timeout=10)
+        assert count_rows(isolated_storage) == 25
+        assert count_rows(isolated_storage, "steps") == 25
+        assert (telemetry.RUNS_DIR / "run_0.json").exists()
+        assert write_behind.get_stats()["written"] == 25
+
+    def test_reads_flush_first(self, isolated_storage, write_behind):
+        """Test that query functions see runs logged by this process."""
+        log_runs(3)
+
+        assert len(telemetry.query_runs(name="test-skill")) == 3
+        assert len(telemetry.query_runs(status="success", limit=2)) == 2
+
+    def test_wait_commits_before_returning(self, isolated_storage, write_behind):
+        """Test that log_run(wait=True) blocks until the run is committed."""
+        telemetry.log_run(
+            run_id="waited", type="skill", name="test-skill", status="success",
+            start_time="2026-01-01T00:00:00+00:00", wait=True
+        )
+        assert count_rows(isolated_storage) == 1
+
+    def test_close_writes_everything_queued(self, isolated_storage, write_behind):
+        """Test that nothing queued is lost when the queue shuts down."""
+        log_runs(500)
+        write_behind.close()
+
+        stats = write_behind.get_stats()
+        assert count_rows(isolated_storage) == 500
+        assert stats["written"] == 500
+        assert stats["dropped"] == stats["failed"] == stats["queue_depth"] == 0
+
+    def test_log_run_after_close_writes_directly(self, isolated_storage, write_behind):
+        """Test that runs logged after shutdown are still written."""
+        write_behind.close()
+        log_runs(2, prefix="late")
+
+        assert count_rows(isolated_storage) == 2
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Tests for the warm skill worker (lib/worker.py).
+
+Run with:
+    python -m pytest automation/scripts/test_worker.py -v
+"""
+
+import io
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from lib import worker
+from lib.worker import ScriptWorker, WorkerBusy, run_script
+
+WORKER_PY = Path(worker.__file__).resolve()
+
+ECHO_SCRIPT = """
+import sys
+
+def main():
+    print(f"{VERSION} argv={sys.argv[1:]} stdin={sys.stdin.read()!r}")
+    if "--fail" in sys.argv:
+        sys.exit(3)
+
+VERSION = "v1"
+"""
+
+SLEEP_SCRIPT = """
+import sys
+import time
+
+def main():
+    time.sleep(float(sys.argv[1]))
+    print("slept")
+"""
+
+
+def write_script(path, source, mtime_ns=None):
+    path.write_text(source)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    return path
+
+
+@pytest.fixture
+def scripts(tmp_path, monkeypatch):
+    """Scripts in tmp_path, registered as warm-safe."""
+    echo = write_script(tmp_path / "echo.py", ECHO_SCRIPT, mtime_ns=1_000_000_000)
+    sleep = write_script(tmp_path / "sleep.py", SLEEP_SCRIPT)
+    monkeypatch.setattr(worker, "WARM_SCRIPTS", frozenset({echo.resolve(), sleep.resolve()}))
+    monkeypatch.delenv("MH1_WORKER_AUTOSTART", raising=False)
+    monkeypatch.delenv("MH1_WORKER_DISABLE", raising=False)
+    return {"echo": echo, "sleep": sleep, "cold": write_script(tmp_path / "cold.py", ECHO_SCRIPT + "\nmain()\n")}
+
+
+class TestScriptWorker:
+    """Test running scripts in-process."""
+
+    def test_runs_main_with_argv_stdin_and_exit_code(self, scripts, tmp_path):
+        """Test that a job sees its argv and stdin and reports its exit code."""
+        result = ScriptWorker().run(scripts["echo"], ["--fail"], cwd=str(tmp_path), stdin="hi")
+
+        assert result.stdout == "v1 argv=['--fail'] stdin='hi'\n"
+        assert result.returncode == 3
+        assert result.warm is True
+
+    def test_reuses_module_until_mtime_changes(self, scripts):
+        """Test that a script is imported once and reloaded when its file changes."""
+        script_worker = ScriptWorker()
+        script_worker.run(scripts["echo"])
+        module = script_worker._load(scripts["echo"].resolve())
+        assert script_worker.run(scripts["echo"]).stdout.startswith("v1")
+        assert script_worker._load(scripts["echo"].resolve()) is module
+
+        write_script(scripts["echo"], ECHO_SCRIPT.replace('"v1"', '"v2"'), mtime_ns=2_000_000_000)
+
+        assert script_worker.run(scripts["echo"]).stdout.startswith("v2")
+        assert script_worker._load(scripts["echo"].resolve()) is not module
+
+    def test_rejects_scripts_that_are_not_warm_safe(self, scripts):
+        """Test that only WARM_SCRIPTS run in-process."""
+        with pytest.raises(ValueError):
+            ScriptWorker().run(scripts["cold"])
+
+    def test_overrun_job_makes_worker_busy(self, scripts):
+        """Test that a timed-out job blocks new jobs until it finishes."""
+        script_worker = ScriptWorker()
+
+        with pytest.raises(subprocess.TimeoutExpired):
+            script_worker.run(scripts["sleep"], ["0.5"], timeout=0.05)
+        with pytest.raises(WorkerBusy):
+            script_worker.run(scripts["echo"])
+        assert script_worker.status()["busy"] is True
+
+        script_worker._overrun.join()
+        assert script_worker.run(scripts["echo"]).returncode == 0
+
+    def test_overlapping_job_that_cannot_start_in_time(self, scripts):
+        """Test that a job queued behind a running one gives up at its timeout."""
+        script_worker = ScriptWorker()
+        first = threading.Thread(target=script_worker.run, args=(scripts["sleep"], ["0.5"]))
+        first.start()
+        try:
+            while not script_worker._lock.locked():
+                time.sleep(0.01)
+
+            with pytest.raises(WorkerBusy):
+                script_worker.run(scripts["echo"], timeout=0.1)
+        finally:
+            first.join()
+
+
+class TestRunScript:
+    """Test run_script() falling back to a subprocess."""
+
+    def test_cold_script_runs_in_subprocess(self, scripts, tmp_path):
+        """Test that a script outside WARM_SCRIPTS runs as `python script`."""
+        result = run_script(scripts["cold"], ["a", 1], cwd=str(tmp_path), stdin="in")
+
+        assert result.warm is False
+        assert result.returncode == 0
+        assert result.stdout == "v1 argv=['a', '1'] stdin='in'\n"
+
+    def test_warm_script_without_worker_runs_in_subprocess(self, scripts, tmp_path, monkeypatch):
+        """Test that a warm-safe script still runs when no worker is available."""
+        monkeypatch.setenv("MH1_WORKER_DISABLE", "1")
+        script = write_script(tmp_path / "warm_main.py", ECHO_SCRIPT + "\nmain()\n")
+        monkeypatch.setattr(worker, "WARM_SCRIPTS", frozenset({script.resolve()}))
+
+        result = run_script(script, ["--fail"])
+
+        assert result.warm is False
+        assert result.returncode == 3
+
+
+class TestJsonRpc:
+    """Test the JSON-RPC protocol."""
+
+    def request(self, method, params=None, request_id=1):
+        return json.dumps({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params or {}})
+
+    def test_stdio_round_trip(self, scripts, monkeypatch):
+        """Test run, ping, errors and shutdown over stdin/stdout."""
+        lines = [
+            self.request("run", {"script": str(scripts["echo"]), "argv": ["x"], "stdin": "data"}, 1),
+            self.request("ping", request_id=2),
+            self.request("run", {"script": str(scripts["cold"])}, 3),
+            self.request("nope", request_id=4),
+            "not json",
+            self.request("shutdown", request_id=5),
+            self.request("ping", request_id=6),
+        ]
+        stdout = io.StringIO()
+        monkeypatch.setattr(sys, "stdin", io.StringIO("\n".join(lines) + "\n"))
+        monkeypatch.setattr(sys, "stdout", stdout)
+
+        worker.serve_stdio()
+
+        responses = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        assert [r["id"] for r in responses] == [1, 2, 3, 4, None, 5]
+        assert responses[0]["result"]["stdout"] == "v1 argv=['x'] stdin='data'\n"
+        assert responses[0]["result"]["warm"] is True
+        assert responses[1]["result"]["jobs_run"] == 1
+        assert responses[2]["error"]["code"] == worker.INVALID_PARAMS
+        assert responses[3]["error"]["code"] == worker.METHOD_NOT_FOUND
+        assert responses[4]["error"]["code"] == worker.PARSE_ERROR
+        assert responses[5]["result"] == {"stopping": True}
+
+    def test_stdio_worker_process(self):
+        """Test the `serve --stdio` command as a separate process."""
+        requests = "\n".join([self.request("ping"), self.request("shutdown", request_id=2)]) + "\n"
+        proc = subprocess.run(
+            [sys.executable, str(WORKER_PY), "serve", "--stdio"],
+            input=requests, capture_output=True, text=True, timeout=30
+        )
+
+        responses = [json.loads(line) for line in proc.stdout.splitlines()]
+        assert proc.returncode == 0
+        assert responses[0]["result"]["pid"] != os.getpid()
+        assert responses[1]["result"] == {"stopping": True}
+
+    @pytest.mark.skipif(not hasattr(worker.socket, "AF_UNIX"), reason="Unix sockets not available")
+    def test_socket_round_trip(self, scripts, tmp_path):
+        """Test a run over the Unix socket, then shutdown."""
+        socket_path = tmp_path / "w.sock"
+        server = threading.Thread(target=worker.serve, args=(socket_path, 0), daemon=True)
+        server.start()
+        for _ in range(100):
+            if worker.ping(socket_path):
+                break
+            time.sleep(0.05)
+
+        result = worker._call("run", {"script": str(scripts["echo"]), "argv": ["y"]}, socket_path=socket_path)
+        assert result["stdout"] == "v1 argv=['y'] stdin=''\n"
+
+        worker._call("shutdown", {}, socket_path=socket_path, timeout=5.0)
+        server.join(timeout=10)
+        assert not server.is_alive()
+        assert not socket_path.exists()
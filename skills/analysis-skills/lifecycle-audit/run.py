@@ -14,6 +14,7 @@ Features:
 - Deterministic release policy (auto_deliver/refine/review/blocked)
 - Three execution modes: suggest, preview, execute
 - Large dataset handling with context manager (RLM pattern)
+- Streaming columnar analysis with top-k scoring for very large portals
 
 Usage:
     # Basic run
@@ -35,17 +36,23 @@ Usage:
 """
 
 import argparse
+import heapq
 import json
 import os
 import sys
 import time
 import uuid
+from array import array
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-# Add lib to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "lib"))
+# Add lib to path (automation/lib, plus automation/ for lib.* imports inside it)
+AUTOMATION_ROOT = Path(__file__).parent.parent.parent.parent / "automation"
+sys.path.insert(0, str(AUTOMATION_ROOT))
+sys.path.insert(0, str(AUTOMATION_ROOT / "lib"))
 
 from runner import (
     WorkflowRunner, 
@@ -71,6 +78,12 @@ try:
 except ImportError:
     INTELLIGENCE_AVAILABLE = False
 
+# Vectorized scoring (optional - falls back to per-row scoring)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # Constants
 SKILL_NAME = "lifecycle-audit"
 SKILL_VERSION = "v2.0.0"
@@ -100,6 +113,17 @@ DATA_REQUIREMENTS = {
     }
 }
 
+# Streaming analysis
+STREAMING_MIN_RECORDS = 5000   # analysis_mode "auto" streams above this limit
+CONTACT_PAGE_SIZE = 100        # HubSpot list page size
+SCORING_BLOCK_ROWS = 4096      # Customers buffered per vectorized scoring block
+SCORING_TOP_K = 20             # At-risk / upsell accounts kept
+
+# Snowflake enrichment
+SNOWFLAKE_CHUNK_SIZE = 1000    # Emails per IN (...) list
+SNOWFLAKE_MAX_WORKERS = 4      # Enrichment queries in flight
+ENRICHMENT_BATCH_SIZE = SNOWFLAKE_CHUNK_SIZE * SNOWFLAKE_MAX_WORKERS  # Customers per streamed enrichment
+
 # Cost estimates (per 1K tokens)
 COST_PER_1K_INPUT = 0.003   # Sonnet input
 COST_PER_1K_OUTPUT = 0.015  # Sonnet output
@@ -107,6 +131,212 @@ COST_HAIKU_INPUT = 0.00025  # Haiku input
 COST_HAIKU_OUTPUT = 0.00125 # Haiku output
 
 
+def _usage_value(usage: Dict, key: str, default: float) -> float:
+    """Numeric usage signal, or default when missing or not a number."""
+    value = usage.get(key, default)
+    return float(value) if isinstance(value, (int, float)) else default
+
+
+class TopK:
+    """
+    Bounded min-heap keeping the k highest-scoring items.
+
+    Ties keep the earliest pushed item, so results match a stable sort by
+    score (descending) truncated to k.
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        self._heap: List[Tuple[float, int, Any]] = []
+        self._seq = 0
+
+    def accepts(self, score: float) -> bool:
+        """Whether an item with this score would enter the heap now."""
+        return len(self._heap) < self.k or score > self._heap[0][0]
+
+    def push(self, score: float, item: Any):
+        self._seq += 1
+        entry = (score, -self._seq, item)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def items(self) -> List[Any]:
+        """Items by score, highest first."""
+        return [item for _, _, item in sorted(self._heap, reverse=True)]
+
+
+class AccountScorer:
+    """
+    Risk and upsell scoring over customer contacts.
+
+    Usage signals are buffered in columnar arrays (last_active_days,
+    login_trend, feature_adoption) and scored a block at a time, vectorized
+    when NumPy is available. Only the top-k at-risk and upsell accounts are
+    kept, so memory does not grow with the number of customers scored.
+    """
+
+    def __init__(self, top_k: int = SCORING_TOP_K, block_rows: int = SCORING_BLOCK_ROWS):
+        self.at_risk = TopK(top_k)
+        self.upsell = TopK(top_k)
+        self.at_risk_total = 0
+        self.upsell_total = 0
+        self.scored = 0
+        self._block_rows = block_rows
+        self._contacts: List[Dict] = []
+        self._last_active = array("d")
+        self._login_trend = array("d")
+        self._adoption = array("d")
+
+    def add(self, contact: Dict):
+        """Buffer one customer contact, scoring the block when it fills."""
+        usage = contact.get("usage") or {}
+        if not isinstance(usage, dict):
+            usage = {}
+        self._contacts.append(contact)
+        self._last_active.append(_usage_value(usage, "last_active_days", 30))
+        self._login_trend.append(_usage_value(usage, "login_trend", 0))
+        self._adoption.append(_usage_value(usage, "feature_adoption", 0.5))
+        if len(self._contacts) >= self._block_rows:
+            self.flush()
+
+    def extend(self, contacts: Iterable[Any]):
+        for contact in contacts:
+            if isinstance(contact, dict):
+                self.add(contact)
+
+    def flush(self):
+        """Score buffered contacts and clear the buffer."""
+        if not self._contacts:
+            return
+
+        if np is not None:
+            last_active = np.frombuffer(self._last_active, dtype=np.float64)
+            login_trend = np.frombuffer(self._login_trend, dtype=np.float64)
+            adoption = np.frombuffer(self._adoption, dtype=np.float64)
+            risk = 0.3 * (last_active > 14) + 0.3 * (last_active > 30) + 0.2 * (login_trend < 0)
+            upsell = 0.4 * (last_active < 7) + 0.3 * (login_trend > 0) + 0.3 * (adoption > 0.7)
+            risk_rows = np.flatnonzero(risk > 0.5).tolist()
+            upsell_rows = np.flatnonzero(upsell > 0.6).tolist()
+            risk, upsell = risk.tolist(), upsell.tolist()
+        else:
+            risk = [
+                0.3 * (la > 14) + 0.3 * (la > 30) + 0.2 * (lt < 0)
+                for la, lt in zip(self._last_active, self._login_trend)
+            ]
+            upsell = [
+                0.4 * (la < 7) + 0.3 * (lt > 0) + 0.3 * (fa > 0.7)
+                for la, lt, fa in zip(self._last_active, self._login_trend, self._adoption)
+            ]
+            risk_rows = [i for i, score in enumerate(risk) if score > 0.5]
+            upsell_rows = [i for i, score in enumerate(upsell) if score > 0.6]
+
+        self.at_risk_total += len(risk_rows)
+        self.upsell_total += len(upsell_rows)
+
+        # Only rows that can still enter a heap get an output record
+        for i in risk_rows:
+            score = round(risk[i], 2)
+            if self.at_risk.accepts(score):
+                self.at_risk.push(score, self._risk_record(i, score))
+        for i in upsell_rows:
+            score = round(upsell[i], 2)
+            if self.upsell.accepts(score):
+                self.upsell.push(score, self._upsell_record(i, score))
+
+        self.scored += len(self._contacts)
+        self._contacts = []
+        self._last_active = array("d")
+        self._login_trend = array("d")
+        self._adoption = array("d")
+
+    def _identity(self, i: int) -> Dict:
+        contact = self._contacts[i]
+        return {
+            "email": contact.get("email", "unknown"),
+            "name": f"{contact.get('firstname', '')} {contact.get('lastname', '')}".strip(),
+            "company": contact.get("company", "Unknown"),
+            "stage": "customer",
+        }
+
+    def _raw_usage(self, i: int, key: str, default: Any) -> Any:
+        usage = self._contacts[i].get("usage") or {}
+        return usage.get(key, default) if isinstance(usage, dict) else default
+
+    def _risk_record(self, i: int, score: float) -> Dict:
+        return {
+            **self._identity(i),
+            "risk_score": score,
+            "risk_factors": {
+                "days_inactive": self._raw_usage(i, "last_active_days", 30),
+                "negative_trend": self._login_trend[i] < 0
+            }
+        }
+
+    def _upsell_record(self, i: int, score: float) -> Dict:
+        return {
+            **self._identity(i),
+            "upsell_score": score,
+            "upsell_signals": {
+                "highly_active": self._last_active[i] < 7,
+                "growing_usage": self._login_trend[i] > 0,
+                "high_adoption": self._adoption[i] > 0.7
+            }
+        }
+
+    def results(self) -> Dict:
+        """Top at-risk and upsell accounts, highest score first."""
+        self.flush()
+        return {
+            "at_risk": self.at_risk.items(),
+            "upsell_candidates": self.upsell.items()
+        }
+
+
+class StreamingLifecycleAnalysis:
+    """
+    Single-pass lifecycle aggregates over pages of contacts.
+
+    Counts stages and field coverage, feeds customers to an AccountScorer,
+    and estimates the token size of the contacts seen from each contact's
+    serialized length. Pages are not retained, so peak memory is one page
+    plus one scoring block regardless of portal size.
+    """
+
+    def __init__(self, stages: Optional[List[str]] = None):
+        self.stages = stages
+        self.total_contacts = 0
+        self.stage_counts: Counter = Counter()
+        self.field_present: Counter = Counter()
+        self.scorer = AccountScorer()
+        self._chars = 0
+
+    def add_page(self, contacts: Iterable[Any]):
+        """Consume one page (or part of a page) of contacts."""
+        coverage_fields = DATA_REQUIREMENTS["recommended_coverage"]
+        for contact in contacts:
+            if not isinstance(contact, dict):
+                continue
+            self.total_contacts += 1
+            for field in coverage_fields:
+                if contact.get(field):
+                    self.field_present[field] += 1
+
+            stage = contact.get("lifecyclestage", "unknown")
+            if self.stages and stage not in self.stages:
+                continue
+            self.stage_counts[stage] += 1
+            self._chars += len(json.dumps(contact, default=str)) + 2
+            if stage == "customer":
+                self.scorer.add(contact)
+
+    @property
+    def tokens(self) -> int:
+        """Estimated tokens of the contacts kept after stage filtering."""
+        return self._chars // 4
+
+
 class LifecycleAuditSkill:
     """
     Production-ready Lifecycle Audit skill with full MCP integration.
@@ -151,10 +381,11 @@ class LifecycleAuditSkill:
                 pass
         return self._intelligence
         
-    def _estimate_cost(self, limit: int) -> float:
+    def _estimate_cost(self, limit: int, streaming: bool = False) -> float:
         """Estimate run cost based on expected operations."""
-        # Base cost for discovery + analysis
-        base_tokens = limit * 50  # ~50 tokens per contact
+        # Base cost for discovery + analysis (streaming aggregates locally,
+        # so contacts never reach a prompt)
+        base_tokens = 0 if streaming else limit * 50  # ~50 tokens per contact
         analysis_tokens = 2000    # LLM analysis
         synthesis_tokens = 1500   # Synthesis
         
@@ -185,13 +416,25 @@ class LifecycleAuditSkill:
         override: Optional[Dict] = None
     ) -> Dict:
         """Validate that data meets minimum requirements."""
+        field_present = {
+            field: sum(1 for c in contacts if c.get(field))
+            for field in DATA_REQUIREMENTS["recommended_coverage"]
+        }
+        return self._validate_coverage(len(contacts), field_present, override)
+    
+    def _validate_coverage(
+        self,
+        record_count: int,
+        field_present: Dict[str, int],
+        override: Optional[Dict] = None
+    ) -> Dict:
+        """Validate record count and per-field presence counts against requirements."""
         min_records = DATA_REQUIREMENTS["minimum_records"]
         if override and "minimum_records" in override:
             min_records = override["minimum_records"]
         
         skip_validation = override and override.get("skip_validation", False)
         
-        record_count = len(contacts)
         issues = []
         warnings = []
         
@@ -205,8 +448,7 @@ class LifecycleAuditSkill:
         field_coverage = {}
         for field, required_coverage in DATA_REQUIREMENTS["recommended_coverage"].items():
             if record_count > 0:
-                present = sum(1 for c in contacts if c.get(field))
-                coverage = present / record_count
+                coverage = field_present.get(field, 0) / record_count
                 field_coverage[field] = round(coverage, 3)
                 
                 if coverage < required_coverage and field in DATA_REQUIREMENTS["required_fields"]:
@@ -261,16 +503,38 @@ class LifecycleAuditSkill:
             "fetched_at": datetime.now(timezone.utc).isoformat()
         }
     
-    def _fetch_snowflake_usage(
+    def _iter_contact_pages(
         self,
-        emails: List[str]
-    ) -> Dict:
-        """Fetch usage data from Snowflake via MCP."""
-        if not self.snowflake.is_available() or not emails:
-            return {"usage": [], "source": "unavailable"}
+        limit: int,
+        stages: Optional[List[str]] = None,
+        page_size: int = CONTACT_PAGE_SIZE
+    ) -> Iterator[List[Dict]]:
+        """Yield contacts from HubSpot via MCP one page at a time."""
+        if self.hubspot.is_available():
+            properties = "email,firstname,lastname,company,lifecyclestage,hs_lead_status"
+            
+            # In production, pages would be fetched with the list cursor;
+            # the MCPClient returns a call spec that would be executed
+            response = self.hubspot.list_contacts(
+                limit=min(page_size, limit),
+                properties=properties
+            )
+            
+            if response.success:
+                # For development, we fall back to sample data
+                pass
         
-        # Build query for user engagement data
-        email_list = ",".join(f"'{e}'" for e in emails[:1000])  # Limit for safety
+        # Fallback to sample data for development/testing
+        available_stages = stages or STAGE_ORDER
+        for start in range(0, limit, page_size):
+            yield [
+                self._sample_contact(i, available_stages)
+                for i in range(start, min(start + page_size, limit))
+            ]
+    
+    def _query_usage_chunk(self, emails: List[str]) -> MCPResponse:
+        """Query user engagement for one chunk of emails."""
+        email_list = ",".join("'{}'".format(e.replace("'", "''")) for e in emails)
         query = f"""
             SELECT 
                 email,
@@ -284,17 +548,103 @@ class LifecycleAuditSkill:
             FROM user_engagement
             WHERE email IN ({email_list})
         """
+        return self.snowflake.execute_query(query, limit=len(emails))
+    
+    def _fetch_snowflake_usage(self, emails: Iterable[str]) -> Dict:
+        """
+        Fetch usage data from Snowflake via MCP, indexed by email.
         
-        response = self.snowflake.execute_query(query, limit=1000)
+        Emails are deduplicated and split into SNOWFLAKE_CHUNK_SIZE IN-lists,
+        queried SNOWFLAKE_MAX_WORKERS at a time. Rows are merged into the
+        index as each chunk completes; a failed chunk leaves its emails
+        unenriched without failing the others.
         
-        if response.success:
-            # Real MCP response would have usage data
-            return {
-                "usage": response.data,
-                "source": "snowflake"
+        Returns:
+            Dict with usage_by_email, source and chunks (one timing record
+            per query: chunk_index, emails, rows, timestamp, duration_ms,
+            status, error)
+        """
+        unique_emails = list(dict.fromkeys(e for e in emails if e))
+        if not self.snowflake.is_available() or not unique_emails:
+            return {"usage_by_email": {}, "source": "unavailable", "chunks": []}
+        
+        chunks = [
+            unique_emails[i:i + SNOWFLAKE_CHUNK_SIZE]
+            for i in range(0, len(unique_emails), SNOWFLAKE_CHUNK_SIZE)
+        ]
+        
+        def run_chunk(index: int, chunk: List[str]) -> Tuple[MCPResponse, Dict]:
+            timestamp = datetime.now(timezone.utc).isoformat()
+            start = time.perf_counter()
+            try:
+                response = self._query_usage_chunk(chunk)
+            except Exception as e:
+                response = MCPResponse(success=False, data=None, error=str(e))
+            return response, {
+                "chunk_index": index,
+                "emails": len(chunk),
+                "timestamp": timestamp,
+                "duration_ms": int((time.perf_counter() - start) * 1000),
+                "status": "success" if response.success else "failed",
+                "error": response.error
             }
         
-        return {"usage": [], "source": "unavailable"}
+        usage_by_email: Dict[str, Dict] = {}
+        timings: List[Dict] = []
+        with ThreadPoolExecutor(max_workers=min(SNOWFLAKE_MAX_WORKERS, len(chunks))) as pool:
+            futures = [pool.submit(run_chunk, i, chunk) for i, chunk in enumerate(chunks)]
+            for future in as_completed(futures):
+                response, timing = future.result()
+                rows = response.data if response.success and isinstance(response.data, list) else []
+                for row in rows:
+                    if isinstance(row, dict) and row.get("email"):
+                        usage_by_email[row["email"]] = row
+                timing["rows"] = len(rows)
+                timings.append(timing)
+        
+        timings.sort(key=lambda t: t["chunk_index"])
+        succeeded = any(t["status"] == "success" for t in timings)
+        return {
+            "usage_by_email": usage_by_email,
+            "source": "snowflake" if succeeded else "unavailable",
+            "chunks": timings
+        }
+    
+    def _enrich_contacts(self, contacts: List[Dict], runner: Optional[WorkflowRunner] = None) -> int:
+        """
+        Attach Snowflake usage to customer contacts in place.
+        
+        Args:
+            contacts: Contacts of any stage; only customers are looked up
+            runner: If given, each enrichment query is recorded as a tool
+                call of the running step
+        
+        Returns:
+            Number of contacts enriched
+        """
+        customers = [
+            c for c in contacts
+            if isinstance(c, dict) and c.get("lifecyclestage") == "customer" and c.get("email")
+        ]
+        usage = self._fetch_snowflake_usage(c["email"] for c in customers)
+        if runner is not None:
+            for chunk in usage["chunks"]:
+                runner.record_tool_call(
+                    "snowflake_execute_query",
+                    chunk["duration_ms"],
+                    status=chunk["status"],
+                    error=chunk["error"],
+                    timestamp=chunk["timestamp"]
+                )
+        
+        usage_by_email = usage["usage_by_email"]
+        enriched = 0
+        for contact in customers:
+            row = usage_by_email.get(contact["email"])
+            if row is not None:
+                contact["usage"] = row
+                enriched += 1
+        return enriched
     
     def _analyze_with_llm(
         self,
@@ -365,39 +715,45 @@ Respond with JSON containing:
         contacts: List[Dict],
         config: ContextConfig
     ) -> Dict:
-        """Process large datasets using RLM pattern."""
-        ctx = ContextManager(contacts, config)
-        
-        if not ctx.should_offload():
-            # Small dataset, process directly
-            return self._analyze_contacts_directly(contacts)
-        
-        # Large dataset - use chunked processing
-        strategy = ctx.get_strategy()
-        
-        # Process chunks with cheaper model
-        chunk_model = get_model_for_subtask("chunk_processing")
-        
-        for chunk in ctx.chunk(size=config.chunk_size):
-            # Process each chunk
-            chunk_result = self._analyze_chunk(chunk, chunk_model["model"])
-            ctx.aggregate_buffer("chunk_results", chunk_result)
-        
-        # Synthesize results with stronger model
-        synthesis_model = get_model_for_subtask("synthesis")
-        aggregated = ctx.get_aggregated("chunk_results")
-        
-        final_analysis = self._synthesize_results(aggregated, synthesis_model["model"])
-        
-        # Get context telemetry
-        ctx_telemetry = ctx.get_telemetry()
-        
+        """
+        Process large datasets using RLM pattern.
+
+        Contacts past the offload threshold are spilled to disk; chunks are
+        analyzed concurrently (config.max_workers at a time) and each chunk
+        result is aggregated as it completes.
+        """
+        with ContextManager(contacts, config) as ctx:
+            if not ctx.should_offload():
+                # Small dataset, process directly
+                return self._analyze_contacts_directly(contacts)
+
+            # Process chunks with cheaper model
+            chunk_model = get_model_for_subtask("chunk_processing")["model"]
+            ctx.map_chunks(
+                lambda chunk: self._analyze_chunk(chunk, chunk_model),
+                size=config.chunk_size,
+                model=chunk_model
+            )
+
+            # Synthesize results with stronger model
+            synthesis_model = get_model_for_subtask("synthesis")
+            aggregated = ctx.get_aggregated("chunk_results")
+
+            final_analysis = self._synthesize_results(aggregated, synthesis_model["model"])
+
+            # Get context telemetry
+            ctx_telemetry = ctx.get_telemetry()
+
+        self.sub_calls.extend(ctx_telemetry.sub_calls)
+
         return {
             "analysis": final_analysis,
             "context_handling": {
                 "strategy": ctx_telemetry.strategy,
                 "input_size_tokens": ctx_telemetry.input_size_tokens,
                 "chunks_processed": ctx_telemetry.chunks_processed,
+                "offloaded": ctx_telemetry.offloaded,
+                "processing_ms": ctx_telemetry.processing_ms,
                 "sub_calls": ctx_telemetry.sub_calls
             }
         }
@@ -447,17 +803,11 @@ Respond with JSON containing:
     
     def _analyze_contacts_directly(self, contacts: List[Dict]) -> Dict:
         """Analyze contacts directly (for small datasets)."""
-        by_stage = {}
-        for contact in contacts:
-            stage = contact.get("lifecyclestage", "unknown")
-            if stage not in by_stage:
-                by_stage[stage] = []
-            by_stage[stage].append(contact)
+        by_stage = Counter(contact.get("lifecyclestage", "unknown") for contact in contacts)
         
         return {
             "analysis": {
-                "total_by_stage": {s: len(c) for s, c in by_stage.items()},
-                "contacts_by_stage": by_stage
+                "total_by_stage": dict(by_stage)
             },
             "context_handling": {
                 "strategy": "inline",
@@ -473,38 +823,37 @@ Respond with JSON containing:
         stages: Optional[List[str]] = None
     ) -> List[Dict]:
         """Generate sample contact data for testing/development."""
+        available_stages = stages or STAGE_ORDER
+        return [self._sample_contact(i, available_stages) for i in range(limit)]
+    
+    def _sample_contact(self, i: int, available_stages: List[str]) -> Dict:
+        """Generate one sample contact."""
         import random
         
-        available_stages = stages or STAGE_ORDER
         companies = ["Acme Corp", "TechCo", "BigBrand", "StartupX", "Enterprise Inc"]
+        stage = random.choices(
+            available_stages, 
+            weights=[10, 25, 20, 15, 10, 15, 5][:len(available_stages)]
+        )[0]
+        
+        contact = {
+            "id": f"contact_{i}",
+            "email": f"user{i}@example.com",
+            "firstname": f"User",
+            "lastname": f"{i}",
+            "company": random.choice(companies),
+            "lifecyclestage": stage,
+        }
         
-        contacts = []
-        for i in range(limit):
-            stage = random.choices(
-                available_stages, 
-                weights=[10, 25, 20, 15, 10, 15, 5][:len(available_stages)]
-            )[0]
-            
-            contact = {
-                "id": f"contact_{i}",
-                "email": f"user{i}@example.com",
-                "firstname": f"User",
-                "lastname": f"{i}",
-                "company": random.choice(companies),
-                "lifecyclestage": stage,
+        # Add usage data for customers/evangelists
+        if stage in ["customer", "evangelist"]:
+            contact["usage"] = {
+                "last_active_days": random.randint(1, 60),
+                "login_trend": random.choice([-1, 0, 1]),
+                "feature_adoption": random.random()
             }
-            
-            # Add usage data for customers/evangelists
-            if stage in ["customer", "evangelist"]:
-                contact["usage"] = {
-                    "last_active_days": random.randint(1, 60),
-                    "login_trend": random.choice([-1, 0, 1]),
-                    "feature_adoption": random.random()
-                }
-            
-            contacts.append(contact)
         
-        return contacts
+        return contact
     
     def _calculate_conversions(self, stage_counts: Dict) -> List[Dict]:
         """Calculate conversion rates between stages."""
@@ -548,9 +897,6 @@ Respond with JSON containing:
     
     def _score_accounts(self, contacts_by_stage: Dict) -> Dict:
         """Calculate risk and upsell scores for accounts."""
-        at_risk = []
-        upsell_candidates = []
-
         # Handle None or non-dict input gracefully
         if not isinstance(contacts_by_stage, dict):
             return {"at_risk": [], "upsell_candidates": []}
@@ -559,71 +905,9 @@ Respond with JSON containing:
         if not isinstance(customer_contacts, list):
             customer_contacts = []
 
-        for contact in customer_contacts:
-            if not isinstance(contact, dict):
-                continue
-            email = contact.get("email", "unknown")
-            name = f"{contact.get('firstname', '')} {contact.get('lastname', '')}".strip()
-            company = contact.get("company", "Unknown")
-            usage = contact.get("usage", {})
-            
-            last_active = usage.get("last_active_days", 30)
-            login_trend = usage.get("login_trend", 0)
-            feature_adoption = usage.get("feature_adoption", 0.5)
-            
-            # Risk scoring
-            risk_score = 0
-            if last_active > 14:
-                risk_score += 0.3
-            if last_active > 30:
-                risk_score += 0.3
-            if login_trend < 0:
-                risk_score += 0.2
-            
-            if risk_score > 0.5:
-                at_risk.append({
-                    "email": email,
-                    "name": name,
-                    "company": company,
-                    "stage": "customer",
-                    "risk_score": round(risk_score, 2),
-                    "risk_factors": {
-                        "days_inactive": last_active,
-                        "negative_trend": login_trend < 0
-                    }
-                })
-            
-            # Upsell scoring
-            upsell_score = 0
-            if last_active < 7:
-                upsell_score += 0.4
-            if login_trend > 0:
-                upsell_score += 0.3
-            if feature_adoption > 0.7:
-                upsell_score += 0.3
-            
-            if upsell_score > 0.6:
-                upsell_candidates.append({
-                    "email": email,
-                    "name": name,
-                    "company": company,
-                    "stage": "customer",
-                    "upsell_score": round(upsell_score, 2),
-                    "upsell_signals": {
-                        "highly_active": last_active < 7,
-                        "growing_usage": login_trend > 0,
-                        "high_adoption": feature_adoption > 0.7
-                    }
-                })
-        
-        # Sort by score
-        at_risk.sort(key=lambda x: x["risk_score"], reverse=True)
-        upsell_candidates.sort(key=lambda x: x["upsell_score"], reverse=True)
-        
-        return {
-            "at_risk": at_risk[:20],
-            "upsell_candidates": upsell_candidates[:20]
-        }
+        scorer = AccountScorer()
+        scorer.extend(customer_contacts)
+        return scorer.results()
     
     def _generate_recommendations(
         self,
@@ -757,6 +1041,9 @@ Respond with JSON containing:
                 - stages: Lifecycle stages to include (optional)
                 - execution_mode: suggest|preview|execute (default: suggest)
                 - data_requirements_override: Override data validation (optional)
+                - analysis_mode: auto|standard|streaming (default: auto, which
+                  streams when limit > STREAMING_MIN_RECORDS)
+                - page_size: Contacts per page in streaming mode (default 100)
         
         Returns:
             Complete audit result with recommendations, metadata, and release action
@@ -768,6 +1055,8 @@ Respond with JSON containing:
         stages = inputs.get("stages")
         self.execution_mode = inputs.get("execution_mode", "suggest")
         data_override = inputs.get("data_requirements_override")
+        analysis_mode = inputs.get("analysis_mode", "auto")
+        page_size = inputs.get("page_size", CONTACT_PAGE_SIZE)
         
         # Intelligence: Get guidance and register prediction
         guidance = None
@@ -821,7 +1110,8 @@ Respond with JSON containing:
         
         try:
             # Step 0: Budget check
-            estimated_cost = self._estimate_cost(limit)
+            streaming = self._use_streaming(analysis_mode, limit)
+            estimated_cost = self._estimate_cost(limit, streaming=streaming)
             budget_check = self._check_budget(estimated_cost)
             
             if not budget_check["allowed"]:
@@ -835,187 +1125,14 @@ Respond with JSON containing:
                     )
                 }
             
-            # Step 1: Discovery - Fetch contacts
-            def discovery_step(inputs):
-                hubspot_data = self._fetch_hubspot_contacts(limit=limit, stages=stages)
-                contacts = hubspot_data["contacts"]
-                
-                # Validate data requirements
-                validation = self._validate_data_requirements(contacts, data_override)
-                
-                if not validation["valid"]:
-                    raise ValueError(f"Data requirements not met: {validation['issues']}")
-                
-                # Group by stage
-                by_stage = {}
-                for contact in contacts:
-                    stage = contact.get("lifecyclestage", "unknown")
-                    if stages and stage not in stages:
-                        continue
-                    if stage not in by_stage:
-                        by_stage[stage] = []
-                    by_stage[stage].append(contact)
-                
-                output = {
-                    "total_contacts": len(contacts),
-                    "by_stage": {s: len(c) for s, c in by_stage.items()},
-                    "contacts": by_stage,
-                    "data_validation": validation,
-                    "source": hubspot_data["source"]
-                }
-                
-                return {
-                    "output": output,
-                    "tokens_input": estimate_tokens(json.dumps(inputs)),
-                    "tokens_output": estimate_tokens(json.dumps(output))
-                }
-            
-            discovery_result = runner.run_step("discovery", discovery_step, {"limit": limit})
-            if discovery_result.status != "success":
-                raise Exception(f"Discovery failed: {discovery_result.error}")
-            
-            contacts_by_stage = discovery_result.output.get("contacts", {})
-            
-            # Step 2: Enrichment - Add Snowflake data
-            def enrichment_step(inputs):
-                contacts = inputs.get("contacts", {})
-
-                # Ensure contacts is a dict, not a string or None
-                if not isinstance(contacts, dict):
-                    contacts = {}
-
-                # Get emails for all customers
-                customer_contacts = contacts.get("customer", [])
-                if not isinstance(customer_contacts, list):
-                    customer_contacts = []
-
-                customer_emails = [
-                    c.get("email") for c in customer_contacts
-                    if isinstance(c, dict) and c.get("email")
-                ]
-
-                # Fetch usage data
-                usage_data = self._fetch_snowflake_usage(customer_emails)
-
-                # Enrich contacts - only if usage data is a list of records
-                usage_records = usage_data.get("usage", [])
-                if isinstance(usage_records, list) and usage_records:
-                    usage_by_email = {
-                        u.get("email"): u for u in usage_records
-                        if isinstance(u, dict) and u.get("email")
-                    }
-                    for stage, stage_contacts in contacts.items():
-                        if not isinstance(stage_contacts, list):
-                            continue
-                        for contact in stage_contacts:
-                            if not isinstance(contact, dict):
-                                continue
-                            email = contact.get("email")
-                            if email and email in usage_by_email:
-                                contact["usage"] = usage_by_email[email]
-
-                return {
-                    "output": contacts,
-                    "tokens_input": estimate_tokens(json.dumps(inputs)),
-                    "tokens_output": estimate_tokens(json.dumps(contacts))
-                }
-            
-            enrichment_result = runner.run_step(
-                "enrichment",
-                enrichment_step,
-                {"contacts": contacts_by_stage}
-            )
-            # Graceful degradation: if enrichment fails, use original contacts
-            enriched_contacts = enrichment_result.output
-            if enriched_contacts is None or not isinstance(enriched_contacts, dict):
-                enriched_contacts = contacts_by_stage
-
-            # Step 3: Analysis - Context-aware processing
-            def analysis_step(inputs):
-                contacts = inputs.get("contacts", {})
-                if not isinstance(contacts, dict):
-                    contacts = {}
-                all_contacts = []
-                for stage_contacts in contacts.values():
-                    if isinstance(stage_contacts, list):
-                        all_contacts.extend(stage_contacts)
-                
-                # Check if we need context offloading
-                should_offload, strategy = should_offload_context(all_contacts)
-                
-                if should_offload:
-                    config = ContextConfig(
-                        max_inline_tokens=8000,
-                        chunk_size=500,
-                        sub_model="claude-haiku",
-                        synthesis_model="claude-sonnet-4"
-                    )
-                    result = self._process_with_context_manager(all_contacts, config)
-                else:
-                    result = self._analyze_contacts_directly(all_contacts)
-                
-                # Calculate conversions and bottlenecks
-                stage_counts = {
-                    stage: len(contacts.get(stage, []))
-                    for stage in STAGE_ORDER
-                }
-                
-                conversions = self._calculate_conversions(stage_counts)
-                bottlenecks = self._identify_bottlenecks(conversions)
-                
-                output = {
-                    "stage_counts": stage_counts,
-                    "conversions": conversions,
-                    "bottlenecks": bottlenecks,
-                    "context_handling": result.get("context_handling", {})
-                }
-                
-                return {
-                    "output": output,
-                    "tokens_input": estimate_tokens(json.dumps(inputs)),
-                    "tokens_output": estimate_tokens(json.dumps(output))
-                }
-            
-            analysis_result = runner.run_step(
-                "analysis",
-                analysis_step,
-                {"contacts": enriched_contacts}
-            )
-            # Graceful degradation: provide defaults if analysis fails
-            analysis_output = analysis_result.output
-            if analysis_output is None or not isinstance(analysis_output, dict):
-                analysis_output = {
-                    "stage_counts": {},
-                    "conversions": [],
-                    "bottlenecks": [],
-                    "context_handling": {}
-                }
-
-            # Step 4: Scoring
-            def scoring_step(inputs):
-                contacts = inputs.get("contacts", {})
-                if not isinstance(contacts, dict):
-                    contacts = {}
-                scoring = self._score_accounts(contacts)
-
-                return {
-                    "output": scoring,
-                    "tokens_input": estimate_tokens(json.dumps(inputs)),
-                    "tokens_output": estimate_tokens(json.dumps(scoring))
-                }
-
-            scoring_result = runner.run_step(
-                "scoring",
-                scoring_step,
-                {"contacts": enriched_contacts}
-            )
-            # Graceful degradation: provide defaults if scoring fails
-            scoring_output = scoring_result.output
-            if scoring_output is None or not isinstance(scoring_output, dict):
-                scoring_output = {
-                    "at_risk": [],
-                    "upsell_candidates": []
-                }
+            # Steps 1-4: Discovery, enrichment, analysis, scoring
+            step_args = (runner, limit, stages, data_override)
+            if streaming:
+                discovery_result, analysis_output, scoring_output = self._run_streaming_steps(
+                    *step_args, page_size=page_size
+                )
+            else:
+                discovery_result, analysis_output, scoring_output = self._run_standard_steps(*step_args)
 
             # Step 5: Synthesis
             def synthesis_step(inputs):
@@ -1146,7 +1263,8 @@ Respond with JSON containing:
                 model="claude-sonnet-4",
                 client=company_id or "all",
                 evaluation=evaluation,
-                steps=runner.telemetry.steps
+                steps=runner.telemetry.steps,
+                tool_calls=runner.telemetry.tool_calls
             )
             
             # Intelligence: Record outcome for learning
@@ -1196,6 +1314,326 @@ Respond with JSON containing:
                 )
             }
     
+    def _use_streaming(self, analysis_mode: str, limit: int) -> bool:
+        """Whether to run the streaming analysis path."""
+        if analysis_mode in ("standard", "streaming"):
+            return analysis_mode == "streaming"
+        return limit > STREAMING_MIN_RECORDS
+    
+    def _run_standard_steps(
+        self,
+        runner: WorkflowRunner,
+        limit: int,
+        stages: Optional[List[str]],
+        data_override: Optional[Dict]
+    ) -> Tuple[Any, Dict, Dict]:
+        """
+        Run discovery, enrichment, analysis and scoring on the full contact set.
+        
+        Returns:
+            (discovery StepResult, analysis output, scoring output)
+        """
+        # Step 1: Discovery - Fetch contacts
+        def discovery_step(inputs):
+            hubspot_data = self._fetch_hubspot_contacts(limit=limit, stages=stages)
+            contacts = hubspot_data["contacts"]
+
+            # Validate data requirements
+            validation = self._validate_data_requirements(contacts, data_override)
+
+            if not validation["valid"]:
+                raise ValueError(f"Data requirements not met: {validation['issues']}")
+
+            # Group by stage
+            by_stage = {}
+            for contact in contacts:
+                stage = contact.get("lifecyclestage", "unknown")
+                if stages and stage not in stages:
+                    continue
+                if stage not in by_stage:
+                    by_stage[stage] = []
+                by_stage[stage].append(contact)
+
+            output = {
+                "total_contacts": len(contacts),
+                "by_stage": {s: len(c) for s, c in by_stage.items()},
+                "contacts": by_stage,
+                "data_validation": validation,
+                "source": hubspot_data["source"]
+            }
+
+            return {
+                "output": output,
+                "tokens_input": estimate_tokens(json.dumps(inputs)),
+                "tokens_output": estimate_tokens(json.dumps(output))
+            }
+
+        discovery_result = runner.run_step("discovery", discovery_step, {"limit": limit}, persist_output=False)
+        if discovery_result.status != "success":
+            raise Exception(f"Discovery failed: {discovery_result.error}")
+
+        contacts_by_stage = discovery_result.output.get("contacts", {})
+
+        # Step 2: Enrichment - Add Snowflake data
+        def enrichment_step(inputs):
+            contacts = inputs.get("contacts", {})
+
+            # Ensure contacts is a dict, not a string or None
+            if not isinstance(contacts, dict):
+                contacts = {}
+
+            # Only customers carry usage; enrich them in one pass over the index
+            customer_contacts = contacts.get("customer", [])
+            if isinstance(customer_contacts, list):
+                self._enrich_contacts(customer_contacts, runner)
+
+            return {
+                "output": contacts,
+                "tokens_input": estimate_tokens(json.dumps(inputs)),
+                "tokens_output": estimate_tokens(json.dumps(contacts))
+            }
+
+        enrichment_result = runner.run_step(
+            "enrichment",
+            enrichment_step,
+            {"contacts": contacts_by_stage},
+            persist_output=False
+        )
+        # Graceful degradation: if enrichment fails, use original contacts
+        enriched_contacts = enrichment_result.output
+        if enriched_contacts is None or not isinstance(enriched_contacts, dict):
+            enriched_contacts = contacts_by_stage
+
+        # Step 3: Analysis - Context-aware processing
+        def analysis_step(inputs):
+            contacts = inputs.get("contacts", {})
+            if not isinstance(contacts, dict):
+                contacts = {}
+            all_contacts = []
+            for stage_contacts in contacts.values():
+                if isinstance(stage_contacts, list):
+                    all_contacts.extend(stage_contacts)
+
+            # Check if we need context offloading
+            should_offload, strategy = should_offload_context(all_contacts)
+
+            if should_offload:
+                config = ContextConfig(
+                    max_inline_tokens=8000,
+                    chunk_size=500,
+                    sub_model="claude-haiku",
+                    synthesis_model="claude-sonnet-4"
+                )
+                result = self._process_with_context_manager(all_contacts, config)
+                runner.record_sub_calls(result["context_handling"].get("sub_calls", []))
+            else:
+                result = self._analyze_contacts_directly(all_contacts)
+
+            # Calculate conversions and bottlenecks
+            stage_counts = {
+                stage: len(contacts.get(stage, []))
+                for stage in STAGE_ORDER
+            }
+
+            conversions = self._calculate_conversions(stage_counts)
+            bottlenecks = self._identify_bottlenecks(conversions)
+
+            output = {
+                "stage_counts": stage_counts,
+                "conversions": conversions,
+                "bottlenecks": bottlenecks,
+                "context_handling": result.get("context_handling", {})
+            }
+
+            return {
+                "output": output,
+                "tokens_input": estimate_tokens(json.dumps(inputs)),
+                "tokens_output": estimate_tokens(json.dumps(output))
+            }
+
+        analysis_result = runner.run_step(
+            "analysis",
+            analysis_step,
+            {"contacts": enriched_contacts},
+            persist_output=False
+        )
+        # Graceful degradation: provide defaults if analysis fails
+        analysis_output = analysis_result.output
+        if analysis_output is None or not isinstance(analysis_output, dict):
+            analysis_output = {
+                "stage_counts": {},
+                "conversions": [],
+                "bottlenecks": [],
+                "context_handling": {}
+            }
+
+        # Step 4: Scoring
+        def scoring_step(inputs):
+            contacts = inputs.get("contacts", {})
+            if not isinstance(contacts, dict):
+                contacts = {}
+            scoring = self._score_accounts(contacts)
+
+            return {
+                "output": scoring,
+                "tokens_input": estimate_tokens(json.dumps(inputs)),
+                "tokens_output": estimate_tokens(json.dumps(scoring))
+            }
+
+        scoring_result = runner.run_step(
+            "scoring",
+            scoring_step,
+            {"contacts": enriched_contacts},
+            persist_output=False
+        )
+        # Graceful degradation: provide defaults if scoring fails
+        scoring_output = scoring_result.output
+        if scoring_output is None or not isinstance(scoring_output, dict):
+            scoring_output = {
+                "at_risk": [],
+                "upsell_candidates": []
+            }
+
+        return discovery_result, analysis_output, scoring_output
+    
+    def _run_streaming_steps(
+        self,
+        runner: WorkflowRunner,
+        limit: int,
+        stages: Optional[List[str]],
+        data_override: Optional[Dict],
+        page_size: int = CONTACT_PAGE_SIZE
+    ) -> Tuple[Any, Dict, Dict]:
+        """
+        Run discovery, enrichment, analysis and scoring in one pass over pages.
+        
+        Each page is enriched and folded into a StreamingLifecycleAnalysis,
+        then dropped; later steps work from its counts and top-k heaps, so
+        no step holds the full contact set.
+        
+        Returns:
+            (discovery StepResult, analysis output, scoring output)
+        """
+        state: Dict[str, Any] = {}
+        
+        # Step 1: Discovery + enrichment, streamed page by page
+        def discovery_step(inputs):
+            analysis = StreamingLifecycleAnalysis(stages=stages)
+            # Usage only matters for customers the stage filter keeps
+            enrich_customers = not stages or "customer" in stages
+            enriched = 0
+            pages = 0
+            pending: List[Dict] = []
+            for page in self._iter_contact_pages(limit, stages, page_size):
+                pages += 1
+                # Only customers need usage: fold the rest in now and hold
+                # customers until there are enough to fill every query chunk
+                others: List[Any] = []
+                for contact in page:
+                    is_customer = (
+                        enrich_customers
+                        and isinstance(contact, dict)
+                        and contact.get("lifecyclestage") == "customer"
+                    )
+                    (pending if is_customer else others).append(contact)
+                analysis.add_page(others)
+                if len(pending) >= ENRICHMENT_BATCH_SIZE:
+                    enriched += self._enrich_contacts(pending, runner)
+                    analysis.add_page(pending)
+                    pending = []
+            if pending:
+                enriched += self._enrich_contacts(pending, runner)
+                analysis.add_page(pending)
+            analysis.scorer.flush()
+            state["analysis"] = analysis
+            state["pages"] = pages
+            
+            validation = self._validate_coverage(
+                analysis.total_contacts, analysis.field_present, data_override
+            )
+            if not validation["valid"]:
+                raise ValueError(f"Data requirements not met: {validation['issues']}")
+            
+            output = {
+                "total_contacts": analysis.total_contacts,
+                "by_stage": dict(analysis.stage_counts),
+                "data_validation": validation,
+                "source": "hubspot" if self.hubspot.is_available() else "sample",
+                "streaming": {
+                    "pages": pages,
+                    "page_size": page_size,
+                    "contacts_enriched": enriched,
+                    "customers_scored": analysis.scorer.scored
+                }
+            }
+            
+            return {
+                "output": output,
+                "tokens_input": estimate_tokens(inputs),
+                "tokens_output": analysis.tokens
+            }
+        
+        discovery_result = runner.run_step("discovery", discovery_step, {"limit": limit}, persist_output=False)
+        if discovery_result.status != "success":
+            raise Exception(f"Discovery failed: {discovery_result.error}")
+        analysis = state["analysis"]
+        
+        # Step 2: Analysis - conversions from the streamed stage counts
+        def analysis_step(inputs):
+            stage_counts = {
+                stage: analysis.stage_counts.get(stage, 0)
+                for stage in STAGE_ORDER
+            }
+            conversions = self._calculate_conversions(stage_counts)
+            
+            output = {
+                "stage_counts": stage_counts,
+                "conversions": conversions,
+                "bottlenecks": self._identify_bottlenecks(conversions),
+                "context_handling": {
+                    "strategy": "streaming",
+                    "input_size_tokens": analysis.tokens,
+                    "chunks_processed": state["pages"],
+                    "sub_calls": []
+                }
+            }
+            
+            return {
+                "output": output,
+                "tokens_input": estimate_tokens(inputs),
+                "tokens_output": estimate_tokens(output)
+            }
+        
+        analysis_output = runner.run_step("analysis", analysis_step, {}).output
+        if not isinstance(analysis_output, dict):
+            analysis_output = {
+                "stage_counts": {},
+                "conversions": [],
+                "bottlenecks": [],
+                "context_handling": {}
+            }
+        
+        # Step 3: Scoring - top-k heaps filled during discovery
+        def scoring_step(inputs):
+            scoring = analysis.scorer.results()
+            scoring["at_risk_total"] = analysis.scorer.at_risk_total
+            scoring["upsell_total"] = analysis.scorer.upsell_total
+            
+            return {
+                "output": scoring,
+                "tokens_input": estimate_tokens(inputs),
+                "tokens_output": estimate_tokens(scoring)
+            }
+        
+        scoring_output = runner.run_step("scoring", scoring_step, {}, persist_output=False).output
+        if not isinstance(scoring_output, dict):
+            scoring_output = {
+                "at_risk": [],
+                "upsell_candidates": []
+            }
+        
+        return discovery_result, analysis_output, scoring_output
+    
     def _calculate_actual_cost(self) -> float:
         """Calculate actual cost from tracked tokens."""
         # Main model costs
@@ -1258,6 +1696,7 @@ def run_lifecycle_audit(inputs: Dict) -> Dict:
             - stages: Lifecycle stages to include (optional)
             - execution_mode: "suggest" | "preview" | "execute" (default: "suggest")
             - data_requirements_override: Override validation settings (optional)
+            - analysis_mode: "auto" | "standard" | "streaming" (default: "auto")
     
     Returns:
         Complete audit result with recommendations and metadata
@@ -1323,6 +1762,13 @@ Examples:
         default="suggest",
         help="Execution mode"
     )
+    parser.add_argument(
+        "--analysis_mode",
+        type=str,
+        choices=["auto", "standard", "streaming"],
+        default="auto",
+        help="Analysis path (auto streams above %d records)" % STREAMING_MIN_RECORDS
+    )
     parser.add_argument(
         "--output", 
         type=str, 
@@ -1335,7 +1781,8 @@ Examples:
     inputs = {
         "tenant_id": args.tenant_id,
         "limit": args.limit,
-        "execution_mode": args.execution_mode
+        "execution_mode": args.execution_mode,
+        "analysis_mode": args.analysis_mode
     }
     
     if args.company_id:
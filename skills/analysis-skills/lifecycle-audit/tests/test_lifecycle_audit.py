@@ -22,12 +22,102 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from run import (
     run_lifecycle_audit,
     LifecycleAuditSkill,
+    AccountScorer,
     STAGE_ORDER,
     BENCHMARKS,
     DATA_REQUIREMENTS
 )
 
 
+@pytest.fixture(autouse=True)
+def isolated_storage(tmp_path, monkeypatch):
+    """Keep run directories and the shared database out of automation/telemetry."""
+    import runner
+    import telemetry
+    from lib import rate_limiter, storage_engine
+
+    runs_dir = tmp_path / "runs"
+    runs_dir.mkdir()
+    db_path = tmp_path / "mh1.db"
+    monkeypatch.setenv("MH1_RUNS_DIR", str(runs_dir))
+    monkeypatch.setenv("MH1_STORAGE_DB", str(db_path))
+
+    # The paths are read at import, so repoint the already-loaded modules too
+    engine = storage_engine.StorageEngine(db_path)
+    monkeypatch.setattr(storage_engine, "STORAGE_DB_PATH", db_path)
+    monkeypatch.setattr(storage_engine, "_engine", engine)
+    monkeypatch.setattr(rate_limiter, "_buckets", {})
+    monkeypatch.setattr(runner, "RUNS_DIR", runs_dir)
+    monkeypatch.setattr(telemetry, "RUNS_DIR", runs_dir)
+    monkeypatch.setattr(telemetry, "_write_behind", None)
+
+    yield runs_dir
+
+    if telemetry._write_behind is not None:
+        telemetry._write_behind.close()
+    engine.close()
+
+
+def legacy_score_accounts(customer_contacts, top_k=20):
+    """Per-contact scoring as in v2.0.0, the reference for AccountScorer."""
+    at_risk = []
+    upsell_candidates = []
+    for contact in customer_contacts:
+        email = contact.get("email", "unknown")
+        name = f"{contact.get('firstname', '')} {contact.get('lastname', '')}".strip()
+        company = contact.get("company", "Unknown")
+        usage = contact.get("usage", {})
+        
+        last_active = usage.get("last_active_days", 30)
+        login_trend = usage.get("login_trend", 0)
+        feature_adoption = usage.get("feature_adoption", 0.5)
+        
+        risk_score = 0
+        if last_active > 14:
+            risk_score += 0.3
+        if last_active > 30:
+            risk_score += 0.3
+        if login_trend < 0:
+            risk_score += 0.2
+        if risk_score > 0.5:
+            at_risk.append({
+                "email": email,
+                "name": name,
+                "company": company,
+                "stage": "customer",
+                "risk_score": round(risk_score, 2),
+                "risk_factors": {
+                    "days_inactive": last_active,
+                    "negative_trend": login_trend < 0
+                }
+            })
+        
+        upsell_score = 0
+        if last_active < 7:
+            upsell_score += 0.4
+        if login_trend > 0:
+            upsell_score += 0.3
+        if feature_adoption > 0.7:
+            upsell_score += 0.3
+        if upsell_score > 0.6:
+            upsell_candidates.append({
+                "email": email,
+                "name": name,
+                "company": company,
+                "stage": "customer",
+                "upsell_score": round(upsell_score, 2),
+                "upsell_signals": {
+                    "highly_active": last_active < 7,
+                    "growing_usage": login_trend > 0,
+                    "high_adoption": feature_adoption > 0.7
+                }
+            })
+    
+    at_risk.sort(key=lambda x: x["risk_score"], reverse=True)
+    upsell_candidates.sort(key=lambda x: x["upsell_score"], reverse=True)
+    return {"at_risk": at_risk[:top_k], "upsell_candidates": upsell_candidates[:top_k]}
+
+
 class TestHappyPath:
     """Test normal successful execution."""
     
@@ -470,6 +560,183 @@ class TestContextHandling:
         assert result["status"] in ["success", "review"]
 
 
+class TestStreamingAnalysis:
+    """Test the streaming (page-by-page) analysis path."""
+    
+    def _run(self, mode, seed=7, **extra):
+        import random
+        random.seed(seed)
+        return run_lifecycle_audit({
+            "tenant_id": "test_tenant",
+            "limit": 600,
+            "analysis_mode": mode,
+            **extra
+        })
+    
+    def test_streaming_matches_standard(self):
+        """Test that streaming produces the same audit as the standard path."""
+        standard = self._run("standard")["output"]
+        streaming = self._run("streaming", page_size=70)["output"]
+        
+        assert streaming["summary"]["total_accounts"] == standard["summary"]["total_accounts"]
+        assert streaming["summary"]["by_stage"] == standard["summary"]["by_stage"]
+        assert streaming["conversions"] == standard["conversions"]
+    
+    def _contact(self, i, **usage):
+        return {
+            "email": f"user{i}@example.com",
+            "firstname": "User",
+            "lastname": str(i),
+            "company": f"Co {i}",
+            "usage": usage
+        }
+    
+    def _score(self, contacts, **kwargs):
+        scorer = AccountScorer(**kwargs)
+        scorer.extend(contacts)
+        return scorer.results()
+    
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_scoring_thresholds(self, use_numpy):
+        """Test scores at the threshold boundaries and with missing usage."""
+        import run
+        contacts = [
+            self._contact(0, last_active_days=7, login_trend=1, feature_adoption=0.7),
+            self._contact(1, last_active_days=6, login_trend=1, feature_adoption=0.71),
+            self._contact(2, last_active_days=14, login_trend=-1),
+            self._contact(3, last_active_days=30, login_trend=-1),
+            self._contact(4, last_active_days=31, login_trend=0),
+            {"email": "nousage@example.com"},
+        ]
+        numpy_module = run.np if use_numpy else None
+        if use_numpy and numpy_module is None:
+            pytest.skip("NumPy not installed")
+        
+        with patch.object(run, "np", numpy_module):
+            result = self._score(contacts, block_rows=4)
+        
+        # 7 days is not "highly active" and 0.7 is not "high adoption"; 14 days is not inactive
+        assert result["upsell_candidates"] == [{
+            "email": "user1@example.com",
+            "name": "User 1",
+            "company": "Co 1",
+            "stage": "customer",
+            "upsell_score": 1.0,
+            "upsell_signals": {"highly_active": True, "growing_usage": True, "high_adoption": True}
+        }]
+        # 30 days with a falling trend scores exactly 0.5, which is not at risk
+        assert result["at_risk"] == [{
+            "email": "user4@example.com",
+            "name": "User 4",
+            "company": "Co 4",
+            "stage": "customer",
+            "risk_score": 0.6,
+            "risk_factors": {"days_inactive": 31, "negative_trend": False}
+        }]
+    
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_scoring_matches_legacy(self, use_numpy):
+        """Test that block scoring with top-k matches per-contact scoring."""
+        import random
+        import run
+        numpy_module = run.np if use_numpy else None
+        if use_numpy and numpy_module is None:
+            pytest.skip("NumPy not installed")
+        
+        rng = random.Random(11)
+        contacts = []
+        for i in range(500):
+            usage = {
+                "last_active_days": rng.choice([1, 6, 7, 8, 14, 15, 30, 31, 60]),
+                "login_trend": rng.choice([-1, 0, 1]),
+                "feature_adoption": rng.choice([0.2, 0.5, 0.7, 0.71, 0.9])
+            }
+            if i % 7 == 0:
+                usage.pop(rng.choice(list(usage)))
+            contacts.append(self._contact(i, **usage))
+        contacts.append({"email": "nousage@example.com"})
+        
+        with patch.object(run, "np", numpy_module):
+            result = self._score(contacts, top_k=15, block_rows=64)
+        
+        assert result == legacy_score_accounts(contacts, top_k=15)
+    
+    def test_streaming_top_k_bounded(self):
+        """Test that scoring keeps only the top accounts, highest first."""
+        output = self._run("streaming")["output"]
+        
+        scores = [a["risk_score"] for a in output["at_risk"]]
+        assert len(scores) <= 20
+        assert scores == sorted(scores, reverse=True)
+    
+    def test_streaming_validation_enforced(self):
+        """Test that data requirements apply to streamed contacts."""
+        result = self._run("streaming", data_requirements_override={"minimum_records": 1000})
+        
+        assert result["status"] == "failed"
+        assert "Data requirements not met" in result["error"]
+
+    def _stream_steps(self, stages=None, limit=300, page_size=70):
+        from runner import WorkflowRunner
+        skill = LifecycleAuditSkill(tenant_id="test_tenant")
+        runner = WorkflowRunner(
+            workflow_name="lifecycle-audit",
+            version="test",
+            client="all",
+            tenant_id="test_tenant"
+        )
+        with patch.object(skill, "_enrich_contacts", side_effect=lambda c, r=None: len(c)) as enrich:
+            discovery, analysis, _ = skill._run_streaming_steps(
+                runner, limit, stages, None, page_size=page_size
+            )
+        return discovery.output, analysis, enrich
+
+    def test_streaming_chunks_are_pages(self):
+        """Test that chunks_processed reports pages, not add_page calls."""
+        discovery, analysis, _ = self._stream_steps()
+
+        assert discovery["streaming"]["pages"] == 5
+        assert analysis["context_handling"]["chunks_processed"] == 5
+
+    def test_streaming_skips_enrichment_for_excluded_customers(self):
+        """Test that customers the stage filter drops are not enriched."""
+        _, _, enrich = self._stream_steps(stages=["lead", "mql"])
+        assert enrich.call_count == 0
+
+        discovery, _, enrich = self._stream_steps(stages=["customer"])
+        assert enrich.call_count >= 1
+        assert discovery["streaming"]["contacts_enriched"] == discovery["by_stage"]["customer"]
+
+
+class TestSnowflakeEnrichment:
+    """Test chunked Snowflake usage enrichment."""
+    
+    def test_enriches_beyond_one_chunk(self):
+        """Test that every customer is enriched, not just the first 1000 emails."""
+        import re
+        skill = LifecycleAuditSkill(tenant_id="test_tenant")
+        queries = []
+        
+        def execute_query(query, limit=100):
+            emails = re.findall(r"'([^']+@[^']+)'", query)
+            queries.append(emails)
+            rows = [{"email": e, "last_active_days": 3, "feature_adoption": 0.9} for e in emails]
+            return Mock(success=True, data=rows, error=None)
+        
+        contacts = [
+            {"email": f"user{i}@example.com", "lifecyclestage": "customer"}
+            for i in range(2500)
+        ] + [{"email": "lead@example.com", "lifecyclestage": "lead"}]
+        
+        with patch.object(skill.snowflake, "execute_query", side_effect=execute_query):
+            enriched = skill._enrich_contacts(contacts)
+        
+        assert enriched == 2500
+        assert sorted(len(q) for q in queries) == [500, 1000, 1000]
+        assert all("usage" in c for c in contacts[:2500])
+        assert "usage" not in contacts[-1]
+
+
 # Run tests directly
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
@@ -7,7 +7,8 @@ keywords, score for ICP relevance, and store to Firestore with intelligent dedup
 
 Features:
 - Client configuration read from inputs/active_client.md
-- Parallel platform scraping
+- Concurrent platform scraping, with collector NDJSON output parsed and
+  deduplicated as it streams in
 - Relevance scoring with competitive-intelligence-analyst agent
 - Firebase integration for storing signals
 - Collection report generation
@@ -31,20 +32,23 @@ Usage:
 """
 
 import argparse
+import asyncio
 import json
 import os
 import sys
 import time
 import subprocess
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 # Add lib to path
 SKILL_ROOT = Path(__file__).parent
 SYSTEM_ROOT = SKILL_ROOT.parent.parent
 sys.path.insert(0, str(SYSTEM_ROOT / "lib"))
+sys.path.insert(0, str(SYSTEM_ROOT.parent / "automation" / "lib"))
 
 # Import lib modules
 try:
@@ -61,10 +65,25 @@ except ImportError:
     def log_run(*args, **kwargs):
         pass
 
+# Warm worker for helper scripts (falls back to one subprocess per script)
+try:
+    from worker import run_script
+except ImportError:
+    run_script = None
+
 # Constants
 SKILL_NAME = "social-listening-collect"
 SKILL_VERSION = "v1.0.0"
 
+# Platform collectors (skill directory -> {platform}_collection_template.py)
+PLATFORM_SKILLS = {
+    "linkedin": "linkedin-keyword-search",
+    "twitter": "twitter-keyword-search",
+    "reddit": "reddit-keyword-search"
+}
+PLATFORM_TIMEOUT_SECONDS = 300  # Per platform; posts streamed before a timeout are kept
+STREAM_LINE_LIMIT = 2 ** 20     # Longest NDJSON line accepted from a collector
+
 
 def _read_client_from_file() -> Dict[str, str]:
     """Read client configuration from inputs/active_client.md."""
@@ -93,6 +112,17 @@ def _read_client_from_file() -> Dict[str, str]:
     return result
 
 
+def _post_key(platform: str, post: Dict) -> tuple:
+    """Deduplication key for a collected post."""
+    post_id = (
+        post.get("post_id") or post.get("tweet_id") or post.get("postId")
+        or post.get("share_url") or post.get("tweet_url") or post.get("permalink")
+    )
+    if post_id:
+        return (platform, str(post_id))
+    return (platform, json.dumps(post, sort_keys=True, default=str))
+
+
 def load_defaults() -> Dict:
     """Load default configuration from config/defaults.json."""
     config_path = SKILL_ROOT / "config" / "defaults.json"
@@ -136,64 +166,178 @@ class SocialListeningCollectSkill:
         default_path = self.client_dir / "social-listening" / "keywords.md"
         return default_path
     
-    def _run_platform_script(
+    def _find_skill_script(self, skill_name: str, script_name: str) -> Optional[Path]:
+        """Locate another skill's script (flat or categorized skills layout)."""
+        candidates = [SYSTEM_ROOT / "skills" / skill_name / script_name]
+        candidates.extend(SKILL_ROOT.parent.parent.glob(f"*/{skill_name}/{script_name}"))
+        return next((path for path in candidates if path.exists()), None)
+    
+    async def _run_platform_script(
         self,
         platform: str,
         keywords_data: Dict,
-        date_range: str
+        date_range: str,
+        on_post: Callable[[str, Dict], bool],
+        timeout: float = PLATFORM_TIMEOUT_SECONDS
     ) -> Dict:
-        """Run platform-specific collection script."""
-        script_map = {
-            "linkedin": "linkedin-keyword-search",
-            "twitter": "twitter-keyword-search",
-            "reddit": "reddit-keyword-search"
-        }
+        """
+        Run one platform's collection script, consuming its posts as they stream.
         
-        skill_name = script_map.get(platform)
-        if not skill_name:
-            return {"status": "error", "error": f"Unknown platform: {platform}"}
+        The script writes one post per stdout line (--ndjson); each is handed
+        to on_post as soon as it is read. A single JSON document with a
+        "posts" list (--json output) is accepted too. Posts read before a
+        timeout or a failed exit are kept.
         
-        script_path = SYSTEM_ROOT / "skills" / skill_name / f"{platform}_collection_template.py"
+        Args:
+            platform: linkedin, twitter or reddit
+            keywords_data: Processed keywords
+            date_range: Time window
+            on_post: Called with (platform, post); returns False for duplicates
+            timeout: Seconds before the script is killed
         
-        if not script_path.exists():
-            return {"status": "error", "error": f"Script not found: {script_path}"}
+        Returns:
+            Platform result with status, count, duplicates and latency
+        """
+        if platform not in PLATFORM_SKILLS:
+            return {"status": "error", "error": f"Unknown platform: {platform}", "count": 0}
+        
+        script_path = self._find_skill_script(
+            PLATFORM_SKILLS[platform], f"{platform}_collection_template.py"
+        )
+        if script_path is None:
+            return {
+                "status": "error",
+                "error": f"Script not found for {platform} ({PLATFORM_SKILLS[platform]})",
+                "count": 0
+            }
+        
+        start = time.perf_counter()
+        stats = {"count": 0, "duplicates": 0, "unparsed_lines": 0, "first_post_seconds": None}
+        
+        def accept(post: Any):
+            if not isinstance(post, dict):
+                return
+            if stats["first_post_seconds"] is None:
+                stats["first_post_seconds"] = round(time.perf_counter() - start, 2)
+            if on_post(platform, post):
+                stats["count"] += 1
+            else:
+                stats["duplicates"] += 1
         
         try:
-            # Run the script with JSON output
-            result = subprocess.run(
-                [sys.executable, str(script_path), "--json"],
-                capture_output=True,
-                text=True,
+            proc = await asyncio.create_subprocess_exec(
+                sys.executable, str(script_path), "--ndjson",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
                 cwd=str(SYSTEM_ROOT),
-                timeout=300  # 5 minute timeout per platform
+                limit=STREAM_LINE_LIMIT
             )
-            
-            if result.returncode != 0:
-                return {
-                    "status": "error",
-                    "error": result.stderr,
-                    "returncode": result.returncode
-                }
-            
-            # Parse JSON output
-            try:
-                data = json.loads(result.stdout)
-                return {
-                    "status": "success",
-                    "posts": data.get("posts", []),
-                    "count": data.get("count", len(data.get("posts", [])))
-                }
-            except json.JSONDecodeError:
-                return {
-                    "status": "error",
-                    "error": "Failed to parse JSON output",
-                    "raw_output": result.stdout[:500]
-                }
-                
-        except subprocess.TimeoutExpired:
-            return {"status": "error", "error": "Script timed out after 5 minutes"}
         except Exception as e:
-            return {"status": "error", "error": str(e)}
+            return {"status": "error", "error": str(e), "count": 0}
+        
+        # Drain stderr alongside stdout so a chatty script cannot block on a full pipe
+        stderr_task = asyncio.ensure_future(proc.stderr.read())
+        
+        async def consume():
+            async for raw in proc.stdout:
+                line = raw.strip()
+                if not line:
+                    continue
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    stats["unparsed_lines"] += 1
+                    continue
+                if isinstance(data, dict) and isinstance(data.get("posts"), list):
+                    for post in data["posts"]:
+                        accept(post)
+                else:
+                    accept(data)
+            await proc.wait()
+        
+        status, error = "success", None
+        try:
+            await asyncio.wait_for(consume(), timeout)
+        except asyncio.TimeoutError:
+            status, error = "timeout", f"Script timed out after {timeout:g}s"
+        except Exception as e:
+            status, error = "error", str(e)
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        
+        stderr = (await stderr_task).decode("utf-8", errors="replace")
+        if status == "success" and proc.returncode != 0:
+            status, error = "error", stderr[-2000:] or f"Exited with code {proc.returncode}"
+        if status != "success" and stats["count"]:
+            status = "partial"
+        
+        return {
+            "status": status,
+            "error": error,
+            "returncode": proc.returncode,
+            "latency_seconds": round(time.perf_counter() - start, 2),
+            **stats
+        }
+    
+    async def _collect_platforms_async(
+        self,
+        platforms: List[str],
+        keywords_data: Dict,
+        date_range: str,
+        on_post: Callable[[str, Dict], bool],
+        timeout: float = PLATFORM_TIMEOUT_SECONDS
+    ) -> Dict[str, Dict]:
+        """
+        Run all platform collectors concurrently on the current event loop.
+        
+        Returns:
+            Platform result per platform (see _run_platform_script)
+        """
+        async def run_one(platform: str) -> Dict:
+            result = await self._run_platform_script(
+                platform, keywords_data, date_range, on_post, timeout
+            )
+            if result["status"] == "success":
+                print(f"  - {platform}: {result['count']} posts in {result['latency_seconds']}s")
+            else:
+                print(f"  - {platform}: {result['status']} after {result.get('latency_seconds', 0)}s, "
+                      f"{result['count']} posts kept ({result.get('error', 'Unknown error')})")
+            return result
+        
+        results = await asyncio.gather(*(run_one(p) for p in platforms))
+        return dict(zip(platforms, results))
+    
+    def _collect_platforms(
+        self,
+        platforms: List[str],
+        keywords_data: Dict,
+        date_range: str,
+        on_post: Callable[[str, Dict], bool],
+        timeout: float = PLATFORM_TIMEOUT_SECONDS
+    ) -> Dict[str, Dict]:
+        """
+        Run all platform collectors concurrently from synchronous code.
+        
+        asyncio.run() cannot be called while this thread is already running
+        an event loop (e.g. under Jupyter or an async caller), so in that
+        case the collectors run on their own loop in a helper thread.
+        
+        Returns:
+            Platform result per platform (see _run_platform_script)
+        """
+        def collect() -> Dict[str, Dict]:
+            return asyncio.run(self._collect_platforms_async(
+                platforms, keywords_data, date_range, on_post, timeout
+            ))
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return collect()
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(collect).result()
     
     def _save_posts_to_file(self, posts: List[Dict], filename: str) -> str:
         """Save posts to JSON file."""
@@ -256,6 +400,7 @@ class SocialListeningCollectSkill:
                 - keyword_file: Path to keyword file (optional)
                 - platforms: List of platforms to scrape (default: all)
                 - date_range: Time window (default: past-week)
+                - platform_timeout: Seconds allowed per platform (default: 300)
         
         Returns:
             Complete skill result with outputs and metadata
@@ -265,6 +410,9 @@ class SocialListeningCollectSkill:
         keyword_file = inputs.get("keyword_file")
         platforms = inputs.get("platforms", params.get("platforms", ["linkedin", "twitter", "reddit"]))
         date_range = inputs.get("date_range", params.get("dateRange", "past-week"))
+        platform_timeout = inputs.get(
+            "platform_timeout", params.get("platformTimeoutSeconds", PLATFORM_TIMEOUT_SECONDS)
+        )
         
         print(f"\n{'='*60}")
         print(f"SOCIAL LISTENING COLLECTION")
@@ -302,23 +450,22 @@ class SocialListeningCollectSkill:
         
         # Stage 2: Social Scraping
         print("\n[Stage 2] Social Media Scraping...")
-        platform_results = {}
         all_posts = []
-        
-        for platform in platforms:
-            print(f"  - Scraping {platform}...")
-            result = self._run_platform_script(platform, keywords_data, date_range)
-            platform_results[platform] = result
-            
-            if result.get("status") == "success":
-                posts = result.get("posts", [])
-                # Add platform tag
-                for post in posts:
-                    post["platform"] = platform
-                all_posts.extend(posts)
-                print(f"    Collected: {len(posts)} posts")
-            else:
-                print(f"    Error: {result.get('error', 'Unknown error')}")
+        seen_posts = set()
+        
+        def on_post(platform: str, post: Dict) -> bool:
+            key = _post_key(platform, post)
+            if key in seen_posts:
+                return False
+            seen_posts.add(key)
+            post["platform"] = platform
+            all_posts.append(post)
+            return True
+        
+        print(f"  - Launching {', '.join(platforms)} concurrently...")
+        platform_results = self._collect_platforms(
+            platforms, keywords_data, date_range, on_post, timeout=platform_timeout
+        )
         
         total_posts = len(all_posts)
         print(f"\n  Total posts collected: {total_posts}")
@@ -351,18 +498,17 @@ class SocialListeningCollectSkill:
         upload_script = SYSTEM_ROOT / "skills" / "firebase-bulk-upload" / "update_post_scores.py"
         if upload_script.exists():
             try:
-                result = subprocess.run(
-                    [
-                        sys.executable, str(upload_script),
-                        scored_file,
-                        self.client_id,
-                        "--upsert"
-                    ],
-                    capture_output=True,
-                    text=True,
-                    cwd=str(SYSTEM_ROOT),
-                    timeout=120
-                )
+                upload_args = [scored_file, self.client_id, "--upsert"]
+                if run_script is not None:
+                    result = run_script(str(upload_script), upload_args, cwd=str(SYSTEM_ROOT), timeout=120)
+                else:
+                    result = subprocess.run(
+                        [sys.executable, str(upload_script), *upload_args],
+                        capture_output=True,
+                        text=True,
+                        cwd=str(SYSTEM_ROOT),
+                        timeout=120
+                    )
                 if result.returncode == 0:
                     try:
                         upload_result = json.loads(result.stdout)
@@ -398,6 +544,10 @@ class SocialListeningCollectSkill:
             "stats": {
                 "total_posts": total_posts,
                 "platforms": {k: v.get("count", 0) for k, v in platform_results.items()},
+                "platform_status": {k: v.get("status") for k, v in platform_results.items()},
+                "platform_latency_seconds": {
+                    k: v.get("latency_seconds") for k, v in platform_results.items()
+                },
                 "high_relevance": len([p for p in scored_posts if p.get("relevanceScore", 0) >= 7]),
                 "medium_relevance": len([p for p in scored_posts if 5 <= p.get("relevanceScore", 0) < 7]),
                 "upload": upload_stats
@@ -478,6 +628,8 @@ Examples:
     parser.add_argument("--date-range", type=str, default="past-week",
                        choices=["past-24h", "past-week", "past-month"],
                        help="Date range for collection (default: past-week)")
+    parser.add_argument("--platform-timeout", type=float, default=None,
+                       help=f"Seconds allowed per platform (default: {PLATFORM_TIMEOUT_SECONDS})")
     parser.add_argument("--output", type=str, help="Output file path (JSON)")
     
     args = parser.parse_args()
@@ -489,6 +641,8 @@ Examples:
         "date_range": args.date_range
     }
     
+    if args.platform_timeout:
+        inputs["platform_timeout"] = args.platform_timeout
     if args.client_id:
         inputs["client_id"] = args.client_id
     if args.client_name:
@@ -36,16 +36,18 @@ import json
 import os
 import sys
 import time
-import subprocess
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-# Add lib to path
+# Add lib to path (automation/lib, plus automation/ for lib.* imports inside it)
 SKILL_ROOT = Path(__file__).parent
 SYSTEM_ROOT = SKILL_ROOT.parent.parent
+AUTOMATION_ROOT = SYSTEM_ROOT.parent / "automation"
 sys.path.insert(0, str(SYSTEM_ROOT / "lib"))
+sys.path.insert(0, str(AUTOMATION_ROOT))
+sys.path.insert(0, str(AUTOMATION_ROOT / "lib"))
 
 from runner import (
     WorkflowRunner, 
@@ -62,6 +64,7 @@ from evaluator import evaluate_output
 from release_policy import determine_release_action, ReleaseAction, get_release_action_message
 from budget import BudgetManager, BudgetExceededError
 from telemetry import log_run
+from worker import run_script
 
 # Constants
 SKILL_NAME = "ghostwrite-content"
@@ -176,17 +179,11 @@ class GhostwriteContentSkill:
         }
     
     def _run_script(self, script_name: str, args: List[str]) -> Dict:
-        """Run a Python script from the scripts directory."""
+        """Run a Python script from the scripts directory (in the warm worker if running)."""
         script_path = SKILL_ROOT / "scripts" / script_name
-        cmd = [sys.executable, str(script_path)] + args
         
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=str(SYSTEM_ROOT)
-            )
+            result = run_script(str(script_path), args, cwd=str(SYSTEM_ROOT))
             
             if result.returncode != 0:
                 return {
@@ -261,7 +261,9 @@ def main():
         try:
             posts_ref = db.collection("clients").document(CLIENT_ID) \
                 .collection("thoughtLeaders").document(leader_id).collection("posts")
-            posts_docs = posts_ref.stream()
+            # Newest first, sorted and limited server-side
+            posts_docs = posts_ref.order_by("postedAt", direction=firestore.Query.DESCENDING) \
+                .limit(posts_to_fetch).stream()
 
             leader_posts = []
             for doc in posts_docs:
@@ -269,8 +271,17 @@ def main():
                 post_data["id"] = doc.id
                 leader_posts.append(post_data)
 
-            leader_posts.sort(key=lambda p: p.get("postedAt", ""), reverse=True)
-            leader_posts = leader_posts[:posts_to_fetch]
+            # order_by skips posts without postedAt; if the page came up
+            # short, read the rest unordered and sort those last
+            if len(leader_posts) < posts_to_fetch:
+                seen = {p["id"] for p in leader_posts}
+                for doc in posts_ref.stream():
+                    if doc.id not in seen:
+                        post_data = doc.to_dict()
+                        post_data["id"] = doc.id
+                        leader_posts.append(post_data)
+                leader_posts.sort(key=lambda p: p.get("postedAt", ""), reverse=True)
+                leader_posts = leader_posts[:posts_to_fetch]
 
             formatted_posts = [format_post_for_output(p) for p in leader_posts]
             all_posts.extend(formatted_posts)
@@ -374,7 +374,9 @@ def load_founder_posts(db, client_id, founder_id, limit=50):
     try:
         posts_ref = db.collection("clients").document(client_id) \
             .collection("founders").document(founder_id).collection("posts")
-        docs = posts_ref.stream()
+        # Newest first, sorted and limited server-side
+        docs = posts_ref.order_by("postedAt", direction=firestore.Query.DESCENDING) \
+            .limit(limit).stream()
 
         posts = []
         for doc in docs:
@@ -382,8 +384,19 @@ def load_founder_posts(db, client_id, founder_id, limit=50):
             data["id"] = doc.id
             posts.append(data)
 
-        posts.sort(key=lambda p: p.get("postedAt", ""), reverse=True)
-        return posts[:limit]
+        # order_by skips posts without postedAt; if the page came up short,
+        # read the rest unordered and sort those last
+        if len(posts) < limit:
+            seen = {p["id"] for p in posts}
+            for doc in posts_ref.stream():
+                if doc.id not in seen:
+                    data = doc.to_dict()
+                    data["id"] = doc.id
+                    posts.append(data)
+            posts.sort(key=lambda p: p.get("postedAt", ""), reverse=True)
+            posts = posts[:limit]
+
+        return posts
     except Exception as e:
         print(f"  ERROR loading founder posts: {e}", file=sys.stderr)
         return []
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Tests for update_post_scores.py
+
+Run with:
+    python -m pytest skills/operations-skills/firebase-bulk-upload/tests/ -v
+"""
+
+import json
+import pytest
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+pytest.importorskip("firebase_admin")
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import update_post_scores
+
+
+def run_main(tmp_path, posts, *args, existing=None):
+    """Run main() on posts; returns the operations handed to the bulk writer."""
+    existing = existing or {}
+    json_file = tmp_path / "posts.json"
+    json_file.write_text(json.dumps(posts))
+
+    writer = MagicMock()
+    writer.write.return_value = {
+        "written": 0, "batches": 1, "docs_per_second": 0, "failed_operations": []
+    }
+
+    def find_existing(collection_ref, post_id):
+        if post_id not in existing:
+            return None
+        ref = MagicMock()
+        ref.id = existing[post_id]
+        return ref
+
+    argv = ["update_post_scores.py", str(json_file), "client_1", *args]
+    with patch.object(sys, "argv", argv), \
+            patch.object(update_post_scores, "find_firebase_credentials", return_value="creds.json"), \
+            patch.object(update_post_scores.firebase_admin, "_apps", {"[DEFAULT]": object()}), \
+            patch.object(update_post_scores.firestore, "client", return_value=MagicMock()), \
+            patch.object(update_post_scores, "FirebaseClient"), \
+            patch.object(update_post_scores, "BulkWriter", return_value=writer), \
+            patch.object(update_post_scores, "find_existing_document", side_effect=find_existing) as lookup:
+        update_post_scores.main()
+
+    return writer.write.call_args[0][0], lookup
+
+
+class TestDuplicatePostIds:
+    """Repeated postIds in the input must write one document each."""
+
+    def test_upsert_creates_once(self, tmp_path):
+        """Test a repeated new postId is created once with the last scores."""
+        posts = [
+            {"postId": "p1", "content": "first", "relevanceScore": 4},
+            {"postId": "p2", "relevanceScore": 6},
+            {"postId": "p1", "content": "second", "relevanceScore": 8, "sentiment": "positive"},
+        ]
+        operations, lookup = run_main(tmp_path, posts, "--upsert")
+
+        assert [op["type"] for op in operations] == ["set", "set"]
+        created = operations[0]["data"]
+        assert created["legacyId"] == "p1"
+        assert created["content"] == "first"
+        assert created["relevanceScore"] == 8
+        assert created["sentiment"] == "positive"
+        assert lookup.call_count == 2
+
+    def test_existing_updated_once(self, tmp_path):
+        """Test a repeated existing postId is updated once with merged fields."""
+        posts = [
+            {"postId": "p1", "relevanceScore": 4, "icpFit": "low"},
+            {"postId": "p1", "relevanceScore": 9},
+        ]
+        operations, _ = run_main(tmp_path, posts, existing={"p1": "doc_1"})
+
+        assert len(operations) == 1
+        assert operations[0]["type"] == "update"
+        assert operations[0]["doc_id"] == "doc_1"
+        assert operations[0]["data"]["relevanceScore"] == 9
+        assert operations[0]["data"]["icpFit"] == "low"
+
+    def test_missing_without_upsert_skipped(self, tmp_path, capsys):
+        """Test repeats of a missing postId are all skipped without --upsert."""
+        posts = [{"postId": "p1"}, {"postId": "p1"}]
+        operations, _ = run_main(tmp_path, posts)
+
+        assert operations == []
+        result = json.loads(capsys.readouterr().out)
+        assert result["skipped"] == 2
+        assert result["created"] == 0
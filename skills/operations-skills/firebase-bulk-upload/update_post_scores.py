@@ -49,6 +49,10 @@ except ImportError:
 SCRIPT_DIR = Path(__file__).parent
 PROJECT_ROOT = SCRIPT_DIR.parent.parent
 
+# Shared bulk writer (automation/lib)
+sys.path.insert(0, str(SCRIPT_DIR.parent.parent.parent / "automation" / "lib"))
+from firebase_client import BulkWriter, FirebaseClient
+
 
 def get_client_from_active_file():
     """Read client configuration from inputs/active_client.md."""
@@ -216,6 +220,19 @@ def find_existing_document(collection_ref, post_id):
     return None
 
 
+def merge_post(operation, post):
+    """
+    Fold a repeated postId into the write already queued for it.
+
+    Writes are committed only after every post is looked up, so a repeat
+    cannot find the document its first occurrence creates. Applying the
+    repeat's scoring fields to the queued write leaves the same document as
+    creating (or updating) it first and updating it again.
+    """
+    operation["data"] = {**operation["data"], **extract_scoring_fields(post)}
+    return operation
+
+
 def parse_collection_path(path):
     """Parse a collection path into segments."""
     path = path.strip('/')
@@ -335,6 +352,9 @@ def main():
         "competitor_mentions": {}
     }
 
+    # Writes are queued per postId and committed together by the bulk writer
+    queued = {}  # postId -> operation
+
     print(f"\nProcessing posts...", file=sys.stderr)
 
     for i, post in enumerate(posts):
@@ -381,29 +401,35 @@ def main():
             enrichment_stats["with_matched_keywords"] += 1
 
         try:
-            # Try to find existing document by legacyId or externalId
-            existing_ref = find_existing_document(collection_ref, post_id)
+            existing_ref = None
+            if post_id not in queued:
+                # Try to find existing document by legacyId or externalId
+                existing_ref = find_existing_document(collection_ref, post_id)
 
-            if existing_ref:
+            if post_id in queued:
+                # Repeated postId: update the write already queued for it
+                merge_post(queued[post_id], post)
+
+            elif existing_ref:
                 # Update existing document with scoring fields only
                 scoring_data = extract_scoring_fields(post)
-                existing_ref.update(scoring_data)
-                updated_count += 1
-
-                if (i + 1) % 50 == 0:
-                    print(f"  [{i+1}/{len(posts)}] Updated {updated_count} posts...", file=sys.stderr)
+                queued[post_id] = {
+                    "type": "update",
+                    "collection": collection_path,
+                    "doc_id": existing_ref.id,
+                    "data": scoring_data
+                }
 
             elif args.upsert:
                 # Create new document with auto-generated ID and legacyId for lookup
                 full_doc = build_full_document(post)
                 full_doc['legacyId'] = post_id  # Store original ID for future lookups
                 full_doc['externalId'] = post_id  # Also set externalId
-                new_doc_ref = collection_ref.document()  # Auto-generate UUID
-                new_doc_ref.set(full_doc)
-                created_count += 1
-
-                if (i + 1) % 50 == 0:
-                    print(f"  [{i+1}/{len(posts)}] Created {created_count} new posts...", file=sys.stderr)
+                queued[post_id] = {
+                    "type": "set",
+                    "collection": collection_path,  # No doc_id: auto-generated
+                    "data": full_doc
+                }
 
             else:
                 # Skip - document doesn't exist and upsert not enabled
@@ -416,6 +442,37 @@ def main():
             print(f"  ERROR: {error_msg}", file=sys.stderr)
             errors.append(error_msg)
 
+        if (i + 1) % 50 == 0:
+            print(f"  [{i+1}/{len(posts)}] Queued {len(queued)} writes...", file=sys.stderr)
+
+    operations = list(queued.values())
+
+    # Bulk write: batches of up to 500, committed concurrently, retried with backoff
+    writer = BulkWriter(FirebaseClient(db.project, firestore_client=db), add_metadata=False)
+    write_result = writer.write(operations, atomic=False)
+
+    failed_indexes = set()
+    for failed in write_result["failed_operations"]:
+        failed_indexes.add(failed["index"])
+        post_id = failed["data"].get("legacyId") or failed.get("doc_id", "")
+        error_msg = f"Error with post {post_id}: {failed['error']}"
+        print(f"  ERROR: {error_msg}", file=sys.stderr)
+        errors.append(error_msg)
+
+    for index, operation in enumerate(operations):
+        if index in failed_indexes:
+            continue
+        if operation["type"] == "update":
+            updated_count += 1
+        else:
+            created_count += 1
+
+    print(
+        f"  Committed {write_result['written']} writes in {write_result['batches']} batches "
+        f"({write_result['docs_per_second']} docs/sec)",
+        file=sys.stderr
+    )
+
     # Summary
     print("\n" + "="*60, file=sys.stderr)
     print(f"Score update complete!", file=sys.stderr)
@@ -477,7 +534,8 @@ def main():
         'scoreDistribution': score_distribution,
         'enrichmentStats': enrichment_stats,
         'minScoreFilter': args.min_score,
-        'upsertEnabled': args.upsert
+        'upsertEnabled': args.upsert,
+        'docsPerSecond': write_result['docs_per_second']
     }
     print(json.dumps(result))
 
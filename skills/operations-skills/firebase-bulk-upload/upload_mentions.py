@@ -50,6 +50,10 @@ except ImportError:
 SCRIPT_DIR = Path(__file__).parent
 PROJECT_ROOT = SCRIPT_DIR.parent.parent
 
+# Shared bulk writer (automation/lib)
+sys.path.insert(0, str(SCRIPT_DIR.parent.parent.parent / "automation" / "lib"))
+from firebase_client import BulkWriter, FirebaseClient
+
 
 def get_client_from_active_file():
     """Read client configuration from inputs/active_client.md."""
@@ -520,9 +524,7 @@ def main():
     # Upload to Firestore
     # Path structure: clients/{id}/signals/{signalId}
     collection_path = f"clients/{client_id}/signals"
-    collection_ref = get_collection_ref(db, collection_path)
 
-    upload_count = 0
     errors = []
 
     # Stats tracking
@@ -532,40 +534,35 @@ def main():
         "byCategory": defaultdict(int)
     }
 
-    # Use batch writes (max 500 per batch)
-    batch_size = 500
-    batch = db.batch()
-    batch_count = 0
-
+    operations = []
     for mention_id, mention_data in mentions:
-        try:
-            doc_ref = collection_ref.document(mention_id)
-            batch.set(doc_ref, mention_data)
-
-            # Track stats
-            stats["byPlatform"][mention_data["platform"]] += 1
-            stats["bySentiment"][mention_data["sentiment"]] += 1
-            stats["byCategory"][mention_data["keywordCategory"]] += 1
-
-            batch_count += 1
-
-            if batch_count >= batch_size:
-                batch.commit()
-                upload_count += batch_count
-                print(f"[{upload_count}/{len(mentions)}] Committed batch", file=sys.stderr)
-                batch = db.batch()
-                batch_count = 0
-
-        except Exception as e:
-            error_msg = f"Error with mention {mention_id}: {str(e)}"
-            print(f"  ERROR: {error_msg}", file=sys.stderr)
-            errors.append(error_msg)
-
-    # Commit remaining
-    if batch_count > 0:
-        batch.commit()
-        upload_count += batch_count
-        print(f"[{upload_count}/{len(mentions)}] Committed final batch", file=sys.stderr)
+        operations.append({
+            "type": "set",
+            "collection": collection_path,
+            "doc_id": mention_id,
+            "data": mention_data
+        })
+
+        # Track stats
+        stats["byPlatform"][mention_data["platform"]] += 1
+        stats["bySentiment"][mention_data["sentiment"]] += 1
+        stats["byCategory"][mention_data["keywordCategory"]] += 1
+
+    # Bulk write: batches of up to 500, committed concurrently, retried with backoff
+    writer = BulkWriter(FirebaseClient(db.project, firestore_client=db), add_metadata=False)
+    write_result = writer.write(operations, atomic=False)
+    upload_count = write_result["written"]
+
+    for failed in write_result["failed_operations"]:
+        error_msg = f"Error with mention {failed['doc_id']}: {failed['error']}"
+        print(f"  ERROR: {error_msg}", file=sys.stderr)
+        errors.append(error_msg)
+
+    print(
+        f"[{upload_count}/{len(mentions)}] Committed {write_result['batches']} batches "
+        f"({write_result['docs_per_second']} docs/sec)",
+        file=sys.stderr
+    )
 
     # Summary
     print("\n" + "="*60, file=sys.stderr)
@@ -591,6 +588,7 @@ def main():
         'errorMessages': errors[:10],
         'collectionPath': collection_path,
         'clientId': client_id,
+        'docsPerSecond': write_result['docs_per_second'],
         'statistics': {
             'byPlatform': dict(stats["byPlatform"]),
             'bySentiment': dict(stats["bySentiment"]),
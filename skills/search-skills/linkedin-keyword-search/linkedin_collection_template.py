@@ -11,6 +11,7 @@ Usage:
     python linkedin_collection_template.py                    # Output CSV files (default)
     python linkedin_collection_template.py --json             # Output JSON to stdout
     python linkedin_collection_template.py --json --limit 100 # Output JSON, limit to top 100 by engagement
+    python linkedin_collection_template.py --ndjson           # Posts to stdout, one JSON object per line (after the single API call)
 """
 
 import sys
@@ -299,7 +300,18 @@ def output_json(posts: List[Dict[str, Any]], project_name: str):
     print(json.dumps(output, ensure_ascii=False, default=str))
 
 
-def main(json_output: bool = False, output_limit: Optional[int] = None):
+def output_ndjson(posts: List[Dict[str, Any]]):
+    """
+    Write posts to stdout as newline-delimited JSON, one post per line.
+
+    Crustdata returns every post from one request, so nothing can be
+    emitted before fetch_linkedin_posts() completes.
+    """
+    for post in posts:
+        print(json.dumps(post, ensure_ascii=False, default=str), flush=True)
+
+
+def main(json_output: bool = False, output_limit: Optional[int] = None, ndjson: bool = False):
     """Main execution function."""
     log = sys.stderr if json_output else sys.stdout
 
@@ -309,7 +321,9 @@ def main(json_output: bool = False, output_limit: Optional[int] = None):
     print(f"   Keyword: {KEYWORD}", file=log)
     print(f"   Date Range: {DATE_POSTED}", file=log)
     print(f"   Max Posts: {LIMIT}", file=log)
-    if json_output:
+    if ndjson:
+        print("   Output mode: NDJSON to stdout", file=log)
+    elif json_output:
         print(f"   Output mode: JSON to stdout", file=log)
     if output_limit:
         print(f"   Limit: {output_limit} posts (by engagement)", file=log)
@@ -352,7 +366,10 @@ def main(json_output: bool = False, output_limit: Optional[int] = None):
 
     # Output results
     if posts_data:
-        if json_output:
+        if ndjson:
+            output_ndjson(posts_data)
+            print(f"\n Output {len(posts_data)} posts as NDJSON", file=log)
+        elif json_output:
             output_json(posts_data, PROJECT_NAME)
             print(f"\n Output {len(posts_data)} posts as JSON", file=log)
         else:
@@ -371,7 +388,8 @@ def main(json_output: bool = False, output_limit: Optional[int] = None):
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='LinkedIn Keyword Search')
     parser.add_argument('--json', action='store_true', help='Output JSON to stdout')
+    parser.add_argument('--ndjson', action='store_true', help='Output posts to stdout as newline-delimited JSON')
     parser.add_argument('--limit', type=int, default=None, help='Max posts to output')
     args = parser.parse_args()
 
-    main(json_output=args.json, output_limit=args.limit)
+    main(json_output=args.json or args.ndjson, output_limit=args.limit, ndjson=args.ndjson)
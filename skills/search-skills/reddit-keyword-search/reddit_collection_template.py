@@ -9,6 +9,7 @@ Usage:
     python reddit_collection_template.py                    # Output CSV files (default)
     python reddit_collection_template.py --json             # Output JSON to stdout
     python reddit_collection_template.py --json --limit 200 # Output JSON, limit to top 200 by engagement
+    python reddit_collection_template.py --ndjson           # Stream posts to stdout as they are found, one JSON object per line
 """
 
 import sys
@@ -135,9 +136,12 @@ reddit = praw.Reddit(
 
 
 def scrape_subreddit_for_keywords(
-    subreddit_name, keywords, months=12, time_filter="year", seen_post_ids=None
+    subreddit_name, keywords, months=12, time_filter="year", seen_post_ids=None, on_post=None
 ):
-    """Scrape a specific subreddit for multiple keywords with filtering."""
+    """Scrape a specific subreddit for multiple keywords with filtering.
+
+    on_post, if given, is called with each new post as soon as it is found.
+    """
     if seen_post_ids is None:
         seen_post_ids = set()
 
@@ -194,6 +198,8 @@ def scrape_subreddit_for_keywords(
                     }
 
                     results.append(post_data)
+                    if on_post:
+                        on_post(post_data)
 
             if keyword_results > 0:
                 print(f"      Found {keyword_results} posts for '{keyword}'", file=sys.stderr)
@@ -210,8 +216,8 @@ def scrape_subreddit_for_keywords(
     return results, seen_post_ids
 
 
-def scrape_all_subreddits(subreddit_config, keywords, months=12):
-    """Scrape all subreddits for keywords."""
+def scrape_all_subreddits(subreddit_config, keywords, months=12, on_post=None):
+    """Scrape all subreddits for keywords (on_post is passed to each subreddit scrape)."""
     print("\n" + "=" * 60, file=sys.stderr)
     print(" STARTING REDDIT KEYWORD SEARCH", file=sys.stderr)
     print("=" * 60, file=sys.stderr)
@@ -228,7 +234,7 @@ def scrape_all_subreddits(subreddit_config, keywords, months=12):
         print(f"\n[{i}/{len(subreddit_config)}] Processing: r/{subreddit_name}", file=sys.stderr)
 
         results, seen_post_ids = scrape_subreddit_for_keywords(
-            subreddit_name, keywords, months, seen_post_ids=seen_post_ids
+            subreddit_name, keywords, months, seen_post_ids=seen_post_ids, on_post=on_post
         )
         all_results.extend(results)
         subreddit_stats[subreddit_name] = len(results)
@@ -252,6 +258,11 @@ def output_json(data, project_name="reddit_search"):
     print(json.dumps(output, ensure_ascii=False, default=str))
 
 
+def output_ndjson_post(post):
+    """Write one post to stdout as a line of newline-delimited JSON."""
+    print(json.dumps(post, ensure_ascii=False, default=str), flush=True)
+
+
 def print_summary(data, subreddit_stats, keywords, file=None):
     """Print final summary."""
     out = file or sys.stdout
@@ -277,24 +288,30 @@ def print_summary(data, subreddit_stats, keywords, file=None):
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Reddit Keyword Search')
     parser.add_argument('--json', action='store_true', help='Output JSON to stdout')
+    parser.add_argument('--ndjson', action='store_true', help='Stream posts to stdout as newline-delimited JSON')
     parser.add_argument('--limit', type=int, default=None, help='Max posts to output')
     args = parser.parse_args()
 
-    log = sys.stderr if args.json else sys.stdout
+    log = sys.stderr if args.json or args.ndjson else sys.stdout
+    # Without a limit there is nothing to rank, so posts stream out as they are found
+    stream_posts = args.ndjson and not args.limit
 
     print(" REDDIT KEYWORD SEARCH", file=log)
     print(f"Client: {CLIENT_NAME} ({CLIENT_ID})", file=log)
     print(f"Project: {PROJECT_NAME}", file=log)
     print(f"Keywords: {', '.join(KEYWORDS)}", file=log)
     print(f"Subreddits: {len(SUBREDDITS)} total", file=log)
-    if args.json:
+    if args.ndjson:
+        print("Output mode: NDJSON to stdout", file=log)
+    elif args.json:
         print(f"Output mode: JSON to stdout", file=log)
     if args.limit:
         print(f"Limit: {args.limit} posts", file=log)
 
     # Full scrape
     scraped_data, subreddit_stats = scrape_all_subreddits(
-        SUBREDDITS, KEYWORDS, months=MONTHS_BACK
+        SUBREDDITS, KEYWORDS, months=MONTHS_BACK,
+        on_post=output_ndjson_post if stream_posts else None
     )
 
     # Apply limit
@@ -308,7 +325,13 @@ if __name__ == "__main__":
 
     # Output results
     if scraped_data:
-        if args.json:
+        if args.ndjson:
+            if not stream_posts:
+                for post in scraped_data:
+                    output_ndjson_post(post)
+            print_summary(scraped_data, subreddit_stats, KEYWORDS, file=log)
+            print(f"\n Output {len(scraped_data)} posts as NDJSON", file=log)
+        elif args.json:
             output_json(scraped_data, PROJECT_NAME)
             print_summary(scraped_data, subreddit_stats, KEYWORDS, file=log)
             print(f"\n Output {len(scraped_data)} posts as JSON", file=log)
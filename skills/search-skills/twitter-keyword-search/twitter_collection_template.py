@@ -11,6 +11,7 @@ Usage:
     python twitter_collection_template.py                   # Output CSV files (default)
     python twitter_collection_template.py --json            # Output JSON to stdout
     python twitter_collection_template.py --json --limit 50 # Output JSON, limit to top 50 by engagement
+    python twitter_collection_template.py --ndjson          # Stream tweets to stdout as they are found, one JSON object per line
 """
 
 import sys
@@ -27,7 +28,7 @@ import time
 import argparse
 from datetime import datetime, timedelta, timezone
 from collections import defaultdict
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable
 from pathlib import Path
 
 try:
@@ -235,8 +236,14 @@ def build_search_query() -> str:
     return query
 
 
-def search_tweets(client: tweepy.Client, query: str, start_time: datetime, max_results: int = 100, log=None) -> List[Dict[str, Any]]:
-    """Search for tweets using X API v2."""
+def search_tweets(client: tweepy.Client, query: str, start_time: datetime, max_results: int = 100, log=None,
+                  on_tweet: Optional[Callable[[Any, Dict[int, Any]], None]] = None) -> List[Dict[str, Any]]:
+    """
+    Search for tweets using X API v2, page by page.
+
+    on_tweet, if given, is called with (tweet, users_lookup) for each tweet
+    as soon as its page arrives; users_lookup then holds the page's authors.
+    """
     if log is None:
         log = sys.stderr
 
@@ -247,7 +254,7 @@ def search_tweets(client: tweepy.Client, query: str, start_time: datetime, max_r
     users_lookup = {}
 
     try:
-        for page, response in enumerate(tweepy.Paginator(
+        for response in tweepy.Paginator(
             client.search_recent_tweets,
             query=query,
             start_time=start_time,
@@ -256,16 +263,23 @@ def search_tweets(client: tweepy.Client, query: str, start_time: datetime, max_r
             media_fields=MEDIA_FIELDS,
             expansions=EXPANSIONS,
             max_results=min(100, max_results)
-        ).flatten(limit=max_results)):
+        ):
+            includes = getattr(response, 'includes', None) or {}
+            for user in includes.get('users', []):
+                users_lookup[user.id] = user
 
-            if hasattr(response, 'includes') and 'users' in response.includes:
-                for user in response.includes['users']:
-                    users_lookup[user.id] = user
+            for tweet in response.data or []:
+                all_tweets.append(tweet)
+                if on_tweet is not None:
+                    on_tweet(tweet, users_lookup)
 
-            all_tweets.append(response)
+                if len(all_tweets) % 50 == 0:
+                    print(f"   Collected {len(all_tweets)} tweets...", file=log)
+                if len(all_tweets) >= max_results:
+                    break
 
-            if len(all_tweets) % 50 == 0:
-                print(f"   Collected {len(all_tweets)} tweets...", file=log)
+            if len(all_tweets) >= max_results:
+                break
 
         print(f" Found {len(all_tweets)} tweets", file=log)
 
@@ -277,6 +291,12 @@ def search_tweets(client: tweepy.Client, query: str, start_time: datetime, max_r
     return all_tweets, users_lookup
 
 
+def is_excluded(tweet: Any, exclusion_patterns: List[str]) -> bool:
+    """Whether a tweet's text matches any exclusion pattern."""
+    text_to_check = tweet.text.lower()
+    return any(pattern.lower() in text_to_check for pattern in exclusion_patterns)
+
+
 def filter_tweets(tweets: List[Any], exclusion_patterns: List[str], log=None) -> List[Any]:
     """Apply post-collection filtering."""
     if log is None:
@@ -285,11 +305,7 @@ def filter_tweets(tweets: List[Any], exclusion_patterns: List[str], log=None) ->
     if not exclusion_patterns:
         return tweets
 
-    filtered = []
-    for tweet in tweets:
-        text_to_check = tweet.text.lower()
-        if not any(pattern.lower() in text_to_check for pattern in exclusion_patterns):
-            filtered.append(tweet)
+    filtered = [tweet for tweet in tweets if not is_excluded(tweet, exclusion_patterns)]
 
     excluded_count = len(tweets) - len(filtered)
     if excluded_count > 0:
@@ -346,7 +362,13 @@ def output_json(tweets_data: List[Dict[str, Any]], project_name: str):
     print(json.dumps(output, ensure_ascii=False, default=str))
 
 
-def main(json_output: bool = False, output_limit: Optional[int] = None):
+def output_ndjson(tweets_data: List[Dict[str, Any]]):
+    """Write tweets to stdout as newline-delimited JSON, one tweet per line."""
+    for tweet in tweets_data:
+        print(json.dumps(tweet, ensure_ascii=False, default=str), flush=True)
+
+
+def main(json_output: bool = False, output_limit: Optional[int] = None, ndjson: bool = False):
     """Main execution function."""
     log = sys.stderr if json_output else sys.stdout
 
@@ -355,7 +377,9 @@ def main(json_output: bool = False, output_limit: Optional[int] = None):
     print(f"Project: {PROJECT_NAME}", file=log)
     print(f"Query: {SEARCH_QUERY}", file=log)
     print(f"Days back: {DAYS_BACK}", file=log)
-    if json_output:
+    if ndjson:
+        print("Output mode: NDJSON to stdout", file=log)
+    elif json_output:
         print(f"Output mode: JSON to stdout", file=log)
     if output_limit:
         print(f"Limit: {output_limit} tweets", file=log)
@@ -378,6 +402,25 @@ def main(json_output: bool = False, output_limit: Optional[int] = None):
     query = build_search_query()
     start_time = datetime.now(timezone.utc) - timedelta(days=DAYS_BACK)
 
+    # Without a limit (which ranks the whole collection), NDJSON is written as pages arrive
+    if ndjson and not output_limit:
+        streamed = 0
+
+        def emit(tweet: Any, users_lookup: Dict[int, Any]):
+            nonlocal streamed
+            if is_excluded(tweet, EXCLUSION_PATTERNS):
+                return
+            output_ndjson([extract_tweet_data(tweet, users_lookup)])
+            streamed += 1
+
+        search_tweets(client, query, start_time, MAX_TWEETS, log=log, on_tweet=emit)
+        update_monthly_usage(streamed)
+        if streamed:
+            print(f"\n Streamed {streamed} tweets as NDJSON", file=log)
+        else:
+            print("\n No tweets were collected.", file=log)
+        return
+
     tweets, users_lookup = search_tweets(client, query, start_time, MAX_TWEETS, log=log)
 
     if not tweets:
@@ -404,7 +447,10 @@ def main(json_output: bool = False, output_limit: Optional[int] = None):
 
     # Output results
     if tweets_data:
-        if json_output:
+        if ndjson:
+            output_ndjson(tweets_data)
+            print(f"\n Output {len(tweets_data)} tweets as NDJSON", file=log)
+        elif json_output:
             output_json(tweets_data, PROJECT_NAME)
             print(f"\n Output {len(tweets_data)} tweets as JSON", file=log)
         else:
@@ -422,7 +468,8 @@ def main(json_output: bool = False, output_limit: Optional[int] = None):
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='X (Twitter) Keyword Search')
     parser.add_argument('--json', action='store_true', help='Output JSON to stdout')
+    parser.add_argument('--ndjson', action='store_true', help='Stream tweets to stdout as newline-delimited JSON')
     parser.add_argument('--limit', type=int, default=None, help='Max tweets to output')
     args = parser.parse_args()
 
-    main(json_output=args.json, output_limit=args.limit)
+    main(json_output=args.json or args.ndjson, output_limit=args.limit, ndjson=args.ndjson)